@@ -0,0 +1,55 @@
+"""add movies.updated_at change watermark
+
+Revision ID: 7c1e5a9d2f40
+Revises: 3a2d04b4c24c
+Create Date: 2026-03-10
+
+In-process MovieFeatureStore가 변경된 행만 증분 갱신할 수 있도록
+movies.updated_at 컬럼 + 인덱스 + BEFORE UPDATE 트리거를 추가한다.
+배치 스크립트의 raw SQL UPDATE도 트리거로 워터마크가 갱신된다.
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7c1e5a9d2f40"
+down_revision: str | None = "3a2d04b4c24c"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "movies",
+        sa.Column(
+            "updated_at",
+            sa.DateTime(),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+    )
+    op.create_index("ix_movies_updated_at", "movies", ["updated_at"])
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION movies_touch_updated_at() RETURNS trigger AS $$
+        BEGIN
+            NEW.updated_at = now();
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_movies_touch_updated_at
+        BEFORE UPDATE ON movies
+        FOR EACH ROW EXECUTE FUNCTION movies_touch_updated_at()
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_movies_touch_updated_at ON movies")
+    op.execute("DROP FUNCTION IF EXISTS movies_touch_updated_at()")
+    op.drop_index("ix_movies_updated_at", table_name="movies")
+    op.drop_column("movies", "updated_at")
@@ -0,0 +1,53 @@
+"""add JSONB score expression indexes
+
+Revision ID: 8d4f1b2c6e13
+Revises: 7c1e5a9d2f40
+Create Date: 2026-10-16
+
+MBTI 16 / 날씨 4 / 감성 7 키마다 `((<score_type> ->> '<key>')::float) DESC NULLS LAST`
+B-tree 표현식 인덱스를 추가한다. GET /movies?mbti=|weather= 정렬과
+get_movies_by_score의 점수순 조회가 전체 스캔 + 정렬 대신 인덱스 순서로 읽고 LIMIT에서 멈춘다.
+쿼리 식은 app/services/score_indexes.py가 같은 형태로 만든다.
+
+CONCURRENTLY로 생성하므로 autocommit 블록에서 실행한다 (쓰기 락 없음).
+생성 후 ANALYZE — 표현식 인덱스는 ANALYZE 이후에야 식별 통계가 생겨 플래너가 선택도를 추정한다.
+(모델에는 선언하지 않는다: autogenerate는 표현식 인덱스를 반영하지 않는다.)
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8d4f1b2c6e13"
+down_revision: str | None = "7c1e5a9d2f40"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# 이 리비전 시점의 키 목록 (앱 코드가 바뀌어도 마이그레이션은 고정)
+SCORE_KEYS = {
+    "mbti_scores": ("ix_movies_mbti", [
+        "INTJ", "INTP", "ENTJ", "ENTP", "INFJ", "INFP", "ENFJ", "ENFP",
+        "ISTJ", "ISFJ", "ESTJ", "ESFJ", "ISTP", "ISFP", "ESTP", "ESFP",
+    ]),
+    "weather_scores": ("ix_movies_weather", ["sunny", "rainy", "cloudy", "snowy"]),
+    "emotion_tags": ("ix_movies_emotion", ["healing", "tension", "energy", "romance", "deep", "fantasy", "light"]),
+}
+
+
+def _indexes():
+    for score_type, (prefix, keys) in SCORE_KEYS.items():
+        for key in keys:
+            yield f"{prefix}_{key.lower()}", f"(({score_type} ->> '{key}')::float)"
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, expr in _indexes():
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON movies ({expr} DESC NULLS LAST)")
+        op.execute("ANALYZE movies")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _ in _indexes():
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
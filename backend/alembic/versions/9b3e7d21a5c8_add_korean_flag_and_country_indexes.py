@@ -0,0 +1,53 @@
+"""add movies.is_korean, countries.name_ko and country lookup indexes
+
+Revision ID: 9b3e7d21a5c8
+Revises: 8d4f1b2c6e13
+Create Date: 2026-10-16
+
+국가 필터를 production_countries_ko ILIKE '%...%' (전체 스캔)에서
+정규화된 movie_countries 조인으로 옮긴다.
+- countries.name_ko: 한글 국가명 (production_countries_ko 표기) → country_id 조회
+- movie_countries (country_id, movie_id): PK가 (movie_id, country_id)라 국가 → 영화 방향 인덱스 추가
+- movies.is_korean + 부분 인덱스 (popularity, vote_average) WHERE is_korean:
+  홈 "한국 인기 영화" 풀이 한국 영화만 인기도순으로 읽는다
+
+is_korean은 여기서 기존 ILIKE와 같은 의미로 초기화하고,
+name_ko/조인 정합성은 scripts/backfill_movie_countries.py가 맞춘다.
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9b3e7d21a5c8"
+down_revision: str | None = "8d4f1b2c6e13"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column("countries", sa.Column("name_ko", sa.String(100), nullable=True))
+    op.create_index("ix_countries_name_ko", "countries", ["name_ko"])
+    op.create_index("ix_movie_countries_country_movie", "movie_countries", ["country_id", "movie_id"])
+
+    op.add_column(
+        "movies",
+        sa.Column("is_korean", sa.Boolean(), server_default=sa.false(), nullable=False),
+    )
+    op.execute("UPDATE movies SET is_korean = true WHERE production_countries_ko LIKE '%대한민국%'")
+    op.create_index(
+        "ix_movies_korean_popularity",
+        "movies",
+        ["popularity", "vote_average"],
+        postgresql_where=sa.text("is_korean"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_movies_korean_popularity", table_name="movies")
+    op.drop_column("movies", "is_korean")
+    op.drop_index("ix_movie_countries_country_movie", table_name="movie_countries")
+    op.drop_index("ix_countries_name_ko", table_name="countries")
+    op.drop_column("countries", "name_ko")
@@ -0,0 +1,42 @@
+"""add batch_watermarks and similar_movies reverse index
+
+Revision ID: a1c4e8f02d37
+Revises: 9b3e7d21a5c8
+Create Date: 2026-10-16
+
+compute_similar_movies.py --incremental이 마지막으로 반영한 movies.updated_at을
+batch_watermarks에 기록하고, 변경된 영화를 이웃으로 가진 영화를
+similar_movies(similar_movie_id) 인덱스로 역방향 조회한다.
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a1c4e8f02d37"
+down_revision: str | None = "9b3e7d21a5c8"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "batch_watermarks",
+        sa.Column("name", sa.String(64), nullable=False),
+        sa.Column("watermark", sa.DateTime(), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("name"),
+    )
+    op.create_index("ix_similar_movies_similar_movie_id", "similar_movies", ["similar_movie_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_similar_movies_similar_movie_id", table_name="similar_movies")
+    op.drop_table("batch_watermarks")
@@ -0,0 +1,54 @@
+"""add similar_movies.score / rank and covering top-k index
+
+Revision ID: b7d2f5a9c3e1
+Revises: a1c4e8f02d37
+Create Date: 2026-10-16
+
+/movies/{id}/similar와 get_similar_movie_ids가 시드 영화별 Top-K를
+(movie_id, rank) INCLUDE (similar_movie_id, score) 인덱스만으로 읽는다.
+
+기존 행은 유사도가 없으므로 score는 NULL로 두고 rank만 similar_movie_id 순으로 채운다
+(다음 compute_similar_movies.py 실행이 score/rank를 덮어쓴다).
+인덱스는 CONCURRENTLY로 생성하므로 autocommit 블록에서 실행한다.
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b7d2f5a9c3e1"
+down_revision: str | None = "a1c4e8f02d37"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column("similar_movies", sa.Column("score", sa.Float(), nullable=True))
+    op.add_column("similar_movies", sa.Column("rank", sa.SmallInteger(), nullable=True))
+    op.execute("""
+        UPDATE similar_movies s SET rank = r.rn
+        FROM (
+            SELECT movie_id, similar_movie_id,
+                   row_number() OVER (PARTITION BY movie_id ORDER BY similar_movie_id) AS rn
+            FROM similar_movies
+        ) r
+        WHERE s.movie_id = r.movie_id AND s.similar_movie_id = r.similar_movie_id
+    """)
+    op.alter_column("similar_movies", "rank", nullable=False)
+
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_similar_movies_movie_rank "
+            "ON similar_movies (movie_id, rank) INCLUDE (similar_movie_id, score)"
+        )
+        # index-only scan은 visibility map이 채워져야 힙 방문을 건너뛴다
+        op.execute("VACUUM ANALYZE similar_movies")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_similar_movies_movie_rank")
+    op.drop_column("similar_movies", "rank")
+    op.drop_column("similar_movies", "score")
@@ -0,0 +1,48 @@
+"""keep movies.is_korean in sync with production_countries_ko
+
+Revision ID: c4f9e2a7b815
+Revises: b7d2f5a9c3e1
+Create Date: 2026-10-16
+
+홈 "한국 인기 영화" 풀은 movies.is_korean만 읽는데, 임포트 스크립트는
+production_countries_ko만 쓴다. INSERT와 production_countries_ko를 바꾸는 UPDATE에서
+트리거가 is_korean을 9b3e7d21a5c8의 초기화와 같은 규칙('%대한민국%')으로 맞춘다.
+is_korean의 기준은 production_countries_ko 하나다 — scripts/backfill_movie_countries.py도
+같은 식(IS_KOREAN_SQL)으로 재계산한다.
+
+9b3e7d21a5c8 이후 트리거 없이 들어오거나 다른 규칙으로 바뀐 행도 여기서 한 번 맞춘다.
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c4f9e2a7b815"
+down_revision: str | None = "b7d2f5a9c3e1"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE OR REPLACE FUNCTION movies_sync_is_korean() RETURNS trigger AS $$
+        BEGIN
+            NEW.is_korean = COALESCE(NEW.production_countries_ko LIKE '%대한민국%', false);
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_movies_sync_is_korean
+        BEFORE INSERT OR UPDATE OF production_countries_ko ON movies
+        FOR EACH ROW EXECUTE FUNCTION movies_sync_is_korean()
+    """)
+    op.execute("""
+        UPDATE movies SET is_korean = COALESCE(production_countries_ko LIKE '%대한민국%', false)
+        WHERE is_korean IS DISTINCT FROM COALESCE(production_countries_ko LIKE '%대한민국%', false)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_movies_sync_is_korean ON movies")
+    op.execute("DROP FUNCTION IF EXISTS movies_sync_is_korean()")
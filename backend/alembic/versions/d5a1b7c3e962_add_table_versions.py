@@ -0,0 +1,59 @@
+"""add table_versions and change-counter triggers for index source tables
+
+Revision ID: d5a1b7c3e962
+Revises: c4f9e2a7b815
+Create Date: 2026-10-16
+
+자동완성(persons.name, movie_cast)과 BM25 역색인(keywords, movie_keywords)은
+movies.updated_at을 건드리지 않는 변경(transliterate_* 스크립트의 인물명 수정,
+키워드 재임포트)도 반영해야 한다. 이 테이블들에 문장 단위 AFTER 트리거를 달아
+table_versions의 해당 행을 1씩 올리고, IndexRebuilder가 버전을 시그니처에 넣는다.
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d5a1b7c3e962"
+down_revision: str | None = "c4f9e2a7b815"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+VERSIONED_TABLES = ("persons", "movie_cast", "keywords", "movie_keywords")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "table_versions",
+        sa.Column("name", sa.String(64), nullable=False),
+        sa.Column("version", sa.BigInteger(), server_default="0", nullable=False),
+        sa.PrimaryKeyConstraint("name"),
+    )
+    op.execute(
+        "INSERT INTO table_versions (name) VALUES "
+        + ", ".join(f"('{table}')" for table in VERSIONED_TABLES)
+    )
+    op.execute("""
+        CREATE OR REPLACE FUNCTION bump_table_version() RETURNS trigger AS $$
+        BEGIN
+            INSERT INTO table_versions (name, version) VALUES (TG_TABLE_NAME, 1)
+            ON CONFLICT (name) DO UPDATE SET version = table_versions.version + 1;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    for table in VERSIONED_TABLES:
+        op.execute(f"""
+            CREATE TRIGGER trg_{table}_bump_version
+            AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table}
+            FOR EACH STATEMENT EXECUTE FUNCTION bump_table_version()
+        """)
+
+
+def downgrade() -> None:
+    for table in VERSIONED_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_bump_version ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS bump_table_version()")
+    op.drop_table("table_versions")
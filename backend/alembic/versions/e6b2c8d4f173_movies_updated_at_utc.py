@@ -0,0 +1,54 @@
+"""write movies.updated_at in UTC from the DB side too
+
+Revision ID: e6b2c8d4f173
+Revises: d5a1b7c3e962
+Create Date: 2026-10-16
+
+movies.updated_at은 timezone 없는 timestamp인데, 7c1e5a9d2f40의 server default와
+BEFORE UPDATE 트리거는 now()(세션 TimeZone 기준 로컬 시각)를, ORM은 datetime.utcnow를
+쓴다. UTC가 아닌 서버에서는 두 시계가 어긋나 피처 스토어/유사 영화 워터마크
+(max(updated_at) - 겹침 구간)가 뒤처진 쪽 행을 건너뛴다.
+DB 쪽도 now() AT TIME ZONE 'utc'로 바꿔 시계를 UTC 하나로 맞춘다.
+
+기존 로컬 시각 값 중 현재 UTC보다 앞선 행(UTC+ 서버에서 트리거가 찍은 값)은 그대로 두면
+이후 UTC 행이 그보다 작아 워터마크 뒤에 숨는다. 그런 행은 트리거를 거쳐 현재 UTC로 당기고,
+batch_watermarks도 현재 UTC를 넘지 않게 자른다. 앱의 인메모리 워터마크는 재시작 시 다시 읽는다.
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e6b2c8d4f173"
+down_revision: str | None = "d5a1b7c3e962"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _touch_function(expr: str) -> str:
+    return f"""
+        CREATE OR REPLACE FUNCTION movies_touch_updated_at() RETURNS trigger AS $$
+        BEGIN
+            NEW.updated_at = {expr};
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """
+
+
+def upgrade() -> None:
+    op.execute(_touch_function("now() AT TIME ZONE 'utc'"))
+    op.alter_column("movies", "updated_at", server_default=sa.text("(now() AT TIME ZONE 'utc')"))
+    # 트리거가 updated_at을 현재 UTC로 찍는다
+    op.execute("UPDATE movies SET updated_at = updated_at WHERE updated_at > now() AT TIME ZONE 'utc'")
+    op.execute(
+        "UPDATE batch_watermarks SET watermark = now() AT TIME ZONE 'utc' "
+        "WHERE watermark > now() AT TIME ZONE 'utc'"
+    )
+
+
+def downgrade() -> None:
+    op.alter_column("movies", "updated_at", server_default=sa.text("now()"))
+    op.execute(_touch_function("now()"))
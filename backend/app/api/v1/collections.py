@@ -3,11 +3,12 @@ Collection API endpoints
 """
 
 from fastapi import APIRouter, Depends, HTTPException, Request, status
-from sqlalchemy.orm import Session
+from sqlalchemy import func
+from sqlalchemy.orm import Session, selectinload
 
 from app.core.deps import get_current_user, get_db
 from app.core.rate_limit import limiter
-from app.models import Collection, Movie, User
+from app.models import Collection, Movie, User, collection_movies
 from app.schemas import (
     AddMovieToCollection,
     CollectionCreate,
@@ -16,6 +17,7 @@ from app.schemas import (
     CollectionUpdate,
     MovieListItem,
 )
+from app.services.user_profile_cache import invalidate_user_profile
 
 router = APIRouter(prefix="/collections", tags=["Collections"])
 
@@ -28,19 +30,35 @@ def get_my_collections(
     db: Session = Depends(get_db)
 ):
     """Get current user's collections"""
-    collections = db.query(Collection).filter(
+    # 영화 수는 GROUP BY 집계로 함께 읽는다 (컬렉션마다 movies를 로드하지 않음)
+    rows = db.query(Collection, func.count(collection_movies.c.movie_id)).outerjoin(
+        collection_movies, collection_movies.c.collection_id == Collection.id
+    ).filter(
         Collection.user_id == current_user.id
-    ).order_by(Collection.created_at.desc()).all()
+    ).group_by(Collection.id).order_by(Collection.created_at.desc()).all()
 
     result = []
-    for c in collections:
+    for c, movie_count in rows:
         resp = CollectionResponse.model_validate(c)
-        resp.movie_count = len(c.movies)
+        resp.movie_count = movie_count
         result.append(resp)
 
     return result
 
 
+def _movie_count(db: Session, collection_id: int) -> int:
+    return db.query(func.count()).select_from(collection_movies).filter(
+        collection_movies.c.collection_id == collection_id
+    ).scalar()
+
+
+def _in_collection(db: Session, collection_id: int, movie_id: int) -> bool:
+    return db.query(collection_movies.c.movie_id).filter(
+        collection_movies.c.collection_id == collection_id,
+        collection_movies.c.movie_id == movie_id
+    ).first() is not None
+
+
 @router.post("", response_model=CollectionResponse, status_code=status.HTTP_201_CREATED)
 @limiter.limit("30/minute")
 def create_collection(
@@ -74,7 +92,9 @@ def get_collection(
     db: Session = Depends(get_db)
 ):
     """Get collection detail"""
-    collection = db.query(Collection).filter(
+    collection = db.query(Collection).options(
+        selectinload(Collection.movies).selectinload(Movie.genres)
+    ).filter(
         Collection.id == collection_id
     ).first()
 
@@ -129,10 +149,11 @@ def update_collection(
         setattr(collection, field, value)
 
     db.commit()
+    invalidate_user_profile(current_user.id)  # 찜 컬렉션 이름이 바뀔 수 있다
     db.refresh(collection)
 
     resp = CollectionResponse.model_validate(collection)
-    resp.movie_count = len(collection.movies)
+    resp.movie_count = _movie_count(db, collection.id)
     return resp
 
 
@@ -158,6 +179,7 @@ def delete_collection(
 
     db.delete(collection)
     db.commit()
+    invalidate_user_profile(current_user.id)
 
 
 @router.post("/{collection_id}/movies", status_code=status.HTTP_201_CREATED)
@@ -188,14 +210,15 @@ def add_movie_to_collection(
             detail="Movie not found"
         )
 
-    if movie in collection.movies:
+    if _in_collection(db, collection.id, movie.id):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Movie already in collection"
         )
 
-    collection.movies.append(movie)
+    db.execute(collection_movies.insert().values(collection_id=collection.id, movie_id=movie.id))
     db.commit()
+    invalidate_user_profile(current_user.id)
 
     return {"message": "Movie added to collection"}
 
@@ -221,12 +244,15 @@ def remove_movie_from_collection(
             detail="Collection not found"
         )
 
-    movie = db.query(Movie).filter(Movie.id == movie_id).first()
-    if not movie or movie not in collection.movies:
+    if not _in_collection(db, collection.id, movie_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Movie not in collection"
         )
 
-    collection.movies.remove(movie)
+    db.execute(collection_movies.delete().where(
+        collection_movies.c.collection_id == collection.id,
+        collection_movies.c.movie_id == movie_id
+    ))
     db.commit()
+    invalidate_user_profile(current_user.id)
@@ -6,11 +6,12 @@ import logging
 import random
 from datetime import datetime
 
-from sqlalchemy import func
+import numpy as np
 from sqlalchemy.orm import Session, selectinload
 
 from app.models import Genre, Movie
 from app.schemas.recommendation import RecommendationTag
+from app.services.movie_feature_store import MovieFeatures, get_feature_store
 
 logger = logging.getLogger(__name__)
 
@@ -20,11 +21,45 @@ ScoredMovie = tuple[Movie, float, list[RecommendationTag]]
 
 def _get_primary_genre(movie: Movie) -> str:
     """영화의 primary genre(첫 번째 장르) 반환."""
-    if movie.genres:
+    if getattr(movie, "genres", None):
         return movie.genres[0].name
     return "기타"
 
 
+def _primary_genre_map(movies: list) -> dict[int, str]:
+    """movie_id → primary genre. Feature store에 있으면 배열에서, 없으면 ORM에서 읽음."""
+    result: dict[int, str] = {}
+    store = get_feature_store()
+    if store is not None:
+        feats = store.features
+        rows = feats.rows([m.id for m in movies])
+        for movie, row in zip(movies, rows, strict=True):
+            if row >= 0:
+                result[movie.id] = feats.genre_name(int(feats.primary_genre[row])) or "기타"
+    for movie in movies:
+        if movie.id not in result:
+            result[movie.id] = _get_primary_genre(movie)
+    return result
+
+
+def _release_year_map(movies: list) -> dict[int, int | None]:
+    """movie_id → 개봉 연도. Feature store에 있으면 배열에서, 없으면 ORM에서 읽음."""
+    result: dict[int, int | None] = {}
+    store = get_feature_store()
+    if store is not None:
+        feats = store.features
+        rows = feats.rows([m.id for m in movies])
+        for movie, row in zip(movies, rows, strict=True):
+            if row >= 0:
+                year = int(feats.release_year[row])
+                result[movie.id] = year or None
+    for movie in movies:
+        if movie.id not in result:
+            release_date = getattr(movie, "release_date", None)
+            result[movie.id] = release_date.year if release_date else None
+    return result
+
+
 def diversify_by_genre(
     scored_movies: list[ScoredMovie],
     limit: int,
@@ -41,12 +76,13 @@ def diversify_by_genre(
     result: list[ScoredMovie] = []
     remaining = list(scored_movies)
     genre_window: list[str] = []
+    genre_of = _primary_genre_map([item[0] for item in scored_movies])
 
     while len(result) < limit and remaining:
         selected = False
         for i, item in enumerate(remaining):
             movie = item[0]
-            primary_genre = _get_primary_genre(movie)
+            primary_genre = genre_of[movie.id]
 
             recent = genre_window[-(max_consecutive - 1):]
             if (
@@ -65,7 +101,7 @@ def diversify_by_genre(
             # 모든 남은 영화가 연속 제한에 걸림 → 최고점 선택 (제약 완화)
             item = remaining.pop(0)
             result.append(item)
-            genre_window.append(_get_primary_genre(item[0]))
+            genre_window.append(genre_of[item[0].id])
 
     return result
 
@@ -85,12 +121,13 @@ def apply_genre_cap(
     result: list[ScoredMovie] = []
     skipped: list[ScoredMovie] = []
     genre_count: dict[str, int] = {}
+    genre_of = _primary_genre_map([item[0] for item in scored_movies])
 
     for item in scored_movies:
         if len(result) >= limit:
             break
 
-        primary_genre = _get_primary_genre(item[0])
+        primary_genre = genre_of[item[0].id]
         count = genre_count.get(primary_genre, 0)
         max_allowed = max(int(limit * max_genre_ratio), 2)
 
@@ -132,11 +169,11 @@ def ensure_freshness(
     recent: list[ScoredMovie] = []
     classic: list[ScoredMovie] = []
     middle: list[ScoredMovie] = []
+    year_of = _release_year_map([item[0] for item in scored_movies])
 
     for item in scored_movies:
-        movie = item[0]
-        if movie.release_date:
-            year = movie.release_date.year
+        year = year_of[item[0].id]
+        if year:
             if year >= recent_cutoff:
                 recent.append(item)
             elif year < classic_cutoff:
@@ -180,12 +217,15 @@ def inject_serendipity(
     db: Session,
     serendipity_ratio: float = 0.10,
     min_quality: float = 7.0,
+    rng: random.Random | None = None,
 ) -> list[ScoredMovie]:
     """추천 리스트의 일부를 사용자 선호 장르 외의 고품질 영화로 대체.
 
     user_top_genres가 비어있으면 스킵.
     리스트의 70% 지점에 삽입하여 상위 관련성 높은 영화 유지.
+    무작위 선택은 rng(없으면 새 Random)로 Python에서 한다 (ORDER BY random() 없음).
     """
+    rng = rng or random.Random()
     if not scored_movies or not user_top_genres:
         return scored_movies
 
@@ -195,36 +235,75 @@ def inject_serendipity(
     main_movies = scored_movies[:main_count]
     used_ids = {item[0].id for item in main_movies}
 
-    # 사용자 선호 장르 외의 고품질 영화 조회
-    serendipity_pool = (
-        db.query(Movie)
-        .options(selectinload(Movie.genres))
-        .join(Movie.genres)
-        .filter(
-            Movie.weighted_score >= min_quality,
-            ~Movie.id.in_(used_ids),
-            ~Genre.name.in_(user_top_genres),
+    # Feature store: 배열 마스킹으로 후보 선택 → 선택된 영화만 조회
+    store = get_feature_store()
+    if store is not None:
+        selected = _serendipity_from_store(
+            db, store.features, serendipity_count, used_ids, user_top_genres, min_quality, rng,
+        )
+        if not selected:
+            return scored_movies[:limit]
+        return _insert_serendipity(main_movies, main_count, selected, limit)
+
+    # 사용자 선호 장르 외의 고품질 영화 id만 조회 → Python에서 샘플 → 선택된 영화만 하이드레이션
+    eligible = [
+        mid for (mid,) in (
+            db.query(Movie.id)
+            .join(Movie.genres)
+            .filter(
+                Movie.weighted_score >= min_quality,
+                ~Movie.id.in_(used_ids),
+                ~Genre.name.in_(user_top_genres),
+            )
+            .distinct()
         )
-        .order_by(func.random())
-        .limit(serendipity_count * 5)
-        .all()
-    )
-
-    # 중복 제거
-    seen: set[int] = set()
-    unique_pool: list[Movie] = []
-    for m in serendipity_pool:
-        if m.id not in seen and m.id not in used_ids:
-            seen.add(m.id)
-            unique_pool.append(m)
-
-    count = min(serendipity_count, len(unique_pool))
-    if count == 0:
+    ]
+    if not eligible:
         return scored_movies[:limit]
 
-    selected = random.sample(unique_pool, count)
+    picked_ids = rng.sample(eligible, min(serendipity_count, len(eligible)))
+    selected = _load_in_order(db, picked_ids)
+    if not selected:
+        return scored_movies[:limit]
+    return _insert_serendipity(main_movies, main_count, selected, limit)
 
-    # 메인 리스트 70% 지점에 삽입
+
+def _load_in_order(db: Session, movie_ids: list[int]) -> list[Movie]:
+    """id 목록 순서대로 영화(+장르) 조회. 없는 id는 건너뛴다."""
+    movies = db.query(Movie).options(selectinload(Movie.genres)).filter(Movie.id.in_(movie_ids)).all()
+    movie_dict = {m.id: m for m in movies}
+    return [movie_dict[mid] for mid in movie_ids if mid in movie_dict]
+
+
+def _serendipity_from_store(
+    db: Session,
+    feats: MovieFeatures,
+    count: int,
+    used_ids: set[int],
+    user_top_genres: set[str],
+    min_quality: float,
+    rng: random.Random,
+) -> list[Movie]:
+    """선호 장르 외 장르를 하나 이상 가진 고품질 영화 중 count편 무작위 선택."""
+    top_bits = np.uint64(feats.genre_bits(user_top_genres))
+    mask = (feats.weighted_score >= min_quality) & ((feats.genre_mask & ~top_bits) != 0)
+    if used_ids:
+        mask &= ~np.isin(feats.ids, list(used_ids))
+    eligible = feats.ids[mask]
+    if len(eligible) == 0:
+        return []
+
+    picked = rng.sample(range(len(eligible)), min(count, len(eligible)))
+    return _load_in_order(db, [int(eligible[i]) for i in picked])
+
+
+def _insert_serendipity(
+    main_movies: list[ScoredMovie],
+    main_count: int,
+    selected: list[Movie],
+    limit: int,
+) -> list[ScoredMovie]:
+    """메인 리스트 70% 지점에 의외의 발견 영화 삽입."""
     result = list(main_movies)
     insert_pos = int(main_count * 0.7)
     for i, movie in enumerate(selected):
@@ -48,6 +48,8 @@ async def health_check() -> dict:
     """Detailed health check with component status."""
     from app.api.v1.recommendation_cf import is_cf_available
     from app.api.v1.semantic_search import is_semantic_search_available
+    from app.services.lexical_index import get_lexical_index
+    from app.services.movie_feature_store import get_feature_store
     from app.services.reranker import get_reranker
     from app.services.two_tower_retriever import get_retriever
 
@@ -60,5 +62,7 @@ async def health_check() -> dict:
         "cf_model": "loaded" if is_cf_available() else "not_loaded",
         "two_tower": "loaded" if get_retriever() is not None else "not_loaded",
         "reranker": "loaded" if get_reranker() is not None else "not_loaded",
+        "feature_store": "loaded" if get_feature_store() is not None else "not_loaded",
+        "lexical_index": "loaded" if get_lexical_index() is not None else "not_loaded",
         "version": os.environ.get("GIT_SHA", os.environ.get("APP_VERSION", "v2.0.0")),
     }
@@ -4,12 +4,14 @@ User Interactions API - 평점/찜 상태 통합 조회
 
 from fastapi import APIRouter, Depends, Query, Request
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
+from app.api.v1.recommendation_engine import favorite_movie_ids, genre_counts_for
 from app.core.deps import get_current_user, get_current_user_optional, get_db
 from app.core.rate_limit import limiter
 from app.models import Collection, Movie, Rating, User, collection_movies
 from app.schemas import MovieListItem
+from app.services.user_profile_cache import invalidate_user_profile
 
 router = APIRouter(prefix="/interactions", tags=["Interactions"])
 
@@ -142,15 +144,20 @@ def toggle_favorite(
         db.commit()
         db.refresh(favorites)
 
-    # 토글
-    if movie in favorites.movies:
-        favorites.movies.remove(movie)
+    # 토글 (찜 목록 전체를 읽지 않고 해당 행만 확인)
+    link = (
+        collection_movies.c.collection_id == favorites.id,
+        collection_movies.c.movie_id == movie_id,
+    )
+    if db.query(collection_movies.c.movie_id).filter(*link).first() is not None:
+        db.execute(collection_movies.delete().where(*link))
         is_favorited = False
     else:
-        favorites.movies.append(movie)
+        db.execute(collection_movies.insert().values(collection_id=favorites.id, movie_id=movie_id))
         is_favorited = True
 
     db.commit()
+    invalidate_user_profile(current_user.id)
 
     return {
         "movie_id": movie_id,
@@ -178,7 +185,16 @@ def get_favorites(
         return []
 
     offset = (page - 1) * page_size
-    movies = favorites.movies[offset:offset + page_size]
+    movies = (
+        db.query(Movie)
+        .join(collection_movies, collection_movies.c.movie_id == Movie.id)
+        .options(selectinload(Movie.genres))
+        .filter(collection_movies.c.collection_id == favorites.id)
+        .order_by(collection_movies.c.added_at, Movie.id)
+        .offset(offset)
+        .limit(page_size)
+        .all()
+    )
 
     return [MovieListItem.from_orm_with_genres(m) for m in movies]
 
@@ -191,20 +207,13 @@ def get_favorite_genres(
     db: Session = Depends(get_db)
 ):
     """찜한 영화들의 장르 분포 (추천용)"""
-    favorites = db.query(Collection).filter(
-        Collection.user_id == current_user.id,
-        Collection.name == "찜한 영화"
-    ).first()
+    favorited_ids = favorite_movie_ids(db, current_user.id)
 
-    if not favorites or not favorites.movies:
+    if not favorited_ids:
         return {"genres": {}, "top_genres": []}
 
     # 장르 집계
-    genre_counts: dict[str, int] = {}
-    for movie in favorites.movies:
-        for genre in movie.genres:
-            genre_name = genre.name if hasattr(genre, 'name') else str(genre)
-            genre_counts[genre_name] = genre_counts.get(genre_name, 0) + 1
+    genre_counts = genre_counts_for(db, favorited_ids)
 
     # 상위 5개 장르
     top_genres = sorted(genre_counts.items(), key=lambda x: x[1], reverse=True)[:5]
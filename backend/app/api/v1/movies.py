@@ -1,6 +1,7 @@
 """
 Movie API endpoints
 """
+import base64
 import contextlib
 import hashlib
 import json
@@ -8,10 +9,11 @@ import logging
 import math
 import random as random_mod
 import time
+from datetime import date
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from redis.exceptions import RedisError
-from sqlalchemy import Float, cast, distinct, extract, func, or_, select
+from sqlalchemy import and_, distinct, extract, or_, select
 from sqlalchemy.orm import Session, selectinload
 
 from app.api.v1.recommendation_constants import (
@@ -20,13 +22,19 @@ from app.api.v1.recommendation_constants import (
     SEMANTIC_GENRE_MAX,
 )
 from app.api.v1.semantic_search import is_semantic_search_available, search_similar
+from app.config import settings
 from app.core.deps import get_db
 from app.core.rate_limit import limiter
-from app.models import Genre, Keyword, Movie, Person
-from app.models.movie import movie_cast, movie_keywords, similar_movies
+from app.models import Country, Genre, Keyword, Movie, Person
+from app.models.movie import movie_cast, movie_countries, movie_keywords, similar_movies
 from app.schemas import GenreResponse, MovieDetail, MovieListItem, PaginatedMovies
+from app.services.autocomplete import get_autocomplete_index
+from app.services.count_cache import get_cached_count
 from app.services.embedding import get_query_embedding
+from app.services.lexical_index import get_lexical_index, reciprocal_rank_fusion
 from app.services.llm import get_redis_client
+from app.services.score_indexes import score_expr
+from app.services.section_cache import get_section_pool
 
 logger = logging.getLogger(__name__)
 
@@ -46,8 +54,12 @@ async def search_autocomplete(
     """
     Search autocomplete for movies, cast, and directors.
     Returns quick suggestions for search dropdown.
-    Redis cached (1 hour TTL).
+    In-memory prefix/trigram index when built; otherwise ILIKE queries, Redis cached (1 hour TTL).
     """
+    index = get_autocomplete_index()
+    if index is not None:
+        return index.search(query, limit)
+
     cache_key = f"autocomplete:{query.lower().strip()}:{limit}"
 
     # Check Redis cache
@@ -124,9 +136,14 @@ def get_movies(
     sort_order: str = Query("desc", pattern="^(asc|desc)$"),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None, description="Keyset cursor (next_cursor of the previous page); page is ignored"),
     db: Session = Depends(get_db)
 ):
-    """Get movies with search, filter and pagination"""
+    """Get movies with search, filter and pagination.
+
+    page 모드는 OFFSET, cursor 모드는 (정렬 키, id) keyset으로 다음 페이지를 조회한다.
+    응답의 next_cursor는 두 모드 모두에서 반환되며, total은 필터 조합별로 캐시된다.
+    """
     q = db.query(Movie).options(selectinload(Movie.genres))
 
     # Search by title, cast, or director
@@ -190,9 +207,9 @@ def get_movies(
             or_(Movie.certification.in_(allowed), Movie.certification.is_(None))
         )
 
-    # Filter by country (production_countries_ko ILIKE — 한글 국가명)
+    # Filter by country (movie_countries 조인 — 한글/영문 국가명)
     if country:
-        q = q.filter(Movie.production_countries_ko.ilike(f"%{country}%"))
+        q = q.filter(_country_condition(db, country))
 
     # Filter by keyword (M:M JOIN)
     if keyword:
@@ -205,25 +222,41 @@ def get_movies(
         )
         q = q.filter(Movie.id.in_(select(keyword_movie_ids)))
 
-    # Get total count
-    total = q.count()
+    # Get total count (filter tuple cached — 정렬/페이지와 무관)
+    filters = {
+        "query": query, "genres": ",".join(sorted(g.strip() for g in genres.split(","))) if genres else None,
+        "person": person, "country": country, "keyword": keyword,
+        "min_rating": min_rating, "max_rating": max_rating,
+        "year_from": year_from, "year_to": year_to, "age_rating": age_rating,
+    }
+    total = get_cached_count(filters, q.count)
 
-    # Sort — MBTI/weather override sort_by (validated by pattern)
+    # Sort — MBTI/weather override sort_by (validated by pattern). id로 순서를 고정한다.
+    # 점수 식은 표현식 인덱스(ix_movies_mbti_*, ix_movies_weather_*)와 같은 형태로 만든다.
     if mbti:
-        score_col = cast(Movie.mbti_scores[mbti].astext, Float)
-        q = q.order_by(score_col.desc().nulls_last())
+        sort_key, sort_expr, descending = f"mbti:{mbti}", score_expr("mbti_scores", mbti), True
     elif weather:
-        score_col = cast(Movie.weather_scores[weather].astext, Float)
-        q = q.order_by(score_col.desc().nulls_last())
+        sort_key, sort_expr, descending = f"weather:{weather}", score_expr("weather_scores", weather), True
     else:
-        sort_column = getattr(Movie, sort_by)
-        if sort_order == "desc":
-            sort_column = sort_column.desc()
-        q = q.order_by(sort_column.nulls_last())
+        sort_key, sort_expr, descending = f"{sort_by}:{sort_order}", getattr(Movie, sort_by), sort_order == "desc"
 
-    # Paginate
-    offset = (page - 1) * page_size
-    movies = q.offset(offset).limit(page_size).all()
+    if cursor:
+        q = q.filter(_keyset_condition(sort_expr, descending, _decode_cursor(cursor, sort_key)))
+    q = q.order_by(
+        (sort_expr.desc() if descending else sort_expr.asc()).nulls_last(),
+        Movie.id.desc() if descending else Movie.id.asc(),
+    )
+
+    # Paginate (page_size + 1로 다음 페이지 존재 여부 확인)
+    if not cursor:
+        q = q.offset((page - 1) * page_size)
+    rows = q.limit(page_size + 1).all()
+    movies = rows[:page_size]
+
+    next_cursor = None
+    if len(rows) > page_size:
+        last = movies[-1]
+        next_cursor = _encode_cursor(sort_key, _sort_value(last, sort_by, mbti, weather), last.id)
 
     # Convert to response
     items = [MovieListItem.from_orm_with_genres(m) for m in movies]
@@ -234,10 +267,68 @@ def get_movies(
         total=total,
         page=page,
         page_size=page_size,
-        total_pages=total_pages
+        total_pages=total_pages,
+        next_cursor=next_cursor,
+    )
+
+
+def _country_condition(db: Session, country: str):
+    """국가명 → movie_countries (country_id, movie_id) 인덱스 조회 조건.
+
+    countries에 없는 이름(name_ko 백필 전 포함)은 기존 production_countries_ko 부분 일치로 폴백.
+    """
+    country = country.strip()
+    country_ids = [
+        cid for (cid,) in db.query(Country.id).filter(or_(Country.name_ko == country, Country.name == country))
+    ]
+    if not country_ids:
+        return Movie.production_countries_ko.ilike(f"%{country}%")
+    return Movie.id.in_(
+        select(movie_countries.c.movie_id).where(movie_countries.c.country_id.in_(country_ids))
     )
 
 
+def _sort_value(movie: Movie, sort_by: str, mbti: str | None, weather: str | None) -> float | str | None:
+    """정렬 키 값 (cursor 인코딩용, JSON 직렬화 가능)."""
+    if mbti or weather:
+        scores = (movie.mbti_scores if mbti else movie.weather_scores) or {}
+        value = scores.get(mbti or weather)
+        return float(value) if value is not None else None
+    value = getattr(movie, sort_by)
+    if value is None:
+        return None
+    return value.isoformat() if sort_by == "release_date" else float(value)
+
+
+def _encode_cursor(sort_key: str, value: float | str | None, movie_id: int) -> str:
+    raw = json.dumps({"s": sort_key, "v": value, "id": movie_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str, sort_key: str) -> tuple[float | str | date | None, int]:
+    """cursor → (정렬 값, id). 형식이 잘못됐거나 다른 정렬의 cursor면 400."""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if payload["s"] != sort_key:
+            raise ValueError("sort mismatch")
+        value = payload["v"]
+        if value is not None and sort_key.startswith("release_date"):
+            value = date.fromisoformat(value)
+        return value, int(payload["id"])
+    except (ValueError, KeyError, TypeError) as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor") from e
+
+
+def _keyset_condition(sort_expr, descending: bool, position: tuple):
+    """(sort NULLS LAST, id) 순서에서 position 다음 행들의 조건."""
+    value, last_id = position
+    id_after = Movie.id < last_id if descending else Movie.id > last_id
+    if value is None:  # 이미 NULL 구간 → id로만 진행
+        return and_(sort_expr.is_(None), id_after)
+    value_after = sort_expr < value if descending else sort_expr > value
+    return or_(value_after, and_(sort_expr == value, id_after), sort_expr.is_(None))
+
+
 @router.get("/genres", response_model=list[GenreResponse])
 @limiter.limit("60/minute")
 def get_genres(request: Request, db: Session = Depends(get_db)):
@@ -246,50 +337,83 @@ def get_genres(request: Request, db: Session = Depends(get_db)):
     return genres
 
 
+ONBOARDING_COUNT = 40
+ONBOARDING_POOL_PER_GENRE = 60  # 장르별 후보 상한 (인기도순)
+
+
 @router.get("/onboarding", response_model=list[MovieListItem])
 @limiter.limit("10/minute")
 def get_onboarding_movies(
     request: Request,
+    seed: int | None = Query(None, description="샘플링 RNG 시드 (같은 시드 → 같은 목록)"),
     db: Session = Depends(get_db),
 ) -> list[MovieListItem]:
     """
     Get movies for onboarding: 40 popular, high-quality movies
     distributed across genres for new users to rate.
+
+    후보 풀은 섹션 캐시(로컬 + Redis, ONBOARDING_POOL_CACHE_TTL)에서 한 번 읽고,
+    장르별 샘플링은 Python RNG로 한다 (장르마다 ORDER BY random() 쿼리 없음).
     """
-    genres = db.query(Genre).all()
-    genre_names = [g.name for g in genres]
+    pool = get_section_pool(
+        "onboarding", "all", lambda: _load_onboarding_pool(db), ttl=settings.ONBOARDING_POOL_CACHE_TTL,
+    )
+    return sample_onboarding(pool, random_mod.Random(seed))
 
-    all_movies: list[Movie] = []
-    seen_ids: set[int] = set()
-    per_genre = max(4, 40 // len(genre_names) + 1)
 
-    for genre_name in genre_names:
-        movies = (
-            db.query(Movie)
-            .options(selectinload(Movie.genres))
-            .join(Movie.genres)
-            .filter(
-                Genre.name == genre_name,
-                Movie.weighted_score >= 7.0,
-                Movie.vote_count >= 500,
-                extract("year", Movie.release_date) >= 2000,
-                Movie.poster_path.isnot(None),
-            )
-            .order_by(func.random())
-            .limit(per_genre)
-            .all()
+def _load_onboarding_pool(db: Session) -> list[MovieListItem]:
+    """온보딩 후보: 고품질 2000년 이후 영화를 인기도순으로, 장르별 최대 ONBOARDING_POOL_PER_GENRE편."""
+    movies = (
+        db.query(Movie)
+        .options(selectinload(Movie.genres))
+        .filter(
+            Movie.weighted_score >= 7.0,
+            Movie.vote_count >= 500,
+            extract("year", Movie.release_date) >= 2000,
+            Movie.poster_path.isnot(None),
         )
-        for m in movies:
-            if m.id not in seen_ids:
-                seen_ids.add(m.id)
-                all_movies.append(m)
+        .order_by(Movie.popularity.desc(), Movie.id)
+        .all()
+    )
+    per_genre: dict[str, int] = {}
+    pool: list[MovieListItem] = []
+    for m in movies:
+        names = [g.name for g in m.genres]
+        if not any(per_genre.get(name, 0) < ONBOARDING_POOL_PER_GENRE for name in names):
+            continue
+        for name in names:
+            per_genre[name] = per_genre.get(name, 0) + 1
+        pool.append(MovieListItem.from_orm_with_genres(m))
+    return pool
+
+
+def sample_onboarding(
+    pool: list[MovieListItem], rng: random_mod.Random, count: int = ONBOARDING_COUNT,
+) -> list[MovieListItem]:
+    """장르마다 per_genre편씩 무작위 선택 → 중복 제거 → 셔플 후 count편. 풀은 변경하지 않는다."""
+    by_genre: dict[str, list[MovieListItem]] = {}
+    for item in pool:
+        for name in item.genres:
+            by_genre.setdefault(name, []).append(item)
+    if not by_genre:
+        return []
+
+    per_genre = max(4, count // len(by_genre) + 1)
+    selected: dict[int, MovieListItem] = {}
+    for name in sorted(by_genre):  # 시드 재현성을 위해 장르 순서 고정
+        items = by_genre[name]
+        for item in rng.sample(items, min(per_genre, len(items))):
+            selected.setdefault(item.id, item)
 
-    random_mod.shuffle(all_movies)
-    selected = all_movies[:40]
-    return [MovieListItem.from_orm_with_genres(m) for m in selected]
+    picked = list(selected.values())
+    rng.shuffle(picked)
+    return picked[:count]
 
 
 SEMANTIC_RESULT_CACHE_TTL = 1800  # 30분
+LEXICAL_TOP_K = 100  # BM25 후보 수 (벡터 후보 300과 RRF 결합)
+RRF_K = 60
+LEXICAL_ONLY_SEMANTIC_SCORE = 0.0  # 벡터 후보에 없는 BM25 결과의 semantic_score (키워드 폴백과 동일)
 
 
 def _calculate_relevance(semantic_score: float, movie: Movie) -> float:
@@ -310,9 +434,12 @@ def _calculate_relevance(semantic_score: float, movie: Movie) -> float:
 
 def _get_match_reason(
     semantic_score: float, popularity_score: float, quality_score: float,
+    keyword_match: bool = False,
 ) -> str:
-    """추천 이유 태그 생성."""
+    """추천 이유 태그 생성 (semantic_score는 코사인 유사도)."""
     reasons: list[str] = []
+    if keyword_match:
+        reasons.append("키워드 일치")
     if semantic_score >= 0.45:
         reasons.append("분위기 일치")
     if quality_score >= 0.75:
@@ -399,12 +526,16 @@ async def semantic_search(
     # 4. 벡터 유사도 검색 (Top 300 — 재랭킹용 넓은 후보)
     t_search = time.time()
     candidates = search_similar(embedding, top_k=300)
+    lexical = get_lexical_index()
+    lexical_hits = lexical.search(q, top_k=LEXICAL_TOP_K) if lexical else []
     t_search_done = time.time()
     if not candidates:
         return _keyword_fallback(q, limit, t_start, db)
 
-    candidate_ids = [mid for mid, _ in candidates]
+    # score_map은 벡터 후보의 코사인 유사도 그대로 — 응답 semantic_score/match_reason에 쓴다
     score_map = {mid: score for mid, score in candidates}
+    lexical_ids = [mid for mid, _ in lexical_hits]
+    candidate_ids = [mid for mid, _ in candidates] + [mid for mid in lexical_ids if mid not in score_map]
 
     # 5. DB에서 후보 영화 조회
     t_db = time.time()
@@ -416,7 +547,7 @@ async def semantic_search(
     )
     movie_map = {m.id: m for m in movies}
 
-    # 6. 복합 점수 재랭킹 + 품질 필터
+    # 6. 복합 점수 재랭킹 + 품질 필터 (BM25에만 걸린 영화는 벡터 유사도 LEXICAL_ONLY_SEMANTIC_SCORE)
     scored_items = []
     for mid in candidate_ids:
         m = movie_map.get(mid)
@@ -426,17 +557,25 @@ async def semantic_search(
         if ws < 5.0:
             continue
 
-        sem = score_map.get(mid, 0.0)
+        sem = score_map.get(mid, LEXICAL_ONLY_SEMANTIC_SCORE)
         relevance = _calculate_relevance(sem, m)
         scored_items.append((m, sem, relevance))
 
     # relevance 기준 내림차순 정렬
     scored_items.sort(key=lambda x: x[2], reverse=True)
 
+    # 6-1. BM25 후보와 RRF 결합 — 순서(와 다양성 후처리가 고를 후보)만 결합 순위로 정하고
+    # 점수는 코사인 기반 값을 유지한다. 벡터 쪽 순위는 relevance 순.
+    if lexical_ids:
+        vector_ranking = [m.id for m, _, _ in scored_items if m.id in score_map]
+        fused = reciprocal_rank_fusion(vector_ranking, lexical_ids, k=RRF_K)
+        scored_items.sort(key=lambda x: fused.get(x[0].id, 0.0), reverse=True)
+
     # 장르 다양성 후처리: 같은 장르 최대 SEMANTIC_GENRE_MAX편
     if DIVERSITY_ENABLED:
         scored_items = _diversify_semantic(scored_items, limit, SEMANTIC_GENRE_MAX)
 
+    lexical_set = set(lexical_ids)
     results = []
     for m, sem, relevance in scored_items[:limit]:
         ws = m.weighted_score or 0.0
@@ -455,7 +594,7 @@ async def semantic_search(
             "genres": genres,
             "semantic_score": round(sem, 4),
             "relevance_score": round(relevance, 4),
-            "match_reason": _get_match_reason(sem, pop, qual),
+            "match_reason": _get_match_reason(sem, pop, qual, keyword_match=m.id in lexical_set),
         })
 
     t_db_done = time.time()
@@ -491,20 +630,29 @@ async def semantic_search(
 def _keyword_fallback(
     query: str, limit: int, t_start: float, db: Session,
 ) -> dict:
-    """시맨틱 검색 불가 시 기존 키워드 검색으로 폴백."""
-    movies = (
-        db.query(Movie)
-        .options(selectinload(Movie.genres))
-        .filter(
-            or_(
-                Movie.title.ilike(f"%{query}%"),
-                Movie.title_ko.ilike(f"%{query}%"),
+    """시맨틱 검색 불가 시 키워드 검색으로 폴백 (BM25 역색인, 없으면 ILIKE)."""
+    lexical = get_lexical_index()
+    if lexical is not None:
+        hit_ids = [mid for mid, _ in lexical.search(query, top_k=limit)]
+        movie_map = {
+            m.id: m
+            for m in db.query(Movie).options(selectinload(Movie.genres)).filter(Movie.id.in_(hit_ids)).all()
+        } if hit_ids else {}
+        movies = [movie_map[mid] for mid in hit_ids if mid in movie_map]
+    else:
+        movies = (
+            db.query(Movie)
+            .options(selectinload(Movie.genres))
+            .filter(
+                or_(
+                    Movie.title.ilike(f"%{query}%"),
+                    Movie.title_ko.ilike(f"%{query}%"),
+                )
             )
+            .order_by(Movie.popularity.desc())
+            .limit(limit)
+            .all()
         )
-        .order_by(Movie.popularity.desc())
-        .limit(limit)
-        .all()
-    )
 
     results = []
     for m in movies:
@@ -563,7 +711,7 @@ def get_similar_movies(
     limit: int = Query(10, ge=1, le=50),
     db: Session = Depends(get_db)
 ):
-    """Get similar movies"""
+    """Get similar movies (유사도 순)"""
     movie_exists = db.query(Movie.id).filter(Movie.id == movie_id).first()
     if not movie_exists:
         raise HTTPException(
@@ -571,9 +719,11 @@ def get_similar_movies(
             detail="Movie not found"
         )
 
+    # (movie_id, rank) 커버링 인덱스 — 유사도 순 Top-K를 인덱스만으로 읽는다
     similar_ids_rows = (
         db.query(similar_movies.c.similar_movie_id)
         .filter(similar_movies.c.movie_id == movie_id)
+        .order_by(similar_movies.c.rank)
         .limit(limit)
         .all()
     )
@@ -5,10 +5,12 @@ Rating API endpoints
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy.orm import Session
 
+from app.api.v1.recommendation_cf import invalidate_user_vector
 from app.core.deps import get_current_user, get_db
 from app.core.rate_limit import limiter
 from app.models import Movie, Rating, User
 from app.schemas import MovieListItem, RatingCreate, RatingResponse, RatingUpdate, RatingWithMovie
+from app.services.user_profile_cache import invalidate_user_profile
 
 router = APIRouter(prefix="/ratings", tags=["Ratings"])
 
@@ -71,6 +73,8 @@ def create_or_update_rating(
         existing.score = rating_data.score
         existing.weather_context = rating_data.weather_context
         db.commit()
+        invalidate_user_vector(current_user.id)
+        invalidate_user_profile(current_user.id)
         db.refresh(existing)
         return existing
     else:
@@ -83,6 +87,8 @@ def create_or_update_rating(
         )
         db.add(rating)
         db.commit()
+        invalidate_user_vector(current_user.id)
+        invalidate_user_profile(current_user.id)
         db.refresh(rating)
         return rating
 
@@ -136,6 +142,8 @@ def update_rating(
         rating.weather_context = rating_data.weather_context
 
     db.commit()
+    invalidate_user_vector(current_user.id)
+    invalidate_user_profile(current_user.id)
     db.refresh(rating)
 
     return rating
@@ -163,3 +171,5 @@ def delete_rating(
 
     db.delete(rating)
     db.commit()
+    invalidate_user_vector(current_user.id)
+    invalidate_user_profile(current_user.id)
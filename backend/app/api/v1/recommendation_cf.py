@@ -6,35 +6,106 @@
 
 RecFlix 사용자는 MovieLens에 없으므로,
 CF 점수 = global_mean + item_bias (아이템 품질 추정).
+
+평점이 충분한 RecFlix 사용자는 fold-in으로 사용자 벡터를 구해 개인화한다:
+  b_u = Σ(r - μ - b_i) / (n + λ_b),  p_u = (QᵀQ + λ·n·I)⁻¹ Qᵀ(r - μ - b_i - b_u)
+  CF 점수 = μ + b_u + b_i + q_i·p_u
+사용자 벡터는 프로세스 내 캐시(TTL)에 보관하고 평점 변경 시 무효화한다.
+
+서빙용 아티팩트는 scripts/train_cf_model.py가 내보내는 .npy 디렉토리(CF_DIR)이며
+memory-map으로 로드한다. 없으면 기존 svd_model.pkl에서 아이템 정보만 추출한다.
 """
 
+import json
 import logging
 import pickle
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
 
 import numpy as np
+from sqlalchemy.orm import Session
+
+from app.models import Rating
 
 logger = logging.getLogger(__name__)
 
 MODEL_PATH = Path(__file__).parent.parent.parent.parent / "data" / "movielens" / "svd_model.pkl"
+CF_DIR = Path(__file__).parent.parent.parent.parent / "data" / "movielens" / "cf"
+
+CF_MIN_SCORE = 0.5
+CF_MAX_SCORE = 5.0
+
+# Fold-in
+FOLD_IN_MIN_RATINGS = 3      # 이보다 적으면 아이템 품질 점수로 폴백
+FOLD_IN_FACTOR_REG = 0.1     # λ (평점 수에 비례: λ·n)
+FOLD_IN_BIAS_REG = 5.0       # λ_b (사용자 bias 수축)
+USER_VECTOR_TTL = 600.0      # 다른 워커의 평점 변경 반영 상한 (초)
+USER_VECTOR_CACHE_SIZE = 10000
 
 _cf_data: dict | None = None
 
+# user_id → (만료 시각(monotonic), (b_u, p_u) 또는 None)
+_user_vectors: OrderedDict[int, tuple[float, tuple[float, np.ndarray] | None]] = OrderedDict()
+_user_vectors_lock = threading.Lock()
+
+
+def _load_npy(cf_dir: Path) -> dict:
+    """내보낸 .npy 아티팩트 로드 (item_factors는 memory-map)."""
+    meta = json.loads((cf_dir / "meta.json").read_text(encoding="utf-8"))
+    return {
+        "global_mean": float(meta["global_mean"]),
+        "item_ids": np.load(cf_dir / "item_ids.npy"),
+        "item_bias": np.load(cf_dir / "item_bias.npy", mmap_mode="r"),
+        "item_factors": np.load(cf_dir / "item_factors.npy", mmap_mode="r"),
+    }
+
+
+def _load_pickle(model_path: Path) -> dict:
+    """레거시 pickle 로드 — 서빙에 필요한 아이템 정보만 남긴다."""
+    with open(model_path, "rb") as f:
+        raw = pickle.load(f)
+    item_map: dict = raw["item_map"]
+    item_ids = np.fromiter(item_map.keys(), dtype=np.int64, count=len(item_map))
+    rows = np.fromiter(item_map.values(), dtype=np.int64, count=len(item_map))
+    return {
+        "global_mean": float(raw["global_mean"]),
+        "item_ids": item_ids[np.argsort(rows)],
+        "item_bias": np.asarray(raw["item_bias"], dtype=np.float64),
+        "item_factors": np.asarray(raw["item_factors"], dtype=np.float32),
+    }
+
+
+def _index(data: dict) -> dict:
+    """movie_id → 행 dense 배열과 아이템별 CF 점수를 미리 계산."""
+    item_ids = np.asarray(data["item_ids"], dtype=np.int64)
+    row_of = np.full(int(item_ids.max()) + 1 if len(item_ids) else 0, -1, dtype=np.int32)
+    row_of[item_ids] = np.arange(len(item_ids), dtype=np.int32)
+    item_score = np.clip(
+        data["global_mean"] + np.asarray(data["item_bias"], dtype=np.float64),
+        CF_MIN_SCORE, CF_MAX_SCORE,
+    )
+    return {**data, "item_ids": item_ids, "row_of": row_of, "item_score": item_score}
+
 
 def _load_model() -> dict | None:
     """SVD 모델 데이터 로드 (lazy singleton)"""
     global _cf_data
     if _cf_data is not None:
         return _cf_data
-    if not MODEL_PATH.exists():
-        logger.warning("CF 모델 없음: %s", MODEL_PATH)
-        return None
     try:
-        with open(MODEL_PATH, "rb") as f:
-            _cf_data = pickle.load(f)
+        if (CF_DIR / "meta.json").exists():
+            data = _load_npy(CF_DIR)
+        elif MODEL_PATH.exists():
+            data = _load_pickle(MODEL_PATH)
+        else:
+            logger.warning("CF 모델 없음: %s", CF_DIR)
+            return None
+        _cf_data = _index(data)
         logger.info(
             "CF 모델 로드: items=%d, global_mean=%.4f",
-            len(_cf_data["item_map"]),
+            len(_cf_data["item_ids"]),
             _cf_data["global_mean"],
         )
         return _cf_data
@@ -43,6 +114,39 @@ def _load_model() -> dict | None:
         return None
 
 
+def _rows(data: dict, movie_ids: np.ndarray) -> np.ndarray:
+    ids = np.asarray(movie_ids, dtype=np.int64)
+    row_of: np.ndarray = data["row_of"]
+    in_range = (ids >= 0) & (ids < len(row_of))
+    rows = np.full(len(ids), -1, dtype=np.int64)
+    rows[in_range] = row_of[ids[in_range]]
+    return rows
+
+
+def cf_rows(movie_ids: np.ndarray) -> np.ndarray | None:
+    """movie_id 배열 → item_factors 행 인덱스 배열 (매핑에 없으면 -1). 모델이 없으면 None."""
+    data = _load_model()
+    if data is None:
+        return None
+    return _rows(data, movie_ids)
+
+
+def predict_cf_scores(movie_ids: np.ndarray) -> np.ndarray | None:
+    """
+    영화 배열의 CF 품질 점수 일괄 예측 (0.5~5.0 범위, float64).
+
+    매핑에 없는 영화는 NaN. 모델이 없으면 None.
+    """
+    data = _load_model()
+    if data is None:
+        return None
+    rows = _rows(data, movie_ids)
+    scores = np.full(len(rows), np.nan, dtype=np.float64)
+    known = rows >= 0
+    scores[known] = data["item_score"][rows[known]]
+    return scores
+
+
 def predict_cf_score(movie_id: int) -> float | None:
     """
     영화의 CF 품질 점수 예측.
@@ -51,22 +155,95 @@ def predict_cf_score(movie_id: int) -> float | None:
     global_mean + item_bias를 반환 (0.5~5.0 범위).
     모델이 없거나 해당 영화가 매핑에 없으면 None.
     """
+    scores = predict_cf_scores(np.array([movie_id], dtype=np.int64))
+    if scores is None or np.isnan(scores[0]):
+        return None
+    return float(scores[0])
+
+
+def fold_in_user(movie_ids: np.ndarray, scores: np.ndarray) -> tuple[float, np.ndarray] | None:
+    """사용자 평점 → (user_bias, user_factors). 매핑된 평점이 부족하거나 모델이 없으면 None."""
     data = _load_model()
     if data is None:
         return None
-
-    item_map: dict = data["item_map"]
-    i_idx = item_map.get(movie_id)
-    if i_idx is None:
+    rows = _rows(data, movie_ids)
+    known = rows >= 0
+    n = int(known.sum())
+    if n < FOLD_IN_MIN_RATINGS:
         return None
 
-    score = data["global_mean"] + data["item_bias"][i_idx]
-    return float(np.clip(score, 0.5, 5.0))
+    rows = rows[known]
+    q = np.asarray(data["item_factors"][rows], dtype=np.float64)  # (n, k)
+    residual = np.asarray(scores, dtype=np.float64)[known] - data["global_mean"] - data["item_bias"][rows]
+    user_bias = float(residual.sum() / (n + FOLD_IN_BIAS_REG))
+    residual -= user_bias
+
+    k = q.shape[1]
+    a = q.T @ q + FOLD_IN_FACTOR_REG * n * np.eye(k)
+    user_factors = np.linalg.solve(a, q.T @ residual)
+    return user_bias, user_factors
+
+
+def get_user_vector(db: Session, user_id: int) -> tuple[float, np.ndarray] | None:
+    """캐시된 사용자 fold-in 벡터 (미스 시 Rating 행으로 계산)."""
+    now = time.monotonic()
+    with _user_vectors_lock:
+        entry = _user_vectors.get(user_id)
+        if entry is not None and entry[0] > now:
+            _user_vectors.move_to_end(user_id)
+            return entry[1]
+
+    rows = db.query(Rating.movie_id, Rating.score).filter(Rating.user_id == user_id).all()
+    vector = None
+    if rows:
+        vector = fold_in_user(
+            np.fromiter((r[0] for r in rows), dtype=np.int64, count=len(rows)),
+            np.fromiter((r[1] for r in rows), dtype=np.float64, count=len(rows)),
+        )
+
+    with _user_vectors_lock:
+        _user_vectors[user_id] = (now + USER_VECTOR_TTL, vector)
+        _user_vectors.move_to_end(user_id)
+        while len(_user_vectors) > USER_VECTOR_CACHE_SIZE:
+            _user_vectors.popitem(last=False)
+    return vector
+
+
+def invalidate_user_vector(user_id: int) -> None:
+    """평점 생성/수정/삭제 후 호출."""
+    with _user_vectors_lock:
+        _user_vectors.pop(user_id, None)
 
 
-def normalize_cf_score(cf_score: float) -> float:
+def predict_user_cf_scores(db: Session, user_id: int | None, movie_ids: np.ndarray) -> np.ndarray | None:
+    """
+    사용자 개인화 CF 점수 일괄 예측 (0.5~5.0 범위, 매핑에 없는 영화는 NaN).
+
+    fold-in 벡터가 없으면(비로그인/평점 부족) predict_cf_scores와 같다. 모델이 없으면 None.
+    """
+    data = _load_model()
+    if data is None:
+        return None
+    vector = get_user_vector(db, user_id) if user_id is not None else None
+    if vector is None:
+        return predict_cf_scores(movie_ids)
+
+    user_bias, user_factors = vector
+    rows = _rows(data, movie_ids)
+    known = rows >= 0
+    scores = np.full(len(rows), np.nan, dtype=np.float64)
+    r = rows[known]
+    raw = (
+        data["global_mean"] + user_bias + data["item_bias"][r]
+        + np.asarray(data["item_factors"][r], dtype=np.float64) @ user_factors
+    )
+    scores[known] = np.clip(raw, CF_MIN_SCORE, CF_MAX_SCORE)
+    return scores
+
+
+def normalize_cf_score(cf_score: float | np.ndarray) -> float | np.ndarray:
     """CF 점수(0.5~5.0)를 0~1 범위로 정규화"""
-    return (cf_score - 0.5) / 4.5
+    return (cf_score - CF_MIN_SCORE) / (CF_MAX_SCORE - CF_MIN_SCORE)
 
 
 def is_cf_available() -> bool:
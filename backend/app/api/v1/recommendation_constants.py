@@ -119,6 +119,11 @@ SERENDIPITY_RATIO = 0.10         # 의외의 발견 비율
 SERENDIPITY_MIN_QUALITY = 7.0    # 의외의 발견 최소 weighted_score
 SEMANTIC_GENRE_MAX = 5           # 시맨틱 검색 같은 장르 최대 편수
 
+# === Similar-Movie Seeds (get_similar_movie_ids) ===
+SIMILAR_PER_SEED = 10            # 시드 영화당 읽는 유사 영화 Top-K (similar_movies.rank)
+SIMILAR_SEED_WEIGHT_FAVORITE = 1.0
+SIMILAR_SEED_WEIGHT_HIGH_RATING = 0.7  # 평점 4.0+ (찜과 겹치면 합산)
+
 # === Experiment Group → Algorithm Version Registry ===
 # 새 알고리즘 도입 시 이 딕셔너리만 수정하면 됨
 GROUP_ALGORITHM_MAP: dict[str, str] = {
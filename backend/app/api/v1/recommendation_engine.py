@@ -6,13 +6,20 @@ import json
 import logging
 import random
 import time
+from collections.abc import Container
 from datetime import datetime, timedelta
 
-from sqlalchemy import text
+import numpy as np
+from sqlalchemy import desc, func, select, text
 from sqlalchemy.orm import Session, selectinload
 
 from app.api.v1.diversity import apply_genre_cap, diversify_by_genre, ensure_freshness
-from app.api.v1.recommendation_cf import is_cf_available, normalize_cf_score, predict_cf_score
+from app.api.v1.recommendation_cf import (
+    is_cf_available,
+    normalize_cf_score,
+    predict_cf_scores,
+    predict_user_cf_scores,
+)
 from app.api.v1.recommendation_constants import (
     AGE_RATING_MAP,
     DIVERSITY_ENABLED,
@@ -24,6 +31,9 @@ from app.api.v1.recommendation_constants import (
     MOOD_LABELS,
     QUALITY_BOOST_MAX,
     QUALITY_BOOST_MIN,
+    SIMILAR_PER_SEED,
+    SIMILAR_SEED_WEIGHT_FAVORITE,
+    SIMILAR_SEED_WEIGHT_HIGH_RATING,
     WEATHER_LABELS,
     WEIGHT_CF,
     WEIGHT_CF_NO_MOOD,
@@ -46,8 +56,26 @@ from app.api.v1.recommendation_constants import (
     WEIGHTS_HYBRID_B,
     WEIGHTS_HYBRID_B_NO_MOOD,
 )
-from app.models import Collection, Genre, Movie, Rating, User
+from app.models import (
+    Collection,
+    Genre,
+    Movie,
+    Rating,
+    User,
+    collection_movies,
+    movie_genres,
+    similar_movies,
+)
 from app.schemas.recommendation import RecommendationTag
+from app.services.movie_feature_store import (
+    SCORE_COLUMNS,
+    MovieFeatures,
+    MovieRef,
+    RankedList,
+    get_feature_store,
+)
+from app.services.score_indexes import is_indexed_key, score_sql
+from app.services.user_profile_cache import UserProfile, get_user_profile
 
 logger = logging.getLogger(__name__)
 
@@ -130,17 +158,59 @@ def get_movies_by_score(
     Get movies sorted by a specific score with optional shuffling.
     Ensures minimum ratio of LLM-analyzed movies for quality.
     Quality filter: weighted_score >= min_weighted_score
+
+    Feature store가 있으면 (score_type, key, 등급)별 사전 정렬 리스트를 슬라이스하고,
+    없으면 JSONB ORDER BY 쿼리로 같은 형태의 리스트를 만든다.
     """
     if score_type not in _ALLOWED_SCORE_TYPES:
         logger.warning("Invalid score_type requested: %s", score_type)
         return []
 
+    ranked = None
+    store = get_feature_store(db)
+    if store is not None:
+        allowed = AGE_RATING_MAP.get(age_rating) if age_rating else None
+        ranked = store.features.ranked_list(score_type, score_key, allowed, min_weighted_score)
+    if ranked is None:
+        ranked = _query_ranked_list(db, score_type, score_key, pool_size * 2, min_weighted_score, age_rating)
+
+    selected_ids = _select_ranked_ids(ranked, pool_size, llm_min_ratio)
+    if not selected_ids:
+        return []
+
+    if shuffle and len(selected_ids) > limit:
+        picked = random.sample(selected_ids, limit)
+        random.shuffle(picked)
+    else:
+        picked = selected_ids[:limit]
+
+    movies = db.query(Movie).options(selectinload(Movie.genres)).filter(Movie.id.in_(picked)).all()
+    movie_dict = {m.id: m for m in movies}
+    return [movie_dict[mid] for mid in picked if mid in movie_dict]
+
+
+def _query_ranked_list(
+    db: Session,
+    score_type: str,
+    score_key: str,
+    pool_size: int,
+    min_weighted_score: float,
+    age_rating: str | None,
+) -> RankedList:
+    """Feature store가 없을 때의 정렬 리스트 (JSONB ORDER BY 쿼리).
+
+    점수 식은 표현식 인덱스와 같은 형태(키 리터럴, DESC NULLS LAST)라
+    인덱스를 점수순으로 읽다가 LIMIT에서 멈춘다.
+    """
+    if not is_indexed_key(score_type, score_key):
+        logger.warning("Invalid score_key requested: %s.%s", score_type, score_key)
+        return RankedList(np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64), np.empty(0, dtype=bool))
     llm_ids = get_llm_movie_ids(db)
-    extended_pool = pool_size * 2
+    score = score_sql(score_type, score_key)
 
     # Build age rating SQL clause
     age_rating_clause = ""
-    params: dict = {"score_key": score_key, "pool_size": extended_pool, "min_weighted_score": min_weighted_score}
+    params: dict = {"pool_size": pool_size, "min_weighted_score": min_weighted_score}
     if age_rating and age_rating in AGE_RATING_MAP:
         allowed = AGE_RATING_MAP[age_rating]
         placeholders = ", ".join(f":cert_{i}" for i in range(len(allowed)))
@@ -149,54 +219,78 @@ def get_movies_by_score(
             params[f"cert_{i}"] = cert
 
     result = db.execute(text(f"""
-        SELECT id, ({score_type}->>:score_key)::float as score FROM movies
+        SELECT id, {score} as score FROM movies
         WHERE COALESCE(weighted_score, 0) >= :min_weighted_score
-        AND {score_type} IS NOT NULL
-        AND {score_type}->>:score_key IS NOT NULL
+        AND {score} IS NOT NULL
         {age_rating_clause}
-        ORDER BY ({score_type}->>:score_key)::float DESC, weighted_score DESC
+        ORDER BY {score} DESC NULLS LAST, weighted_score DESC
         LIMIT :pool_size
     """), params).fetchall()
 
-    if not result:
-        return []
+    ids = np.array([int(row[0]) for row in result], dtype=np.int64)
+    scores = np.array([float(row[1] or 0.0) for row in result], dtype=np.float64)
+    is_llm = np.array([int(row[0]) in llm_ids for row in result], dtype=bool)
+    return RankedList(ids, scores, is_llm)
 
-    score_lookup = {int(row[0]): float(row[1] or 0.0) for row in result}
 
-    # Separate LLM and keyword movies
-    llm_movies = [(int(row[0]), float(row[1] or 0.0)) for row in result if row[0] in llm_ids]
-    kw_movies = [(int(row[0]), float(row[1] or 0.0)) for row in result if row[0] not in llm_ids]
+def _select_ranked_ids(ranked: RankedList, pool_size: int, llm_min_ratio: float) -> list[int]:
+    """정렬 리스트 상위 pool_size*2에서 LLM 최소 비율을 보장하며 pool_size편 선택 (점수순)."""
+    extended_pool = pool_size * 2
+    scores = ranked.scores[:extended_pool]
+    is_llm = ranked.is_llm[:extended_pool]
 
-    # Calculate minimum LLM count needed
-    min_llm_count = int(pool_size * llm_min_ratio)
+    # Separate LLM and keyword movies
+    llm_idx = np.flatnonzero(is_llm)
+    kw_idx = np.flatnonzero(~is_llm)
 
     # Build final selection with LLM guarantee
-    selected_ids: list[int] = []
-
-    llm_to_take = min(min_llm_count, len(llm_movies))
-    selected_ids.extend([m[0] for m in llm_movies[:llm_to_take]])
-
-    remaining = pool_size - len(selected_ids)
-    all_remaining = [(m[0], m[1]) for m in llm_movies[llm_to_take:]] + kw_movies
-    all_remaining.sort(key=lambda x: x[1], reverse=True)
-    selected_ids.extend([m[0] for m in all_remaining[:remaining]])
-
-    if not selected_ids:
-        return []
-
-    movies = db.query(Movie).options(selectinload(Movie.genres)).filter(Movie.id.in_(selected_ids)).all()
-    movie_dict = {m.id: m for m in movies}
-
-    # Keep SQL score ordering stable for all score types.
-    selected_ids.sort(key=lambda mid: score_lookup.get(mid, 0.0), reverse=True)
-    ordered_movies = [movie_dict[mid] for mid in selected_ids if mid in movie_dict]
-
-    if shuffle and len(ordered_movies) > limit:
-        selected = random.sample(ordered_movies, limit)
-        random.shuffle(selected)
-        return selected
-
-    return ordered_movies[:limit]
+    llm_to_take = min(int(pool_size * llm_min_ratio), len(llm_idx))
+    remaining = np.concatenate([llm_idx[llm_to_take:], kw_idx])
+    remaining = remaining[np.argsort(-scores[remaining], kind="stable")][:pool_size - llm_to_take]
+    selected = np.concatenate([llm_idx[:llm_to_take], remaining])
+
+    # Keep score ordering stable for all score types.
+    selected = selected[np.argsort(-scores[selected], kind="stable")]
+    return ranked.ids[selected].tolist()
+
+
+def warm_ranked_lists() -> int:
+    """모든 (score_type, key, 등급) 정렬 리스트를 미리 계산 (lifespan에서 호출). 생성 수 반환."""
+    store = get_feature_store()
+    if store is None:
+        return 0
+    feats = store.features
+    buckets = [None, *AGE_RATING_MAP.values()]
+    count = 0
+    for score_type, keys in SCORE_COLUMNS.items():
+        for key in keys:
+            for allowed in buckets:
+                if feats.ranked_list(score_type, key, allowed) is not None:
+                    count += 1
+    return count
+
+
+def favorite_movie_ids(db: Session, user_id: int) -> set[int]:
+    """찜 컬렉션의 영화 id (collection_movies 조인 한 번, 영화 행은 읽지 않는다)"""
+    rows = db.query(collection_movies.c.movie_id).join(
+        Collection, Collection.id == collection_movies.c.collection_id,
+    ).filter(
+        Collection.user_id == user_id,
+        Collection.name == "찜한 영화",
+    )
+    return {movie_id for (movie_id,) in rows}
+
+
+def genre_counts_for(db: Session, movie_ids: set[int]) -> dict[str, int]:
+    """영화들의 장르별 편수 (movie_genres GROUP BY 한 번)"""
+    if not movie_ids:
+        return {}
+    rows = db.query(Genre.name, func.count()).join(
+        movie_genres, movie_genres.c.genre_id == Genre.id,
+    ).filter(
+        movie_genres.c.movie_id.in_(list(movie_ids)),
+    ).group_by(Genre.name)
+    return dict(rows.all())
 
 
 def get_user_preferences(
@@ -206,43 +300,24 @@ def get_user_preferences(
     """
     Get user preferences from favorites and ratings.
     Returns: (favorited_ids, genre_counts, highly_rated_movie_ids)
-    """
-    favorited_ids: set = set()
-    genre_counts: dict[str, int] = {}
-    highly_rated_ids: set = set()
 
+    장르 편수는 집계 쿼리로 구한다 — 찜/평점 수와 관계없이 쿼리 수가 일정하다.
+    """
     # Get favorites
-    favorites = db.query(Collection).filter(
-        Collection.user_id == user.id,
-        Collection.name == "찜한 영화"
-    ).first()
-
-    if favorites and favorites.movies:
-        for movie in favorites.movies:
-            favorited_ids.add(movie.id)
-            for genre in movie.genres:
-                genre_name = genre.name if hasattr(genre, 'name') else str(genre)
-                genre_counts[genre_name] = genre_counts.get(genre_name, 0) + 1
+    favorited_ids = favorite_movie_ids(db, user.id)
+    genre_counts = genre_counts_for(db, favorited_ids)
 
     # Get highly rated movies (score >= 4.0) from last 90 days
     recent_date = datetime.utcnow() - timedelta(days=90)
-    high_ratings = db.query(Rating).filter(
+    high_ratings = db.query(Rating.movie_id).filter(
         Rating.user_id == user.id,
         Rating.score >= 4.0,
         Rating.created_at >= recent_date
     ).all()
+    highly_rated_ids = {movie_id for (movie_id,) in high_ratings}
 
-    highly_rated_movie_ids = [r.movie_id for r in high_ratings]
-    highly_rated_ids = set(highly_rated_movie_ids)
-
-    if highly_rated_movie_ids:
-        rated_movies = db.query(Movie).options(selectinload(Movie.genres)).filter(
-            Movie.id.in_(highly_rated_movie_ids)
-        ).all()
-        for movie in rated_movies:
-            for genre in movie.genres:
-                genre_name = genre.name if hasattr(genre, 'name') else str(genre)
-                genre_counts[genre_name] = genre_counts.get(genre_name, 0) + 2  # Double weight
+    for genre_name, count in genre_counts_for(db, highly_rated_ids).items():
+        genre_counts[genre_name] = genre_counts.get(genre_name, 0) + 2 * count  # Double weight
 
     # Cold-start fallback: use preferred_genres when interactions are sparse
     total_interactions = len(favorited_ids) + len(highly_rated_ids)
@@ -263,158 +338,359 @@ def get_user_preferences(
     return favorited_ids, genre_counts, highly_rated_ids
 
 
-def get_similar_movie_ids(db: Session, movie_ids: set, limit: int = 50) -> set:
-    """Get IDs of movies similar to the given movie IDs"""
+def similar_seed_weights(favorited_ids: set[int], highly_rated_ids: set[int]) -> dict[int, float]:
+    """유사 영화 시드 가중치: 찜 + 고평점 (둘 다면 합산)"""
+    weights = dict.fromkeys(favorited_ids, SIMILAR_SEED_WEIGHT_FAVORITE)
+    for movie_id in highly_rated_ids:
+        weights[movie_id] = weights.get(movie_id, 0.0) + SIMILAR_SEED_WEIGHT_HIGH_RATING
+    return weights
+
+
+def get_similar_movie_ids(
+    db: Session,
+    movie_ids: set[int] | dict[int, float],
+    limit: int = 50,
+    per_seed: int = SIMILAR_PER_SEED,
+) -> dict[int, float]:
+    """시드 영화들의 유사 영화 가중 합집합 → {similar_id: 점수} (점수 내림차순 상위 limit편).
+
+    movie_ids가 dict면 {시드 id: 가중치}, set이면 모두 1.0.
+    시드마다 rank <= per_seed 범위만 (movie_id, rank) 커버링 인덱스로 읽고,
+    여러 시드에 걸친 영화는 가중치 × 유사도를 합산한다.
+    score가 아직 없는 행(재계산 전 데이터)은 1.0으로 센다.
+    """
     if not movie_ids:
-        return set()
+        return {}
+    weights = movie_ids if isinstance(movie_ids, dict) else dict.fromkeys(movie_ids, 1.0)
 
-    result = db.execute(
-        text("""
-            SELECT DISTINCT similar_movie_id
-            FROM similar_movies
-            WHERE movie_id = ANY(:movie_ids)
-            LIMIT :limit
-        """),
-        {"movie_ids": list(movie_ids), "limit": limit}
-    ).fetchall()
+    rows = db.execute(
+        select(similar_movies.c.movie_id, similar_movies.c.similar_movie_id, similar_movies.c.score)
+        .where(similar_movies.c.movie_id.in_(list(weights)), similar_movies.c.rank <= per_seed)
+    )
+    totals: dict[int, float] = {}
+    for seed_id, similar_id, score in rows:
+        gain = weights[seed_id] * (1.0 if score is None else score)
+        totals[similar_id] = totals.get(similar_id, 0.0) + gain
 
-    return {row[0] for row in result}
+    top = sorted(totals.items(), key=lambda x: (-x[1], x[0]))[:limit]
+    return dict(top)
 
 
-def calculate_hybrid_scores(
+def load_user_profile(db: Session, user_id: int) -> UserProfile:
+    """사용자 선호 프로필 (캐시 경유). 미스 시 get_user_preferences + get_similar_movie_ids.
+
+    캐시 히트면 User 행도 읽지 않는다. 없는 사용자는 빈 프로필.
+    """
+    def loader() -> UserProfile:
+        user = db.get(User, user_id)
+        if user is None:
+            return UserProfile(set(), {}, set(), {})
+        favorited_ids, genre_counts, highly_rated_ids = get_user_preferences(db, user)
+        similar_ids = get_similar_movie_ids(db, similar_seed_weights(favorited_ids, highly_rated_ids))
+        return UserProfile(favorited_ids, genre_counts, highly_rated_ids, similar_ids)
+
+    return get_user_profile(user_id, loader)
+
+
+def get_hybrid_candidates(
     db: Session,
+    exclude_ids: set,
+    age_rating: str | None,
+    limit: int,
+) -> list[Movie] | list[MovieRef]:
+    """하이브리드 스코어링 후보 풀 (weighted_score >= 6.0, 인기도순 상위 limit편).
+
+    Feature store가 로드되어 있으면 배열 마스킹으로 id만 선택하고 (MovieRef),
+    ORM 하이드레이션은 calculate_hybrid_scores가 최종 top_n에 대해서만 수행한다.
+    """
+    store = get_feature_store(db)
+    if store is not None:
+        feats = store.features
+        allowed = AGE_RATING_MAP.get(age_rating) if age_rating else None
+        mask = (feats.weighted_score >= 6.0) & feats.age_rating_mask(allowed)
+        if exclude_ids:
+            mask &= ~np.isin(feats.ids, list(exclude_ids))
+        order = feats.popularity_order
+        rows = order[mask[order]][:limit]
+        return [MovieRef(int(mid)) for mid in feats.ids[rows]]
+
+    candidate_q = db.query(Movie).options(selectinload(Movie.genres)).filter(
+        Movie.weighted_score >= 6.0,
+        ~Movie.id.in_(exclude_ids)
+    )
+    candidate_q = apply_age_rating_filter(candidate_q, age_rating)
+    return candidate_q.order_by(desc(Movie.popularity), desc(Movie.weighted_score)).limit(limit).all()
+
+
+def _pack_from_store(
+    feats: MovieFeatures,
+    rows: np.ndarray,
+    mbti: str | None,
+    weather: str | None,
+    emotion_keys: list[str],
+    top_genre_names: set[str],
+) -> dict[str, np.ndarray]:
+    """Feature store 행 인덱스 → 스코어링 피처 (JSONB/장르 관계 접근 없음)."""
+    n = len(rows)
+
+    def _column(score_type: str, key: str | None) -> np.ndarray:
+        col = feats.score_column(score_type, key) if key else None
+        if col is None:
+            return np.zeros(n, dtype=np.float64)
+        return np.nan_to_num(col[rows].astype(np.float64), nan=0.0)
+
+    if emotion_keys:
+        emotion_vals = np.stack([_column("emotion_tags", k) for k in emotion_keys], axis=1)
+    else:
+        emotion_vals = np.zeros((n, 0), dtype=np.float64)
+
+    top_bits = np.uint64(feats.genre_bits(top_genre_names))
+    return {
+        "mbti": _column("mbti_scores", mbti),
+        "weather": _column("weather_scores", weather),
+        "emotion": emotion_vals,
+        "genre_match": np.bitwise_count(feats.genre_mask[rows] & top_bits).astype(np.float64),
+        "weighted_score": feats.weighted_score[rows].astype(np.float64),
+        "popularity": feats.popularity[rows].astype(np.float64),
+    }
+
+
+def _pack_candidate_features(
     movies: list[Movie],
     mbti: str | None,
     weather: str | None,
+    emotion_keys: list[str],
+    top_genre_names: set[str],
+    similar_ids: Container[int],
+    use_cf: bool,
+    db: Session | None = None,
+    user_id: int | None = None,
+) -> dict[str, np.ndarray]:
+    """후보 영화 풀 → 컬럼 단위 NumPy 피처 행렬.
+
+    Feature store에 모든 후보가 있으면 배열에서 바로 읽고, 아니면 ORM 속성에서 읽는다.
+    장르 일치 수는 영화별 장르 비트마스크 & top 장르 비트마스크의 popcount.
+    """
+    n = len(movies)
+    is_similar = np.fromiter((m.id in similar_ids for m in movies), dtype=bool, count=n)
+    cf = np.zeros(n, dtype=np.float64)
+    if use_cf:
+        movie_ids = np.fromiter((m.id for m in movies), dtype=np.int64, count=n)
+        if db is not None and user_id is not None:
+            raw_cf = predict_user_cf_scores(db, user_id, movie_ids)
+        else:
+            raw_cf = predict_cf_scores(movie_ids)
+        if raw_cf is not None:
+            cf = np.nan_to_num(normalize_cf_score(raw_cf), nan=0.0)
+
+    store = get_feature_store()
+    rows = store.features.rows([m.id for m in movies]) if store is not None else None
+    if rows is not None and (rows >= 0).all():
+        packed = _pack_from_store(store.features, rows, mbti, weather, emotion_keys, top_genre_names)
+    else:
+        packed = _pack_from_orm(movies, mbti, weather, emotion_keys, top_genre_names)
+
+    emotion_vals = packed.pop("emotion")
+
+    # Mood: 0이 아닌 emotion 값들의 평균 (해당 키가 모두 없으면 0)
+    emotion_count = np.count_nonzero(emotion_vals, axis=1)
+    mood_vals = np.divide(
+        emotion_vals.sum(axis=1), emotion_count,
+        out=np.zeros(n, dtype=np.float64), where=emotion_count > 0,
+    )
+
+    return {**packed, "mood": mood_vals, "similar": is_similar, "cf": cf}
+
+
+def _pack_from_orm(
+    movies: list[Movie],
+    mbti: str | None,
+    weather: str | None,
+    emotion_keys: list[str],
+    top_genre_names: set[str],
+) -> dict[str, np.ndarray]:
+    """ORM 객체 → 스코어링 피처 (feature store 미로드 시 폴백)."""
+    n = len(movies)
+    genre_bits = {name: 1 << i for i, name in enumerate(sorted(top_genre_names))}
+
+    mbti_vals = np.zeros(n, dtype=np.float64)
+    weather_vals = np.zeros(n, dtype=np.float64)
+    emotion_vals = np.zeros((n, len(emotion_keys)), dtype=np.float64)
+    genre_mask = np.zeros(n, dtype=np.uint8)
+    ws = np.zeros(n, dtype=np.float64)
+    popularity = np.zeros(n, dtype=np.float64)
+
+    for i, movie in enumerate(movies):
+        if mbti and movie.mbti_scores:
+            mbti_vals[i] = float(movie.mbti_scores.get(mbti, 0.0) or 0.0)
+        if weather and movie.weather_scores:
+            weather_vals[i] = float(movie.weather_scores.get(weather, 0.0) or 0.0)
+        if emotion_keys and movie.emotion_tags:
+            for j, key in enumerate(emotion_keys):
+                emotion_vals[i, j] = float(movie.emotion_tags.get(key, 0.0) or 0.0)
+        if genre_bits:
+            mask = 0
+            for g in movie.genres:
+                mask |= genre_bits.get(g.name, 0)
+            genre_mask[i] = mask
+        ws[i] = movie.weighted_score or 0.0
+        popularity[i] = movie.popularity or 0.0
+
+    return {
+        "mbti": mbti_vals,
+        "weather": weather_vals,
+        "emotion": emotion_vals,
+        "genre_match": np.bitwise_count(genre_mask).astype(np.float64),
+        "weighted_score": ws,
+        "popularity": popularity,
+    }
+
+
+def _hybrid_score_kernel(
+    features: dict[str, np.ndarray],
+    weights: tuple[float, float, float, float, float],
+) -> np.ndarray:
+    """5축 가중합 + 인기 보정 + 품질 보정 + 클리핑을 후보 풀 전체에 대해 일괄 계산."""
+    w_mbti, w_weather, w_mood, w_personal, w_cf = weights
+
+    genre_bonus = np.minimum(features["genre_match"] * 0.3, 0.9)
+    personal = genre_bonus + np.where(features["similar"], 0.4, 0.0)
+
+    hybrid = (
+        (w_mbti * features["mbti"]) +
+        (w_weather * features["weather"]) +
+        (w_mood * features["mood"]) +
+        (w_personal * personal) +
+        (w_cf * features["cf"])
+    )
+
+    # Popularity boost (small)
+    hybrid = hybrid + np.where(features["popularity"] > 100, 0.05, 0.0)
+
+    # Quality correction: continuous boost based on weighted_score (6.0~max → 0.85~1.0)
+    max_ws = 9.0
+    quality_ratio = np.clip((features["weighted_score"] - 6.0) / (max_ws - 6.0), 0.0, 1.0)
+    quality_factor = QUALITY_BOOST_MIN + (QUALITY_BOOST_MAX - QUALITY_BOOST_MIN) * quality_ratio
+    hybrid = hybrid * quality_factor
+
+    # Normalize to 0-1 range
+    return np.clip(hybrid, 0.0, 1.0)
+
+
+def _build_recommendation_tags(
+    features: dict[str, np.ndarray],
+    row: int,
+    mbti: str | None,
+    weather: str | None,
+    mood: str | None,
+) -> list[RecommendationTag]:
+    """한 행의 축별 점수 → 추천 태그 (상위 N개에 대해서만 호출)."""
+    tags: list[RecommendationTag] = []
+
+    mbti_score = float(features["mbti"][row])
+    if mbti and mbti_score > 0.5:
+        tags.append(RecommendationTag(type="mbti", label=f"#{mbti}추천", score=mbti_score))
+
+    weather_score = float(features["weather"][row])
+    if weather and weather_score > 0.5:
+        tags.append(RecommendationTag(
+            type="weather",
+            label=WEATHER_LABELS.get(weather, f"#{weather}"),
+            score=weather_score,
+        ))
+
+    mood_score = float(features["mood"][row])
+    if mood and mood_score > 0.5:
+        tags.append(RecommendationTag(
+            type="personal",
+            label=MOOD_LABELS.get(mood, f"#{mood}"),
+            score=mood_score,
+        ))
+
+    genre_match = int(features["genre_match"][row])
+    if genre_match >= 2:
+        tags.append(RecommendationTag(
+            type="personal",
+            label="#취향저격",
+            score=min(genre_match * 0.3, 0.9),
+        ))
+
+    if features["similar"][row] and genre_match < 2:
+        tags.append(RecommendationTag(type="personal", label="#비슷한영화", score=0.4))
+
+    if features["weighted_score"][row] >= 7.5:
+        tags.append(RecommendationTag(type="rating", label="#명작", score=0.2))
+
+    return tags
+
+
+def _hydrate_scored(
+    db: Session,
+    scored_movies: list[tuple],
+) -> list[tuple[Movie, float, list[RecommendationTag]]]:
+    """MovieRef 항목을 ORM 객체로 교체 (최종 노출 행만 1회 조회)."""
+    ref_ids = [m.id for m, _, _ in scored_movies if isinstance(m, MovieRef)]
+    if not ref_ids:
+        return scored_movies
+
+    movies = db.query(Movie).options(selectinload(Movie.genres)).filter(Movie.id.in_(ref_ids)).all()
+    movie_dict = {m.id: m for m in movies}
+    hydrated = []
+    for m, score, tags in scored_movies:
+        if isinstance(m, MovieRef):
+            m = movie_dict.get(m.id)
+            if m is None:
+                continue
+        hydrated.append((m, score, tags))
+    return hydrated
+
+
+def calculate_hybrid_scores(
+    db: Session,
+    movies: list[Movie] | list[MovieRef],
+    mbti: str | None,
+    weather: str | None,
     genre_counts: dict[str, int],
     favorited_ids: set,
-    similar_ids: set,
+    similar_ids: Container[int],
     mood: str | None = None,
     experiment_group: str = "control",
+    top_n: int | None = None,
+    user_id: int | None = None,
 ) -> list[tuple[Movie, float, list[RecommendationTag]]]:
     """
     Calculate hybrid scores for movies.
     Weights are determined by experiment_group (control/test_a/test_b).
     Final score is multiplied by a quality factor based on weighted_score (0.85~1.0).
+
+    Scoring runs as one batched NumPy operation over the candidate pool.
+    If top_n is given, only the first top_n rows (after diversity reordering)
+    are returned and tags are built for those rows only.
+    MovieRef candidates (from get_hybrid_candidates) are hydrated for returned rows only.
+    With user_id, the CF axis uses the user's fold-in vector (item quality otherwise).
     """
-    scored_movies: list[tuple[Movie, float, list[RecommendationTag]]] = []
+    if not movies:
+        return []
+
     top_genres = sorted(genre_counts.items(), key=lambda x: x[1], reverse=True)[:3] if genre_counts else []
     top_genre_names = {g[0] for g in top_genres}
 
     use_mood = mood is not None and mood in MOOD_EMOTION_MAPPING
-    w_mbti, w_weather, w_mood, w_personal, w_cf = get_weights_for_group(experiment_group, use_mood)
-
-    for movie in movies:
-        tags: list[RecommendationTag] = []
-        mbti_score = 0.0
-        weather_score = 0.0
-        mood_score = 0.0
-        personal_score = 0.0
-
-        # 1. MBTI Score
-        if mbti and movie.mbti_scores:
-            mbti_val = movie.mbti_scores.get(mbti, 0.0)
-            mbti_score = float(mbti_val) if mbti_val else 0.0
-            if mbti_score > 0.5:
-                tags.append(RecommendationTag(
-                    type="mbti",
-                    label=f"#{mbti}추천",
-                    score=mbti_score
-                ))
-
-        # 2. Weather Score
-        if weather and movie.weather_scores:
-            weather_val = movie.weather_scores.get(weather, 0.0)
-            weather_score = float(weather_val) if weather_val else 0.0
-            if weather_score > 0.5:
-                tags.append(RecommendationTag(
-                    type="weather",
-                    label=WEATHER_LABELS.get(weather, f"#{weather}"),
-                    score=weather_score
-                ))
-
-        # 3. Mood Score (emotion_tags 기반)
-        if use_mood and movie.emotion_tags:
-            emotion_keys = MOOD_EMOTION_MAPPING.get(mood, [])
-            if emotion_keys:
-                emotion_values = []
-                for key in emotion_keys:
-                    val = movie.emotion_tags.get(key, 0.0)
-                    if val:
-                        emotion_values.append(float(val))
-                if emotion_values:
-                    mood_score = sum(emotion_values) / len(emotion_values)
-                    if mood_score > 0.5:
-                        tags.append(RecommendationTag(
-                            type="personal",
-                            label=MOOD_LABELS.get(mood, f"#{mood}"),
-                            score=mood_score
-                        ))
-
-        # 4. Personal Score
-        movie_genre_names = {g.name for g in movie.genres}
-
-        matching_genres = movie_genre_names & top_genre_names
-        if matching_genres:
-            genre_bonus = len(matching_genres) * 0.3
-            personal_score += min(genre_bonus, 0.9)
-            if len(matching_genres) >= 2:
-                tags.append(RecommendationTag(
-                    type="personal",
-                    label="#취향저격",
-                    score=personal_score
-                ))
-
-        if movie.id in similar_ids:
-            personal_score += 0.4
-            if not any(t.label == "#취향저격" for t in tags):
-                tags.append(RecommendationTag(
-                    type="personal",
-                    label="#비슷한영화",
-                    score=0.4
-                ))
-
-        # High quality tag
-        ws = movie.weighted_score or 0.0
-        if ws >= 7.5:
-            tags.append(RecommendationTag(
-                type="rating",
-                label="#명작",
-                score=0.2
-            ))
-
-        # 5. CF Score
-        cf_score = 0.0
-        if w_cf > 0:
-            raw_cf = predict_cf_score(movie.id)
-            if raw_cf is not None:
-                cf_score = normalize_cf_score(raw_cf)
-
-        # Calculate hybrid score
-        hybrid_score = (
-            (w_mbti * mbti_score) +
-            (w_weather * weather_score) +
-            (w_mood * mood_score) +
-            (w_personal * personal_score) +
-            (w_cf * cf_score)
-        )
-
-        # Popularity boost (small)
-        if movie.popularity > 100:
-            hybrid_score += 0.05
-
-        # Quality correction: continuous boost based on weighted_score (6.0~max → 0.85~1.0)
-        max_ws = 9.0
-        quality_ratio = min(max((ws - 6.0) / (max_ws - 6.0), 0.0), 1.0)
-        quality_factor = QUALITY_BOOST_MIN + (QUALITY_BOOST_MAX - QUALITY_BOOST_MIN) * quality_ratio
-        hybrid_score *= quality_factor
-
-        # Normalize to 0-1 range
-        hybrid_score = min(max(hybrid_score, 0.0), 1.0)
-
-        scored_movies.append((movie, hybrid_score, tags))
-
-    scored_movies.sort(key=lambda x: x[1], reverse=True)
+    weights = get_weights_for_group(experiment_group, use_mood)
+    emotion_keys = MOOD_EMOTION_MAPPING.get(mood, []) if use_mood else []
+
+    features = _pack_candidate_features(
+        movies, mbti, weather, emotion_keys, top_genre_names, similar_ids,
+        use_cf=weights[4] > 0, db=db, user_id=user_id,
+    )
+    scores = _hybrid_score_kernel(features, weights)
+
+    # Stable descending sort (ties keep candidate order, same as list.sort(reverse=True))
+    order = np.argsort(-scores, kind="stable")
+    row_of = {movie.id: i for i, movie in enumerate(movies)}
+    scored_movies: list[tuple[Movie, float, list[RecommendationTag]]] = [
+        (movies[i], float(scores[i]), []) for i in order
+    ]
 
     # Diversity post-processing (does not modify scores, only reorders)
     if DIVERSITY_ENABLED:
@@ -429,4 +705,13 @@ def calculate_hybrid_scores(
             classic_ratio=FRESHNESS_CLASSIC_RATIO,
         )
 
-    return scored_movies
+    if top_n is not None:
+        scored_movies = scored_movies[:top_n]
+
+    scored_movies = _hydrate_scored(db, scored_movies)
+
+    tag_mood = mood if use_mood else None
+    return [
+        (movie, score, _build_recommendation_tags(features, row_of[movie.id], mbti, weather, tag_mood))
+        for movie, score, _ in scored_movies
+    ]
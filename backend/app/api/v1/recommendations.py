@@ -5,13 +5,14 @@ Scoring logic lives in recommendation_engine.py, constants in recommendation_con
 import hashlib
 import random
 import uuid
+from collections.abc import Callable
 
 from fastapi import APIRouter, BackgroundTasks, Depends, Query, Request
-from sqlalchemy import desc
 from sqlalchemy.orm import Session, selectinload
 
 from app.api.v1.diversity import deduplicate_section, inject_serendipity
 from app.api.v1.recommendation_constants import (
+    AGE_RATING_MAP,
     DIVERSITY_ENABLED,
     MOOD_EMOTION_MAPPING,
     MOOD_SECTION_CONFIG,
@@ -24,18 +25,22 @@ from app.api.v1.recommendation_constants import (
 from app.api.v1.recommendation_engine import (
     apply_age_rating_filter,
     calculate_hybrid_scores,
+    favorite_movie_ids,
+    genre_counts_for,
+    get_hybrid_candidates,
     get_movies_by_score,
-    get_similar_movie_ids,
-    get_user_preferences,
+    load_user_profile,
 )
 from app.api.v1.recommendation_reason import generate_reason
 from app.core.deps import get_current_user, get_current_user_optional, get_db
 from app.core.rate_limit import limiter
-from app.models import Collection, Genre, Movie, User
+from app.core.section_executor import run_section_tasks
+from app.models import Genre, Movie, User
 from app.schemas import HomeRecommendations, MovieListItem, RecommendationRow
 from app.schemas.recommendation import HybridMovieItem, HybridRecommendationRow
 from app.services.reco_logger import log_impressions
 from app.services.reranker import get_reranker
+from app.services.section_cache import get_section_pool
 from app.services.two_tower_retriever import get_retriever
 
 router = APIRouter(prefix="/recommendations", tags=["Recommendations"])
@@ -95,6 +100,72 @@ def _prepare_reranker_input(
     return result
 
 
+def _fetch_hybrid(
+    db: Session,
+    user_id: int,
+    mbti: str | None,
+    weather: str | None,
+    mood: str | None,
+    age_rating: str | None,
+) -> list[tuple[Movie, float, list]]:
+    """홈 hybrid_row 후보 (상위 40편). 컨텍스트/취향 신호가 없으면 빈 리스트.
+
+    hybrid_row는 항상 control 경로 사용 (DB 전체 스캔 → 5축 가중합산)
+    Two-Tower/LGBM 경로는 컨텍스트(날씨/기분) 변경에 둔감하므로 비활성화
+    """
+    profile = load_user_profile(db, user_id)
+    if not (mbti or weather or mood or profile.genre_counts):
+        return []
+
+    candidate_movies = get_hybrid_candidates(db, profile.favorited_ids, age_rating, limit=200)
+    scored = calculate_hybrid_scores(
+        db, candidate_movies, mbti, weather,
+        profile.genre_counts, profile.favorited_ids, profile.similar_ids, mood,
+        experiment_group="control",
+        top_n=40,
+        user_id=user_id,
+    )
+    return scored[:40]
+
+
+def _popular_pool(db: Session, age_rating: str | None) -> list[MovieListItem]:
+    """인기 영화 풀 (popularity 상위 100편, 섹션 캐시 경유)."""
+    def load() -> list[MovieListItem]:
+        popular_q = db.query(Movie).options(selectinload(Movie.genres)).filter(Movie.weighted_score >= 6.0)
+        popular_q = apply_age_rating_filter(popular_q, age_rating)
+        movies = popular_q.order_by(Movie.popularity.desc(), Movie.weighted_score.desc()).limit(100).all()
+        return [MovieListItem.from_orm_with_genres(m) for m in movies]
+    return get_section_pool("popular", _age_bucket(age_rating), load)
+
+
+def _korean_popular_pool(db: Session, age_rating: str | None) -> list[MovieListItem]:
+    """한국 인기 영화 풀 (popularity 상위 100편, 섹션 캐시 경유)."""
+    def load() -> list[MovieListItem]:
+        # is_korean 부분 인덱스(ix_movies_korean_popularity)를 인기도순으로 읽는다
+        korean_q = db.query(Movie).options(selectinload(Movie.genres)).filter(Movie.is_korean)
+        korean_q = apply_age_rating_filter(korean_q, age_rating)
+        movies = korean_q.order_by(Movie.popularity.desc(), Movie.vote_average.desc()).limit(100).all()
+        return [MovieListItem.from_orm_with_genres(m) for m in movies]
+    return get_section_pool("korean_popular", _age_bucket(age_rating), load)
+
+
+def _top_rated_pool(db: Session, age_rating: str | None) -> list[MovieListItem]:
+    """높은 평점 영화 풀 (weighted_score 상위 100편, 섹션 캐시 경유)."""
+    def load() -> list[MovieListItem]:
+        top_rated_q = db.query(Movie).options(selectinload(Movie.genres)).filter(
+            Movie.weighted_score >= 6.0, Movie.vote_count >= 100,
+        )
+        top_rated_q = apply_age_rating_filter(top_rated_q, age_rating)
+        movies = top_rated_q.order_by(Movie.weighted_score.desc(), Movie.vote_average.desc()).limit(100).all()
+        return [MovieListItem.from_orm_with_genres(m) for m in movies]
+    return get_section_pool("top_rated", _age_bucket(age_rating), load)
+
+
+def _age_bucket(age_rating: str | None) -> str:
+    """섹션 캐시 키용 등급 버킷 (필터가 없는 all/adult/None은 하나로 묶음)."""
+    return age_rating if age_rating in AGE_RATING_MAP else "all"
+
+
 @router.get("", response_model=HomeRecommendations)
 @limiter.limit("15/minute")
 def get_home_recommendations(
@@ -123,77 +194,72 @@ def get_home_recommendations(
     hybrid_row = None
     impression_sections: dict[str, list[tuple[int, int, float | None]]] = {}
 
-    # Get user preferences if logged in
-    favorited_ids: set = set()
-    genre_counts: dict[str, int] = {}
-    similar_ids: set = set()
-
+    # === FETCH: 서로 독립적인 섹션 조회 (HOME_PARALLEL_SECTIONS면 세션별 동시 실행) ===
+    tasks: dict[str, Callable[[Session], list]] = {}
     if current_user:
-        favorited_ids, genre_counts, highly_rated_ids = get_user_preferences(db, current_user)
-        user_movie_ids = favorited_ids | highly_rated_ids
-        similar_ids = get_similar_movie_ids(db, user_movie_ids)
-
-    # === HYBRID RECOMMENDATION ROW (Main personalized) ===
-    # hybrid_row는 항상 control 경로 사용 (DB 전체 스캔 → 5축 가중합산)
-    # Two-Tower/LGBM 경로는 컨텍스트(날씨/기분) 변경에 둔감하므로 비활성화
-    if current_user and (mbti or weather or mood or genre_counts):
-        candidate_q = db.query(Movie).options(selectinload(Movie.genres)).filter(
-            Movie.weighted_score >= 6.0,
-            ~Movie.id.in_(favorited_ids)
-        )
-        candidate_q = apply_age_rating_filter(candidate_q, age_rating)
-        candidate_movies = candidate_q.order_by(desc(Movie.popularity), desc(Movie.weighted_score)).limit(200).all()
+        user_id = current_user.id
+        tasks["hybrid"] = lambda s: _fetch_hybrid(s, user_id, mbti, weather, mood, age_rating)
+    if mbti:
+        tasks["mbti"] = lambda s: get_movies_by_score(
+            s, "mbti_scores", mbti, limit=50, pool_size=120, age_rating=age_rating)
+    if weather:
+        tasks["weather"] = lambda s: get_movies_by_score(
+            s, "weather_scores", weather, limit=50, pool_size=120, age_rating=age_rating)
+    if mood:
+        primary_emotion = MOOD_EMOTION_MAPPING.get(mood, ["healing"])[0]
+        tasks["mood"] = lambda s: get_movies_by_score(
+            s, "emotion_tags", primary_emotion, limit=50, pool_size=120, age_rating=age_rating)
+    tasks["popular"] = lambda s: _popular_pool(s, age_rating)
+    tasks["korean_popular"] = lambda s: _korean_popular_pool(s, age_rating)
+    tasks["top_rated"] = lambda s: _top_rated_pool(s, age_rating)
 
-        scored = calculate_hybrid_scores(
-            db, candidate_movies, mbti, weather,
-            genre_counts, favorited_ids, similar_ids, mood,
-            experiment_group="control",
-        )
+    fetched = run_section_tasks(db, tasks)
 
-        top_pool = scored[:60]
-        top_recommendations = top_pool[:40]
+    # === MERGE: 고정 순서로 dedup/샘플링 (hybrid → mbti → weather → mood → popular → korean → top_rated) ===
 
-        if top_recommendations:
-            hybrid_movies = [
-                HybridMovieItem.from_movie_with_tags(
-                    m, tags, score,
-                    reason=generate_reason(tags, m, mbti, weather, mood),
-                )
-                for m, score, tags in top_recommendations
-            ]
-
-            # Build title
-            title_parts = []
-            if mbti:
-                title_parts.append(f"{mbti}")
-            if weather:
-                weather_emoji = {"sunny": "☀️", "rainy": "🌧️", "cloudy": "☁️", "snowy": "❄️"}
-                title_parts.append(weather_emoji.get(weather, ""))
-            if mood:
-                mood_emoji = {"relaxed": "😌", "tense": "😰", "excited": "😆", "emotional": "💕", "imaginative": "🔮", "light": "😄", "gloomy": "😢", "stifled": "😤"}
-                title_parts.append(mood_emoji.get(mood, ""))
-
-            hybrid_title = "🎯 " + (" + ".join(title_parts) if title_parts else "당신을 위한") + " 맞춤 추천"
-
-            desc_parts = []
-            if mbti:
-                desc_parts.append("MBTI")
-            if weather:
-                desc_parts.append("날씨")
-            if mood:
-                desc_parts.append("기분")
-            desc_parts.append("취향")
-            hybrid_desc = ", ".join(desc_parts) + "을 모두 고려한 추천"
-
-            hybrid_row = HybridRecommendationRow(
-                title=hybrid_title,
-                description=hybrid_desc,
-                movies=hybrid_movies
+    # === HYBRID RECOMMENDATION ROW (Main personalized) ===
+    top_recommendations = fetched.get("hybrid") or []
+    if top_recommendations:
+        hybrid_movies = [
+            HybridMovieItem.from_movie_with_tags(
+                m, tags, score,
+                reason=generate_reason(tags, m, mbti, weather, mood),
             )
-            impression_sections["hybrid_row"] = [
-                (m.id, rank, score)
-                for rank, (m, score, _) in enumerate(top_recommendations)
-            ]
+            for m, score, tags in top_recommendations
+        ]
+
+        # Build title
+        title_parts = []
+        if mbti:
+            title_parts.append(f"{mbti}")
+        if weather:
+            weather_emoji = {"sunny": "☀️", "rainy": "🌧️", "cloudy": "☁️", "snowy": "❄️"}
+            title_parts.append(weather_emoji.get(weather, ""))
+        if mood:
+            mood_emoji = {"relaxed": "😌", "tense": "😰", "excited": "😆", "emotional": "💕", "imaginative": "🔮", "light": "😄", "gloomy": "😢", "stifled": "😤"}
+            title_parts.append(mood_emoji.get(mood, ""))
+
+        hybrid_title = "🎯 " + (" + ".join(title_parts) if title_parts else "당신을 위한") + " 맞춤 추천"
+
+        desc_parts = []
+        if mbti:
+            desc_parts.append("MBTI")
+        if weather:
+            desc_parts.append("날씨")
+        if mood:
+            desc_parts.append("기분")
+        desc_parts.append("취향")
+        hybrid_desc = ", ".join(desc_parts) + "을 모두 고려한 추천"
+
+        hybrid_row = HybridRecommendationRow(
+            title=hybrid_title,
+            description=hybrid_desc,
+            movies=hybrid_movies
+        )
+        impression_sections["hybrid_row"] = [
+            (m.id, rank, score)
+            for rank, (m, score, _) in enumerate(top_recommendations)
+        ]
 
     # === SECTION DEDUP: track seen movie IDs ===
     seen_ids: set[int] = set()
@@ -207,7 +273,7 @@ def get_home_recommendations(
     # MBTI-based recommendations
     mbti_row = None
     if mbti:
-        mbti_movies = get_movies_by_score(db, "mbti_scores", mbti, limit=50, pool_size=120, age_rating=age_rating)
+        mbti_movies = fetched["mbti"]
         if DIVERSITY_ENABLED:
             mbti_movies = deduplicate_section(mbti_movies, seen_ids)
         if mbti_movies:
@@ -225,7 +291,7 @@ def get_home_recommendations(
     # Weather-based recommendations
     weather_row = None
     if weather:
-        weather_movies = get_movies_by_score(db, "weather_scores", weather, limit=50, pool_size=120, age_rating=age_rating)
+        weather_movies = fetched["weather"]
         if DIVERSITY_ENABLED:
             weather_movies = deduplicate_section(weather_movies, seen_ids)
         if weather_movies:
@@ -243,9 +309,7 @@ def get_home_recommendations(
     # 기분별 추천 (동적) - 사용자가 명시적으로 선택한 경우에만 표시
     mood_row = None
     if mood:
-        mood_emotion_keys = MOOD_EMOTION_MAPPING.get(mood, ["healing"])
-        primary_emotion = mood_emotion_keys[0]
-        mood_movies = get_movies_by_score(db, "emotion_tags", primary_emotion, limit=50, pool_size=120, age_rating=age_rating)
+        mood_movies = fetched["mood"]
         if DIVERSITY_ENABLED:
             mood_movies = deduplicate_section(mood_movies, seen_ids)
         if mood_movies:
@@ -262,9 +326,7 @@ def get_home_recommendations(
             ]
 
     # Popular movies (shuffle from top 100)
-    popular_q = db.query(Movie).options(selectinload(Movie.genres)).filter(Movie.weighted_score >= 6.0)
-    popular_q = apply_age_rating_filter(popular_q, age_rating)
-    popular_pool = popular_q.order_by(Movie.popularity.desc(), Movie.weighted_score.desc()).limit(100).all()
+    popular_pool = fetched["popular"]
     if DIVERSITY_ENABLED:
         popular_pool = deduplicate_section(popular_pool, seen_ids)
     popular = random.sample(popular_pool, min(50, len(popular_pool))) if popular_pool else []
@@ -274,18 +336,14 @@ def get_home_recommendations(
     popular_row = RecommendationRow(
         title="🔥 인기 영화",
         description="지금 가장 핫한 영화들",
-        movies=[MovieListItem.from_orm_with_genres(m) for m in popular]
+        movies=popular,
     )
     impression_sections["popular"] = [
         (m.id, rank, None) for rank, m in enumerate(popular)
     ]
 
     # Korean popular movies (shuffle from top 100)
-    korean_q = db.query(Movie).options(selectinload(Movie.genres)).filter(
-        Movie.production_countries_ko.ilike("%대한민국%"),
-    )
-    korean_q = apply_age_rating_filter(korean_q, age_rating)
-    korean_pool = korean_q.order_by(Movie.popularity.desc(), Movie.vote_average.desc()).limit(100).all()
+    korean_pool = fetched["korean_popular"]
     if DIVERSITY_ENABLED:
         korean_pool = deduplicate_section(korean_pool, seen_ids)
     korean_popular = random.sample(korean_pool, min(50, len(korean_pool))) if korean_pool else []
@@ -295,16 +353,14 @@ def get_home_recommendations(
     korean_popular_row = RecommendationRow(
         title="🇰🇷 한국 인기 영화",
         description="지금 한국에서 사랑받는 영화들",
-        movies=[MovieListItem.from_orm_with_genres(m) for m in korean_popular]
+        movies=korean_popular,
     )
     impression_sections["korean_popular"] = [
         (m.id, rank, None) for rank, m in enumerate(korean_popular)
     ]
 
     # Top rated (shuffle from top 100)
-    top_rated_q = db.query(Movie).options(selectinload(Movie.genres)).filter(Movie.weighted_score >= 6.0, Movie.vote_count >= 100)
-    top_rated_q = apply_age_rating_filter(top_rated_q, age_rating)
-    top_rated_pool = top_rated_q.order_by(Movie.weighted_score.desc(), Movie.vote_average.desc()).limit(100).all()
+    top_rated_pool = fetched["top_rated"]
     if DIVERSITY_ENABLED:
         top_rated_pool = deduplicate_section(top_rated_pool, seen_ids)
     top_rated = random.sample(top_rated_pool, min(50, len(top_rated_pool))) if top_rated_pool else []
@@ -312,7 +368,7 @@ def get_home_recommendations(
     top_rated_row = RecommendationRow(
         title="⭐ 높은 평점 영화",
         description="평점이 높은 명작들",
-        movies=[MovieListItem.from_orm_with_genres(m) for m in top_rated]
+        movies=top_rated,
     )
     impression_sections["top_rated"] = [
         (m.id, rank, None) for rank, m in enumerate(top_rated)
@@ -361,7 +417,7 @@ def get_home_recommendations(
     return HomeRecommendations(
         request_id=request_id,
         algorithm_version=algorithm_version,
-        featured=MovieListItem.from_orm_with_genres(featured) if featured else None,
+        featured=featured,
         rows=rows,
         hybrid_row=hybrid_row
     )
@@ -386,21 +442,16 @@ def get_hybrid_recommendations(
         weights=get_experiment_weights(),
     )
 
-    favorited_ids, genre_counts, highly_rated_ids = get_user_preferences(db, current_user)
-    user_movie_ids = favorited_ids | highly_rated_ids
-    similar_ids = get_similar_movie_ids(db, user_movie_ids)
+    profile = load_user_profile(db, current_user.id)
 
-    candidate_q = db.query(Movie).options(selectinload(Movie.genres)).filter(
-        Movie.weighted_score >= 6.0,
-        ~Movie.id.in_(favorited_ids)
-    )
-    candidate_q = apply_age_rating_filter(candidate_q, age_rating)
-    candidate_movies = candidate_q.order_by(desc(Movie.popularity), desc(Movie.weighted_score)).limit(300).all()
+    candidate_movies = get_hybrid_candidates(db, profile.favorited_ids, age_rating, limit=300)
 
     scored = calculate_hybrid_scores(
         db, candidate_movies, mbti, weather,
-        genre_counts, favorited_ids, similar_ids,
+        profile.genre_counts, profile.favorited_ids, profile.similar_ids,
         experiment_group=experiment_group,
+        top_n=limit,
+        user_id=current_user.id,
     )
 
     top_movies = scored[:limit]
@@ -496,26 +547,16 @@ def get_personalized_recommendations(
     db: Session = Depends(get_db)
 ):
     """찜한 영화 기반 개인화 추천"""
-    favorites = db.query(Collection).filter(
-        Collection.user_id == current_user.id,
-        Collection.name == "찜한 영화"
-    ).first()
+    favorited_ids = favorite_movie_ids(db, current_user.id)
 
-    if not favorites or not favorites.movies:
+    if not favorited_ids:
         q = db.query(Movie).options(selectinload(Movie.genres)).filter(Movie.weighted_score >= 6.0)
         q = apply_age_rating_filter(q, age_rating)
         movies = q.order_by(Movie.popularity.desc(), Movie.weighted_score.desc()).limit(limit).all()
         return [MovieListItem.from_orm_with_genres(m) for m in movies]
 
-    # 찜한 영화들의 장르 집계
-    genre_counts: dict[str, int] = {}
-    favorited_ids: set = set()
-
-    for movie in favorites.movies:
-        favorited_ids.add(movie.id)
-        for genre in movie.genres:
-            genre_name = genre.name if hasattr(genre, 'name') else str(genre)
-            genre_counts[genre_name] = genre_counts.get(genre_name, 0) + 1
+    # 찜한 영화들의 장르 집계 (영화/장르 행을 읽지 않고 GROUP BY 한 번)
+    genre_counts = genre_counts_for(db, favorited_ids)
 
     if not genre_counts:
         q = db.query(Movie).options(selectinload(Movie.genres)).filter(Movie.weighted_score >= 6.0)
@@ -0,0 +1,234 @@
+"""
+ANN index backends for semantic search.
+
+시맨틱 검색 코퍼스(L2 정규화, 내적 = 코사인)에서 후보 행을 고르는 인덱스.
+점수 계산/재채점은 semantic_search가 양자화 코퍼스로 수행하고, 인덱스는 후보 행만 반환한다.
+
+- IVFIndex: 순수 NumPy IVF (구면 k-means coarse quantizer + inverted lists). ivf_index.npz
+- FaissIndex: FAISS IVF-SQ8 / HNSW-SQ8 (faiss 설치 시). faiss_semantic.index
+
+인덱스는 오프라인 임베딩 파이프라인(scripts/quantize_embeddings.py)에서 빌드한다.
+"""
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+IVF_FILE = "ivf_index.npz"
+FAISS_FILE = "faiss_semantic.index"
+
+DEFAULT_NPROBE = 32
+MIN_CANDIDATE_FACTOR = 8  # IVF: 후보가 k × 8행 이상이 될 때까지 리스트를 더 탐색
+FAISS_CANDIDATE_FACTOR = 4  # FAISS: k × 4개 후보 → 정확 재채점
+HNSW_M = 32
+HNSW_EF_SEARCH = 256
+KMEANS_ITERATIONS = 12
+KMEANS_SAMPLE_SIZE = 50_000
+ASSIGN_BLOCK_ROWS = 8192
+
+BACKENDS = ("auto", "faiss", "ivf", "exact")
+
+
+def default_nlist(n_rows: int) -> int:
+    """리스트 수 ≈ √N (리스트당 평균 √N행)."""
+    return max(1, int(np.sqrt(n_rows)))
+
+
+def _assign(corpus: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """각 행의 최근접(최대 내적) 중심 인덱스 — 블록 단위로 계산."""
+    labels = np.empty(len(corpus), dtype=np.int32)
+    for start in range(0, len(corpus), ASSIGN_BLOCK_ROWS):
+        block = np.asarray(corpus[start:start + ASSIGN_BLOCK_ROWS], dtype=np.float32)
+        labels[start:start + len(block)] = np.argmax(block @ centroids.T, axis=1)
+    return labels
+
+
+def train_ivf(
+    corpus: np.ndarray,
+    nlist: int | None = None,
+    n_iter: int = KMEANS_ITERATIONS,
+    sample_size: int = KMEANS_SAMPLE_SIZE,
+    seed: int = 42,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """정규화 코퍼스 → (centroids (nlist, d), offsets (nlist+1,), rows (N,)).
+
+    리스트 l의 행은 rows[offsets[l]:offsets[l+1]] (리스트 내에서는 행 번호 오름차순).
+    """
+    n = len(corpus)
+    nlist = min(nlist or default_nlist(n), n)
+    rng = np.random.default_rng(seed)
+    sample_idx = np.sort(rng.choice(n, size=min(sample_size, n), replace=False))
+    sample = np.asarray(corpus[sample_idx], dtype=np.float32)
+
+    centroids = sample[rng.choice(len(sample), size=nlist, replace=False)].copy()
+    for _ in range(n_iter):
+        labels = _assign(sample, centroids)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, labels, sample)
+        counts = np.bincount(labels, minlength=nlist)
+        empty = counts == 0
+        if empty.any():
+            # 빈 클러스터는 임의의 샘플로 재초기화
+            sums[empty] = sample[rng.choice(len(sample), size=int(empty.sum()), replace=False)]
+        norms = np.linalg.norm(sums, axis=1, keepdims=True)
+        norms[norms == 0] = 1
+        centroids = sums / norms
+
+    labels = _assign(corpus, centroids)
+    rows = np.argsort(labels, kind="stable").astype(np.int32)
+    offsets = np.zeros(nlist + 1, dtype=np.int64)
+    np.cumsum(np.bincount(labels, minlength=nlist), out=offsets[1:])
+    return centroids.astype(np.float32), offsets, rows
+
+
+class IVFIndex:
+    """NumPy IVF. 쿼리와 가까운 중심 순으로 리스트를 열어 후보 행을 모은다."""
+
+    __slots__ = ("centroids", "offsets", "rows", "nprobe")
+    name = "ivf"
+
+    def __init__(self, centroids: np.ndarray, offsets: np.ndarray, rows: np.ndarray, nprobe: int = DEFAULT_NPROBE):
+        self.centroids = centroids
+        self.offsets = offsets
+        self.rows = rows
+        self.nprobe = nprobe
+
+    @property
+    def ntotal(self) -> int:
+        return len(self.rows)
+
+    @classmethod
+    def load(cls, path: Path, nprobe: int = DEFAULT_NPROBE) -> IVFIndex:
+        with np.load(str(path)) as data:
+            return cls(data["centroids"], data["offsets"], data["rows"], nprobe)
+
+    def save(self, path: Path) -> None:
+        np.savez(str(path), centroids=self.centroids, offsets=self.offsets, rows=self.rows)
+
+    def candidates(self, query: np.ndarray, k: int) -> np.ndarray:
+        """후보 행 (오름차순). 최소 nprobe개 리스트, 후보가 k × MIN_CANDIDATE_FACTOR행이 될 때까지 추가 탐색."""
+        order = np.argsort(self.centroids @ query)[::-1]
+        sizes = np.diff(self.offsets)[order]
+        need = min(k * MIN_CANDIDATE_FACTOR, self.ntotal)
+        n_lists = max(min(self.nprobe, len(order)), int(np.searchsorted(np.cumsum(sizes), need)) + 1)
+        probed = order[:n_lists]
+        parts = [self.rows[self.offsets[lst]:self.offsets[lst + 1]] for lst in probed]
+        return np.sort(np.concatenate(parts)) if parts else np.empty(0, dtype=np.int32)
+
+
+class FaissIndex:
+    """FAISS 인덱스 래퍼 (IVF-SQ8 또는 HNSW-SQ8, 내적)."""
+
+    __slots__ = ("index", "nprobe", "_faiss")
+    name = "faiss"
+
+    def __init__(self, index: Any, faiss: Any, nprobe: int = DEFAULT_NPROBE):
+        self.index = index
+        self.nprobe = nprobe
+        self._faiss = faiss
+
+    @property
+    def ntotal(self) -> int:
+        return int(self.index.ntotal)
+
+    @classmethod
+    def load(cls, path: Path, nprobe: int = DEFAULT_NPROBE) -> FaissIndex:
+        import faiss
+
+        flags = getattr(faiss, "IO_FLAG_MMAP", 0)  # 가능하면 워커 간 페이지 캐시 공유
+        return cls(faiss.read_index(str(path), flags), faiss, nprobe)
+
+    def candidates(self, query: np.ndarray, k: int) -> np.ndarray:
+        faiss = self._faiss
+        n = min(k * FAISS_CANDIDATE_FACTOR, self.ntotal)
+        inner = faiss.downcast_index(self.index)
+        if isinstance(inner, faiss.IndexIVF):
+            params = faiss.SearchParametersIVF(nprobe=self.nprobe)
+        else:
+            params = faiss.SearchParametersHNSW(efSearch=max(HNSW_EF_SEARCH, n))
+        _, ids = self.index.search(query.reshape(1, -1).astype(np.float32), n, params=params)
+        rows = ids[0]
+        return np.sort(rows[rows >= 0])
+
+
+def build_faiss_index(corpus: np.ndarray, kind: str = "hnsw", nlist: int | None = None) -> Any:
+    """FAISS 인덱스 생성 (8bit scalar quantizer로 벡터 저장)."""
+    import faiss
+
+    data = np.ascontiguousarray(corpus, dtype=np.float32)
+    dim = data.shape[1]
+    if kind == "ivf":
+        quantizer = faiss.IndexFlatIP(dim)
+        index = faiss.IndexIVFScalarQuantizer(
+            quantizer, dim, nlist or default_nlist(len(data)),
+            faiss.ScalarQuantizer.QT_8bit, faiss.METRIC_INNER_PRODUCT,
+        )
+        index.train(data)
+    else:
+        index = faiss.IndexHNSWSQ(dim, faiss.ScalarQuantizer.QT_8bit, HNSW_M, faiss.METRIC_INNER_PRODUCT)
+        index.train(data)
+    index.add(data)
+    return index
+
+
+def build_indexes(corpus: np.ndarray, out_dir: Path, faiss_kind: str | None = None) -> list[str]:
+    """오프라인 빌드: NumPy IVF는 항상, FAISS는 faiss_kind 지정 + 설치 시. 생성된 파일명 반환."""
+    written = []
+    centroids, offsets, rows = train_ivf(corpus)
+    IVFIndex(centroids, offsets, rows).save(out_dir / IVF_FILE)
+    written.append(IVF_FILE)
+
+    if faiss_kind:
+        try:
+            import faiss
+        except ImportError:
+            logger.warning("faiss not installed — skipping %s index", faiss_kind)
+            return written
+        faiss.write_index(build_faiss_index(corpus, faiss_kind), str(out_dir / FAISS_FILE))
+        written.append(FAISS_FILE)
+    return written
+
+
+def load_index(directory: Path, n_rows: int, backend: str = "auto", nprobe: int = DEFAULT_NPROBE):
+    """backend에 맞는 인덱스 로드. 없거나 "exact"면 None (전체 스캔).
+
+    auto: FAISS 파일 + faiss 설치 시 FAISS, 아니면 NumPy IVF 파일, 둘 다 없으면 전체 스캔.
+    """
+    if backend not in BACKENDS:
+        logger.warning("Unknown semantic index backend %r — using exact search", backend)
+        return None
+    if backend == "exact":
+        return None
+
+    index: IVFIndex | FaissIndex | None = None
+    faiss_path = directory / FAISS_FILE
+    ivf_path = directory / IVF_FILE
+    try:
+        if backend in ("auto", "faiss") and faiss_path.exists():
+            try:
+                index = FaissIndex.load(faiss_path, nprobe)
+            except ImportError:
+                if backend == "faiss":
+                    logger.warning("faiss not installed — semantic index disabled")
+            except RuntimeError as e:
+                # 손상/비호환 파일, IO_FLAG_MMAP 미지원 등 — auto면 IVF 파일로 넘어간다
+                logger.error("Failed to load FAISS semantic index: %s", e)
+        if index is None and backend in ("auto", "ivf") and ivf_path.exists():
+            index = IVFIndex.load(ivf_path, nprobe)
+    except (OSError, ValueError, KeyError, RuntimeError) as e:
+        logger.error("Failed to load semantic index: %s", e)
+        return None
+
+    if index is None:
+        if backend != "auto":
+            logger.warning("Semantic index %r not found in %s — using exact search", backend, directory)
+        return None
+    if index.ntotal != n_rows:
+        logger.warning("Semantic index size %d != corpus rows %d — using exact search", index.ntotal, n_rows)
+        return None
+    return index
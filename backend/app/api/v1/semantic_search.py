@@ -1,6 +1,17 @@
 """
 In-memory vector search using NumPy.
 Loads pre-computed movie embeddings at server startup.
+
+오프라인(scripts/quantize_embeddings.py)에서 L2 정규화된 코퍼스를 두 형태로 내보낸다.
+  corpus_f16.npy       (N, 1024) float16 — 정확 점수/재채점용
+  corpus_i8.npy        (N, 1024) int8    — 행별 스케일 양자화 (x ≈ q · scale)
+  corpus_i8_scale.npy  (N,) float32
+서버는 이 파일들을 memory-map으로 열어 모든 워커가 같은 페이지 캐시를 공유한다.
+검색은 int8 내적으로 후보(top_k × RESCORE_FACTOR)를 고른 뒤 float16 행으로 재채점한다.
+양자화 파일이 없으면 기존처럼 movie_embeddings.npy를 float32로 정규화해 메모리에 올린다.
+
+ANN 인덱스(semantic_index: FAISS 또는 NumPy IVF)가 있으면 전체 스캔 대신
+인덱스가 고른 후보 행만 채점한다.
 """
 import json
 import logging
@@ -8,23 +19,85 @@ from pathlib import Path
 
 import numpy as np
 
+from app.api.v1 import semantic_index
+
 logger = logging.getLogger(__name__)
 
 # In-memory vector index
-_corpus_embeddings: np.ndarray | None = None  # (N, 1024), L2 normalized
+_corpus_embeddings: np.ndarray | None = None  # (N, 1024), L2 normalized (float32 또는 float16 memmap)
+_corpus_i8: np.ndarray | None = None  # (N, 1024) int8 memmap
+_corpus_i8_scale: np.ndarray | None = None  # (N,) float32
 _movie_ids: list[int] = []  # index → movie_id mapping
+_index: semantic_index.IVFIndex | semantic_index.FaissIndex | None = None  # None이면 전체 스캔
 
 EMBEDDINGS_DIR = Path(__file__).parent.parent.parent.parent / "data" / "embeddings"
-
-
-def load_embeddings() -> None:
-    """서버 시작 시 임베딩을 메모리에 로드."""
-    global _corpus_embeddings, _movie_ids
+CORPUS_F16_FILE = "corpus_f16.npy"
+CORPUS_I8_FILE = "corpus_i8.npy"
+CORPUS_I8_SCALE_FILE = "corpus_i8_scale.npy"
+
+RESCORE_FACTOR = 4  # int8 후보 수 = top_k × RESCORE_FACTOR
+SCORE_BLOCK_ROWS = 4096  # memmap 블록 단위 내적 (전체 float 변환 복사 방지)
+
+
+def _normalize_rows(raw: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(raw, axis=1, keepdims=True)
+    norms[norms == 0] = 1  # zero-vector 방지
+    return raw / norms
+
+
+def quantize_corpus(raw: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """원본 임베딩 → (정규화 float16, int8, 행별 스케일 float32)."""
+    normalized = _normalize_rows(np.asarray(raw, dtype=np.float32))
+    scale = np.abs(normalized).max(axis=1) / 127.0
+    scale[scale == 0] = 1.0
+    quantized = np.clip(np.rint(normalized / scale[:, None]), -127, 127).astype(np.int8)
+    return normalized.astype(np.float16), quantized, scale.astype(np.float32)
+
+
+def write_quantized_corpus(emb_path: Path, out_dir: Path) -> int:
+    """movie_embeddings.npy → 양자화 코퍼스 파일 3개. 행 수 반환."""
+    f16, i8, scale = quantize_corpus(np.load(str(emb_path)))
+    out_dir.mkdir(parents=True, exist_ok=True)
+    np.save(str(out_dir / CORPUS_F16_FILE), f16)
+    np.save(str(out_dir / CORPUS_I8_FILE), i8)
+    np.save(str(out_dir / CORPUS_I8_SCALE_FILE), scale)
+    return len(f16)
+
+
+def _load_corpus() -> tuple[np.ndarray, np.ndarray | None, np.ndarray | None]:
+    """(정확 점수용 코퍼스, int8 코퍼스, 스케일). 양자화 파일 우선, 없으면 float32 폴백."""
+    f16_path = EMBEDDINGS_DIR / CORPUS_F16_FILE
+    if f16_path.exists():
+        exact = np.load(str(f16_path), mmap_mode="r")
+        i8_path = EMBEDDINGS_DIR / CORPUS_I8_FILE
+        scale_path = EMBEDDINGS_DIR / CORPUS_I8_SCALE_FILE
+        if i8_path.exists() and scale_path.exists():
+            i8 = np.load(str(i8_path), mmap_mode="r")
+            scale = np.load(str(scale_path))
+            if i8.shape == exact.shape and scale.shape == (len(exact),):
+                return exact, i8, scale
+            logger.warning("Quantized corpus shape mismatch — int8 path disabled")
+        return exact, None, None
+
+    logger.warning(
+        "Quantized corpus not found in %s — loading float32 copy (run scripts/quantize_embeddings.py)",
+        EMBEDDINGS_DIR,
+    )
+    raw = np.load(str(EMBEDDINGS_DIR / "movie_embeddings.npy")).astype(np.float32)
+    # L2 정규화 (코사인 유사도 → 내적으로 변환)
+    return _normalize_rows(raw), None, None
+
+
+def load_embeddings(
+    index_backend: str = "auto", nprobe: int = semantic_index.DEFAULT_NPROBE
+) -> None:
+    """서버 시작 시 임베딩 로드 (양자화 코퍼스는 memory-map) + ANN 인덱스 로드."""
+    global _corpus_embeddings, _corpus_i8, _corpus_i8_scale, _movie_ids, _index
 
     emb_path = EMBEDDINGS_DIR / "movie_embeddings.npy"
     idx_path = EMBEDDINGS_DIR / "movie_id_index.json"
 
-    if not emb_path.exists():
+    if not emb_path.exists() and not (EMBEDDINGS_DIR / CORPUS_F16_FILE).exists():
         logger.warning("Embedding file not found: %s — semantic search disabled", emb_path)
         return
 
@@ -33,50 +106,101 @@ def load_embeddings() -> None:
         return
 
     try:
-        raw = np.load(str(emb_path)).astype(np.float32)
-
-        # L2 정규화 (코사인 유사도 → 내적으로 변환)
-        norms = np.linalg.norm(raw, axis=1, keepdims=True)
-        norms[norms == 0] = 1  # zero-vector 방지
-        _corpus_embeddings = raw / norms
+        exact, i8, scale = _load_corpus()
 
         with open(idx_path, encoding="utf-8") as f:
             idx_map: dict[str, int] = json.load(f)
-        _movie_ids = [idx_map[str(i)] for i in range(len(idx_map))]
+        movie_ids = [idx_map[str(i)] for i in range(len(idx_map))]
+        if len(movie_ids) != len(exact):
+            raise ValueError(f"index size {len(movie_ids)} != corpus rows {len(exact)}")
+
+        _corpus_embeddings, _corpus_i8, _corpus_i8_scale = exact, i8, scale
+        _movie_ids = movie_ids
+        _index = semantic_index.load_index(EMBEDDINGS_DIR, len(movie_ids), index_backend, nprobe)
 
         logger.info(
-            "Loaded %d movie embeddings (%d dims, %.1f MB)",
+            "Loaded %d movie embeddings (%d dims, %s, %.1f MB%s)",
             len(_movie_ids),
             _corpus_embeddings.shape[1],
+            "int8+float16" if i8 is not None else str(_corpus_embeddings.dtype),
             _corpus_embeddings.nbytes / 1024 / 1024,
+            ", memory-mapped" if isinstance(_corpus_embeddings, np.memmap) else "",
         )
-    except (OSError, ValueError) as e:
+        logger.info("Semantic index: %s", _index.name if _index is not None else "exact scan")
+    except (OSError, ValueError, KeyError) as e:
         logger.error("Failed to load embeddings: %s", e)
-        _corpus_embeddings = None
+        _corpus_embeddings = _corpus_i8 = _corpus_i8_scale = _index = None
         _movie_ids = []
 
 
+def _dot(corpus: np.ndarray, query: np.ndarray) -> np.ndarray:
+    """corpus @ query (float32). float32가 아니면 블록 단위로 변환해 임시 메모리를 제한한다."""
+    if corpus.dtype == np.float32:
+        return corpus @ query
+    scores = np.empty(len(corpus), dtype=np.float32)
+    for start in range(0, len(corpus), SCORE_BLOCK_ROWS):
+        block = corpus[start:start + SCORE_BLOCK_ROWS]
+        scores[start:start + len(block)] = block.astype(np.float32) @ query
+    return scores
+
+
+def _top_indices(scores: np.ndarray, top_k: int) -> np.ndarray:
+    """점수 내림차순 Top-K 인덱스 (argpartition은 O(N), argsort O(N log N)보다 빠름)."""
+    if top_k < len(scores):
+        top = np.argpartition(scores, -top_k)[-top_k:]
+        return top[np.argsort(scores[top])[::-1]]
+    return np.argsort(scores)[::-1][:top_k]
+
+
+def _rank(rows: np.ndarray | None, query: np.ndarray, top_k: int, rescore: bool) -> list[tuple[int, float]]:
+    """후보 행(None이면 전체 코퍼스) 채점 → Top-K (movie_id, score)."""
+    def take(arr: np.ndarray) -> np.ndarray:
+        return arr if rows is None else arr[rows]
+
+    def row_ids(idx: np.ndarray) -> np.ndarray:
+        return idx if rows is None else rows[idx]
+
+    n_rows = len(_movie_ids) if rows is None else len(rows)
+    n_candidates = top_k * RESCORE_FACTOR
+    if _corpus_i8 is None or (rescore and n_rows <= n_candidates):
+        scores = _dot(take(_corpus_embeddings), query)
+        top = _top_indices(scores, top_k)
+        return [(int(_movie_ids[r]), float(scores[i])) for i, r in zip(top, row_ids(top), strict=True)]
+
+    approx = _dot(take(_corpus_i8), query) * take(_corpus_i8_scale)
+    if not rescore:
+        top = _top_indices(approx, top_k)
+        return [(int(_movie_ids[r]), float(approx[i])) for i, r in zip(top, row_ids(top), strict=True)]
+
+    candidates = np.sort(row_ids(_top_indices(approx, n_candidates)))  # 정렬된 행으로 memmap 순차 접근
+    exact = _dot(_corpus_embeddings[candidates], query)
+    order = _top_indices(exact, top_k)
+    return [(int(_movie_ids[candidates[i]]), float(exact[i])) for i in order]
+
+
 def search_similar(
-    query_embedding: np.ndarray, top_k: int = 100
+    query_embedding: np.ndarray, top_k: int = 100, rescore: bool = True, use_index: bool = True
 ) -> list[tuple[int, float]]:
-    """코사인 유사도 기반 Top-K 검색. (movie_id, score) 리스트 반환."""
+    """코사인 유사도 기반 Top-K 검색. (movie_id, score) 리스트 반환.
+
+    ANN 인덱스가 있고 use_index=True면 인덱스 후보 행만 채점한다.
+    int8 코퍼스가 있으면 양자화 내적으로 후보를 고르고, rescore=True면
+    후보 top_k × RESCORE_FACTOR편을 float16 행으로 다시 채점한다.
+    """
     if _corpus_embeddings is None or len(_movie_ids) == 0:
         return []
 
     norm = np.linalg.norm(query_embedding)
     if norm < 1e-10:
         return []
-    query_norm = query_embedding / norm
-    scores = _corpus_embeddings @ query_norm  # (N,)
-
-    # Top-K 추출 (argpartition은 O(N), argsort O(N log N)보다 빠름)
-    if top_k < len(scores):
-        top_indices = np.argpartition(scores, -top_k)[-top_k:]
-        top_indices = top_indices[np.argsort(scores[top_indices])[::-1]]
-    else:
-        top_indices = np.argsort(scores)[::-1][:top_k]
-
-    return [(int(_movie_ids[i]), float(scores[i])) for i in top_indices]
+    query_norm = (query_embedding / norm).astype(np.float32)
+
+    rows = None
+    if use_index and _index is not None:
+        rows = _index.candidates(query_norm, top_k)
+        if len(rows) < min(top_k, len(_movie_ids)):
+            rows = None  # 후보 부족 → 전체 스캔
+    return _rank(rows, query_norm, top_k, rescore)
 
 
 def is_semantic_search_available() -> bool:
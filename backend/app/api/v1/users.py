@@ -14,6 +14,7 @@ from app.core.security import revoke_refresh_token
 from app.models import User, UserEvent
 from app.schemas import MBTIUpdate, OnboardingComplete, UserResponse, UserUpdate
 from app.services.llm import get_redis_client
+from app.services.user_profile_cache import invalidate_user_profile
 
 logger = logging.getLogger(__name__)
 
@@ -77,6 +78,7 @@ def complete_onboarding(
     current_user.onboarding_completed = True
     current_user.preferred_genres = json.dumps(body.preferred_genres, ensure_ascii=False)
     db.commit()
+    invalidate_user_profile(current_user.id)
     db.refresh(current_user)
     return current_user
 
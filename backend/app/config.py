@@ -39,6 +39,13 @@ class Settings(BaseSettings):
     GEMINI_API_KEY: str = ""
     ANTHROPIC_API_KEY: str = ""
     VOYAGE_API_KEY: str = ""
+    VOYAGE_API_URL: str = "https://api.voyageai.com/v1/embeddings"  # tests.voyage_stub for local runs
+
+    # Query embedding micro-batching (concurrent semantic searches → one Voyage request)
+    EMBEDDING_BATCH_MAX_SIZE: int = 32
+    EMBEDDING_BATCH_WAIT_MS: float = 5.0
+    # In-process query-embedding LRU in front of Redis (4 KB per 1024-dim vector)
+    EMBEDDING_LOCAL_CACHE_BYTES: int = 32 * 1024 * 1024
 
     # OAuth - Kakao
     KAKAO_CLIENT_ID: str = ""
@@ -69,6 +76,7 @@ class Settings(BaseSettings):
     # Two-Tower Model
     TWO_TOWER_ENABLED: bool = True
     TWO_TOWER_MODEL_PATH: str = "data/models/two_tower/model_v1.pt"
+    TWO_TOWER_USER_TOWER_PATH: str = "data/models/two_tower/user_tower.npz"  # torch-free serving (preferred)
     TWO_TOWER_INDEX_PATH: str = "data/models/two_tower/faiss_index.bin"
     TWO_TOWER_MOVIE_MAP_PATH: str = "data/models/two_tower/movie_id_map.json"
 
@@ -76,6 +84,43 @@ class Settings(BaseSettings):
     RERANKER_ENABLED: bool = True
     RERANKER_MODEL_PATH: str = "data/models/reranker/lgbm_v1.txt"
 
+    # Semantic search ANN index: auto | faiss | ivf | exact
+    SEMANTIC_INDEX_BACKEND: str = "auto"
+    SEMANTIC_INDEX_NPROBE: int = 32
+
+    # In-memory BM25 index (semantic search RRF fusion, keyword fallback)
+    LEXICAL_INDEX_ENABLED: bool = True
+    LEXICAL_INDEX_REFRESH_SECONDS: int = 300
+
+    # In-memory prefix/trigram autocomplete index (search dropdown)
+    AUTOCOMPLETE_INDEX_ENABLED: bool = True
+    AUTOCOMPLETE_INDEX_REFRESH_SECONDS: int = 300
+
+    # In-process movie feature store
+    FEATURE_STORE_ENABLED: bool = True
+    FEATURE_STORE_REFRESH_SECONDS: int = 60
+
+    # SQLAlchemy connection pool (app.database engine)
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+
+    # Home recommendations: fetch independent sections concurrently
+    # (workers capped at DB_POOL_SIZE // 2, see app.core.section_executor)
+    HOME_PARALLEL_SECTIONS: bool = True
+    HOME_SECTION_WORKERS: int = 8
+
+    # Non-personalized home section pools (popular / Korean / top-rated) cache TTL
+    SECTION_POOL_CACHE_TTL: int = 60
+
+    # Onboarding candidate pool (eligible movies per genre), rebuilt after this TTL
+    ONBOARDING_POOL_CACHE_TTL: int = 3600
+
+    # GET /movies totals, cached per normalized filter tuple
+    MOVIE_COUNT_CACHE_TTL: int = 300
+
+    # Per-user preference profile (favorites / genre counts / high ratings / similar ids)
+    USER_PROFILE_CACHE_TTL: int = 600
+
     @field_validator("DATABASE_URL")
     @classmethod
     def validate_database_url(cls, v: str) -> str:
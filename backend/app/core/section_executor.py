@@ -0,0 +1,119 @@
+"""
+Shared thread pool for concurrent section queries.
+
+홈 추천처럼 서로 독립적인 섹션 조회를 동시에 실행한다.
+SQLAlchemy Session은 스레드 간 공유할 수 없으므로 태스크마다 요청 세션과 같은
+엔진(bind)에 묶인 별도 세션을 열고, 끝나면 닫는다. 반환된 ORM 객체는 detached
+상태가 되므로 태스크 안에서 필요한 관계(genres 등)를 eager load 해야 한다.
+
+워커 수는 min(HOME_SECTION_WORKERS, DB_POOL_SIZE // 2)로 제한한다. 워커 세션이
+커넥션 풀의 절반을 넘지 않으므로 동시 홈 요청이 몰려도 요청 세션이 남은 풀을 쓴다.
+태스크는 빈 워커 슬롯만큼만 제출하고(큐에 쌓지 않음) 나머지는 요청 스레드가
+요청 세션으로 순차 실행한다. 슬롯이 하나도 없으면 전체가 순차 모드가 된다.
+"""
+import logging
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+_executor: ThreadPoolExecutor | None = None
+_capacity = 0
+_in_flight = 0
+_slots_lock = threading.Lock()
+
+
+def section_worker_count() -> int:
+    """섹션 워커 수 — DB 커넥션 풀 크기의 절반을 넘지 않는다."""
+    return max(1, min(settings.HOME_SECTION_WORKERS, settings.DB_POOL_SIZE // 2))
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor, _capacity  # noqa: PLW0603
+    if _executor is None:
+        _capacity = section_worker_count()
+        _executor = ThreadPoolExecutor(
+            max_workers=_capacity,
+            thread_name_prefix="section",
+        )
+    return _executor
+
+
+def _acquire_slots(wanted: int) -> int:
+    """빈 워커 슬롯을 최대 wanted개 확보해 개수를 반환 (0이면 풀이 가득 참)."""
+    global _in_flight  # noqa: PLW0603
+    with _slots_lock:
+        granted = max(0, min(wanted, _capacity - _in_flight))
+        _in_flight += granted
+        return granted
+
+
+def _release_slot() -> None:
+    global _in_flight  # noqa: PLW0603
+    with _slots_lock:
+        _in_flight -= 1
+
+
+def close_section_executor() -> None:
+    """Shut down the shared pool. Call once at shutdown."""
+    global _executor, _in_flight  # noqa: PLW0603
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+        with _slots_lock:
+            _in_flight = 0
+        logger.info("Section executor closed")
+
+
+def run_section_tasks(
+    db: Session,
+    tasks: dict[str, Callable[[Session], Any]],
+    parallel: bool | None = None,
+) -> dict[str, Any]:
+    """섹션 태스크 실행 → {이름: 결과} (tasks와 같은 순서).
+
+    parallel이 False(또는 HOME_PARALLEL_SECTIONS=false)면 요청 세션으로 순차 실행한다.
+    병렬 모드에서도 빈 워커 슬롯을 넘는 태스크는 요청 세션으로 순차 실행한다.
+    태스크에서 발생한 예외는 그대로 전파된다.
+    """
+    if parallel is None:
+        parallel = settings.HOME_PARALLEL_SECTIONS
+    if not parallel or len(tasks) <= 1:
+        return {name: fn(db) for name, fn in tasks.items()}
+
+    executor = _get_executor()
+    names = list(tasks)
+    # 마지막 태스크는 요청 스레드 몫 — 제출한 태스크를 기다리는 동안 놀지 않는다
+    offloaded = names[:_acquire_slots(len(names) - 1)]
+    if not offloaded:
+        logger.debug("Section executor saturated; running %d sections sequentially", len(names))
+        return {name: fn(db) for name, fn in tasks.items()}
+
+    factory = sessionmaker(bind=db.get_bind(), autocommit=False, autoflush=False)
+
+    def _call(fn: Callable[[Session], Any]) -> Any:
+        try:
+            session = factory()
+            try:
+                return fn(session)
+            finally:
+                session.close()
+        finally:
+            _release_slot()
+
+    futures = {}
+    try:
+        for name in offloaded:
+            futures[name] = executor.submit(_call, tasks[name])
+    finally:
+        # 제출하지 못한 슬롯 반환 (executor가 종료된 경우 등)
+        for _ in range(len(offloaded) - len(futures)):
+            _release_slot()
+    local = {name: tasks[name](db) for name in names if name not in futures}
+    return {name: futures[name].result() if name in futures else local[name] for name in names}
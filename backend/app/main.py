@@ -45,9 +45,44 @@ async def lifespan(app: FastAPI):
 
     # Load movie embeddings for semantic search
     from app.api.v1.semantic_search import is_semantic_search_available, load_embeddings
-    load_embeddings()
+    load_embeddings(settings.SEMANTIC_INDEX_BACKEND, settings.SEMANTIC_INDEX_NPROBE)
     logger.info("Semantic search: %s", "enabled" if is_semantic_search_available() else "disabled (no embeddings)")
 
+    # Load columnar movie features (optional, graceful fallback to ORM queries)
+    if settings.FEATURE_STORE_ENABLED:
+        from app.database import SessionLocal
+        from app.services.movie_feature_store import init_feature_store
+        store = init_feature_store(SessionLocal, refresh_interval=settings.FEATURE_STORE_REFRESH_SECONDS)
+        logger.info("Movie feature store: %s", f"enabled ({store.size} movies)" if store else "disabled (load failed)")
+        if store:
+            from app.api.v1.recommendation_engine import warm_ranked_lists
+            logger.info("Ranked score lists: %d precomputed", warm_ranked_lists())
+    else:
+        logger.info("Movie feature store: disabled (FEATURE_STORE_ENABLED=false)")
+
+    # Build BM25 lexical index for semantic search fusion / keyword fallback
+    if settings.LEXICAL_INDEX_ENABLED:
+        from app.database import SessionLocal
+        from app.services.lexical_index import init_lexical_index
+        lexical = init_lexical_index(SessionLocal, refresh_interval=settings.LEXICAL_INDEX_REFRESH_SECONDS)
+        logger.info("Lexical index: %s", f"enabled ({lexical.size} movies)" if lexical else "disabled (build failed)")
+    else:
+        logger.info("Lexical index: disabled (LEXICAL_INDEX_ENABLED=false)")
+
+    # Build in-memory autocomplete index (falls back to ILIKE queries)
+    if settings.AUTOCOMPLETE_INDEX_ENABLED:
+        from app.database import SessionLocal
+        from app.services.autocomplete import init_autocomplete_index
+        autocomplete = init_autocomplete_index(
+            SessionLocal, refresh_interval=settings.AUTOCOMPLETE_INDEX_REFRESH_SECONDS,
+        )
+        logger.info(
+            "Autocomplete index: %s",
+            f"enabled ({autocomplete.size} entries)" if autocomplete else "disabled (build failed)",
+        )
+    else:
+        logger.info("Autocomplete index: disabled (AUTOCOMPLETE_INDEX_ENABLED=false)")
+
     # Load Two-Tower retriever (optional, graceful fallback)
     if settings.TWO_TOWER_ENABLED:
         from app.services.two_tower_retriever import init_retriever
@@ -55,6 +90,7 @@ async def lifespan(app: FastAPI):
             model_path=settings.TWO_TOWER_MODEL_PATH,
             index_path=settings.TWO_TOWER_INDEX_PATH,
             movie_id_map_path=settings.TWO_TOWER_MOVIE_MAP_PATH,
+            user_tower_path=settings.TWO_TOWER_USER_TOWER_PATH,
         )
         logger.info("Two-Tower retriever: %s", "enabled" if retriever else "disabled (files not found)")
     else:
@@ -74,8 +110,10 @@ async def lifespan(app: FastAPI):
 
     yield
 
-    # Shutdown: close shared httpx.AsyncClient
+    # Shutdown: close shared httpx.AsyncClient and section thread pool
     await close_http_client()
+    from app.core.section_executor import close_section_executor
+    close_section_executor()
 
 
 app = FastAPI(
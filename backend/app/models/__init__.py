@@ -1,4 +1,5 @@
 """RecFlix Database Models Package"""
+from app.models.batch_watermark import BatchWatermark
 from app.models.collection import Collection, collection_movies
 from app.models.country import Country
 from app.models.genre import GENRE_MAPPING, Genre
@@ -6,6 +7,7 @@ from app.models.keyword import Keyword
 from app.models.movie import Movie, movie_cast, movie_countries, movie_genres, movie_keywords, similar_movies
 from app.models.person import Person
 from app.models.rating import Rating
+from app.models.table_version import TableVersion
 from app.models.user import User
 from app.models.user_event import UserEvent
 
@@ -27,6 +29,8 @@ __all__ = [
     'RecoImpression',
     'RecoInteraction',
     'RecoJudgment',
+    'BatchWatermark',
+    'TableVersion',
     'GENRE_MAPPING',
     'movie_genres',
     'movie_cast',
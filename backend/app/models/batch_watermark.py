@@ -0,0 +1,20 @@
+"""
+BatchWatermark Model - 배치 작업별 마지막 처리 시점 (증분 갱신용)
+"""
+from sqlalchemy import Column, DateTime, String
+from sqlalchemy.sql import func
+
+from app.database import Base
+
+
+class BatchWatermark(Base):
+    """배치 작업 이름 → 마지막으로 반영한 movies.updated_at"""
+
+    __tablename__ = "batch_watermarks"
+
+    name = Column(String(64), primary_key=True)
+    watermark = Column(DateTime, nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<BatchWatermark(name={self.name}, watermark={self.watermark})>"
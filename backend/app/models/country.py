@@ -14,6 +14,7 @@ class Country(Base):
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     name = Column(String(100), unique=True, nullable=False, index=True)
+    name_ko = Column(String(100), index=True)  # production_countries_ko 표기 (backfill_movie_countries.py)
 
     # Relationships
     movies = relationship('Movie', secondary=movie_countries, back_populates='countries')
@@ -1,7 +1,24 @@
 """
 Movie Model
 """
-from sqlalchemy import Boolean, Column, Date, Float, ForeignKey, Integer, String, Table, Text
+from datetime import datetime
+
+from sqlalchemy import (
+    Boolean,
+    Column,
+    Date,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    SmallInteger,
+    String,
+    Table,
+    Text,
+    false,
+    text,
+)
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 
@@ -34,20 +51,31 @@ movie_countries = Table(
     'movie_countries',
     Base.metadata,
     Column('movie_id', Integer, ForeignKey('movies.id', ondelete='CASCADE'), primary_key=True),
-    Column('country_id', Integer, ForeignKey('countries.id', ondelete='CASCADE'), primary_key=True)
+    Column('country_id', Integer, ForeignKey('countries.id', ondelete='CASCADE'), primary_key=True),
+    Index('ix_movie_countries_country_movie', 'country_id', 'movie_id'),  # 국가 → 영화 조회
 )
 
 similar_movies = Table(
     'similar_movies',
     Base.metadata,
     Column('movie_id', Integer, ForeignKey('movies.id', ondelete='CASCADE'), primary_key=True),
-    Column('similar_movie_id', Integer, ForeignKey('movies.id', ondelete='CASCADE'), primary_key=True)
+    Column('similar_movie_id', Integer, ForeignKey('movies.id', ondelete='CASCADE'), primary_key=True),
+    Column('score', Float, nullable=True),      # 유사도 (compute_similar_movies.py)
+    Column('rank', SmallInteger, nullable=False),  # 영화별 1..K (유사도 내림차순)
+    Index('ix_similar_movies_similar_movie_id', 'similar_movie_id'),  # 역방향 조회 (증분 갱신)
+    # 영화별 Top-K를 인덱스만으로 읽는다 (movie_id = ? ORDER BY rank LIMIT k)
+    Index('ix_similar_movies_movie_rank', 'movie_id', 'rank', postgresql_include=['similar_movie_id', 'score']),
 )
 
 
 class Movie(Base):
     """Movie model"""
     __tablename__ = 'movies'
+    __table_args__ = (
+        # 홈 "한국 인기 영화" 풀 — 한국 영화만 담은 부분 인덱스를 역방향으로 읽는다
+        # (ORDER BY popularity DESC, vote_average DESC)
+        Index('ix_movies_korean_popularity', 'popularity', 'vote_average', postgresql_where=text('is_korean')),
+    )
 
     id = Column(Integer, primary_key=True, index=True)  # TMDB ID
     title = Column(String(500), nullable=False, index=True)
@@ -67,7 +95,8 @@ class Movie(Base):
     director = Column(String(500))               # Director name (English/original)
     director_ko = Column(String(500))            # Director name (Korean)
     cast_ko = Column(Text)                       # Cast names in Korean (comma-separated)
-    production_countries_ko = Column(Text)        # Production countries in Korean
+    production_countries_ko = Column(Text)        # Production countries in Korean (표시용, 필터는 movie_countries)
+    is_korean = Column(Boolean, default=False, server_default=false(), nullable=False)  # 제작국에 대한민국 포함 (DB 트리거가 동기화)
     release_season = Column(String(10))           # 봄/여름/가을/겨울
     weighted_score = Column(Float, default=0.0)   # Pre-calculated weighted score
 
@@ -79,6 +108,10 @@ class Movie(Base):
     weather_scores = Column(JSONB, default={})   # {"sunny": 0.7, "rainy": 0.9, ...}
     emotion_tags = Column(JSONB, default={})     # {"healing": 0.8, "tension": 0.3, ...}
 
+    # Change watermark (DB trigger also bumps it for raw-SQL batch updates)
+    # UTC (naive) — DB server default/트리거도 now() AT TIME ZONE 'utc' (alembic e6b2c8d4f173)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
+
     # Relationships
     genres = relationship('Genre', secondary=movie_genres, back_populates='movies')
     cast_members = relationship('Person', secondary=movie_cast, back_populates='movies')
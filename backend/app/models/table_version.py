@@ -0,0 +1,18 @@
+"""
+TableVersion Model - 테이블별 변경 카운터 (인메모리 인덱스 재빌드 판정용)
+"""
+from sqlalchemy import BigInteger, Column, String
+
+from app.database import Base
+
+
+class TableVersion(Base):
+    """테이블 이름 → 변경 문장마다 1씩 오르는 버전 (DB 트리거가 갱신)"""
+
+    __tablename__ = "table_versions"
+
+    name = Column(String(64), primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0, server_default="0")
+
+    def __repr__(self) -> str:
+        return f"<TableVersion(name={self.name}, version={self.version})>"
@@ -143,3 +143,4 @@ class PaginatedMovies(BaseModel):
     page: int
     page_size: int
     total_pages: int
+    next_cursor: str | None = None  # keyset cursor for the next page (None on the last page)
@@ -0,0 +1,267 @@
+"""
+In-memory autocomplete index for movie titles and people.
+
+서버 시작 시 영화 제목(title, title_ko)과 인물 이름으로 빌드하고, 이후 movies가 바뀌면
+IndexRebuilder가 백그라운드에서 다시 빌드해 교체한다 (인물/출연 변경 포함).
+- 키 정규화: NFKC + 소문자 + 공백 압축 후 한글 음절을 자모로 분해한다
+  (겹모음/겹받침도 기본 자모로). 입력 중인 "기생ㅊ"도 "기생충"의 접두사가 된다.
+- 접두사: 정렬된 키 배열 + 이진 탐색. 제목 전체와 각 단어 시작 위치부터의 접미사,
+  한글 제목의 초성열("ㄱㅅㅊ")을 키로 넣는다.
+- 중간 일치: 정규화 텍스트의 문자 trigram 역색인 (쿼리 3자 이상, 접두사 결과가 부족할 때).
+- 순위: 접두사 일치 우선, 그다음 인기도(영화 popularity, 인물은 출연작 수) 내림차순.
+
+요청 경로에서 DB/Redis 왕복 없이 응답한다.
+"""
+from __future__ import annotations
+
+import bisect
+import logging
+import re
+import unicodedata
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.models import Movie, Person, movie_cast
+from app.services.index_rebuilder import IndexRebuilder
+
+logger = logging.getLogger(__name__)
+
+SHORT_PREFIX_LEN = 2  # 이 길이 이하 접두사는 결과를 메모이즈 (범위가 넓음)
+SHORT_PREFIX_DEPTH = 20  # 메모이즈 깊이 (limit 최댓값)
+PEOPLE_LIMIT = 5
+
+# --- Hangul jamo decomposition ---
+
+_HANGUL_BASE = 0xAC00
+_HANGUL_END = 0xD7A3
+_CHOSUNG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_JUNGSUNG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+_JONGSUNG = ["", *"ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ"]
+_COMPOUND = {
+    "ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ", "ㅝ": "ㅜㅓ", "ㅞ": "ㅜㅔ", "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ",
+    "ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ", "ㄼ": "ㄹㅂ",
+    "ㄽ": "ㄹㅅ", "ㄾ": "ㄹㅌ", "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ", "ㅄ": "ㅂㅅ",
+}
+_SPACE_RE = re.compile(r"\s+")
+
+
+def normalize(text: str) -> str:
+    """NFKC + 소문자 + 공백 압축.
+
+    입력 중인 호환 자모(ㄱ-ㅣ)는 NFKC가 조합형 자모로 바꾸므로 그대로 둔다.
+    """
+    text = "".join(ch if "\u3131" <= ch <= "\u318e" else unicodedata.normalize("NFKC", ch) for ch in text)
+    return _SPACE_RE.sub(" ", text.lower()).strip()
+
+
+def to_jamo(text: str) -> str:
+    """한글 음절 → 기본 자모열 (겹모음/겹받침 분해). 그 외 문자는 그대로."""
+    out: list[str] = []
+    for ch in text:
+        code = ord(ch)
+        if _HANGUL_BASE <= code <= _HANGUL_END:
+            offset = code - _HANGUL_BASE
+            jong = _JONGSUNG[offset % 28]
+            jung = _JUNGSUNG[(offset // 28) % 21]
+            cho = _CHOSUNG[offset // 588]
+            out.append(cho + _COMPOUND.get(jung, jung) + _COMPOUND.get(jong, jong))
+        else:
+            out.append(_COMPOUND.get(ch, ch))
+    return "".join(out)
+
+
+def to_chosung(text: str) -> str:
+    """한글 음절의 초성열 (한글이 아닌 문자는 제외). 한글이 없으면 빈 문자열."""
+    return "".join(
+        _CHOSUNG[(ord(ch) - _HANGUL_BASE) // 588]
+        for ch in text
+        if _HANGUL_BASE <= ord(ch) <= _HANGUL_END
+    )
+
+
+def _trigrams(text: str) -> set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class AutocompleteTable:
+    """한 종류(영화/인물)의 접두사 + trigram 인덱스."""
+
+    def __init__(self, names: list[list[str]], payloads: list[dict[str, Any]], popularity: np.ndarray) -> None:
+        """names[i]: 항목 i의 이름들 (예: [title_ko, title]), payloads[i]: 응답 dict."""
+        self.payloads = payloads
+        self.popularity = np.asarray(popularity, dtype=np.float64)
+        self.texts: list[tuple[str, ...]] = []  # 항목별 정규화 이름 (중간 일치 검증용)
+
+        keyed: list[tuple[str, int]] = []
+        grams: dict[str, list[int]] = {}
+        for idx, raw_names in enumerate(names):
+            normalized = tuple(dict.fromkeys(normalize(n) for n in raw_names if n))
+            self.texts.append(normalized)
+            keys: set[str] = set()
+            for name in normalized:
+                words = name.split(" ")
+                for w in range(len(words)):
+                    keys.add(to_jamo(" ".join(words[w:])))
+                chosung = to_chosung(name)
+                if chosung:
+                    keys.add(chosung)
+                for gram in _trigrams(name):
+                    grams.setdefault(gram, []).append(idx)
+            keyed.extend((key, idx) for key in keys)
+
+        keyed.sort()
+        self.keys = [key for key, _ in keyed]
+        self.key_owner = np.fromiter((idx for _, idx in keyed), dtype=np.int32, count=len(keyed))
+        self.grams = {gram: np.unique(np.asarray(ids, dtype=np.int32)) for gram, ids in grams.items()}
+        self._short: dict[str, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self.payloads)
+
+    def _rank(self, ids: np.ndarray, k: int) -> np.ndarray:
+        """항목 인덱스 → 인기도 내림차순 상위 k."""
+        if len(ids) > k:
+            ids = ids[np.argpartition(-self.popularity[ids], k - 1)[:k]]
+        return ids[np.argsort(-self.popularity[ids], kind="stable")]
+
+    def _prefix(self, key: str, k: int) -> np.ndarray:
+        if len(key) <= SHORT_PREFIX_LEN and k <= SHORT_PREFIX_DEPTH:
+            cached = self._short.get(key)
+            if cached is None:
+                cached = self._short[key] = self._prefix_range(key, SHORT_PREFIX_DEPTH)
+            return cached[:k]
+        return self._prefix_range(key, k)
+
+    def _prefix_range(self, key: str, k: int) -> np.ndarray:
+        lo = bisect.bisect_left(self.keys, key)
+        hi = bisect.bisect_left(self.keys, key + "\uffff", lo)
+        return self._rank(np.unique(self.key_owner[lo:hi]), k)
+
+    def _infix(self, text: str, k: int, exclude: np.ndarray) -> np.ndarray:
+        postings = [self.grams.get(gram) for gram in _trigrams(text)]
+        if not postings or any(p is None for p in postings):
+            return np.empty(0, dtype=np.int32)
+        postings.sort(key=len)
+        ids = postings[0]
+        for p in postings[1:]:
+            ids = np.intersect1d(ids, p, assume_unique=True)
+            if len(ids) == 0:
+                return ids
+        ids = np.setdiff1d(ids, exclude, assume_unique=True)
+        if len(text) == 3:  # trigram 하나 = 쿼리 자체 → 검증 불필요
+            return self._rank(ids, k)
+        # 인기도순으로 실제 부분 문자열 포함 여부를 확인하며 k개만 채운다
+        found: list[int] = []
+        for i in ids[np.argsort(-self.popularity[ids], kind="stable")]:
+            if any(text in name for name in self.texts[i]):
+                found.append(i)
+                if len(found) == k:
+                    break
+        return np.asarray(found, dtype=np.int32)
+
+    def search(self, query: str, k: int) -> list[dict[str, Any]]:
+        text = normalize(query)
+        if not text or k <= 0:
+            return []
+        ids = self._prefix(to_jamo(text), k)
+        if len(ids) < k and len(text) >= 3:
+            ids = np.concatenate([ids, self._infix(text, k - len(ids), ids)])
+        return [self.payloads[i] for i in ids]
+
+
+class AutocompleteIndex:
+    """영화 + 인물 자동완성 인덱스."""
+
+    def __init__(self, movies: AutocompleteTable, people: AutocompleteTable) -> None:
+        self.movies = movies
+        self.people = people
+
+    @property
+    def size(self) -> int:
+        return len(self.movies) + len(self.people)
+
+    @classmethod
+    def load(cls, db: Session) -> AutocompleteIndex:
+        movie_rows = db.query(
+            Movie.id, Movie.title, Movie.title_ko, Movie.release_date,
+            Movie.poster_path, Movie.weighted_score, Movie.popularity,
+        ).all()
+        movies = AutocompleteTable(
+            [[r.title_ko, r.title] for r in movie_rows],
+            [
+                {
+                    "id": r.id,
+                    "title": r.title_ko or r.title,
+                    "title_en": r.title,
+                    "year": r.release_date.year if r.release_date else None,
+                    "poster_path": r.poster_path,
+                    "weighted_score": round(r.weighted_score, 1) if r.weighted_score else None,
+                }
+                for r in movie_rows
+            ],
+            np.array([r.popularity or 0.0 for r in movie_rows], dtype=np.float64),
+        )
+
+        credits = dict(
+            db.query(movie_cast.c.person_id, func.count()).group_by(movie_cast.c.person_id).all()
+        )
+        person_rows = db.query(Person.id, Person.name).all()
+        people = AutocompleteTable(
+            [[r.name] for r in person_rows],
+            [{"id": r.id, "name": r.name} for r in person_rows],
+            np.array([credits.get(r.id, 0) for r in person_rows], dtype=np.float64),
+        )
+        return cls(movies, people)
+
+    def search(self, query: str, limit: int) -> dict[str, Any]:
+        return {
+            "movies": self.movies.search(query, limit),
+            "people": self.people.search(query, PEOPLE_LIMIT),
+            "query": query,
+        }
+
+
+_index: AutocompleteIndex | None = None
+_rebuilder: IndexRebuilder | None = None
+
+
+def _swap(index: AutocompleteIndex) -> None:
+    global _index  # noqa: PLW0603
+    _index = index
+
+
+def init_autocomplete_index(
+    session_factory: Callable[[], Session],
+    refresh_interval: float = 300.0,
+) -> AutocompleteIndex | None:
+    """자동완성 인덱스 빌드 (lifespan). 실패 시 None — ILIKE 검색으로 폴백.
+
+    이후 refresh_interval마다 movies/persons/movie_cast가 바뀌었으면 백그라운드에서 다시 빌드해 교체한다.
+    """
+    global _index, _rebuilder  # noqa: PLW0603
+
+    _rebuilder = IndexRebuilder(
+        "AutocompleteIndex", session_factory, AutocompleteIndex.load, _swap, refresh_interval,
+        tables=("persons", "movie_cast"),
+    )
+    db = session_factory()
+    try:
+        return _rebuilder.rebuild(db)
+    except Exception:
+        logger.exception("Failed to build AutocompleteIndex")
+        _index = None
+        _rebuilder = None
+        return None
+    finally:
+        db.close()
+
+
+def get_autocomplete_index() -> AutocompleteIndex | None:
+    """빌드된 자동완성 인덱스 반환 (없으면 None). 주기가 지났으면 백그라운드 재빌드를 건다."""
+    if _rebuilder is not None:
+        _rebuilder.maybe_rebuild()
+    return _index
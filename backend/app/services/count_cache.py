@@ -0,0 +1,79 @@
+"""
+Cached totals for filtered movie listings.
+
+GET /movies의 total은 필터 조합마다 전체 조인 COUNT가 필요하다.
+정규화된 필터 튜플을 키로 결과를 캐시한다 (정렬/페이지는 키에 포함하지 않음).
+
+- 1차: 프로세스 내 dict (TTL)
+- 2차: Redis (워커 간 공유, 같은 TTL) — section_cache의 동기 클라이언트 재사용
+TTL 동안 total은 근사값일 수 있다 (영화 추가/수정 반영 지연).
+"""
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections.abc import Callable
+
+from redis.exceptions import RedisError
+
+from app.config import settings
+from app.services import section_cache
+
+logger = logging.getLogger(__name__)
+
+REDIS_KEY_PREFIX = "movie_count"
+LOCAL_MAX_ENTRIES = 4096
+
+# 필터 해시 → (만료 시각(monotonic), total)
+_local: dict[str, tuple[float, int]] = {}
+_local_lock = threading.Lock()
+
+
+def filter_key(filters: dict) -> str:
+    """필터 dict → 안정적인 해시 키 (None 값 제외, 키 정렬)."""
+    normalized = {k: v for k, v in sorted(filters.items()) if v is not None}
+    return hashlib.md5(json.dumps(normalized, ensure_ascii=False, default=str).encode()).hexdigest()
+
+
+def get_cached_count(filters: dict, counter: Callable[[], int], ttl: int | None = None) -> int:
+    """필터 조합의 total. 로컬 → Redis → counter() 순으로 조회."""
+    ttl = ttl if ttl is not None else settings.MOVIE_COUNT_CACHE_TTL
+    key = filter_key(filters)
+
+    entry = _local.get(key)
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1]
+
+    redis_key = f"{REDIS_KEY_PREFIX}:{key}"
+    client = section_cache.get_redis_client()
+    total: int | None = None
+    if client is not None:
+        try:
+            raw = client.get(redis_key)
+            total = int(raw) if raw is not None else None
+        except (RedisError, ConnectionError, TimeoutError, ValueError) as e:
+            logger.warning("Movie count cache GET failed: %s", e)
+
+    if total is None:
+        total = counter()
+        if client is not None:
+            try:
+                client.setex(redis_key, ttl, total)
+            except (RedisError, ConnectionError, TimeoutError) as e:
+                logger.warning("Movie count cache SET failed: %s", e)
+
+    with _local_lock:
+        if len(_local) >= LOCAL_MAX_ENTRIES:
+            now = time.monotonic()
+            for stale in [k for k, (expires, _) in _local.items() if expires <= now]:
+                del _local[stale]
+            if len(_local) >= LOCAL_MAX_ENTRIES:
+                _local.clear()
+        _local[key] = (time.monotonic() + ttl, total)
+    return total
+
+
+def clear_count_cache() -> None:
+    """프로세스 내 캐시 비우기 (테스트/수동 무효화용). Redis 항목은 TTL로 만료된다."""
+    _local.clear()
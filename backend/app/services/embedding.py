@@ -1,9 +1,20 @@
 """
 Voyage AI Embedding Service — query text → 1024-dim vector.
-Redis caching with binary storage (separate client, decode_responses=False).
+
+2단계 캐시:
+- 1차: 프로세스 내 LRU (바이트 예산 EMBEDDING_LOCAL_CACHE_BYTES) — 네트워크 없이 응답
+- 2차: Redis binary storage (separate client, decode_responses=False), 워커 간 공유
+Redis 연결 상태는 명령 실패로 추적한다 (호출마다 PING 하지 않음).
+실패 시 클라이언트를 버리고 일정 시간 재연결하지 않는다.
+
+캐시 미스는 EmbeddingBatcher로 모아 공유 httpx 클라이언트(core/http_client)로
+한 번의 배치 요청을 보낸다. 같은 쿼리의 동시 요청은 하나로 합친다.
+VOYAGE_API_URL을 tests.voyage_stub 서버로 지정하면 로컬 스텁을 사용한다.
 """
 import hashlib
 import logging
+import time
+from collections import OrderedDict
 
 import httpx
 import numpy as np
@@ -11,38 +22,85 @@ import redis.asyncio as aioredis
 from redis.exceptions import RedisError
 
 from app.config import settings
+from app.core.http_client import get_http_client
+from app.services.embedding_batcher import EmbeddingBatcher
 
 logger = logging.getLogger(__name__)
 
-VOYAGE_API_URL = "https://api.voyageai.com/v1/embeddings"
 VOYAGE_MODEL = "voyage-multilingual-2"
 EMBEDDING_DIM = 1024
 EMBEDDING_CACHE_TTL = 86400  # 24시간
 
+_REDIS_RETRY_SECONDS = 30.0  # 연결 실패 후 재시도 간격
+
 # Binary Redis client (decode_responses=False for raw bytes)
 _redis_binary: aioredis.Redis | None = None
+_redis_retry_at = 0.0
+
+_batcher: EmbeddingBatcher | None = None
+
+
+class _LocalEmbeddingCache:
+    """캐시 키 → 읽기 전용 임베딩 LRU (저장된 배열 바이트 합으로 용량 제한)."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._entries: OrderedDict[str, np.ndarray] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> np.ndarray | None:
+        vec = self._entries.get(key)
+        if vec is not None:
+            self._entries.move_to_end(key)
+        return vec
+
+    def put(self, key: str, vec: np.ndarray) -> np.ndarray:
+        """저장 후 캐시에 보관된(읽기 전용) 배열 반환."""
+        if vec.nbytes > self.max_bytes:
+            return vec
+        vec.setflags(write=False)
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.nbytes -= old.nbytes
+        self._entries[key] = vec
+        self.nbytes += vec.nbytes
+        while self.nbytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.nbytes -= evicted.nbytes
+        return vec
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.nbytes = 0
+
+
+_local_cache = _LocalEmbeddingCache(settings.EMBEDDING_LOCAL_CACHE_BYTES)
 
 
 async def _get_binary_redis() -> aioredis.Redis | None:
-    """임베딩 바이너리 저장용 Redis 클라이언트 (decode_responses=False)."""
-    global _redis_binary
+    """임베딩 바이너리 저장용 Redis 클라이언트 (decode_responses=False).
+
+    연결 시 한 번만 PING 하고, 이후 상태는 명령 실패(_mark_redis_down)로 추적한다.
+    """
+    global _redis_binary, _redis_retry_at  # noqa: PLW0603
 
     if _redis_binary is not None:
-        try:
-            await _redis_binary.ping()
-            return _redis_binary
-        except (RedisError, ConnectionError, TimeoutError):
-            _redis_binary = None
+        return _redis_binary
+    if time.monotonic() < _redis_retry_at:
+        return None
 
     try:
         if settings.REDIS_URL:
-            _redis_binary = aioredis.from_url(
+            client = aioredis.from_url(
                 settings.REDIS_URL,
                 decode_responses=False,
                 socket_connect_timeout=5,
             )
         else:
-            _redis_binary = aioredis.Redis(
+            client = aioredis.Redis(
                 host=settings.REDIS_HOST,
                 port=settings.REDIS_PORT,
                 password=settings.REDIS_PASSWORD,
@@ -50,72 +108,104 @@ async def _get_binary_redis() -> aioredis.Redis | None:
                 decode_responses=False,
                 socket_connect_timeout=5,
             )
-        await _redis_binary.ping()
+        await client.ping()
+        _redis_binary = client
         return _redis_binary
     except (RedisError, ConnectionError, TimeoutError) as e:
         logger.warning("Binary Redis connection failed: %s", e)
-        _redis_binary = None
+        _redis_retry_at = time.monotonic() + _REDIS_RETRY_SECONDS
         return None
 
 
+def _mark_redis_down() -> None:
+    global _redis_binary, _redis_retry_at  # noqa: PLW0603
+    _redis_binary = None
+    _redis_retry_at = time.monotonic() + _REDIS_RETRY_SECONDS
+
+
 def _cache_key(text: str) -> str:
     normalized = text.strip().lower()
     return f"semantic_emb:{hashlib.md5(normalized.encode()).hexdigest()[:12]}"
 
 
+async def _embed_batch(texts: list[str]) -> list[np.ndarray] | None:
+    """Voyage AI 배치 요청 (공유 클라이언트). 실패 시 None."""
+    try:
+        response = await get_http_client().post(
+            settings.VOYAGE_API_URL,
+            json={
+                "input": texts,
+                "model": VOYAGE_MODEL,
+                "input_type": "query",
+            },
+            headers={
+                "Authorization": f"Bearer {settings.VOYAGE_API_KEY}",
+                "Content-Type": "application/json",
+            },
+        )
+        response.raise_for_status()
+        data = response.json()
+    except httpx.HTTPStatusError as e:
+        logger.error("Voyage AI HTTP error %d: %s", e.response.status_code, e.response.text[:200])
+        return None
+    except (httpx.HTTPError, TimeoutError) as e:
+        logger.error("Voyage AI embedding error: %s", e)
+        return None
+
+    items = sorted(data["data"], key=lambda item: item["index"])
+    logger.debug("Voyage AI embedding OK (%d queries)", len(items))
+    return [np.array(item["embedding"], dtype=np.float32) for item in items]
+
+
+def get_query_embedder() -> EmbeddingBatcher:
+    """쿼리 임베딩 배처 (싱글톤)."""
+    global _batcher  # noqa: PLW0603
+    if _batcher is None:
+        _batcher = EmbeddingBatcher(
+            _embed_batch,
+            max_batch_size=settings.EMBEDDING_BATCH_MAX_SIZE,
+            max_wait_ms=settings.EMBEDDING_BATCH_WAIT_MS,
+        )
+    return _batcher
+
+
 async def get_query_embedding(text: str) -> np.ndarray | None:
     """
     쿼리 텍스트를 Voyage AI로 임베딩 변환.
-    Redis 캐싱 적용 (TTL 24시간).
+    프로세스 내 LRU → Redis(TTL 24시간) → API 순으로 조회하고,
+    API 요청은 배치/single-flight로 보낸다. 반환 배열은 읽기 전용.
     API 키 미설정 시 None 반환.
     """
     key = _cache_key(text)
 
-    # Redis 캐시 확인
+    # 1차: 프로세스 내 캐시
+    cached_vec = _local_cache.get(key)
+    if cached_vec is not None:
+        return cached_vec
+
+    # 2차: Redis 캐시 확인
     redis = await _get_binary_redis()
     if redis:
         try:
             cached = await redis.get(key)
             if cached:
                 logger.debug("Embedding cache HIT: %s", key)
-                return np.frombuffer(cached, dtype=np.float32).copy()
+                return _local_cache.put(key, np.frombuffer(cached, dtype=np.float32).copy())
         except (RedisError, ConnectionError, TimeoutError) as e:
             logger.warning("Redis embedding get error: %s", e)
+            _mark_redis_down()
+            redis = None
 
     # API 키 확인
-    api_key = settings.VOYAGE_API_KEY
-    if not api_key:
+    if not settings.VOYAGE_API_KEY:
         logger.warning("VOYAGE_API_KEY not set — semantic search disabled")
         return None
 
-    # Voyage AI API 호출
-    try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.post(
-                VOYAGE_API_URL,
-                json={
-                    "input": [text],
-                    "model": VOYAGE_MODEL,
-                    "input_type": "query",
-                },
-                headers={
-                    "Authorization": f"Bearer {api_key}",
-                    "Content-Type": "application/json",
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
-
-        embedding = np.array(
-            data["data"][0]["embedding"], dtype=np.float32
-        )
-        logger.debug("Voyage AI embedding OK (%d dims)", len(embedding))
-    except httpx.HTTPStatusError as e:
-        logger.error("Voyage AI HTTP error %d: %s", e.response.status_code, e.response.text[:200])
-        return None
-    except (httpx.HTTPError, TimeoutError) as e:
-        logger.error("Voyage AI embedding error: %s", e)
+    # Voyage AI API 호출 (동시 쿼리와 배치, 같은 키는 합침)
+    embedding = await get_query_embedder().embed(text, key)
+    if embedding is None:
         return None
+    embedding = _local_cache.put(key, embedding)
 
     # Redis 캐시 저장
     if redis:
@@ -123,5 +213,11 @@ async def get_query_embedding(text: str) -> np.ndarray | None:
             await redis.setex(key, EMBEDDING_CACHE_TTL, embedding.tobytes())
         except (RedisError, ConnectionError, TimeoutError) as e:
             logger.warning("Redis embedding set error: %s", e)
+            _mark_redis_down()
 
     return embedding
+
+
+def clear_local_embedding_cache() -> None:
+    """프로세스 내 임베딩 캐시 비우기 (테스트/수동 무효화용)."""
+    _local_cache.clear()
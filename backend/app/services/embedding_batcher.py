@@ -0,0 +1,71 @@
+"""
+Micro-batching, single-flight embedding requests.
+
+짧은 시간(max_wait_ms) 안에 들어온 쿼리를 모아 한 번의 API 요청으로 보낸다.
+- 같은 키(정규화된 쿼리)로 진행 중인 요청이 있으면 새 요청 없이 그 결과를 기다린다 (single-flight).
+- 대기열이 max_batch_size에 도달하면 타이머를 기다리지 않고 즉시 보낸다.
+- 배치 함수가 실패(None 또는 예외)하면 배치의 모든 대기자가 None을 받는다.
+"""
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+EmbedBatchFn = Callable[[list[str]], Awaitable[list[np.ndarray] | None]]
+
+
+class EmbeddingBatcher:
+    """동시 쿼리 임베딩 요청을 모아 배치로 보내는 코얼레서."""
+
+    def __init__(self, embed_batch: EmbedBatchFn, max_batch_size: int = 32, max_wait_ms: float = 5.0) -> None:
+        self._embed_batch = embed_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._pending: list[tuple[str, str]] = []  # (key, text)
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    async def embed(self, text: str, key: str | None = None) -> np.ndarray | None:
+        """text 임베딩 (key가 같은 동시 요청은 하나로 합친다). 반환 배열은 대기자 간 공유된다."""
+        key = key if key is not None else text
+        future = self._inflight.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._inflight[key] = future
+            self._pending.append((key, text))
+            if len(self._pending) >= self.max_batch_size:
+                self._flush()
+            elif self._timer is None:
+                self._timer = loop.call_later(self.max_wait, self._flush)
+        # 한 대기자가 취소돼도 다른 대기자의 결과는 유지
+        return await asyncio.shield(future)
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        task = asyncio.get_running_loop().create_task(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: list[tuple[str, str]]) -> None:
+        vectors: list[np.ndarray] | None = None
+        try:
+            vectors = await self._embed_batch([text for _, text in batch])
+            if vectors is not None and len(vectors) != len(batch):
+                logger.error("Embedding batch size mismatch: sent %d, got %d", len(batch), len(vectors))
+                vectors = None
+        except Exception:
+            logger.exception("Embedding batch failed (%d queries)", len(batch))
+        for i, (key, _) in enumerate(batch):
+            future = self._inflight.pop(key, None)
+            if future is not None and not future.done():
+                future.set_result(vectors[i] if vectors is not None else None)
@@ -0,0 +1,128 @@
+"""
+Background rebuild-and-swap for in-memory movie indexes.
+
+자동완성/BM25 역색인은 lifespan에서 한 번 빌드되므로 이후 추가·수정된 데이터를 모른다.
+IndexRebuilder는 조회 경로에서 refresh_interval마다 원본 시그니처를 백그라운드
+스레드에서 확인하고, 바뀌었으면 새 세션으로 인덱스를 다시 빌드해 교체한다.
+요청은 빌드가 끝날 때까지 이전 인덱스를 그대로 쓴다.
+
+시그니처 (SourceSignature):
+- movies: 행 수, max(updated_at), 그리고 빌드 시점 워터마크 - WATERMARK_OVERLAP 이후 행 수.
+  updated_at은 트랜잭션 시작 시각(now() AT TIME ZONE 'utc')이라 긴 트랜잭션이 확인 이후 커밋되면
+  이미 기록한 max보다 작을 수 있다 — 겹침 구간의 행 수로 그런 늦은 커밋을 잡는다.
+- 그 밖의 원본 테이블(persons, keywords 등): table_versions의 변경 카운터
+  (d5a1b7c3e962의 문장 단위 트리거가 올린다). movies.updated_at을 건드리지 않는
+  인물명 수정/키워드 재임포트도 감지한다.
+
+시그니처는 빌드 전에 읽으므로 빌드 중 커밋된 변경은 다음 확인에서 다시 반영된다.
+"""
+import logging
+import threading
+import time
+from collections.abc import Callable, Sequence
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.models import Movie, TableVersion
+
+logger = logging.getLogger(__name__)
+
+WATERMARK_OVERLAP = timedelta(minutes=5)
+
+# (영화 수, max(updated_at), 겹침 구간 행 수, ((테이블, 버전), ...))
+SourceSignature = tuple[int, datetime | None, int, tuple[tuple[str, int], ...]]
+
+
+def source_signature(
+    db: Session,
+    tables: Sequence[str] = (),
+    watermark: datetime | None = None,
+) -> SourceSignature:
+    """원본 시그니처. watermark를 주면 겹침 구간을 그 기준으로 센다 (없으면 현재 max 기준)."""
+    count, latest = db.execute(select(func.count(Movie.id), func.max(Movie.updated_at))).one()
+    window_end = watermark if watermark is not None else latest
+    recent = 0
+    if window_end is not None:
+        recent = db.execute(
+            select(func.count(Movie.id)).where(Movie.updated_at > window_end - WATERMARK_OVERLAP)
+        ).scalar_one()
+    versions: tuple[tuple[str, int], ...] = ()
+    if tables:
+        versions = tuple(db.execute(
+            select(TableVersion.name, TableVersion.version)
+            .where(TableVersion.name.in_(tables))
+            .order_by(TableVersion.name)
+        ).tuples())
+    return int(count), latest, int(recent), versions
+
+
+class IndexRebuilder:
+    """build(db)로 만든 인덱스를 swap(index)으로 교체하는 주기적 재빌드기.
+
+    tables: movies 외에 인덱스가 읽는 테이블 (table_versions 카운터로 변경 감지)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        session_factory: Callable[[], Session],
+        build: Callable[[Session], Any],
+        swap: Callable[[Any], None],
+        refresh_interval: float,
+        tables: Sequence[str] = (),
+    ) -> None:
+        self.name = name
+        self.session_factory = session_factory
+        self.build = build
+        self.swap = swap
+        self.refresh_interval = refresh_interval
+        self.tables = tuple(tables)
+        self._signature: SourceSignature | None = None
+        self._last_check = time.monotonic()
+        self._guard = threading.Lock()
+        self._running = False
+
+    def rebuild(self, db: Session) -> Any:
+        """동기 빌드 + 교체 (초기 빌드용). 실패 시 예외를 그대로 올린다."""
+        return self._build_and_swap(db, source_signature(db, self.tables))
+
+    def is_stale(self, db: Session) -> bool:
+        """마지막 빌드 이후 원본이 바뀌었는지 (겹침 구간은 빌드 시점 워터마크 기준)."""
+        if self._signature is None:
+            return True
+        return source_signature(db, self.tables, self._signature[1]) != self._signature
+
+    def maybe_rebuild(self) -> bool:
+        """주기가 지났으면 백그라운드 확인/재빌드를 시작 (이미 진행 중이면 건너뜀)."""
+        if time.monotonic() - self._last_check < self.refresh_interval:
+            return False
+        with self._guard:
+            if self._running or time.monotonic() - self._last_check < self.refresh_interval:
+                return False
+            self._running = True
+            self._last_check = time.monotonic()
+        threading.Thread(target=self._run, name=f"{self.name}-rebuild", daemon=True).start()
+        return True
+
+    def _run(self) -> None:
+        db = self.session_factory()
+        try:
+            if not self.is_stale(db):
+                return
+            started = time.monotonic()
+            self.rebuild(db)
+            logger.info("%s rebuilt in %.1fs", self.name, time.monotonic() - started)
+        except Exception:
+            logger.exception("%s rebuild failed — keeping the previous index", self.name)
+        finally:
+            db.close()
+            self._running = False
+
+    def _build_and_swap(self, db: Session, signature: SourceSignature) -> Any:
+        index = self.build(db)
+        self.swap(index)
+        self._signature = signature
+        return index
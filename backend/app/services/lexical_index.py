@@ -0,0 +1,224 @@
+"""
+In-memory lexical (BM25) index over movie text fields.
+
+서버 시작 시 title, title_ko, overview, 키워드, cast_ko로 역색인을 빌드하고,
+이후 movies/keywords/movie_keywords가 바뀌면 IndexRebuilder가 백그라운드에서 다시 빌드해 교체한다.
+- 토큰: NFKC + 소문자화 후 단어(\\w+). 짧은 필드(제목/키워드/출연진)는 단어 내부
+  문자 bigram도 추가해 한국어 부분 일치("기생충" ↔ "기생")를 잡는다.
+- 점수: 필드 가중 tf를 합친 단일 문서에 대한 BM25 (k1=1.2, b=0.75).
+  포스팅마다 idf × tf 정규화 값을 미리 계산해 두고 쿼리 시 더하기만 한다.
+- 쿼리가 제목(title/title_ko)과 정확히 같으면 최상위로 올린다.
+
+시맨틱 검색은 이 결과를 벡터 후보와 RRF로 합치고, 임베딩이 없을 때는
+Postgres ILIKE 스캔 대신 이 인덱스로 키워드 검색을 한다.
+"""
+from __future__ import annotations
+
+import logging
+import re
+import unicodedata
+from collections import Counter, defaultdict
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.models import Keyword, Movie, movie_keywords
+from app.services.index_rebuilder import IndexRebuilder
+
+logger = logging.getLogger(__name__)
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# 필드 → (가중치, bigram 추가 여부)
+FIELD_WEIGHTS: dict[str, tuple[float, bool]] = {
+    "title": (3.0, True),
+    "title_ko": (3.0, True),
+    "keywords": (1.5, True),
+    "cast_ko": (1.5, True),
+    "overview": (1.0, False),
+}
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def normalize_text(text: str) -> str:
+    return unicodedata.normalize("NFKC", text).lower().strip()
+
+
+def tokenize(text: str | None, ngrams: bool = True) -> list[str]:
+    """텍스트 → 단어 + (ngrams면) 단어 내부 문자 bigram."""
+    if not text:
+        return []
+    words = _WORD_RE.findall(normalize_text(text))
+    terms = list(words)
+    if ngrams:
+        for word in words:
+            if len(word) > 2:
+                terms.extend(word[i:i + 2] for i in range(len(word) - 1))
+    return terms
+
+
+class LexicalIndex:
+    """CSR 역색인: term → (행 배열, BM25 점수 배열)."""
+
+    def __init__(self) -> None:
+        self.movie_ids = np.empty(0, dtype=np.int64)
+        self.vocab: dict[str, int] = {}
+        self.offsets = np.zeros(1, dtype=np.int64)
+        self.rows = np.empty(0, dtype=np.int32)
+        self.scores = np.empty(0, dtype=np.float32)
+        self.exact_titles: dict[str, list[int]] = {}
+
+    @property
+    def size(self) -> int:
+        return len(self.movie_ids)
+
+    def build(self, docs: list[dict[str, Any]]) -> None:
+        """docs: [{"id", "title", "title_ko", "overview", "cast_ko", "keywords"}]"""
+        vocab: dict[str, int] = {}
+        term_ids: list[int] = []
+        doc_rows: list[int] = []
+        tfs: list[float] = []
+        doc_len = np.zeros(len(docs), dtype=np.float32)
+        exact: dict[str, list[int]] = defaultdict(list)
+
+        for row, doc in enumerate(docs):
+            counts: Counter[str] = Counter()
+            for field, (weight, ngrams) in FIELD_WEIGHTS.items():
+                for term in tokenize(doc.get(field), ngrams):
+                    counts[term] += weight
+            for term, tf in counts.items():
+                term_ids.append(vocab.setdefault(term, len(vocab)))
+                doc_rows.append(row)
+                tfs.append(tf)
+            doc_len[row] = sum(counts.values())
+            for field in ("title", "title_ko"):
+                if doc.get(field):
+                    exact[normalize_text(doc[field])].append(row)
+
+        t = np.asarray(term_ids, dtype=np.int32)
+        r = np.asarray(doc_rows, dtype=np.int32)
+        tf = np.asarray(tfs, dtype=np.float32)
+        n = max(len(docs), 1)
+        df = np.bincount(t, minlength=len(vocab)).astype(np.float32)
+        idf = np.log1p((n - df + 0.5) / (df + 0.5))
+        avgdl = float(doc_len.mean()) if len(docs) else 1.0
+        norm = BM25_K1 * (1 - BM25_B + BM25_B * doc_len[r] / max(avgdl, 1e-6))
+        score = idf[t] * tf * (BM25_K1 + 1) / (tf + norm)
+
+        order = np.argsort(t, kind="stable")
+        offsets = np.zeros(len(vocab) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(t, minlength=len(vocab)), out=offsets[1:])
+
+        self.movie_ids = np.asarray([doc["id"] for doc in docs], dtype=np.int64)
+        self.vocab = vocab
+        self.offsets = offsets
+        self.rows = r[order]
+        self.scores = score[order].astype(np.float32)
+        self.exact_titles = {title: list(dict.fromkeys(rows)) for title, rows in exact.items()}
+
+    def load(self, db: Session) -> None:
+        """movies + keywords 조회 → 빌드."""
+        keywords: dict[int, list[str]] = defaultdict(list)
+        for movie_id, name in (
+            db.query(movie_keywords.c.movie_id, Keyword.name)
+            .join(Keyword, Keyword.id == movie_keywords.c.keyword_id)
+        ):
+            keywords[movie_id].append(name)
+
+        docs = [
+            {
+                "id": movie_id, "title": title, "title_ko": title_ko,
+                "overview": overview, "cast_ko": cast_ko,
+                "keywords": " ".join(keywords.get(movie_id, ())),
+            }
+            for movie_id, title, title_ko, overview, cast_ko in db.query(
+                Movie.id, Movie.title, Movie.title_ko, Movie.overview, Movie.cast_ko,
+            ).order_by(Movie.id)
+        ]
+        self.build(docs)
+
+    def search(self, query: str, top_k: int = 100) -> list[tuple[int, float]]:
+        """BM25 Top-K (movie_id, score). 제목 완전 일치는 최상위."""
+        if self.size == 0:
+            return []
+        term_ids = [self.vocab[t] for t in dict.fromkeys(tokenize(query)) if t in self.vocab]
+        exact_rows = self.exact_titles.get(normalize_text(query), [])
+        if not term_ids and not exact_rows:
+            return []
+
+        scores = np.zeros(self.size, dtype=np.float32)
+        for tid in term_ids:
+            start, end = self.offsets[tid], self.offsets[tid + 1]
+            scores[self.rows[start:end]] += self.scores[start:end]
+        if exact_rows:
+            scores[exact_rows] += scores.max() + 1.0
+
+        hit = np.flatnonzero(scores > 0)
+        if len(hit) > top_k:
+            hit = hit[np.argpartition(scores[hit], -top_k)[-top_k:]]
+        hit = hit[np.argsort(-scores[hit], kind="stable")]
+        return [(int(self.movie_ids[i]), float(scores[i])) for i in hit]
+
+
+_index: LexicalIndex | None = None
+_rebuilder: IndexRebuilder | None = None
+
+
+def _build(db: Session) -> LexicalIndex:
+    index = LexicalIndex()
+    index.load(db)
+    return index
+
+
+def _swap(index: LexicalIndex) -> None:
+    global _index  # noqa: PLW0603
+    _index = index
+
+
+def init_lexical_index(
+    session_factory: Callable[[], Session],
+    refresh_interval: float = 300.0,
+) -> LexicalIndex | None:
+    """역색인 빌드 (lifespan). 실패 시 None — ILIKE 검색으로 폴백.
+
+    이후 refresh_interval마다 movies/keywords/movie_keywords가 바뀌었으면 백그라운드에서 다시 빌드해 교체한다.
+    """
+    global _index, _rebuilder  # noqa: PLW0603
+
+    _rebuilder = IndexRebuilder(
+        "LexicalIndex", session_factory, _build, _swap, refresh_interval,
+        tables=("keywords", "movie_keywords"),
+    )
+    db = session_factory()
+    try:
+        return _rebuilder.rebuild(db)
+    except Exception:
+        logger.exception("Failed to build LexicalIndex")
+        _index = None
+        _rebuilder = None
+        return None
+    finally:
+        db.close()
+
+
+def get_lexical_index() -> LexicalIndex | None:
+    """빌드된 역색인 반환 (없으면 None). 주기가 지났으면 백그라운드 재빌드를 건다."""
+    if _rebuilder is not None:
+        _rebuilder.maybe_rebuild()
+    index = _index
+    if index is None or index.size == 0:
+        return None
+    return index
+
+
+def reciprocal_rank_fusion(*rankings: list[int], k: int = 60) -> dict[int, float]:
+    """여러 순위 리스트(movie_id) → {movie_id: Σ 1/(k + rank)} (rank는 1부터)."""
+    fused: dict[int, float] = defaultdict(float)
+    for ranking in rankings:
+        for rank, movie_id in enumerate(ranking, start=1):
+            fused[movie_id] += 1.0 / (k + rank)
+    return dict(fused)
@@ -0,0 +1,498 @@
+"""
+In-process columnar movie feature store.
+
+서버 시작 시 movies 테이블의 정적 스코어링 필드(mbti/weather/emotion 점수,
+weighted_score, popularity, certification, 장르)를 연속 NumPy 배열로 1회 로드한다.
+이후 movies.updated_at 워터마크(겹침 구간 포함)를 주기적으로 다시 읽어 바뀐 행만 증분 갱신한다.
+
+추천 엔진/다양성 후처리/재랭커는 ORM 객체를 하이드레이션하지 않고 이 배열을 읽는다.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterable
+from datetime import datetime, timedelta
+
+import numpy as np
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.models import Genre, Movie, movie_genres
+
+logger = logging.getLogger(__name__)
+
+# --- Column layouts (행렬 열 순서) ---
+
+MBTI_KEYS = [
+    "INTJ", "INTP", "ENTJ", "ENTP", "INFJ", "INFP", "ENFJ", "ENFP",
+    "ISTJ", "ISFJ", "ESTJ", "ESFJ", "ISTP", "ISFP", "ESTP", "ESFP",
+]
+WEATHER_KEYS = ["sunny", "rainy", "cloudy", "snowy"]
+EMOTION_KEYS = ["healing", "tension", "energy", "romance", "deep", "fantasy", "light"]
+
+SCORE_COLUMNS: dict[str, list[str]] = {
+    "mbti_scores": MBTI_KEYS,
+    "weather_scores": WEATHER_KEYS,
+    "emotion_tags": EMOTION_KEYS,
+}
+
+NO_CODE = -1  # certification/primary genre 없음
+
+# LLM 분석 대상 기준 (recommendation_engine.get_llm_movie_ids와 동일)
+LLM_MIN_VOTES = 50
+LLM_POOL_SIZE = 1000
+
+RANKED_LIST_DEPTH = 1000  # (score_type, key, 등급) 정렬 리스트당 보관 상위 N
+
+# updated_at은 트랜잭션 시작 시각 — 갱신 시점에 아직 커밋 전이던 변경을 놓치지 않도록 겹쳐 읽는다
+# (scripts/compute_similar_movies.py의 WATERMARK_OVERLAP과 같은 값)
+WATERMARK_OVERLAP = timedelta(minutes=5)
+
+
+class MovieRef:
+    """하이드레이션 전 후보 영화 참조 (id만 보유).
+
+    다양성 후처리는 id로 피처 스토어를 조회하므로 ORM 객체 없이 동작한다.
+    """
+
+    __slots__ = ("id",)
+
+    def __init__(self, movie_id: int) -> None:
+        self.id = movie_id
+
+    def __repr__(self) -> str:
+        return f"<MovieRef(id={self.id})>"
+
+
+class RankedList:
+    """(score_type, key, 등급) 기준 사전 정렬 후보 리스트.
+
+    score DESC, weighted_score DESC 순서이며, is_llm으로 LLM/키워드 분할이 미리 되어 있다.
+    """
+
+    __slots__ = ("ids", "scores", "is_llm")
+
+    def __init__(self, ids: np.ndarray, scores: np.ndarray, is_llm: np.ndarray) -> None:
+        self.ids = ids
+        self.scores = scores
+        self.is_llm = is_llm
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+class MovieFeatures:
+    """한 시점의 영화 피처 스냅샷.
+
+    읽기 전용으로 취급하며, 갱신 시 새 스냅샷을 만들어 통째로 교체한다.
+    점수 행렬의 NaN은 해당 JSONB 키가 없음을 의미한다.
+    """
+
+    def __init__(
+        self,
+        ids: np.ndarray,
+        scores: dict[str, np.ndarray],
+        weighted_score: np.ndarray,
+        popularity: np.ndarray,
+        vote_count: np.ndarray,
+        certification: np.ndarray,
+        genre_mask: np.ndarray,
+        primary_genre: np.ndarray,
+        release_year: np.ndarray,
+        genre_names: list[str],
+        cert_codes: list[str],
+    ) -> None:
+        self.ids = ids                        # (N,) int64, 오름차순
+        self.scores = scores                  # {"mbti_scores": (N, 16) float32, ...}
+        self.weighted_score = weighted_score  # (N,) float32
+        self.popularity = popularity          # (N,) float32
+        self.vote_count = vote_count          # (N,) int32
+        self.certification = certification    # (N,) int16, cert_codes 인덱스 (NO_CODE = NULL)
+        self.genre_mask = genre_mask          # (N,) uint64, genre_names 비트마스크
+        self.primary_genre = primary_genre    # (N,) int16, genre_names 인덱스 (NO_CODE = 없음)
+        self.release_year = release_year      # (N,) int16 (0 = 개봉일 없음)
+        self.genre_names = genre_names
+        self.cert_codes = cert_codes
+        self._genre_bit = {name: 1 << i for i, name in enumerate(genre_names)}
+        self._popularity_order: np.ndarray | None = None
+        self._llm_mask: np.ndarray | None = None
+        self._ranked: dict[tuple, RankedList] = {}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def rows(self, movie_ids: Iterable[int] | np.ndarray) -> np.ndarray:
+        """movie_id 배열 → 행 인덱스 배열 (없는 id는 -1)."""
+        ids = np.asarray(list(movie_ids) if not isinstance(movie_ids, np.ndarray) else movie_ids, dtype=np.int64)
+        if len(self.ids) == 0 or len(ids) == 0:
+            return np.full(len(ids), -1, dtype=np.int64)
+        pos = np.searchsorted(self.ids, ids)
+        pos = np.minimum(pos, len(self.ids) - 1)
+        return np.where(self.ids[pos] == ids, pos, -1)
+
+    @property
+    def popularity_order(self) -> np.ndarray:
+        """popularity DESC, weighted_score DESC 행 순서 (스냅샷당 1회 계산)."""
+        if self._popularity_order is None:
+            self._popularity_order = np.lexsort((-self.weighted_score, -self.popularity))
+        return self._popularity_order
+
+    @property
+    def llm_mask(self) -> np.ndarray:
+        """LLM 분석 대상 행 마스크 (vote_count >= 50 중 popularity 상위 1000편)."""
+        if self._llm_mask is None:
+            order = self.popularity_order
+            top = order[self.vote_count[order] >= LLM_MIN_VOTES][:LLM_POOL_SIZE]
+            mask = np.zeros(len(self.ids), dtype=bool)
+            mask[top] = True
+            self._llm_mask = mask
+        return self._llm_mask
+
+    def ranked_list(
+        self,
+        score_type: str,
+        key: str,
+        allowed: list[str] | None = None,
+        min_weighted_score: float = 6.0,
+    ) -> RankedList | None:
+        """점수 키별 정렬 리스트 (스냅샷당 조합별 1회 계산). 알 수 없는 키면 None.
+
+        get_movies_by_score의 `ORDER BY (score_type->>key)::float DESC` 쿼리를 대체한다.
+        """
+        cache_key = (score_type, key, tuple(allowed) if allowed else None, min_weighted_score)
+        ranked = self._ranked.get(cache_key)
+        if ranked is not None:
+            return ranked
+
+        col = self.score_column(score_type, key)
+        if col is None:
+            return None
+        mask = ~np.isnan(col) & (self.weighted_score >= min_weighted_score) & self.age_rating_mask(allowed)
+        rows = np.flatnonzero(mask)
+        rows = rows[np.lexsort((-self.weighted_score[rows], -col[rows]))][:RANKED_LIST_DEPTH]
+        ranked = RankedList(self.ids[rows], col[rows].astype(np.float64), self.llm_mask[rows])
+        self._ranked[cache_key] = ranked
+        return ranked
+
+    def score_column(self, score_type: str, key: str) -> np.ndarray | None:
+        """(score_type, key) 열 벡터 반환. 알 수 없는 키면 None."""
+        keys = SCORE_COLUMNS.get(score_type)
+        if keys is None or key not in keys:
+            return None
+        return self.scores[score_type][:, keys.index(key)]
+
+    def genre_bits(self, names: Iterable[str]) -> int:
+        """장르 이름들 → 비트마스크 (모르는 장르는 무시)."""
+        mask = 0
+        for name in names:
+            mask |= self._genre_bit.get(name, 0)
+        return mask
+
+    def genre_name(self, code: int) -> str | None:
+        return self.genre_names[code] if 0 <= code < len(self.genre_names) else None
+
+    def age_rating_mask(self, allowed: list[str] | None) -> np.ndarray:
+        """허용 certification 목록 → 행 마스크 (NULL certification은 항상 허용)."""
+        if allowed is None:
+            return np.ones(len(self.ids), dtype=bool)
+        codes = [i for i, c in enumerate(self.cert_codes) if c in allowed]
+        return np.isin(self.certification, codes) | (self.certification == NO_CODE)
+
+
+# ---------------------------------------------------------------------------
+# 로더
+# ---------------------------------------------------------------------------
+
+_MOVIE_COLUMNS = (
+    Movie.id,
+    Movie.mbti_scores,
+    Movie.weather_scores,
+    Movie.emotion_tags,
+    Movie.weighted_score,
+    Movie.popularity,
+    Movie.vote_count,
+    Movie.certification,
+    Movie.release_date,
+    Movie.updated_at,
+)
+
+
+def _fill_scores(target: np.ndarray, row: int, values: dict | None, keys: list[str]) -> None:
+    if not isinstance(values, dict):
+        return
+    for j, key in enumerate(keys):
+        val = values.get(key)
+        if val is not None:
+            target[row, j] = float(val)
+
+
+def _build_features(
+    movie_rows: list,
+    genre_rows: list,
+    genre_names: list[str],
+    cert_codes: list[str],
+) -> MovieFeatures:
+    """DB 행 → MovieFeatures. genre_names/cert_codes는 새 값이 나오면 뒤에 추가된다."""
+    movie_rows = sorted(movie_rows, key=lambda r: r[0])
+    n = len(movie_rows)
+
+    ids = np.fromiter((r[0] for r in movie_rows), dtype=np.int64, count=n)
+    scores = {
+        st: np.full((n, len(keys)), np.nan, dtype=np.float32)
+        for st, keys in SCORE_COLUMNS.items()
+    }
+    weighted_score = np.zeros(n, dtype=np.float32)
+    popularity = np.zeros(n, dtype=np.float32)
+    vote_count = np.zeros(n, dtype=np.int32)
+    certification = np.full(n, NO_CODE, dtype=np.int16)
+    genre_mask = np.zeros(n, dtype=np.uint64)
+    primary_genre = np.full(n, NO_CODE, dtype=np.int16)
+    release_year = np.zeros(n, dtype=np.int16)
+
+    cert_index = {c: i for i, c in enumerate(cert_codes)}
+    for i, r in enumerate(movie_rows):
+        _fill_scores(scores["mbti_scores"], i, r[1], MBTI_KEYS)
+        _fill_scores(scores["weather_scores"], i, r[2], WEATHER_KEYS)
+        _fill_scores(scores["emotion_tags"], i, r[3], EMOTION_KEYS)
+        weighted_score[i] = r[4] or 0.0
+        popularity[i] = r[5] or 0.0
+        vote_count[i] = r[6] or 0
+        if r[7] is not None:
+            if r[7] not in cert_index:
+                cert_index[r[7]] = len(cert_codes)
+                cert_codes.append(r[7])
+            certification[i] = cert_index[r[7]]
+        if r[8] is not None:
+            release_year[i] = r[8].year
+
+    genre_index = {g: i for i, g in enumerate(genre_names)}
+    row_of = {int(mid): i for i, mid in enumerate(ids)}
+    for movie_id, genre_name in genre_rows:
+        i = row_of.get(movie_id)
+        if i is None:
+            continue
+        if genre_name not in genre_index:
+            genre_index[genre_name] = len(genre_names)
+            genre_names.append(genre_name)
+        code = genre_index[genre_name]
+        genre_mask[i] |= np.uint64(1 << code)
+        if primary_genre[i] == NO_CODE:
+            primary_genre[i] = code
+
+    return MovieFeatures(
+        ids, scores, weighted_score, popularity, vote_count,
+        certification, genre_mask, primary_genre, release_year,
+        genre_names, cert_codes,
+    )
+
+
+def _load_genre_rows(db: Session, movie_ids: list[int] | None = None) -> list:
+    # primary_genre = 영화별 첫 행 — 전체 로드와 증분 패치가 같은 값을 얻도록 PK 순서로 고정
+    q = select(movie_genres.c.movie_id, Genre.name).join(Genre, Genre.id == movie_genres.c.genre_id)
+    if movie_ids is not None:
+        q = q.where(movie_genres.c.movie_id.in_(movie_ids))
+    return db.execute(q.order_by(movie_genres.c.movie_id, movie_genres.c.genre_id)).all()
+
+
+_PATCH_COLUMNS = ("weighted_score", "popularity", "vote_count", "certification",
+                  "genre_mask", "primary_genre", "release_year")
+
+
+def _changed_rows(current: MovieFeatures, rows: np.ndarray, patch: MovieFeatures) -> np.ndarray:
+    """patch 행 중 현재 스냅샷과 값이 다른 행의 마스크 (NaN == NaN)."""
+    changed = np.zeros(len(rows), dtype=bool)
+    for st, mat in current.scores.items():
+        old, new = mat[rows], patch.scores[st]
+        same = (old == new) | (np.isnan(old) & np.isnan(new))
+        changed |= ~same.all(axis=1)
+    for name in _PATCH_COLUMNS:
+        old, new = getattr(current, name)[rows], getattr(patch, name)
+        same = old == new
+        if old.dtype.kind == "f":
+            same |= np.isnan(old) & np.isnan(new)
+        changed |= ~same
+    return changed
+
+
+class MovieFeatureStore:
+    """MovieFeatures 스냅샷 보관 + 워터마크 기반 증분 갱신."""
+
+    def __init__(
+        self,
+        refresh_interval: float = 60.0,
+        session_factory: Callable[[], Session] | None = None,
+    ) -> None:
+        self.features: MovieFeatures | None = None
+        self.refresh_interval = refresh_interval
+        self._session_factory = session_factory
+        self._watermark: datetime | None = None
+        self._row_count = 0
+        self._last_check = 0.0
+        self._lock = threading.Lock()
+        self._reloading = False
+
+    @property
+    def size(self) -> int:
+        return len(self.features) if self.features is not None else 0
+
+    def load(self, db: Session) -> None:
+        """전체 로드."""
+        t0 = time.perf_counter()
+        movie_rows = db.execute(select(*_MOVIE_COLUMNS)).all()
+        genre_rows = _load_genre_rows(db)
+        self.features = _build_features(movie_rows, genre_rows, [], [])
+        self._watermark = max((r[9] for r in movie_rows if r[9] is not None), default=None)
+        self._row_count = len(movie_rows)
+        self._last_check = time.monotonic()
+        logger.info(
+            "MovieFeatureStore loaded: %d movies, %d genres (%.0fms)",
+            self.size, len(self.features.genre_names), (time.perf_counter() - t0) * 1000,
+        )
+
+    def refresh(self, db: Session, background_reload: bool = False) -> int:
+        """변경 신호 확인 후 증분 갱신. 값이 바뀐 행 수 반환.
+
+        - 행 수가 바뀌었으면(추가/삭제) 전체 재로드 (background_reload면 백그라운드 스레드에서)
+        - 아니면 updated_at > 워터마크 - WATERMARK_OVERLAP 행을 매번 다시 읽는다.
+          updated_at은 트리거가 트랜잭션 시작 시각(now() AT TIME ZONE 'utc')으로 찍으므로, 지난 갱신 이전에 시작해
+          이후에 커밋된 변경은 워터마크보다 작은 updated_at을 가진다 — max(updated_at)만 보면 놓친다.
+        """
+        count = db.execute(select(func.count(Movie.id))).scalar()
+        if self.features is None or count != self._row_count:
+            return self._full_reload(db, background_reload)
+        if self._watermark is None:
+            return 0
+
+        q = select(*_MOVIE_COLUMNS).where(Movie.updated_at > self._watermark - WATERMARK_OVERLAP)
+        fetched = db.execute(q).all()
+        if not fetched:
+            return 0
+
+        current = self.features
+        patch = _build_features(
+            fetched, _load_genre_rows(db, [r[0] for r in fetched]),
+            list(current.genre_names), list(current.cert_codes),
+        )
+        rows = current.rows(patch.ids)
+        if (rows < 0).any():
+            # 워터마크 사이에 추가+삭제가 겹친 경우
+            return self._full_reload(db, background_reload)
+
+        self._watermark = max(self._watermark, max(r[9] for r in fetched))
+        changed = _changed_rows(current, rows, patch)
+        if not changed.any():
+            return 0
+
+        scores = {st: m.copy() for st, m in current.scores.items()}
+        for st in scores:
+            scores[st][rows] = patch.scores[st]
+        arrays = {}
+        for name in _PATCH_COLUMNS:
+            arr = getattr(current, name).copy()
+            arr[rows] = getattr(patch, name)
+            arrays[name] = arr
+
+        self.features = MovieFeatures(
+            current.ids, scores, genre_names=patch.genre_names, cert_codes=patch.cert_codes, **arrays,
+        )
+        n_changed = int(changed.sum())
+        logger.info("MovieFeatureStore refreshed: %d movies updated", n_changed)
+        return n_changed
+
+    def _full_reload(self, db: Session, background: bool) -> int:
+        """전체 재로드. background면 새 세션으로 스냅샷을 빌드해 교체하고 0 반환 (요청 스레드 비차단)."""
+        if not background or self._session_factory is None:
+            self.load(db)
+            return self.size
+        if self._reloading:
+            return 0
+        self._reloading = True
+        threading.Thread(target=self._background_load, name="feature-store-reload", daemon=True).start()
+        return 0
+
+    def _background_load(self) -> None:
+        db = self._session_factory()
+        try:
+            with self._lock:  # 진행 중인 증분 갱신이 끝난 뒤 교체 (이후 갱신은 _reloading 동안 건너뜀)
+                self.load(db)
+        except Exception:
+            logger.exception("MovieFeatureStore background reload failed")
+        finally:
+            self._reloading = False
+            db.close()
+
+    def refresh_if_stale(self, db: Session) -> None:
+        """refresh_interval이 지났으면 갱신 (동시 요청 중 하나만 수행, 전체 재로드는 백그라운드)."""
+        if time.monotonic() - self._last_check < self.refresh_interval or self._reloading:
+            return
+        if not self._lock.acquire(blocking=False):
+            return
+        try:
+            self._last_check = time.monotonic()
+            self.refresh(db, background_reload=True)
+        except Exception:
+            logger.exception("MovieFeatureStore refresh failed")
+        finally:
+            self._lock.release()
+
+    # --- 다양성 후처리용 단건 조회 ---
+
+    def primary_genre(self, movie_id: int) -> str | None:
+        feats = self.features
+        if feats is None:
+            return None
+        row = feats.rows([movie_id])[0]
+        return feats.genre_name(int(feats.primary_genre[row])) if row >= 0 else None
+
+    def release_year(self, movie_id: int) -> int | None:
+        feats = self.features
+        if feats is None:
+            return None
+        row = feats.rows([movie_id])[0]
+        if row < 0 or feats.release_year[row] == 0:
+            return None
+        return int(feats.release_year[row])
+
+    def contains(self, movie_id: int) -> bool:
+        feats = self.features
+        return feats is not None and feats.rows([movie_id])[0] >= 0
+
+
+# ---------------------------------------------------------------------------
+# 싱글톤 인스턴스 관리
+# ---------------------------------------------------------------------------
+
+_store: MovieFeatureStore | None = None
+
+
+def init_feature_store(
+    session_factory: Callable[[], Session],
+    refresh_interval: float = 60.0,
+) -> MovieFeatureStore | None:
+    """Feature store 초기화 (lifespan에서 1회). 실패 시 None — ORM 경로로 폴백."""
+    global _store  # noqa: PLW0603
+
+    db = session_factory()
+    try:
+        store = MovieFeatureStore(refresh_interval=refresh_interval, session_factory=session_factory)
+        store.load(db)
+        _store = store
+        return _store
+    except Exception:
+        logger.exception("Failed to load MovieFeatureStore")
+        _store = None
+        return None
+    finally:
+        db.close()
+
+
+def get_feature_store(db: Session | None = None) -> MovieFeatureStore | None:
+    """현재 로드된 store 반환 (없으면 None). db가 주어지면 갱신 주기 경과 시 증분 갱신."""
+    store = _store
+    if store is None or store.features is None:
+        return None
+    if db is not None:
+        store.refresh_if_stale(db)
+    return store
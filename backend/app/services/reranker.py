@@ -10,6 +10,8 @@ from pathlib import Path
 
 import numpy as np
 
+from app.services.movie_feature_store import MovieFeatures, get_feature_store
+
 logger = logging.getLogger(__name__)
 
 # --- Feature constants (train_reranker.py와 동기화) ---
@@ -111,7 +113,18 @@ class LGBMReranker:
         candidates: list[dict],
         context: dict,
     ) -> np.ndarray:
-        """후보 리스트 → (N, 76) 피처 행렬."""
+        """후보 리스트 → (N, 76) 피처 행렬.
+
+        Feature store에 모든 후보가 있으면 movie_id로 배열에서 아이템 피처를 읽고,
+        없으면 후보 dict의 genres/emotion_tags/... 필드를 사용한다.
+        """
+        store = get_feature_store()
+        if store is not None and candidates:
+            feats = store.features
+            rows = feats.rows([c["movie_id"] for c in candidates])
+            if (rows >= 0).all():
+                return _features_from_store(feats, rows, candidates, context)
+
         n = len(candidates)
         x = np.zeros((n, N_FEATURES), dtype=np.float32)
 
@@ -181,6 +194,74 @@ class LGBMReranker:
         return x
 
 
+def _features_from_store(
+    feats: MovieFeatures,
+    rows: np.ndarray,
+    candidates: list[dict],
+    context: dict,
+) -> np.ndarray:
+    """Feature store 배열 → (N, 76) 피처 행렬 (행 단위 루프 없음)."""
+    n = len(rows)
+    x = np.zeros((n, N_FEATURES), dtype=np.float32)
+
+    mbti = context.get("mbti", "")
+    weather = context.get("weather", "")
+    raw_mood = context.get("mood", "")
+    mood = FRONTEND_MOOD_MAPPING.get(raw_mood, raw_mood)
+
+    offset = 0
+    mbti_idx = MBTI_TO_IDX.get(mbti)
+    if mbti_idx is not None:
+        x[:, offset + mbti_idx] = 1.0
+    offset += len(MBTI_TYPES)
+
+    # user genres (19, 후보 장르 proxy) + item genres (19): 비트마스크 → GENRE_LIST 열 순서
+    masks = feats.genre_mask[rows]
+    genre_block = np.zeros((n, len(GENRE_LIST)), dtype=np.float32)
+    for gidx, name in enumerate(GENRE_LIST):
+        bit = feats.genre_bits([name])
+        if bit:
+            genre_block[:, gidx] = (masks & np.uint64(bit)) != 0
+    x[:, offset:offset + len(GENRE_LIST)] = genre_block
+    offset += len(GENRE_LIST)
+    x[:, offset:offset + len(GENRE_LIST)] = genre_block
+    offset += len(GENRE_LIST)
+
+    x[:, offset] = feats.weighted_score[rows] / 10.0
+    offset += 1
+
+    emotions = np.stack(
+        [feats.score_column("emotion_tags", k)[rows] for k in EMOTION_KEYS], axis=1,
+    )
+    x[:, offset:offset + len(EMOTION_KEYS)] = np.nan_to_num(emotions, nan=0.0)
+    offset += len(EMOTION_KEYS)
+
+    weather_idx = WEATHER_TO_IDX.get(weather)
+    if weather_idx is not None:
+        x[:, offset + weather_idx] = 1.0
+    offset += len(WEATHER_TYPES)
+
+    mood_idx = MOOD_TO_IDX.get(mood)
+    if mood_idx is not None:
+        x[:, offset + mood_idx] = 1.0
+    offset += len(MOOD_TYPES)
+
+    # cross features
+    mbti_col = feats.score_column("mbti_scores", mbti) if mbti else None
+    if mbti_col is not None:
+        x[:, offset] = np.nan_to_num(mbti_col[rows], nan=0.0)
+    weather_col = feats.score_column("weather_scores", weather) if weather else None
+    if weather_col is not None:
+        x[:, offset + 1] = np.nan_to_num(weather_col[rows], nan=0.0)
+    offset += 2
+
+    # candidate features (검색 단계 값)
+    x[:, offset] = [c.get("tt_score", 0.0) for c in candidates]
+    x[:, offset + 1] = [1.0 / (c.get("rank", 0) + 1) for c in candidates]
+
+    return x
+
+
 # ---------------------------------------------------------------------------
 # 싱글톤 인스턴스 관리
 # ---------------------------------------------------------------------------
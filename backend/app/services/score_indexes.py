@@ -0,0 +1,68 @@
+"""
+Expression indexes for JSONB score sorts.
+
+MBTI/날씨/감성 점수는 JSONB(mbti_scores, weather_scores, emotion_tags)에 있어
+`ORDER BY (mbti_scores->>'INTJ')::float DESC`가 매번 전체 스캔 + 정렬이 된다.
+키마다 같은 식의 B-tree 표현식 인덱스를 두고 (alembic 8d4f1b2c6e13,
+scripts/manage_score_indexes.py), 쿼리는 여기서 만든 식을 그대로 쓴다.
+
+플래너는 인덱스 식과 쿼리 식이 구조적으로 같을 때만 인덱스를 쓴다.
+- 키는 바인드 파라미터가 아니라 리터럴로 인라인한다 (서버측 prepared statement에서도
+  상수로 보이도록). 허용 키 목록으로 검증하므로 인젝션 위험은 없다.
+- 정렬은 `DESC NULLS LAST` — 인덱스 정렬 방향과 같아야 Index Scan + LIMIT이 된다.
+"""
+from __future__ import annotations
+
+from sqlalchemy import Float, cast, literal_column
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.models import Movie
+from app.services.movie_feature_store import SCORE_COLUMNS
+
+# score_type → 인덱스 이름 접두사
+INDEX_PREFIXES: dict[str, str] = {
+    "mbti_scores": "ix_movies_mbti",
+    "weather_scores": "ix_movies_weather",
+    "emotion_tags": "ix_movies_emotion",
+}
+
+
+def is_indexed_key(score_type: str, key: str) -> bool:
+    return key in SCORE_COLUMNS.get(score_type, ())
+
+
+def _check(score_type: str, key: str) -> None:
+    if not is_indexed_key(score_type, key):
+        raise ValueError(f"Unknown score key: {score_type}.{key}")
+
+
+def score_sql(score_type: str, key: str) -> str:
+    """raw SQL용 점수 식 (인덱스 정의와 동일)."""
+    _check(score_type, key)
+    return f"(({score_type} ->> '{key}')::float)"
+
+
+def score_expr(score_type: str, key: str) -> ColumnElement[float]:
+    """ORM용 점수 식 — `CAST((movies.<score_type> ->> '<key>') AS FLOAT)`."""
+    _check(score_type, key)
+    column = getattr(Movie, score_type)
+    return cast(column.op("->>")(literal_column(f"'{key}'")), Float)
+
+
+def index_name(score_type: str, key: str) -> str:
+    _check(score_type, key)
+    return f"{INDEX_PREFIXES[score_type]}_{key.lower()}"
+
+
+def index_ddl(score_type: str, key: str, concurrently: bool = True) -> str:
+    """CREATE INDEX 문 (DESC NULLS LAST — 정렬 쿼리와 같은 방향)."""
+    mode = " CONCURRENTLY" if concurrently else ""
+    return (
+        f"CREATE INDEX{mode} IF NOT EXISTS {index_name(score_type, key)} "
+        f"ON movies ({score_sql(score_type, key)} DESC NULLS LAST)"
+    )
+
+
+def all_score_indexes() -> list[tuple[str, str]]:
+    """(score_type, key) 전체 — MBTI 16 + 날씨 4 + 감성 7."""
+    return [(score_type, key) for score_type, keys in SCORE_COLUMNS.items() for key in keys]
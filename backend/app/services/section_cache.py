@@ -0,0 +1,163 @@
+"""
+Shared cache for non-personalized home section pools.
+
+인기/한국 인기/높은 평점 풀은 age_rating에만 의존하므로 (section, age_rating)별로
+상위 100편의 직렬화된 MovieListItem을 캐시한다.
+
+- 1차: 프로세스 내 dict (TTL)
+- 2차: Redis (워커 간 공유, 같은 TTL). Redis에서 읽은 풀은 남은 TTL(PTTL)까지만 로컬에 둔다.
+- 미스 시 키별 락으로 single-flight — 동시 요청 중 하나만 DB를 조회한다.
+
+샘플링/셔플/섹션 dedup은 요청마다 캐시된 풀 위에서 수행한다.
+"""
+import json
+import logging
+import threading
+import time
+from collections.abc import Callable
+
+import redis
+from redis.exceptions import RedisError
+
+from app.config import settings
+from app.schemas import MovieListItem
+
+logger = logging.getLogger(__name__)
+
+REDIS_KEY_PREFIX = "section_pool"
+_REDIS_RETRY_SECONDS = 30.0  # 연결 실패 후 재시도 간격
+
+# (section, age_bucket) → (만료 시각(monotonic), 풀)
+_local: dict[tuple[str, str], tuple[float, list[MovieListItem]]] = {}
+_locks: dict[tuple[str, str], threading.Lock] = {}
+_locks_guard = threading.Lock()
+
+_redis_client: redis.Redis | None = None
+_redis_retry_at = 0.0
+
+
+def get_redis_client() -> redis.Redis | None:
+    """동기 Redis 클라이언트 (싱글톤). 연결 실패 시 일정 시간 재시도하지 않는다."""
+    global _redis_client, _redis_retry_at  # noqa: PLW0603
+
+    if _redis_client is not None:
+        return _redis_client
+    if time.monotonic() < _redis_retry_at:
+        return None
+    try:
+        client = redis.Redis.from_url(
+            settings.redis_connection_url,
+            decode_responses=True,
+            socket_connect_timeout=2,
+            socket_timeout=2,
+        )
+        client.ping()
+        _redis_client = client
+        return _redis_client
+    except (RedisError, ConnectionError, TimeoutError) as e:
+        logger.warning("Section cache Redis unavailable: %s", e)
+        _redis_retry_at = time.monotonic() + _REDIS_RETRY_SECONDS
+        return None
+
+
+def _drop_redis() -> None:
+    global _redis_client, _redis_retry_at  # noqa: PLW0603
+    _redis_client = None
+    _redis_retry_at = time.monotonic() + _REDIS_RETRY_SECONDS
+
+
+def _redis_key(section: str, age_bucket: str) -> str:
+    return f"{REDIS_KEY_PREFIX}:{section}:{age_bucket}"
+
+
+def _redis_get(key: str) -> tuple[list[MovieListItem], float | None] | None:
+    """(풀, 남은 TTL 초) — GET과 PTTL을 한 번에 보내 로컬 만료를 Redis 항목에 맞춘다.
+
+    남은 TTL을 알 수 없으면(만료 없음 등) None.
+    """
+    client = get_redis_client()
+    if client is None:
+        return None
+    try:
+        pipe = client.pipeline(transaction=False)
+        pipe.get(key)
+        pipe.pttl(key)
+        raw, pttl = pipe.execute()
+    except (RedisError, ConnectionError, TimeoutError) as e:
+        logger.warning("Section cache Redis GET failed: %s", e)
+        _drop_redis()
+        return None
+    if not raw:
+        return None
+    try:
+        payload = json.loads(raw)
+        pool = [MovieListItem.model_validate(item) for item in payload["items"]]
+    except (ValueError, KeyError, TypeError) as e:
+        logger.warning("Section cache payload invalid (%s): %s", key, e)
+        return None
+    # PTTL: -1 = 만료 없음, -2 = 키 없음 (GET 이후 만료)
+    return pool, (pttl / 1000 if pttl is not None and pttl >= 0 else None)
+
+
+def _redis_set(key: str, pool: list[MovieListItem], ttl: int) -> None:
+    client = get_redis_client()
+    if client is None or ttl <= 0:  # SETEX는 0 이하 TTL을 거부한다
+        return
+    payload = {
+        "ids": [item.id for item in pool],
+        "items": [item.model_dump(mode="json") for item in pool],
+    }
+    try:
+        client.setex(key, ttl, json.dumps(payload, ensure_ascii=False))
+    except (RedisError, ConnectionError, TimeoutError) as e:
+        logger.warning("Section cache Redis SET failed: %s", e)
+        _drop_redis()
+
+
+def _key_lock(key: tuple[str, str]) -> threading.Lock:
+    with _locks_guard:
+        lock = _locks.get(key)
+        if lock is None:
+            lock = _locks[key] = threading.Lock()
+        return lock
+
+
+def get_section_pool(
+    section: str,
+    age_bucket: str,
+    loader: Callable[[], list[MovieListItem]],
+    ttl: int | None = None,
+) -> list[MovieListItem]:
+    """(section, age_bucket) 풀 반환. 로컬 → Redis → loader(DB) 순으로 조회.
+
+    반환 리스트는 캐시와 공유되므로 호출 측에서 변경하지 않는다 (샘플링은 복사본으로).
+    """
+    ttl = ttl if ttl is not None else settings.SECTION_POOL_CACHE_TTL
+    key = (section, age_bucket)
+
+    entry = _local.get(key)
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1]
+
+    with _key_lock(key):
+        # 락 대기 중 다른 요청이 채웠을 수 있음
+        entry = _local.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+
+        redis_key = _redis_key(section, age_bucket)
+        cached = _redis_get(redis_key)
+        if cached is None:
+            pool, expires_in = loader(), ttl
+            _redis_set(redis_key, pool, ttl)
+        else:
+            # Redis 항목의 남은 수명까지만 — 새 TTL을 주면 풀이 최대 2×TTL 묵는다
+            pool, remaining = cached
+            expires_in = ttl if remaining is None else min(ttl, remaining)
+        _local[key] = (time.monotonic() + expires_in, pool)
+        return pool
+
+
+def clear_section_cache() -> None:
+    """프로세스 내 캐시 비우기 (테스트/수동 무효화용). Redis 항목은 TTL로 만료된다."""
+    _local.clear()
@@ -9,14 +9,17 @@ from __future__ import annotations
 import json
 import logging
 import sys
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 import numpy as np
 
+from app.services.movie_feature_store import get_feature_store
+
 if TYPE_CHECKING:
     import faiss as _faiss
-    import torch as _torch
 
 # backend/ 를 sys.path에 추가 (ml 모듈 접근)
 _backend_dir = str(Path(__file__).resolve().parent.parent.parent)
@@ -25,6 +28,9 @@ if _backend_dir not in sys.path:
 
 logger = logging.getLogger(__name__)
 
+USER_EMBED_DIM = 128
+USER_CACHE_SIZE = 4096  # (mbti, 장르 마스크) 조합 LRU 크기
+
 
 class TwoTowerRetriever:
     """서버 시작 시 1회 로드하여 사용하는 Two-Tower 검색기."""
@@ -34,30 +40,48 @@ class TwoTowerRetriever:
         model_path: str,
         index_path: str,
         movie_id_map_path: str,
+        cache_size: int = USER_CACHE_SIZE,
     ) -> None:
+        """model_path가 .npz면 NumPy User Tower(torch 불필요), 아니면 torch 체크포인트를 로드합니다."""
         import faiss
-        import torch  # noqa: F811
 
-        from ml.dataset import GENRE_TO_IDX, MBTI_TO_IDX  # noqa: F811
-        from ml.two_tower import TwoTowerModel
+        from ml.features import GENRE_TO_IDX, MBTI_TO_IDX
 
-        self._torch = torch
         self._GENRE_TO_IDX = GENRE_TO_IDX
         self._MBTI_TO_IDX = MBTI_TO_IDX
 
-        model = TwoTowerModel()
-        state = torch.load(model_path, map_location="cpu", weights_only=True)
-        model.load_state_dict(state)
-        model.eval()
-        self.model = model
+        self.model = None
+        self.user_tower = None
+        if str(model_path).endswith(".npz"):
+            from ml.user_tower_np import NumpyUserTower
+            self.user_tower = NumpyUserTower.load(model_path)
+            self.backend = "numpy"
+        else:
+            import torch
+
+            from ml.two_tower import TwoTowerModel
 
+            self._torch = torch
+            model = TwoTowerModel()
+            state = torch.load(model_path, map_location="cpu", weights_only=True)
+            model.load_state_dict(state)
+            model.eval()
+            self.model = model
+            self.backend = "torch"
+
+        self._faiss = faiss
         self.index = faiss.read_index(str(index_path))
         with open(movie_id_map_path, encoding="utf-8") as f:
             self.movie_id_map: list[int] = json.load(f)
+        self._position_of = {movie_id: pos for pos, movie_id in enumerate(self.movie_id_map)}
+        self._cert_masks: dict[tuple[int, tuple[str, ...]], np.ndarray] = {}
+        self.cache_size = cache_size
+        self._user_cache: OrderedDict[tuple[int, int], np.ndarray] = OrderedDict()
+        self._cache_lock = threading.Lock()
         self.ready = True
         logger.info(
-            "TwoTowerRetriever loaded: %d items in index",
-            self.index.ntotal,
+            "TwoTowerRetriever loaded: %d items in index (user tower: %s)",
+            self.index.ntotal, self.backend,
         )
 
     def retrieve(
@@ -66,53 +90,211 @@ class TwoTowerRetriever:
         preferred_genres: list[str] | None = None,
         top_k: int = 200,
         exclude_ids: set[int] | None = None,
+        allowed_certifications: list[str] | None = None,
     ) -> list[tuple[int, float]]:
         """Top-K 후보 영화를 반환합니다.
 
+        Args:
+            allowed_certifications: 허용 등급 목록 (None이면 제한 없음, NULL 등급은 항상 허용)
+
         Returns:
             [(movie_id, similarity_score), ...] 최대 top_k개
         """
+        return self.retrieve_batch(
+            [(mbti, preferred_genres)], top_k=top_k,
+            exclude_ids=[exclude_ids] if exclude_ids else None,
+            allowed_certifications=allowed_certifications,
+        )[0]
+
+    def retrieve_batch(
+        self,
+        users: list[tuple[str | None, list[str] | None]],
+        top_k: int = 200,
+        exclude_ids: list[set[int]] | None = None,
+        allowed_certifications: list[str] | None = None,
+    ) -> list[list[tuple[int, float]]]:
+        """여러 사용자의 Top-K 후보를 한 번의 forward로 임베딩하고 필터를 검색 안에서 적용합니다.
+
+        제외 ID와 등급 제한은 허용 비트맵(FAISS ID selector)으로 검색에 내려보내므로
+        제외 목록이 길어도 over-fetch 없이 top_k개를 채웁니다. 같은 필터를 쓰는 사용자는
+        한 번의 index.search로 묶습니다.
+
+        Args:
+            users: [(mbti, preferred_genres), ...]
+            exclude_ids: 사용자별 제외 영화 ID 집합 (users와 같은 길이)
+            allowed_certifications: 허용 등급 목록 (전체 사용자 공통)
+
+        Returns:
+            사용자별 [(movie_id, similarity_score), ...]
+            (실패 시, 또는 등급 제한이 있는데 feature store가 없으면 빈 리스트)
+        """
+        if not users:
+            return []
+        excludes = exclude_ids or [set()] * len(users)
         try:
-            exclude_ids = exclude_ids or set()
-            torch = self._torch
-
-            with torch.no_grad():
-                mbti_idx = torch.tensor([self._MBTI_TO_IDX.get(mbti or "INTJ", 0)], dtype=torch.long)
-                genre_vec = self._genre_multihot(preferred_genres or []).unsqueeze(0)
-                history_emb = torch.zeros(1, 128, dtype=torch.float32)
-
-                user_vec = self.model.user_tower(mbti_idx, genre_vec, history_emb)  # (1, 128)
-                user_vec_np = user_vec.numpy().astype(np.float32)
-
-            # exclude 고려하여 여유분 요청
-            search_k = top_k + len(exclude_ids) + 50
-            scores, indices = self.index.search(user_vec_np, min(search_k, self.index.ntotal))
-
-            results: list[tuple[int, float]] = []
-            for score, idx in zip(scores[0], indices[0], strict=True):
-                if idx < 0 or idx >= len(self.movie_id_map):
-                    continue
-                movie_id = self.movie_id_map[idx]
-                if movie_id in exclude_ids:
-                    continue
-                results.append((movie_id, float(score)))
-                if len(results) >= top_k:
-                    break
+            base_mask = self._certification_mask(allowed_certifications)
+            if allowed_certifications is not None and base_mask is None:
+                # 등급을 확인할 수 없으면 연령 제한 작품이 섞이지 않도록 검색하지 않는다
+                logger.warning("two_tower_retrieve_skipped: feature store unavailable for certification filter")
+                return [[] for _ in users]
+            keys = [self._user_key(mbti, genres) for mbti, genres in users]
+            user_vecs = self._embed_users(keys)  # (B, 128)
+
+            # 같은 제외 집합끼리 묶어 검색
+            groups: dict[frozenset[int], list[int]] = {}
+            for b, exclude in enumerate(excludes):
+                groups.setdefault(frozenset(exclude), []).append(b)
 
+            results: list[list[tuple[int, float]]] = [[] for _ in users]
+            for exclude, members in groups.items():
+                allowed = self._allowed_positions(base_mask, exclude)
+                scores, indices = self._search_filtered(user_vecs[members], top_k, allowed)
+                for row, b in enumerate(members):
+                    results[b] = self._collect(scores[row], indices[row], top_k)
             return results
         except Exception:
             logger.exception("two_tower_retrieve_failed")
-            return []
+            return [[] for _ in users]
 
-    def _genre_multihot(self, genres: list[str]) -> _torch.Tensor:
-        """장르 리스트 → 19차원 멀티핫."""
-        torch = self._torch
-        vec = torch.zeros(len(self._GENRE_TO_IDX), dtype=torch.float32)
-        for g in genres:
+    def _collect(
+        self,
+        scores: np.ndarray,
+        indices: np.ndarray,
+        top_k: int,
+    ) -> list[tuple[int, float]]:
+        results: list[tuple[int, float]] = []
+        for score, idx in zip(scores, indices, strict=True):
+            if idx < 0 or idx >= len(self.movie_id_map):
+                continue
+            results.append((self.movie_id_map[idx], float(score)))
+            if len(results) >= top_k:
+                break
+        return results
+
+    # --- 필터 pushdown ---
+
+    def _certification_mask(self, allowed_certifications: list[str] | None) -> np.ndarray | None:
+        """인덱스 위치별 등급 허용 마스크 (feature store 스냅샷당 등급 조합별 1회 계산).
+
+        제한이 없거나 feature store가 없으면 None (retrieve_batch는 후자를 검색 거부로 처리).
+        """
+        if allowed_certifications is None:
+            return None
+        store = get_feature_store()
+        if store is None:
+            return None
+        feats = store.features
+        key = (id(feats), tuple(allowed_certifications))
+        mask = self._cert_masks.get(key)
+        if mask is None:
+            rows = feats.rows(np.asarray(self.movie_id_map, dtype=np.int64))
+            known = rows >= 0
+            mask = np.zeros(len(rows), dtype=bool)
+            mask[known] = feats.age_rating_mask(allowed_certifications)[rows[known]]
+            # 이전 스냅샷 마스크는 버림
+            self._cert_masks = {k: v for k, v in self._cert_masks.items() if k[0] == id(feats)}
+            self._cert_masks[key] = mask
+        return mask
+
+    def _allowed_positions(self, base_mask: np.ndarray | None, exclude: frozenset[int]) -> np.ndarray | None:
+        """등급 마스크 + 제외 ID → 허용 위치 마스크 (필터가 없으면 None)."""
+        if not exclude:
+            return base_mask
+        allowed = base_mask.copy() if base_mask is not None else np.ones(len(self.movie_id_map), dtype=bool)
+        positions = [self._position_of[m] for m in exclude if m in self._position_of]
+        allowed[positions] = False
+        return allowed
+
+    def _search_filtered(
+        self,
+        queries: np.ndarray,
+        top_k: int,
+        allowed: np.ndarray | None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """허용 위치만 대상으로 Top-K 검색."""
+        ntotal = self.index.ntotal
+        if allowed is None:
+            return self.index.search(queries, min(top_k, ntotal))
+        k = min(top_k, int(allowed[:ntotal].sum()))
+        if k == 0:
+            empty = np.empty((len(queries), 0))
+            return empty.astype(np.float32), empty.astype(np.int64)
+
+        faiss = self._faiss
+        if faiss is not None and hasattr(faiss, "IDSelectorBitmap"):
+            bitmap = np.packbits(allowed[:ntotal], bitorder="little")
+            selector = faiss.IDSelectorBitmap(ntotal, faiss.swig_ptr(bitmap))
+            if isinstance(self.index, faiss.IndexIVF):
+                params = faiss.SearchParametersIVF(sel=selector, nprobe=self.index.nprobe)
+            else:
+                params = faiss.SearchParameters(sel=selector)
+            return self.index.search(queries, k, params=params)
+
+        # selector 미지원: 허용 항목이 k개 찰 때까지 검색 폭을 늘림
+        search_k = min(k * 2, ntotal)
+        while True:
+            scores, indices = self.index.search(queries, search_k)
+            keep = (indices >= 0) & allowed[np.clip(indices, 0, ntotal - 1)]
+            if search_k >= ntotal or (keep.sum(axis=1) >= k).all():
+                break
+            search_k = min(search_k * 2, ntotal)
+        out_scores = np.full((len(queries), k), -np.inf, dtype=np.float32)
+        out_indices = np.full((len(queries), k), -1, dtype=np.int64)
+        for row in range(len(queries)):
+            hit = np.flatnonzero(keep[row])[:k]
+            out_scores[row, :len(hit)] = scores[row, hit]
+            out_indices[row, :len(hit)] = indices[row, hit]
+        return out_scores, out_indices
+
+    # --- 사용자 임베딩 (LRU 캐시) ---
+
+    def _user_key(self, mbti: str | None, genres: list[str] | None) -> tuple[int, int]:
+        """(mbti, 선호 장르) → (mbti_idx, 19비트 장르 마스크). 임베딩 캐시 키."""
+        mask = 0
+        for g in genres or []:
             idx = self._GENRE_TO_IDX.get(g)
             if idx is not None:
-                vec[idx] = 1.0
-        return vec
+                mask |= 1 << idx
+        return self._MBTI_TO_IDX.get(mbti or "INTJ", 0), mask
+
+    def _embed_users(self, keys: list[tuple[int, int]]) -> np.ndarray:
+        """캐시 키 목록 → (B, 128) float32 사용자 벡터. 미스만 모아 한 번에 forward."""
+        out = np.empty((len(keys), USER_EMBED_DIM), dtype=np.float32)
+        missing: dict[tuple[int, int], list[int]] = {}
+        with self._cache_lock:
+            for b, key in enumerate(keys):
+                vec = self._user_cache.get(key)
+                if vec is None:
+                    missing.setdefault(key, []).append(b)
+                else:
+                    self._user_cache.move_to_end(key)
+                    out[b] = vec
+
+        if missing:
+            miss_keys = list(missing)
+            mbti_idx = np.array([k[0] for k in miss_keys], dtype=np.int64)
+            genre_mat = ((np.array([k[1] for k in miss_keys], dtype=np.int64)[:, None]
+                          >> np.arange(len(self._GENRE_TO_IDX))) & 1).astype(np.float32)
+            vecs = self._forward(mbti_idx, genre_mat)
+            with self._cache_lock:
+                for key, vec in zip(miss_keys, vecs, strict=True):
+                    out[missing[key]] = vec
+                    self._user_cache[key] = vec
+                while len(self._user_cache) > self.cache_size:
+                    self._user_cache.popitem(last=False)
+        return out
+
+    def _forward(self, mbti_idx: np.ndarray, genre_mat: np.ndarray) -> np.ndarray:
+        """User Tower forward (history 없음) → (B, 128) float32."""
+        if self.user_tower is not None:
+            return self.user_tower(mbti_idx, genre_mat)
+        torch = self._torch
+        with torch.no_grad():
+            history_emb = torch.zeros(len(mbti_idx), USER_EMBED_DIM, dtype=torch.float32)
+            user_vec = self.model.user_tower(
+                torch.from_numpy(mbti_idx), torch.from_numpy(genre_mat), history_emb,
+            )
+        return user_vec.numpy().astype(np.float32)
 
 
 # ---------------------------------------------------------------------------
@@ -126,10 +308,17 @@ def init_retriever(
     model_path: str,
     index_path: str,
     movie_id_map_path: str,
+    user_tower_path: str | None = None,
 ) -> TwoTowerRetriever | None:
-    """Retriever 초기화. 파일이 없으면 None 반환."""
+    """Retriever 초기화. 파일이 없으면 None 반환.
+
+    user_tower_path(.npz)가 있으면 torch 체크포인트 대신 NumPy User Tower를 사용합니다.
+    """
     global _retriever  # noqa: PLW0603
 
+    if user_tower_path and Path(user_tower_path).exists():
+        model_path = user_tower_path
+
     for path, name in [
         (model_path, "model"),
         (index_path, "FAISS index"),
@@ -0,0 +1,169 @@
+"""
+Per-user preference profile cache.
+
+개인화 추천마다 get_user_preferences(찜 컬렉션 + 장르, 최근 고평점 + 장르, 콜드스타트 장르)와
+get_similar_movie_ids가 3~5번 DB를 왕복한다. 결과를 UserProfile로 묶어 캐시한다.
+
+- 1차: 프로세스 내 LRU (TTL)
+- 2차: Redis (워커 간 공유, 같은 TTL) — section_cache의 동기 클라이언트 재사용
+- 무효화: 평점/찜/온보딩 쓰기 경로가 invalidate_user_profile 호출.
+  Redis의 사용자별 버전 키를 올리고 프로필을 지운다. 다른 워커의 1차 캐시는
+  조회 때마다 버전(같은 MGET 한 번)을 비교해 버린다.
+  Redis가 없으면 프로세스 내 버전만 올린다 (단일 워커 기준으로 정확).
+
+고평점은 최근 90일 기준이라 TTL 동안 창 밖으로 밀려난 평점이 남을 수 있다.
+"""
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+
+from redis.exceptions import RedisError
+
+from app.config import settings
+from app.services import section_cache
+
+logger = logging.getLogger(__name__)
+
+REDIS_KEY_PREFIX = "user_profile"
+LOCAL_MAX_ENTRIES = 10000
+
+
+class UserProfile:
+    """추천용 사용자 선호 스냅샷 (읽기 전용으로 취급)."""
+
+    __slots__ = ("favorited_ids", "genre_counts", "highly_rated_ids", "similar_ids")
+
+    def __init__(
+        self,
+        favorited_ids: set[int],
+        genre_counts: dict[str, int],
+        highly_rated_ids: set[int],
+        similar_ids: dict[int, float],
+    ) -> None:
+        self.favorited_ids = favorited_ids
+        self.genre_counts = genre_counts
+        self.highly_rated_ids = highly_rated_ids
+        self.similar_ids = similar_ids
+
+    def to_json(self) -> str:
+        return json.dumps({
+            "favorited_ids": sorted(self.favorited_ids),
+            "genre_counts": self.genre_counts,
+            "highly_rated_ids": sorted(self.highly_rated_ids),
+            "similar_ids": [[mid, score] for mid, score in self.similar_ids.items()],
+        }, ensure_ascii=False)
+
+    @classmethod
+    def from_json(cls, raw: str) -> "UserProfile":
+        payload = json.loads(raw)
+        return cls(
+            set(payload["favorited_ids"]),
+            payload["genre_counts"],
+            set(payload["highly_rated_ids"]),
+            {int(mid): float(score) for mid, score in payload["similar_ids"]},
+        )
+
+
+# user_id → (만료 시각(monotonic), 버전, 프로필)
+_local: OrderedDict[int, tuple[float, str, UserProfile]] = OrderedDict()
+_local_versions: dict[int, int] = {}
+_local_lock = threading.Lock()
+
+
+def _profile_key(user_id: int) -> str:
+    return f"{REDIS_KEY_PREFIX}:{user_id}"
+
+
+def _version_key(user_id: int) -> str:
+    return f"{REDIS_KEY_PREFIX}_ver:{user_id}"
+
+
+def _read_redis(user_id: int) -> tuple[str, str | None] | None:
+    """(버전, 프로필 JSON) — Redis를 못 쓰면 None."""
+    client = section_cache.get_redis_client()
+    if client is None:
+        return None
+    try:
+        version, raw = client.mget(_version_key(user_id), _profile_key(user_id))
+    except (RedisError, ConnectionError, TimeoutError) as e:
+        logger.warning("User profile cache GET failed: %s", e)
+        return None
+    return version or "0", raw
+
+
+def _store_local(user_id: int, version: str, profile: UserProfile, ttl: int) -> None:
+    with _local_lock:
+        _local[user_id] = (time.monotonic() + ttl, version, profile)
+        _local.move_to_end(user_id)
+        while len(_local) > LOCAL_MAX_ENTRIES:
+            _local.popitem(last=False)
+
+
+def get_user_profile(user_id: int, loader: Callable[[], UserProfile], ttl: int | None = None) -> UserProfile:
+    """사용자 프로필. 로컬(버전 일치) → Redis → loader(DB) 순으로 조회.
+
+    반환 객체는 캐시와 공유되므로 호출 측에서 변경하지 않는다.
+    """
+    ttl = ttl if ttl is not None else settings.USER_PROFILE_CACHE_TTL
+    remote = _read_redis(user_id)
+    if remote is None:
+        with _local_lock:
+            version = str(_local_versions.get(user_id, 0))
+    else:
+        version = remote[0]
+
+    with _local_lock:
+        entry = _local.get(user_id)
+        if entry is not None and entry[0] > time.monotonic() and entry[1] == version:
+            _local.move_to_end(user_id)
+            return entry[2]
+
+    if remote is not None and remote[1]:
+        try:
+            payload_version, _, raw = remote[1].partition(":")
+            if payload_version == version:
+                profile = UserProfile.from_json(raw)
+                _store_local(user_id, version, profile, ttl)
+                return profile
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning("User profile cache payload invalid (user %s): %s", user_id, e)
+
+    # 로드 전에 읽은 버전으로 저장 — 로드 중 무효화되면 다음 조회에서 버전이 달라 다시 읽는다
+    profile = loader()
+    _store_local(user_id, version, profile, ttl)
+    if remote is not None:
+        client = section_cache.get_redis_client()
+        if client is not None:
+            try:
+                client.setex(_profile_key(user_id), ttl, f"{version}:{profile.to_json()}")
+            except (RedisError, ConnectionError, TimeoutError) as e:
+                logger.warning("User profile cache SET failed: %s", e)
+    return profile
+
+
+def invalidate_user_profile(user_id: int) -> None:
+    """평점 생성/수정/삭제, 찜 토글, 컬렉션 변경, 온보딩 완료 후 호출 (커밋 이후)."""
+    with _local_lock:
+        _local.pop(user_id, None)
+        _local_versions[user_id] = _local_versions.get(user_id, 0) + 1
+    client = section_cache.get_redis_client()
+    if client is None:
+        return
+    try:
+        pipe = client.pipeline()
+        pipe.incr(_version_key(user_id))
+        pipe.expire(_version_key(user_id), settings.USER_PROFILE_CACHE_TTL * 2)
+        pipe.delete(_profile_key(user_id))
+        pipe.execute()
+    except (RedisError, ConnectionError, TimeoutError) as e:
+        logger.warning("User profile cache invalidation failed (user %s): %s", user_id, e)
+
+
+def clear_user_profile_cache() -> None:
+    """프로세스 내 캐시 비우기 (테스트/수동 무효화용). Redis 항목은 TTL로 만료된다."""
+    with _local_lock:
+        _local.clear()
+        _local_versions.clear()
@@ -0,0 +1,24 @@
+"""
+Two-Tower 입력 피처 정의 (torch 의존성 없음).
+
+학습(ml.dataset)과 서빙(app.services.two_tower_retriever)이 같은 인덱스를 쓰도록 한 곳에 둡니다.
+"""
+
+# RecFlix 19개 장르 (한국어, DB 기준)
+GENRE_LIST = [
+    "SF", "TV 영화", "가족", "공포", "다큐멘터리",
+    "드라마", "로맨스", "모험", "미스터리", "범죄",
+    "서부", "스릴러", "애니메이션", "액션", "역사",
+    "음악", "전쟁", "코미디", "판타지",
+]
+GENRE_TO_IDX = {g: i for i, g in enumerate(GENRE_LIST)}
+
+# MBTI 16종
+MBTI_TYPES = [
+    "INTJ", "INTP", "ENTJ", "ENTP", "INFJ", "INFP", "ENFJ", "ENFP",
+    "ISTJ", "ISFJ", "ESTJ", "ESFJ", "ISTP", "ISFP", "ESTP", "ESFP",
+]
+MBTI_TO_IDX = {m: i for i, m in enumerate(MBTI_TYPES)}
+
+# Emotion 7종
+EMOTION_KEYS = ["healing", "tension", "energy", "romance", "deep", "fantasy", "light"]
@@ -0,0 +1,473 @@
+"""
+유사 영화 Top-K 블록 행렬 엔진 (DB 의존성 없음).
+
+유사도 = 0.5 × emotion 코사인 + 0.3 × mbti 코사인 + 0.2 × 장르 Jaccard + LLM 보너스
+후보 = 장르가 1개 이상 겹치고 weighted_score >= MIN_WEIGHTED_SCORE인 다른 영화
+
+scripts/compute_similar_movies.py의 영화별 Python 루프를 대체한다.
+- 장르: 영화별 uint64 비트마스크 → Jaccard = popcount(a & b) / popcount(a | b).
+  블록 안에서 같은 마스크의 행은 장르 점수 벡터 하나를 공유한다.
+- 행 블록(block_size편)마다 후보 열 전체와 emotion/mbti를 행렬곱 한 번으로 계산
+- Top-K: 열 청크 최댓값으로 후보 청크 k개를 고른 뒤 그 안에서 argpartition
+- 블록들을 multiprocessing Pool로 병렬 처리 (fork 시 입력 행렬은 복사 없이 공유)
+
+증분 갱신(entrant_rows)은 변경된 영화가 다른 영화의 현재 Top-K에 새로 들어가는지를
+변경 영화 열만으로 판정한다.
+
+reference_top_k는 기존 스크립트의 영화별 루프를 그대로 옮긴 것으로, 패리티 확인용이다.
+"""
+from __future__ import annotations
+
+import multiprocessing as mp
+import os
+from collections.abc import Iterable, Sequence
+
+import numpy as np
+
+TOP_K = 10
+MIN_WEIGHTED_SCORE = 6.0  # 유사 영화 후보 품질 필터
+LLM_BONUS = 0.05          # LLM 분석 영화 우대 보너스
+WEIGHT_EMOTION = 0.5
+WEIGHT_MBTI = 0.3
+WEIGHT_GENRE = 0.2
+BLOCK_SIZE = 256  # 블록당 점수 행렬 ≈ 256 × 후보 수 × 4 bytes
+CHUNK = 32        # Top-K 1차 선별용 열 청크 크기
+
+_BYTE_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def popcount(x: np.ndarray) -> np.ndarray:
+    """uint64 배열의 비트 수 (NumPy 2.0+ bitwise_count, 없으면 바이트 테이블)."""
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(x)
+    as_bytes = np.ascontiguousarray(x).view(np.uint8).reshape(*x.shape, 8)
+    return _BYTE_POPCOUNT[as_bytes].sum(axis=-1, dtype=np.uint8)
+
+
+def normalize_rows(mat: np.ndarray) -> np.ndarray:
+    """L2 정규화 (영벡터는 그대로 0)."""
+    norms = np.linalg.norm(mat, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return (mat / norms).astype(np.float32)
+
+
+def genre_bitmasks(genres: Sequence[Iterable[str]]) -> tuple[np.ndarray, list[str]]:
+    """영화별 장르 집합 → (uint64 비트마스크, 장르 목록). 장르는 최대 64개."""
+    names = sorted({g for gs in genres for g in gs})
+    if len(names) > 64:
+        raise ValueError(f"Too many genres for a 64-bit mask: {len(names)}")
+    bit = {name: np.uint64(1) << np.uint64(i) for i, name in enumerate(names)}
+    masks = np.zeros(len(genres), dtype=np.uint64)
+    for i, gs in enumerate(genres):
+        for g in gs:
+            masks[i] |= bit[g]
+    return masks, names
+
+
+class SimilarityInputs:
+    """엔진 입력 (행 순서 = ids 순서) + 후보 열 사전 계산.
+
+    후보 열 = 품질 필터 통과 영화. 길이를 CHUNK 배수로 패딩한다
+    (패딩 열은 장르 비트 0 → 장르 겹침 없음 → -inf).
+    """
+
+    __slots__ = (
+        "ids", "emotion", "mbti", "genre_bits", "weighted_score", "is_llm",
+        "cand_cols", "cand_feats", "cand_bits", "cand_popcount", "cand_bonus", "row_feats", "col_of_row",
+        "row_index",
+    )
+
+    def __init__(
+        self,
+        ids: np.ndarray,
+        emotion: np.ndarray,
+        mbti: np.ndarray,
+        genre_bits: np.ndarray,
+        weighted_score: np.ndarray,
+        is_llm: np.ndarray,
+    ) -> None:
+        self.ids = np.asarray(ids, dtype=np.int64)
+        self.emotion = normalize_rows(np.asarray(emotion, dtype=np.float32))
+        self.mbti = normalize_rows(np.asarray(mbti, dtype=np.float32))
+        self.genre_bits = np.asarray(genre_bits, dtype=np.uint64)
+        self.weighted_score = np.asarray(weighted_score, dtype=np.float32)
+        self.is_llm = np.asarray(is_llm, dtype=bool)
+
+        n = len(self.ids)
+        cols = np.flatnonzero(self.weighted_score >= MIN_WEIGHTED_SCORE)
+        padded = -(-len(cols) // CHUNK) * CHUNK
+        self.cand_cols = cols
+        # 0.5·e_i·e_j + 0.3·m_i·m_j = [0.5·e_i, 0.3·m_i] · [e_j, m_j] — 행렬곱 한 번
+        self.row_feats = np.hstack([WEIGHT_EMOTION * self.emotion, WEIGHT_MBTI * self.mbti]).astype(np.float32)
+        self.cand_feats = np.zeros((padded, self.row_feats.shape[1]), dtype=np.float32)
+        self.cand_feats[:len(cols)] = np.hstack([self.emotion[cols], self.mbti[cols]])
+        self.cand_bits = np.zeros(padded, dtype=np.uint64)
+        self.cand_bits[:len(cols)] = self.genre_bits[cols]
+        self.cand_popcount = popcount(self.cand_bits).astype(np.float32)
+        self.cand_bonus = np.zeros(padded, dtype=np.float32)
+        self.cand_bonus[:len(cols)] = np.where(self.is_llm[cols], LLM_BONUS, 0.0)
+        self.col_of_row = np.full(n, -1, dtype=np.int64)
+        self.col_of_row[cols] = np.arange(len(cols))
+        self.row_index = {int(mid): row for row, mid in enumerate(self.ids)}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def row_of(self, movie_id: int) -> int:
+        """movie_id의 행 번호 (입력에 없으면 -1)"""
+        return self.row_index.get(movie_id, -1)
+
+
+def score_block(inputs: SimilarityInputs, rows: np.ndarray, k: int = TOP_K) -> tuple[np.ndarray, np.ndarray]:
+    """행 블록의 Top-K → (이웃 행 인덱스 (B, k), 점수 (B, k)). 후보가 k보다 적으면 -1 / -inf.
+
+    점수 행렬은 (후보 열 × 블록 행)으로 만든다 — 열 청크 최댓값 축약이 연속 메모리에서 돈다.
+    """
+    n_rows = len(rows)
+    out_idx = np.full((n_rows, k), -1, dtype=np.int64)
+    out_score = np.full((n_rows, k), -np.inf, dtype=np.float32)
+    n_cols = len(inputs.cand_bits)
+    if n_rows == 0 or n_cols == 0:
+        return out_idx, out_score
+
+    # 같은 장르 마스크끼리 모아 장르 점수 벡터를 한 번씩만 계산
+    order = np.argsort(inputs.genre_bits[rows], kind="stable")
+    rows = rows[order]
+    bits_r = inputs.genre_bits[rows]
+
+    scores = inputs.cand_feats @ inputs.row_feats[rows].T  # (C, B)
+    starts = np.flatnonzero(np.r_[True, bits_r[1:] != bits_r[:-1]])
+    for start, end in zip(starts, np.r_[starts[1:], n_rows], strict=True):
+        inter = popcount(bits_r[start] & inputs.cand_bits).astype(np.float32)
+        union = popcount(bits_r[start:start + 1]).astype(np.float32) + inputs.cand_popcount - inter
+        genre = WEIGHT_GENRE * inter / np.maximum(union, 1.0) + inputs.cand_bonus
+        genre[inter == 0] = -np.inf  # 장르 겹침 없음 (패딩 열 포함)
+        scores[:, start:end] += genre[:, None]
+    self_col = inputs.col_of_row[rows]
+    has_self = np.flatnonzero(self_col >= 0)
+    scores[self_col[has_self], has_self] = -np.inf  # 자기 자신
+
+    # Top-K: 열 청크별 최댓값 상위 k개 청크에 Top-K가 모두 들어 있다 → 그 안에서만 선택
+    n_chunks = n_cols // CHUNK
+    chunk_max = np.ascontiguousarray(scores.reshape(n_chunks, CHUNK, n_rows).max(axis=1).T)  # (B, chunks)
+    kc = min(k, n_chunks)
+    top_chunks = np.argpartition(chunk_max, -kc, axis=1)[:, -kc:]
+    cand = (top_chunks[:, :, None] * CHUNK + np.arange(CHUNK)).reshape(n_rows, -1)  # (B, kc*CHUNK)
+    cand_scores = scores[cand, np.arange(n_rows)[:, None]]
+
+    kk = min(k, cand.shape[1])
+    top = np.argpartition(cand_scores, -kk, axis=1)[:, -kk:]
+    top_scores = np.take_along_axis(cand_scores, top, axis=1)
+    rank = np.argsort(-top_scores, axis=1, kind="stable")
+    top_cols = np.take_along_axis(np.take_along_axis(cand, top, axis=1), rank, axis=1)
+    top_scores = np.take_along_axis(top_scores, rank, axis=1)
+
+    valid = np.isfinite(top_scores)
+    block_idx = np.where(valid, inputs.cand_cols[np.minimum(top_cols, len(inputs.cand_cols) - 1)], -1)
+    out_idx[order, :kk] = block_idx
+    out_score[order, :kk] = np.where(valid, top_scores, -np.inf)
+    return out_idx, out_score
+
+
+# --- multiprocessing (fork: 입력을 전역으로 넘겨 블록마다 pickle하지 않는다) ---
+
+_worker_inputs: SimilarityInputs | None = None
+
+
+def _init_worker(inputs: SimilarityInputs) -> None:
+    global _worker_inputs  # noqa: PLW0603
+    _worker_inputs = inputs
+
+
+def _score_block_worker(args: tuple[np.ndarray, int]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    rows, k = args
+    idx, score = score_block(_worker_inputs, rows, k)
+    return rows, idx, score
+
+
+def compute_top_k(
+    inputs: SimilarityInputs,
+    target_rows: np.ndarray | None = None,
+    k: int = TOP_K,
+    block_size: int = BLOCK_SIZE,
+    workers: int | None = None,
+    progress: bool = False,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """대상 행별 Top-K → (대상 행 (T,), 이웃 행 (T, k), 점수 (T, k)). 빈 자리는 -1 / -inf."""
+    targets = np.arange(len(inputs)) if target_rows is None else np.asarray(target_rows, dtype=np.int64)
+    # 장르 마스크순으로 블록을 나눠 블록 안의 같은 마스크 구간을 길게 만든다
+    order = np.argsort(inputs.genre_bits[targets], kind="stable")
+    blocks = [targets[order[i:i + block_size]] for i in range(0, len(targets), block_size)]
+    out_idx = np.full((len(targets), k), -1, dtype=np.int64)
+    out_score = np.full((len(targets), k), -np.inf, dtype=np.float32)
+    workers = workers if workers is not None else (os.cpu_count() or 1)
+
+    def collect(results: Iterable[tuple[np.ndarray, np.ndarray, np.ndarray]]) -> None:
+        done = 0
+        for n, (rows, idx, score) in enumerate(results):
+            positions = order[n * block_size:n * block_size + len(rows)]
+            out_idx[positions] = idx
+            out_score[positions] = score
+            done += len(rows)
+            if progress and ((n + 1) % 20 == 0 or done == len(targets)):
+                print(f"  진행: {done:,}/{len(targets):,} ({done / len(targets) * 100:.1f}%)")  # noqa: T201
+
+    if workers <= 1 or len(blocks) <= 1:
+        collect((rows, *score_block(inputs, rows, k)) for rows in blocks)
+    else:
+        ctx = mp.get_context("fork") if "fork" in mp.get_all_start_methods() else mp.get_context()
+        with ctx.Pool(workers, initializer=_init_worker, initargs=(inputs,)) as pool:
+            collect(pool.imap(_score_block_worker, [(rows, k) for rows in blocks]))
+    return targets, out_idx, out_score
+
+
+def to_results(
+    inputs: SimilarityInputs, targets: np.ndarray, idx: np.ndarray, score: np.ndarray,
+) -> dict[int, list[tuple[int, float]]]:
+    """엔진 출력 → {movie_id: [(similar_id, score), ...]} (후보 없는 영화는 제외)."""
+    results: dict[int, list[tuple[int, float]]] = {}
+    ids = inputs.ids
+    for row, nbrs, scores in zip(targets.tolist(), idx, score, strict=True):
+        valid = nbrs >= 0
+        if valid.any():
+            results[int(ids[row])] = list(zip(ids[nbrs[valid]].tolist(), scores[valid].astype(float).tolist(),
+                                              strict=True))
+    return results
+
+
+# --- 증분 갱신 (변경된 영화가 다른 영화의 Top-K에 새로 들어오는지) ---
+
+
+def _genre_scores(inputs: SimilarityInputs, rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+    """장르 Jaccard × 가중치 + LLM 보너스 (장르 겹침 없으면 -inf). rows/cols는 같은 모양으로 브로드캐스트."""
+    bits_r, bits_c = inputs.genre_bits[rows], inputs.genre_bits[cols]
+    inter = popcount(bits_r & bits_c).astype(np.float32)
+    union = popcount(bits_r).astype(np.float32) + popcount(bits_c).astype(np.float32) - inter
+    genre = WEIGHT_GENRE * inter / np.maximum(union, 1.0) + np.where(inputs.is_llm[cols], LLM_BONUS, 0.0)
+    genre = genre.astype(np.float32)
+    genre[inter == 0] = -np.inf
+    return genre
+
+
+def _mask_invalid(inputs: SimilarityInputs, scores: np.ndarray, rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+    """품질 미달 후보, 자기 자신 → -inf."""
+    scores[(inputs.weighted_score[cols] < MIN_WEIGHTED_SCORE) | (rows == cols)] = -np.inf
+    return scores
+
+
+def score_matrix(inputs: SimilarityInputs, rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+    """(rows × cols) 유사도 행렬 — score_block과 같은 점수, 후보가 될 수 없는 쌍은 -inf."""
+    rows, cols = np.asarray(rows, dtype=np.int64), np.asarray(cols, dtype=np.int64)
+    col_feats = np.hstack([inputs.emotion[cols], inputs.mbti[cols]])
+    scores = inputs.row_feats[rows] @ col_feats.T
+    scores += _genre_scores(inputs, rows[:, None], cols[None, :])
+    return _mask_invalid(inputs, scores, rows[:, None], cols[None, :])
+
+
+def neighbor_scores(inputs: SimilarityInputs, rows: np.ndarray, neighbors: np.ndarray) -> np.ndarray:
+    """행별 현재 이웃(neighbors (B, k), 빈 자리 -1)의 현재 점수. 빈 자리는 -inf."""
+    rows = np.asarray(rows, dtype=np.int64)
+    valid = neighbors >= 0
+    nbrs = np.where(valid, neighbors, 0)
+    col_feats = np.concatenate([inputs.emotion[nbrs], inputs.mbti[nbrs]], axis=-1)  # (B, k, F)
+    scores = np.einsum("bf,bkf->bk", inputs.row_feats[rows], col_feats)
+    scores += _genre_scores(inputs, rows[:, None], nbrs)
+    scores = _mask_invalid(inputs, scores, rows[:, None], nbrs)
+    scores[~valid] = -np.inf
+    return scores
+
+
+def entrant_rows(
+    inputs: SimilarityInputs,
+    changed_rows: np.ndarray,
+    neighbors: np.ndarray,
+    k: int = TOP_K,
+    block_size: int = 4096,
+) -> np.ndarray:
+    """변경된 영화가 Top-K에 새로 들어가야 하는 행.
+
+    neighbors: 전체 행의 현재 저장된 이웃 (n, k), 빈 자리 -1.
+    이웃이 모두 변경되지 않은 행이라면 기존 이웃 점수는 그대로이므로,
+    변경 영화와의 점수가 현재 k번째 점수보다 높을 때만 Top-K가 바뀐다.
+    (이웃 중 변경 영화가 있는 행은 호출 측이 역방향 조회로 따로 재계산한다.)
+    """
+    changed_rows = np.asarray(changed_rows, dtype=np.int64)
+    if len(changed_rows) == 0:
+        return np.empty(0, dtype=np.int64)
+    flagged = []
+    for start in range(0, len(inputs), block_size):
+        rows = np.arange(start, min(start + block_size, len(inputs)))
+        best_new = score_matrix(inputs, rows, changed_rows).max(axis=1)
+        current = neighbor_scores(inputs, rows, neighbors[rows])
+        full = (neighbors[rows] >= 0).sum(axis=1) >= k
+        kth = np.where(full, current.min(axis=1), -np.inf)
+        flagged.append(rows[np.isfinite(best_new) & (best_new > kth)])
+    return np.concatenate(flagged)
+
+
+def neighbor_matrix(
+    inputs: SimilarityInputs, stored: dict[int, list[tuple[int, float | None]]], k: int = TOP_K,
+) -> np.ndarray:
+    """저장된 {movie_id: [(similar_id, score), ...]} → 행 기준 (n, k) 이웃 행 번호. 없거나 입력에 없는 영화는 -1."""
+    neighbors = np.full((len(inputs), k), -1, dtype=np.int64)
+    for mid, nbrs in stored.items():
+        row = inputs.row_of(mid)
+        if row < 0:
+            continue
+        cols = [c for c in (inputs.row_of(sid) for sid, _ in nbrs[:k]) if c >= 0]
+        neighbors[row, :len(cols)] = cols
+    return neighbors
+
+
+def incremental_rows(
+    inputs: SimilarityInputs,
+    stored: dict[int, list[tuple[int, float | None]]],
+    changed_ids: Iterable[int],
+    k: int = TOP_K,
+) -> np.ndarray:
+    """changed_ids 변경 후 Top-K를 다시 계산해야 하는 행 (오름차순).
+
+    1. 변경된 영화 자신
+    2. 변경된 영화(또는 입력에서 빠진 영화)를 이웃으로 가진 영화 — 기존 점수가 바뀌었거나 자리가 빈다.
+       이웃이 k개 미만인 영화도 포함한다 (삭제된 영화가 CASCADE로 빠진 자리)
+    3. 변경된 영화가 새로 Top-K에 들어가는 영화 (entrant_rows)
+    """
+    changed = set(changed_ids)
+    rows = {inputs.row_of(mid) for mid in changed}
+    for mid, nbrs in stored.items():
+        if len(nbrs) < k or any(sid in changed or inputs.row_of(sid) < 0 for sid, _ in nbrs):
+            rows.add(inputs.row_of(mid))
+    rows.discard(-1)
+    changed_rows = np.array(sorted(r for r in map(inputs.row_of, changed) if r >= 0), dtype=np.int64)
+    rows.update(entrant_rows(inputs, changed_rows, neighbor_matrix(inputs, stored, k), k).tolist())
+    return np.array(sorted(rows), dtype=np.int64)
+
+
+def diff_pairs(
+    stored: dict[int, list[tuple[int, float | None]]],
+    results: dict[int, list[tuple[int, float]]],
+    movie_ids: Iterable[int],
+    atol: float = 1e-6,
+) -> tuple[list[tuple[int, int]], list[tuple[int, int, float, int]]]:
+    """movie_ids 범위에서 저장된 목록(rank 순) → 새 결과로 가는 차분.
+
+    반환: (삭제 (movie_id, similar_id), upsert (movie_id, similar_id, score, rank)).
+    새로 들어온 쌍과 score/rank가 바뀐 쌍을 upsert하고, 결과에 없는 영화는 이웃을 모두 지운다.
+    """
+    deletes, upserts = [], []
+    for mid in movie_ids:
+        old = {sid: (rank, score) for rank, (sid, score) in enumerate(stored.get(mid, ()), 1)}
+        new = results.get(mid, [])
+        new_ids = {sid for sid, _ in new}
+        deletes.extend((mid, sid) for sid in sorted(old.keys() - new_ids))
+        for rank, (sid, score) in enumerate(new, 1):
+            prev = old.get(sid)
+            if prev is None or prev[0] != rank or prev[1] is None or abs(prev[1] - score) > atol:
+                upserts.append((mid, sid, score, rank))
+    return deletes, upserts
+
+
+def ranked_csv_neighbors(
+    movie_id: int, similar_ids: str | Iterable[int | str] | None, known_ids: set[int],
+) -> tuple[list[tuple[int, int]], int]:
+    """CSV similar_movie_ids ("12, 34.0, ..." 또는 파싱된 리스트) → ([(similar_id, rank)], 건너뛴 수).
+
+    CSV 목록 순서가 곧 순위다 (rank는 1부터, 저장되는 이웃만 센다).
+    자기 자신, 데이터셋에 없는 ID, 중복은 건너뛴다. 점수가 없으므로 score는 NULL로 저장한다.
+    """
+    pairs: list[tuple[int, int]] = []
+    seen: set[int] = set()
+    skipped = 0
+    tokens = similar_ids.split(",") if isinstance(similar_ids, str) else (similar_ids or ())
+    for raw in tokens:
+        token = str(raw).strip()
+        if not token:
+            continue
+        try:
+            sid = int(float(token))
+        except ValueError:
+            continue
+        if sid in known_ids and sid != movie_id and sid not in seen:
+            seen.add(sid)
+            pairs.append((sid, len(pairs) + 1))
+        else:
+            skipped += 1
+    return pairs, skipped
+
+
+def reference_top_k(
+    inputs: SimilarityInputs,
+    genres: Sequence[set[str]],
+    target_rows: Iterable[int],
+    k: int = TOP_K,
+) -> dict[int, list[tuple[int, float]]]:
+    """기존 compute_similar의 영화별 루프 (패리티 기준). 느리므로 샘플에만 쓴다."""
+    by_genre: dict[str, set[int]] = {}
+    for row, gs in enumerate(genres):
+        for g in gs:
+            by_genre.setdefault(g, set()).add(row)
+
+    results: dict[int, list[tuple[int, float]]] = {}
+    for row in target_rows:
+        genres_a = genres[row]
+        candidates = set().union(*(by_genre[g] for g in genres_a)) if genres_a else set()
+        candidates.discard(row)
+        cand = np.array(sorted(c for c in candidates if inputs.weighted_score[c] >= MIN_WEIGHTED_SCORE))
+        if len(cand) == 0:
+            continue
+        emotion_sim = inputs.emotion[row] @ inputs.emotion[cand].T
+        mbti_sim = inputs.mbti[row] @ inputs.mbti[cand].T
+        genre_sims = np.array([len(genres_a & genres[c]) / len(genres_a | genres[c]) for c in cand],
+                              dtype=np.float32)
+        llm_bonus = np.array([LLM_BONUS if inputs.is_llm[c] else 0.0 for c in cand], dtype=np.float32)
+        scores = WEIGHT_EMOTION * emotion_sim + WEIGHT_MBTI * mbti_sim + WEIGHT_GENRE * genre_sims + llm_bonus
+        if len(scores) <= k:
+            top = np.argsort(scores)[::-1]
+        else:
+            top = np.argpartition(scores, -k)[-k:]
+            top = top[np.argsort(scores[top])[::-1]]
+        results[int(inputs.ids[row])] = [(int(inputs.ids[cand[i]]), float(scores[i])) for i in top]
+    return results
+
+
+def parity(
+    expected: dict[int, list[tuple[int, float]]],
+    actual: dict[int, list[tuple[int, float]]],
+    atol: float = 1e-5,
+) -> dict[str, float]:
+    """두 결과 비교 → 이웃 집합 일치율, 점수 최대 오차, 불일치 영화 수.
+
+    같은 점수(동점)의 경계 이웃은 구현에 따라 달라질 수 있으므로,
+    집합이 다르더라도 k번째 점수가 atol 안에서 같으면 일치로 본다.
+    """
+    movies = sorted(set(expected) | set(actual))
+    overlap = 0.0
+    max_diff = 0.0
+    mismatched = 0
+    for mid in movies:
+        exp, act = expected.get(mid, []), actual.get(mid, [])
+        exp_scores = np.array([s for _, s in exp], dtype=np.float64)
+        act_scores = np.array([s for _, s in act], dtype=np.float64)
+        if len(exp_scores) != len(act_scores):
+            mismatched += 1
+            continue
+        diff = float(np.max(np.abs(exp_scores - act_scores))) if len(exp_scores) else 0.0
+        max_diff = max(max_diff, diff)
+        exp_ids, act_ids = {s for s, _ in exp}, {s for s, _ in act}
+        overlap += len(exp_ids & act_ids) / max(len(exp_ids), 1)
+        if diff > atol or (exp_ids != act_ids and not _tied_boundary(exp, act, atol)):
+            mismatched += 1
+    return {
+        "movies": len(movies),
+        "overlap": overlap / max(len(movies), 1),
+        "max_score_diff": max_diff,
+        "mismatched": mismatched,
+    }
+
+
+def _tied_boundary(exp: list[tuple[int, float]], act: list[tuple[int, float]], atol: float) -> bool:
+    """다른 이웃이 모두 경계(k번째) 점수와 동점인지."""
+    boundary = exp[-1][1]
+    differing = {s for s, _ in exp} ^ {s for s, _ in act}
+    scores = dict(exp) | dict(act)
+    return all(abs(scores[s] - boundary) <= atol for s in differing)
@@ -0,0 +1,92 @@
+"""
+User Tower NumPy 추론 (torch 의존성 없음).
+
+ml/two_tower.UserTower와 같은 연산을 NumPy로 수행합니다.
+  x = concat(mbti_emb[mbti_idx], genre_vec @ Wg.T + bg, history_emb)   # (B, 192)
+  x = LayerNorm(ReLU(x @ W1.T + b1))                                   # (B, 256)
+  x = normalize(x @ W2.T + b2)                                         # (B, 128)
+
+가중치는 export_user_tower_npz()로 state_dict에서 .npz로 내보냅니다.
+"""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+# UserTower state_dict 키 → .npz 배열 이름
+_STATE_KEYS = {
+    "mbti_emb.weight": "mbti_emb",
+    "genre_proj.weight": "genre_w",
+    "genre_proj.bias": "genre_b",
+    "fc1.weight": "fc1_w",
+    "fc1.bias": "fc1_b",
+    "ln1.weight": "ln1_w",
+    "ln1.bias": "ln1_b",
+    "fc2.weight": "fc2_w",
+    "fc2.bias": "fc2_b",
+}
+LAYER_NORM_EPS = 1e-5   # nn.LayerNorm 기본값
+NORMALIZE_EPS = 1e-12   # F.normalize 기본값
+
+
+def export_user_tower_npz(state_dict: dict[str, Any], path: str | Path) -> None:
+    """UserTower(또는 TwoTowerModel) state_dict → .npz.
+
+    TwoTowerModel state_dict면 "user_tower." 접두사가 붙은 키를 사용합니다.
+    """
+    prefix = "user_tower." if any(k.startswith("user_tower.") for k in state_dict) else ""
+    arrays = {}
+    for key, name in _STATE_KEYS.items():
+        value = state_dict[prefix + key]
+        if hasattr(value, "detach"):
+            value = value.detach().cpu().numpy()
+        arrays[name] = np.asarray(value, dtype=np.float32)
+    np.savez(path, **arrays)
+
+
+class NumpyUserTower:
+    """UserTower의 NumPy 구현 (float32)."""
+
+    def __init__(self, weights: dict[str, np.ndarray]) -> None:
+        self.mbti_emb = weights["mbti_emb"]    # (16, 32)
+        self.genre_w = weights["genre_w"]      # (32, 19)
+        self.genre_b = weights["genre_b"]      # (32,)
+        self.fc1_w = weights["fc1_w"]          # (256, 192)
+        self.fc1_b = weights["fc1_b"]
+        self.ln1_w = weights["ln1_w"]
+        self.ln1_b = weights["ln1_b"]
+        self.fc2_w = weights["fc2_w"]          # (128, 256)
+        self.fc2_b = weights["fc2_b"]
+        self.out_dim = self.fc2_w.shape[0]
+        self.history_dim = self.fc1_w.shape[1] - self.mbti_emb.shape[1] - self.genre_w.shape[0]
+
+    @classmethod
+    def load(cls, path: str | Path) -> NumpyUserTower:
+        with np.load(path) as data:
+            return cls({name: data[name].astype(np.float32) for name in _STATE_KEYS.values()})
+
+    def __call__(
+        self,
+        mbti_idx: np.ndarray,
+        genre_vec: np.ndarray,
+        history_emb: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """(B,) int, (B, 19) float, (B, 128) float → (B, 128) L2-normalized float32."""
+        batch = len(mbti_idx)
+        if history_emb is None:
+            history_emb = np.zeros((batch, self.history_dim), dtype=np.float32)
+
+        mbti_out = self.mbti_emb[mbti_idx]
+        genre_out = genre_vec.astype(np.float32) @ self.genre_w.T + self.genre_b
+        x = np.concatenate([mbti_out, genre_out, history_emb.astype(np.float32)], axis=1)
+
+        x = np.maximum(x @ self.fc1_w.T + self.fc1_b, 0.0)
+        mean = x.mean(axis=1, keepdims=True)
+        var = x.var(axis=1, keepdims=True)
+        x = (x - mean) / np.sqrt(var + LAYER_NORM_EPS) * self.ln1_w + self.ln1_b
+
+        x = x @ self.fc2_w.T + self.fc2_b
+        norm = np.maximum(np.linalg.norm(x, axis=1, keepdims=True), NORMALIZE_EPS)
+        return (x / norm).astype(np.float32)
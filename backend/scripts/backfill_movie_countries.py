@@ -0,0 +1,130 @@
+# ruff: noqa: T201
+"""
+movies.production_countries_ko ↔ movie_countries 정합성 백필.
+
+국가 필터/홈 한국 영화 풀은 정규화된 조인(movie_countries, countries.name_ko)과
+movies.is_korean을 읽습니다. 이 스크립트는 표시용 텍스트 컬럼과 조인을 맞춥니다.
+
+1. countries.name_ko 채우기: 국가가 하나뿐인 영화들에서 (영문명 → 한글 표기) 최빈값
+2. 텍스트에는 있는데 조인에 없는 (영화, 국가) 링크 추가
+3. movies.is_korean 재계산 (트리거와 같은 규칙: production_countries_ko에 대한민국 포함)
+텍스트에만 있고 countries에 없는 한글 국가명, 조인에만 있는 링크는 보고만 합니다.
+
+임포트/신작 추가 후 실행하세요.
+
+Usage:
+    cd backend
+    python scripts/backfill_movie_countries.py --dry-run   # 변경 없이 불일치만 보고
+    python scripts/backfill_movie_countries.py
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+from collections import Counter, defaultdict
+from pathlib import Path
+
+from sqlalchemy import text
+
+# backend/ 를 sys.path에 추가하여 app 모듈 import
+_backend_dir = str(Path(__file__).resolve().parent.parent)
+if _backend_dir not in sys.path:
+    sys.path.insert(0, _backend_dir)
+
+from app.database import engine  # noqa: E402, I001
+
+# movies_sync_is_korean 트리거(alembic c4f9e2a7b815)와 같은 식 — 바꾸면 둘 다 바꾼다
+IS_KOREAN_SQL = "COALESCE(production_countries_ko LIKE '%대한민국%', false)"
+BATCH_SIZE = 1000
+
+
+def parse_list(val: str | None) -> list[str]:
+    if not val or not val.strip():
+        return []
+    return list(dict.fromkeys(item.strip() for item in val.split(",") if item.strip()))
+
+
+def infer_name_ko(texts: dict[int, list[str]], links: dict[int, set[int]]) -> dict[int, tuple[str, float]]:
+    """국가 하나짜리 영화들에서 country_id → (한글 표기 최빈값, 비율)."""
+    votes: dict[int, Counter[str]] = defaultdict(Counter)
+    for movie_id, names in texts.items():
+        country_ids = links.get(movie_id, set())
+        if len(names) == 1 and len(country_ids) == 1:
+            votes[next(iter(country_ids))][names[0]] += 1
+    inferred = {}
+    for country_id, counter in votes.items():
+        name_ko, n = counter.most_common(1)[0]
+        inferred[country_id] = (name_ko, n / sum(counter.values()))
+    return inferred
+
+
+def run(dry_run: bool) -> None:
+    with engine.connect() as conn:
+        countries = {cid: (name, name_ko) for cid, name, name_ko in conn.execute(
+            text("SELECT id, name, name_ko FROM countries"))}
+        texts = {mid: parse_list(val) for mid, val in conn.execute(
+            text("SELECT id, production_countries_ko FROM movies"))}
+        links: dict[int, set[int]] = defaultdict(set)
+        for mid, cid in conn.execute(text("SELECT movie_id, country_id FROM movie_countries")):
+            links[mid].add(cid)
+        print(f"countries: {len(countries)}, movies: {len(texts)}, links: {sum(map(len, links.values()))}")
+
+        # 1. name_ko
+        updates = {}
+        for cid, (name_ko, ratio) in sorted(infer_name_ko(texts, links).items()):
+            current = countries[cid][1]
+            if current is None:
+                updates[cid] = name_ko
+                print(f"  name_ko {countries[cid][0]} → {name_ko} ({ratio:.0%})")
+            elif current != name_ko:
+                print(f"  [warn] name_ko {countries[cid][0]}: {current} (DB) vs {name_ko} (추론 {ratio:.0%}) — 유지")
+        name_to_id = {name_ko: cid for cid, (_, name_ko) in countries.items() if name_ko}
+        name_to_id.update({name_ko: cid for cid, name_ko in updates.items()})
+
+        # 2. 누락 링크
+        missing: list[dict] = []
+        unknown: Counter[str] = Counter()
+        extra = 0
+        for mid, names in texts.items():
+            expected = {name_to_id[name] for name in names if name in name_to_id}
+            unknown.update(name for name in names if name not in name_to_id)
+            missing.extend({"mid": mid, "cid": cid} for cid in expected - links.get(mid, set()))
+            if names and len(expected) == len(names):
+                extra += len(links.get(mid, set()) - expected)
+        print(f"missing links: {len(missing)}, links not in text: {extra}")
+        for name, n in unknown.most_common(10):
+            print(f"  [warn] countries에 없는 한글 국가명: {name} ({n}편)")
+
+        if dry_run:
+            print("\n[dry-run] 변경 없음")
+            return
+
+        for cid, name_ko in updates.items():
+            conn.execute(text("UPDATE countries SET name_ko = :name_ko WHERE id = :cid"),
+                         {"name_ko": name_ko, "cid": cid})
+        for i in range(0, len(missing), BATCH_SIZE):
+            conn.execute(text(
+                "INSERT INTO movie_countries (movie_id, country_id) VALUES (:mid, :cid) ON CONFLICT DO NOTHING"
+            ), missing[i:i + BATCH_SIZE])
+
+        # 3. is_korean — c4f9e2a7b815 트리거와 같은 텍스트 규칙 (단일 기준: production_countries_ko).
+        # 바뀐 행만 UPDATE — updated_at 트리거/피처 스토어 증분 갱신 최소화
+        result = conn.execute(text(f"""
+            UPDATE movies SET is_korean = {IS_KOREAN_SQL}
+            WHERE is_korean IS DISTINCT FROM {IS_KOREAN_SQL}
+        """))
+        conn.commit()
+        korean = conn.execute(text("SELECT count(*) FROM movies WHERE is_korean")).scalar()
+        print(f"\nname_ko updated: {len(updates)}, links added: {len(missing)}, "
+              f"is_korean changed: {result.rowcount} (total {korean})")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Backfill movie_countries / is_korean from production_countries_ko")
+    parser.add_argument("--dry-run", action="store_true", help="변경 없이 불일치만 보고")
+    args = parser.parse_args()
+    run(args.dry_run)
+
+
+if __name__ == "__main__":
+    main()
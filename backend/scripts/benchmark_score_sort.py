@@ -0,0 +1,109 @@
+# ruff: noqa: T201
+"""
+JSONB 점수 정렬 쿼리의 실행 계획 / 지연 벤치마크 (표현식 인덱스 전후).
+
+GET /movies?mbti=|weather= 정렬 쿼리와 get_movies_by_score 점수순 조회를
+키별로 EXPLAIN (ANALYZE, BUFFERS) 합니다.
+- before: 트랜잭션 안에서 enable_indexscan/enable_bitmapscan = off (인덱스 없는 계획 재현, DDL 없음)
+- after:  기본 설정 (scripts/manage_score_indexes.py create 이후)
+
+Usage:
+    cd backend
+    python scripts/benchmark_score_sort.py [--runs 20] [--keys INTJ ENFP rainy healing] [--plans]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+from sqlalchemy import create_engine, select, text
+from sqlalchemy.dialects import postgresql
+
+# backend/ 를 sys.path에 추가하여 app 모듈 import
+_backend_dir = str(Path(__file__).resolve().parent.parent)
+if _backend_dir not in sys.path:
+    sys.path.insert(0, _backend_dir)
+
+from app.config import settings  # noqa: E402, I001
+from app.models import Movie  # noqa: E402
+from app.services.movie_feature_store import SCORE_COLUMNS  # noqa: E402
+from app.services.score_indexes import score_expr, score_sql  # noqa: E402
+
+PAGE_SIZE = 20
+
+
+def listing_sql(score_type: str, key: str) -> str:
+    """GET /movies 정렬 쿼리 (엔드포인트와 같은 식, page_size + 1)."""
+    expr = score_expr(score_type, key)
+    stmt = select(Movie.id).order_by(expr.desc().nulls_last(), Movie.id.desc()).limit(PAGE_SIZE + 1)
+    return str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+def ranked_sql(score_type: str, key: str) -> str:
+    """get_movies_by_score 폴백 쿼리 (recommendation_engine._query_ranked_list와 같은 형태)."""
+    score = score_sql(score_type, key)
+    return f"""
+        SELECT id, {score} AS score FROM movies
+        WHERE COALESCE(weighted_score, 0) >= 6.0
+        AND {score} IS NOT NULL
+        ORDER BY {score} DESC NULLS LAST, weighted_score DESC
+        LIMIT 240
+    """
+
+
+def _plan_nodes(plan: dict) -> list[str]:
+    nodes = [plan["Node Type"] + (f" ({plan['Index Name']})" if "Index Name" in plan else "")]
+    for child in plan.get("Plans", []):
+        nodes.extend(_plan_nodes(child))
+    return nodes
+
+
+def explain(conn, sql: str, runs: int, use_index: bool) -> tuple[list[str], np.ndarray, dict]:
+    times = []
+    plan = {}
+    for _ in range(runs):
+        with conn.begin():
+            if not use_index:
+                conn.execute(text("SET LOCAL enable_indexscan = off"))
+                conn.execute(text("SET LOCAL enable_bitmapscan = off"))
+            raw = conn.execute(text(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {sql}")).scalar()
+        result = (json.loads(raw) if isinstance(raw, str) else raw)[0]
+        times.append(result["Execution Time"])
+        plan = result["Plan"]
+    return _plan_nodes(plan), np.array(times), plan
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="JSONB score sort benchmark")
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--keys", nargs="+", default=["INTJ", "ENFP", "rainy", "healing"])
+    parser.add_argument("--plans", action="store_true", help="after 계획 전체(JSON) 출력")
+    args = parser.parse_args()
+
+    engine = create_engine(settings.DATABASE_URL)
+    with engine.connect() as conn:
+        n = conn.execute(text("SELECT count(*) FROM movies")).scalar()
+        print(f"movies: {n} rows, {args.runs} runs per query\n")
+        for key in args.keys:
+            score_type = next((t for t, keys in SCORE_COLUMNS.items() if key in keys), None)
+            if score_type is None:
+                print(f"unknown key: {key}")
+                continue
+            for label, sql in (("listing", listing_sql(score_type, key)), ("by_score", ranked_sql(score_type, key))):
+                print(f"[{score_type}.{key}] {label}")
+                for mode, use_index in (("before", False), ("after", True)):
+                    nodes, times, plan = explain(conn, sql, args.runs, use_index)
+                    print(
+                        f"  {mode:<7} p50: {np.percentile(times, 50):8.2f} ms  "
+                        f"p95: {np.percentile(times, 95):8.2f} ms  plan: {' > '.join(nodes)}"
+                    )
+                if args.plans:
+                    print(json.dumps(plan, indent=2))
+                print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+# ruff: noqa: T201
+"""
+시맨틱 검색 인덱스 recall@K vs latency 벤치마크.
+
+정답은 float32 정규화 코퍼스 전체 내적의 Top-K. 코퍼스 행에 노이즈를 더한 쿼리로
+exact(전체 스캔), NumPy IVF(nprobe별), FAISS(있으면)의 recall과 쿼리당 지연을 비교합니다.
+먼저 scripts/quantize_embeddings.py로 코퍼스/인덱스를 만들어 두어야 합니다.
+
+Usage:
+    cd backend
+    python scripts/benchmark_semantic_index.py [--queries 200] [--top-k 300] [--nprobe 8 16 32 64]
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# backend/ 를 sys.path에 추가하여 app 모듈 import
+_backend_dir = str(Path(__file__).resolve().parent.parent)
+if _backend_dir not in sys.path:
+    sys.path.insert(0, _backend_dir)
+
+from app.api.v1 import semantic_index, semantic_search  # noqa: E402, I001
+
+
+def make_queries(corpus: np.ndarray, n: int, noise: float = 0.5, seed: int = 42) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    base = corpus[rng.choice(len(corpus), size=min(n, len(corpus)), replace=False)]
+    queries = base + noise * rng.standard_normal(base.shape).astype(np.float32) / np.sqrt(base.shape[1])
+    return queries / np.linalg.norm(queries, axis=1, keepdims=True)
+
+
+def run(label: str, queries: np.ndarray, truth: list[set[int]], top_k: int, use_index: bool = True) -> None:
+    latencies = []
+    recall = 0.0
+    for q, expected in zip(queries, truth, strict=True):
+        t0 = time.perf_counter()
+        results = semantic_search.search_similar(q, top_k=top_k, use_index=use_index)
+        latencies.append((time.perf_counter() - t0) * 1000)
+        recall += len(expected & {mid for mid, _ in results}) / top_k
+    lat = np.array(latencies)
+    print(
+        f"  {label:<18} recall@{top_k}: {recall / len(queries):.4f}  "
+        f"p50: {np.percentile(lat, 50):7.2f} ms  p95: {np.percentile(lat, 95):7.2f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Semantic search index benchmark")
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--top-k", type=int, default=300)
+    parser.add_argument("--nprobe", type=int, nargs="+", default=[8, 16, 32, 64])
+    args = parser.parse_args()
+
+    raw = np.load(str(semantic_search.EMBEDDINGS_DIR / "movie_embeddings.npy")).astype(np.float32)
+    corpus = semantic_search._normalize_rows(raw)
+    queries = make_queries(corpus, args.queries)
+
+    semantic_search.load_embeddings(index_backend="exact")
+    if not semantic_search.is_semantic_search_available():
+        print("ERROR: embeddings not loaded")
+        raise SystemExit(1)
+    movie_ids = np.asarray(semantic_search._movie_ids)
+    truth = [set(movie_ids[semantic_search._top_indices(corpus @ q, args.top_k)].tolist()) for q in queries]
+
+    print("=" * 72)
+    print(f"Corpus: {len(corpus):,} × {corpus.shape[1]}  queries: {len(queries)}")
+    run("exact", queries, truth, args.top_k, use_index=False)
+
+    for nprobe in args.nprobe:
+        semantic_search.load_embeddings(index_backend="ivf", nprobe=nprobe)
+        if semantic_search._index is None:
+            print("  ivf: index not found (run scripts/quantize_embeddings.py)")
+            break
+        run(f"ivf nprobe={nprobe}", queries, truth, args.top_k)
+
+    if (semantic_search.EMBEDDINGS_DIR / semantic_index.FAISS_FILE).exists():
+        for nprobe in args.nprobe:
+            semantic_search.load_embeddings(index_backend="faiss", nprobe=nprobe)
+            if semantic_search._index is None:
+                break
+            run(f"faiss nprobe={nprobe}", queries, truth, args.top_k)
+    print("=" * 72)
+
+
+if __name__ == "__main__":
+    main()
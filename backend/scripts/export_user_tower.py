@@ -0,0 +1,64 @@
+# ruff: noqa: T201
+"""
+Two-Tower User Tower 가중치 → .npz 내보내기.
+
+서빙(TwoTowerRetriever)은 user_tower.npz가 있으면 torch 없이 NumPy로 사용자 임베딩을 계산합니다.
+내보낸 뒤 전체 MBTI × 랜덤 장르 조합으로 torch 출력과의 일치를 확인합니다.
+
+Usage:
+    python backend/scripts/export_user_tower.py \
+        --model data/models/two_tower/model_v1.pt \
+        --output data/models/two_tower/user_tower.npz
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+import numpy as np
+import torch
+
+# backend/ 를 sys.path에 추가하여 ml 모듈 import
+_backend_dir = str(Path(__file__).resolve().parent.parent)
+if _backend_dir not in sys.path:
+    sys.path.insert(0, _backend_dir)
+
+from ml.two_tower import TwoTowerModel  # noqa: E402, I001
+from ml.user_tower_np import NumpyUserTower, export_user_tower_npz  # noqa: E402, I001
+
+
+def check_parity(model: TwoTowerModel, tower: NumpyUserTower, n_samples: int = 512, seed: int = 42) -> float:
+    """torch vs NumPy 최대 절대 오차."""
+    rng = np.random.default_rng(seed)
+    mbti_idx = rng.integers(0, 16, size=n_samples)
+    genre_vec = (rng.random((n_samples, 19)) < 0.2).astype(np.float32)
+    with torch.no_grad():
+        expected = model.user_tower(
+            torch.from_numpy(mbti_idx), torch.from_numpy(genre_vec), torch.zeros(n_samples, 128),
+        ).numpy()
+    actual = tower(mbti_idx, genre_vec)
+    return float(np.abs(expected - actual).max())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Export Two-Tower user tower weights to .npz")
+    parser.add_argument("--model", default="data/models/two_tower/model_v1.pt", help="TwoTowerModel state_dict")
+    parser.add_argument("--output", default="data/models/two_tower/user_tower.npz", help="Output .npz path")
+    parser.add_argument("--atol", type=float, default=1e-5, help="Max allowed parity error")
+    args = parser.parse_args()
+
+    model = TwoTowerModel()
+    model.load_state_dict(torch.load(args.model, map_location="cpu", weights_only=True))
+    model.eval()
+
+    export_user_tower_npz(model.state_dict(), args.output)
+    err = check_parity(model, NumpyUserTower.load(args.output))
+    print(f"Exported {args.output} (max abs diff vs torch: {err:.2e})")
+    if err > args.atol:
+        print(f"ERROR: parity check failed (> {args.atol})")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
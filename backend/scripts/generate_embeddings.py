@@ -10,6 +10,8 @@ Voyage AI voyage-multilingual-2 모델 사용 (1,024차원).
   data/embeddings/movie_embeddings.npy    (N, 1024) float32
   data/embeddings/movie_id_index.json     {"0": movie_id, ...}
   data/embeddings/embedding_metadata.json  메타 정보
+  data/embeddings/corpus_f16.npy, corpus_i8.npy, corpus_i8_scale.npy  서빙용 양자화 코퍼스
+  data/embeddings/ivf_index.npz           시맨틱 검색 ANN 인덱스 (NumPy IVF)
 """
 import argparse
 import json
@@ -24,6 +26,14 @@ import numpy as np
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import Session
 
+# backend/ 를 sys.path에 추가하여 app 모듈 import
+_backend_dir = str(Path(__file__).resolve().parent.parent)
+if _backend_dir not in sys.path:
+    sys.path.insert(0, _backend_dir)
+
+from app.api.v1.semantic_index import build_indexes  # noqa: E402
+from app.api.v1.semantic_search import write_quantized_corpus  # noqa: E402
+
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
 logger = logging.getLogger(__name__)
 
@@ -296,6 +306,11 @@ def main() -> None:
     with open(OUTPUT_DIR / "embedding_metadata.json", "w", encoding="utf-8") as f:
         json.dump(metadata, f, indent=2, ensure_ascii=False)
 
+    # 서빙용 양자화 코퍼스 (semantic_search가 memory-map으로 로드)
+    write_quantized_corpus(OUTPUT_DIR / "movie_embeddings.npy", OUTPUT_DIR)
+    norms = np.linalg.norm(embeddings_array, axis=1, keepdims=True)
+    build_indexes(embeddings_array / np.maximum(norms, 1e-12), OUTPUT_DIR)
+
     # 임시 파일 정리
     for tmp in (PROGRESS_FILE, OUTPUT_DIR / "movie_embeddings_partial.npy"):
         if tmp.exists():
@@ -22,6 +22,7 @@ sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
 from sqlalchemy import text
 from app.database import engine
+from ml.similar_movies import ranked_csv_neighbors
 
 CSV_PATH = os.path.join(
     os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
@@ -378,30 +379,20 @@ def run_import():
         conn.commit()
         print(f"    {count} country links")
 
-        # similar_movies
+        # similar_movies (rank = CSV 목록 순서, score는 NULL — compute_similar_movies.py가 덮어쓴다)
         print("  Inserting similar_movies...")
         count = 0
         skipped = 0
         for i, row in enumerate(rows):
             movie_id = int(row['id'])
-            similar_ids_str = row.get('similar_movie_ids', '').strip()
-            if not similar_ids_str:
-                continue
-            for sid_str in similar_ids_str.split(','):
-                sid_str = sid_str.strip()
-                if not sid_str:
-                    continue
-                try:
-                    sid = int(float(sid_str))
-                except ValueError:
-                    continue
-                if sid in movie_ids_set and sid != movie_id:
-                    conn.execute(text(
-                        "INSERT INTO similar_movies (movie_id, similar_movie_id) VALUES (:mid, :sid) ON CONFLICT DO NOTHING"
-                    ), {"mid": movie_id, "sid": sid})
-                    count += 1
-                else:
-                    skipped += 1
+            pairs, row_skipped = ranked_csv_neighbors(movie_id, row.get('similar_movie_ids'), movie_ids_set)
+            skipped += row_skipped
+            for sid, rank in pairs:
+                conn.execute(text(
+                    "INSERT INTO similar_movies (movie_id, similar_movie_id, rank) VALUES (:mid, :sid, :rank) "
+                    "ON CONFLICT DO NOTHING"
+                ), {"mid": movie_id, "sid": sid, "rank": rank})
+                count += 1
             if (i + 1) % BATCH_SIZE == 0:
                 conn.commit()
         conn.commit()
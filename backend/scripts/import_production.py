@@ -22,6 +22,8 @@ load_dotenv()
 import psycopg2
 from psycopg2.extras import execute_values
 
+from ml.similar_movies import ranked_csv_neighbors
+
 CSV_PATH = os.path.join(
     os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
     "data", "raw", "MOVIE_total_FINAL_FINAL_2010.csv"
@@ -272,24 +274,15 @@ def run():
     conn.commit()
     print(f"{len(mco_vals)}")
 
-    # similar_movies
+    # similar_movies (rank = CSV 목록 순서, score는 NULL — compute_similar_movies.py가 덮어쓴다)
     print("  similar_movies...", end=" ", flush=True)
     sm_vals = []
     for r in rows:
         mid = int(r['id'])
-        sids = r.get('similar_movie_ids','').strip()
-        if not sids: continue
-        seen = set()
-        for s in sids.split(','):
-            s = s.strip()
-            if not s: continue
-            try: sid = int(float(s))
-            except: continue
-            if sid in movie_ids_set and sid != mid and sid not in seen:
-                seen.add(sid)
-                sm_vals.append((mid, sid))
+        pairs, _ = ranked_csv_neighbors(mid, r.get('similar_movie_ids'), movie_ids_set)
+        sm_vals.extend((mid, sid, rank) for sid, rank in pairs)
     for i in range(0, len(sm_vals), BULK_SIZE):
-        execute_values(cur, "INSERT INTO similar_movies (movie_id, similar_movie_id) VALUES %s ON CONFLICT DO NOTHING", sm_vals[i:i+BULK_SIZE])
+        execute_values(cur, "INSERT INTO similar_movies (movie_id, similar_movie_id, rank) VALUES %s ON CONFLICT DO NOTHING", sm_vals[i:i+BULK_SIZE])
     conn.commit()
     print(f"{len(sm_vals)}")
 
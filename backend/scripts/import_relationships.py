@@ -8,10 +8,10 @@ import os
 import io
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
 from sqlalchemy import text
 from app.database import engine
+from ml.similar_movies import ranked_csv_neighbors
 
 CSV_PATH = os.path.join(
     os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
@@ -26,6 +26,26 @@ def parse_list(val):
     return [item.strip() for item in val.split(',') if item.strip()]
 
 
+def insert_similar_movies(conn, rows, movie_ids_set):
+    """CSV similar_movie_ids → similar_movies (rank = CSV 목록 순서, score는 NULL). (삽입 수, 건너뛴 수) 반환."""
+    count = 0
+    skipped = 0
+    for i, row in enumerate(rows):
+        mid = int(row['id'])
+        pairs, row_skipped = ranked_csv_neighbors(mid, row.get('similar_movie_ids'), movie_ids_set)
+        skipped += row_skipped
+        for sid, rank in pairs:
+            conn.execute(text(
+                "INSERT INTO similar_movies (movie_id, similar_movie_id, rank) VALUES (:mid, :sid, :rank) "
+                "ON CONFLICT DO NOTHING"
+            ), {"mid": mid, "sid": sid, "rank": rank})
+            count += 1
+        if (i + 1) % 10000 == 0:
+            conn.commit()
+    conn.commit()
+    return count, skipped
+
+
 def run():
     print("Reading CSV...")
     rows = []
@@ -142,33 +162,7 @@ def run():
 
         # ── similar_movies ──
         print("\nInserting similar_movies...")
-        count = 0
-        skipped = 0
-        for i, row in enumerate(rows):
-            mid = int(row['id'])
-            sids_str = row.get('similar_movie_ids', '').strip()
-            if not sids_str:
-                continue
-            seen = set()
-            for s in sids_str.split(','):
-                s = s.strip()
-                if not s:
-                    continue
-                try:
-                    sid = int(float(s))
-                except ValueError:
-                    continue
-                if sid in movie_ids_set and sid != mid and sid not in seen:
-                    seen.add(sid)
-                    conn.execute(text(
-                        "INSERT INTO similar_movies (movie_id, similar_movie_id) VALUES (:mid, :sid) ON CONFLICT DO NOTHING"
-                    ), {"mid": mid, "sid": sid})
-                    count += 1
-                else:
-                    skipped += 1
-            if (i + 1) % 10000 == 0:
-                conn.commit()
-        conn.commit()
+        count, skipped = insert_similar_movies(conn, rows, movie_ids_set)
         print(f"  Total: {count} similar links ({skipped} skipped)")
 
         # ── Verification ──
@@ -187,4 +181,5 @@ def run():
 
 
 if __name__ == "__main__":
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
     run()
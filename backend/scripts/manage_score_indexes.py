@@ -0,0 +1,108 @@
+# ruff: noqa: T201
+"""
+JSONB 점수 표현식 인덱스 관리 (MBTI 16 / 날씨 4 / 감성 7).
+
+alembic 8d4f1b2c6e13과 같은 인덱스를 확인/생성/재생성/삭제합니다.
+모든 DDL은 CONCURRENTLY (쓰기 락 없음)로 실행하고, 생성/재생성 후 ANALYZE movies로
+표현식 통계를 갱신합니다. CONCURRENTLY 빌드가 중단되어 INVALID로 남은 인덱스는
+create 시 삭제 후 다시 만듭니다.
+
+Usage:
+    cd backend
+    python scripts/manage_score_indexes.py               # 상태 (status)
+    python scripts/manage_score_indexes.py create        # 없거나 INVALID인 인덱스 생성
+    python scripts/manage_score_indexes.py reindex       # 전체 REINDEX CONCURRENTLY (bloat 정리)
+    python scripts/manage_score_indexes.py drop          # 전체 삭제
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine, text
+
+# backend/ 를 sys.path에 추가하여 app 모듈 import
+_backend_dir = str(Path(__file__).resolve().parent.parent)
+if _backend_dir not in sys.path:
+    sys.path.insert(0, _backend_dir)
+
+from app.config import settings  # noqa: E402, I001
+from app.services.score_indexes import all_score_indexes, index_ddl, index_name  # noqa: E402
+
+
+def index_state(conn) -> dict[str, tuple[bool, int]]:
+    """인덱스 이름 → (valid, 크기 bytes). 없는 인덱스는 포함하지 않는다."""
+    names = [index_name(t, k) for t, k in all_score_indexes()]
+    rows = conn.execute(text("""
+        SELECT c.relname, i.indisvalid, pg_relation_size(c.oid)
+        FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid
+        WHERE c.relname = ANY(:names)
+    """), {"names": names}).fetchall()
+    return {name: (valid, size) for name, valid, size in rows}
+
+
+def status(conn) -> None:
+    state = index_state(conn)
+    total = 0
+    for score_type, key in all_score_indexes():
+        name = index_name(score_type, key)
+        if name not in state:
+            print(f"  {name:<28} MISSING")
+            continue
+        valid, size = state[name]
+        total += size
+        print(f"  {name:<28} {'ok     ' if valid else 'INVALID'} {size / 1024:8.0f} KB")
+    print(f"\n{len(state)}/{len(all_score_indexes())} present, {total / 1024 / 1024:.1f} MB")
+
+
+def create(conn) -> None:
+    state = index_state(conn)
+    for score_type, key in all_score_indexes():
+        name = index_name(score_type, key)
+        if name in state and state[name][0]:
+            continue
+        if name in state:
+            print(f"  drop INVALID {name}")
+            conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {name}"))
+        t0 = time.perf_counter()
+        conn.execute(text(index_ddl(score_type, key)))
+        print(f"  created {name} ({time.perf_counter() - t0:.1f}s)")
+    conn.execute(text("ANALYZE movies"))
+
+
+def reindex(conn) -> None:
+    for score_type, key in all_score_indexes():
+        name = index_name(score_type, key)
+        t0 = time.perf_counter()
+        conn.execute(text(f"REINDEX INDEX CONCURRENTLY {name}"))
+        print(f"  reindexed {name} ({time.perf_counter() - t0:.1f}s)")
+    conn.execute(text("ANALYZE movies"))
+
+
+def drop(conn) -> None:
+    for score_type, key in all_score_indexes():
+        conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name(score_type, key)}"))
+    print(f"  dropped {len(all_score_indexes())} indexes")
+
+
+COMMANDS = {"status": status, "create": create, "reindex": reindex, "drop": drop}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="JSONB score expression index maintenance")
+    parser.add_argument("command", nargs="?", default="status", choices=list(COMMANDS))
+    args = parser.parse_args()
+
+    # CONCURRENTLY는 트랜잭션 밖에서만 실행 가능
+    engine = create_engine(settings.DATABASE_URL, isolation_level="AUTOCOMMIT")
+    with engine.connect() as conn:
+        COMMANDS[args.command](conn)
+        if args.command != "status":
+            print()
+            status(conn)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# ruff: noqa: T201
+"""
+영화 임베딩 → 서빙용 양자화 코퍼스 내보내기.
+
+movie_embeddings.npy(float32)를 L2 정규화한 뒤 float16 / int8(행별 스케일)로 저장합니다.
+서버(semantic_search)는 이 파일들을 memory-map으로 열어 워커 간 페이지 캐시를 공유합니다.
+같은 코퍼스로 ANN 인덱스(NumPy IVF, --faiss 지정 시 FAISS)도 빌드합니다.
+내보낸 뒤 샘플 쿼리로 float32 정확 검색 대비 Top-K recall을 확인합니다.
+
+Usage:
+    cd backend
+    python scripts/quantize_embeddings.py [--input data/embeddings/movie_embeddings.npy] [--check-queries 200]
+    python scripts/quantize_embeddings.py --faiss hnsw   # FAISS HNSW-SQ8 인덱스도 빌드
+
+출력 (data/embeddings/):
+    corpus_f16.npy       (N, 1024) float16
+    corpus_i8.npy        (N, 1024) int8
+    corpus_i8_scale.npy  (N,) float32
+    ivf_index.npz        NumPy IVF (centroids, offsets, rows)
+    faiss_semantic.index FAISS 인덱스 (--faiss)
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# backend/ 를 sys.path에 추가하여 app 모듈 import
+_backend_dir = str(Path(__file__).resolve().parent.parent)
+if _backend_dir not in sys.path:
+    sys.path.insert(0, _backend_dir)
+
+from app.api.v1 import semantic_index, semantic_search  # noqa: E402, I001
+
+
+def check_recall(raw: np.ndarray, n_queries: int, top_k: int = 100, seed: int = 42) -> tuple[float, float]:
+    """코퍼스 행을 쿼리로 사용해 (int8 단독, int8+재채점) 평균 recall@top_k 계산."""
+    semantic_search.load_embeddings(index_backend="exact")
+    exact = semantic_search._normalize_rows(raw.astype(np.float32))
+    rng = np.random.default_rng(seed)
+    queries = exact[rng.choice(len(exact), size=min(n_queries, len(exact)), replace=False)]
+    movie_ids = np.asarray(semantic_search._movie_ids)
+
+    recall_approx = recall_rescored = 0.0
+    for q in queries:
+        truth = set(movie_ids[semantic_search._top_indices(exact @ q, top_k)].tolist())
+        approx = semantic_search.search_similar(q, top_k=top_k, rescore=False)
+        rescored = semantic_search.search_similar(q, top_k=top_k)
+        recall_approx += len(truth & {mid for mid, _ in approx}) / top_k
+        recall_rescored += len(truth & {mid for mid, _ in rescored}) / top_k
+    return recall_approx / len(queries), recall_rescored / len(queries)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Quantize movie embeddings for semantic search")
+    parser.add_argument(
+        "--input", type=Path, default=semantic_search.EMBEDDINGS_DIR / "movie_embeddings.npy",
+    )
+    parser.add_argument("--output-dir", type=Path, default=semantic_search.EMBEDDINGS_DIR)
+    parser.add_argument("--faiss", choices=["hnsw", "ivf"], help="FAISS 인덱스도 빌드 (faiss 필요)")
+    parser.add_argument("--no-index", action="store_true", help="ANN 인덱스 빌드 생략")
+    parser.add_argument("--check-queries", type=int, default=200, help="recall 확인 쿼리 수 (0이면 생략)")
+    args = parser.parse_args()
+
+    n = semantic_search.write_quantized_corpus(args.input, args.output_dir)
+    print(f"Wrote {n} rows → {args.output_dir}")
+
+    if not args.no_index:
+        corpus = semantic_search._normalize_rows(np.load(str(args.input)).astype(np.float32))
+        written = semantic_index.build_indexes(corpus, args.output_dir, args.faiss)
+        print(f"Built index: {', '.join(written)}")
+
+    if args.check_queries > 0 and args.output_dir == semantic_search.EMBEDDINGS_DIR:
+        approx, rescored = check_recall(np.load(str(args.input)), args.check_queries)
+        print(f"recall@100  int8: {approx:.4f}  int8+rescore: {rescored:.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,9 +5,13 @@ mapped_ratings.csv 전체로 SVD 학습 후 pickle로 저장.
 프로덕션 recommendation_cf.py에서 로드하여 사용.
 
 실행: cd backend && python scripts/train_cf_model.py
+      cd backend && python scripts/train_cf_model.py --export-only   # 기존 pickle → .npy 변환만
 출력: data/movielens/svd_model.pkl
+      data/movielens/cf/{item_ids,item_bias,item_factors}.npy + meta.json (서빙용, memory-map 로드)
 """
 
+import argparse
+import json
 import logging
 import pickle
 import sys
@@ -24,6 +28,39 @@ logging.basicConfig(level=logging.INFO, format="%(message)s")
 logger = logging.getLogger(__name__)
 
 DATA_DIR = Path(__file__).resolve().parent.parent / "data" / "movielens"
+CF_DIR = DATA_DIR / "cf"
+
+
+def export_serving_artifacts(model_data: dict, out_dir: Path = CF_DIR) -> None:
+    """서빙용 아이템 전용 아티팩트 저장 (user_factors 제외).
+
+    item_ids[i]가 item_bias[i], item_factors[i] 행의 movie_id.
+    """
+    item_map: dict = model_data["item_map"]
+    item_ids = np.empty(len(item_map), dtype=np.int64)
+    for movie_id, idx in item_map.items():
+        item_ids[idx] = int(movie_id)
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    np.save(out_dir / "item_ids.npy", item_ids)
+    np.save(out_dir / "item_bias.npy", np.asarray(model_data["item_bias"], dtype=np.float64))
+    np.save(out_dir / "item_factors.npy", np.ascontiguousarray(model_data["item_factors"], dtype=np.float32))
+    meta = {
+        "global_mean": float(model_data["global_mean"]),
+        "n_factors": int(model_data["n_factors"]),
+        "n_items": len(item_ids),
+    }
+    (out_dir / "meta.json").write_text(json.dumps(meta, indent=2), encoding="utf-8")
+
+    size_mb = sum(p.stat().st_size for p in out_dir.glob("*.npy")) / (1024 * 1024)
+    logger.info("서빙 아티팩트 저장: %s (%.1f MB)", out_dir, size_mb)
+
+
+def export_from_pickle() -> None:
+    """기존 svd_model.pkl에서 서빙 아티팩트만 다시 내보내기 (재학습 없음)"""
+    with open(DATA_DIR / "svd_model.pkl", "rb") as f:
+        model_data = pickle.load(f)
+    export_serving_artifacts(model_data)
 
 
 def train_and_save(n_factors: int = 100, max_users: int = 50000) -> None:
@@ -111,6 +148,15 @@ def train_and_save(n_factors: int = 100, max_users: int = 50000) -> None:
     logger.info("global_mean=%.4f, items=%d, users=%d, factors=%d",
                 global_mean, n_items, n_users, k)
 
+    export_serving_artifacts(model_data)
+
 
 if __name__ == "__main__":
-    train_and_save()
+    parser = argparse.ArgumentParser(description="SVD CF 모델 학습 + 서빙 아티팩트 내보내기")
+    parser.add_argument("--export-only", action="store_true", help="기존 pickle에서 .npy 아티팩트만 내보내기")
+    args = parser.parse_args()
+
+    if args.export_only:
+        export_from_pickle()
+    else:
+        train_and_save()
@@ -36,6 +36,7 @@ if _backend_dir not in sys.path:
 
 from ml.dataset import GENRE_LIST, RecoDataset, collate_fn  # noqa: E402, I001
 from ml.two_tower import TwoTowerModel  # noqa: E402, I001
+from ml.user_tower_np import export_user_tower_npz  # noqa: E402, I001
 
 
 # ---------------------------------------------------------------------------
@@ -435,6 +436,8 @@ def train(args: argparse.Namespace) -> None:
     # 모델 state_dict
     model_path = out_dir / "model_v1.pt"
     torch.save(model.state_dict(), model_path)
+    # 서빙용 User Tower 가중치 (torch 없이 NumPy로 추론)
+    export_user_tower_npz(model.state_dict(), out_dir / "user_tower.npz")
 
     # 최종 Item 임베딩 사전계산
     if args.verbose:
@@ -485,6 +488,7 @@ def train(args: argparse.Namespace) -> None:
     print(f"  Item embeddings: {final_item_vecs.shape}")
     print(f"\nArtifacts saved to {out_dir}/")
     print(f"  model_v1.pt         ({model_path.stat().st_size / 1024:.0f} KB)")
+    print("  user_tower.npz")
     print(f"  item_embeddings_tt.npy ({item_emb_path.stat().st_size / 1024 / 1024:.1f} MB)")
     print("  training_log.json")
     print("  config.json")
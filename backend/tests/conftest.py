@@ -4,6 +4,8 @@ Shared pytest fixtures.
 Uses SQLite in-memory for fast, isolated tests.
 PostgreSQL-specific features are skipped.
 """
+from contextlib import contextmanager
+
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import JSON, create_engine, event
@@ -80,6 +82,52 @@ async def _no_redis() -> None:
 for _mod in (_llm_mod, _weather_mod, _auth_mod, _movies_mod, _users_mod):
     _mod.get_redis_client = _no_redis  # type: ignore[assignment]
 
+# Section pool cache uses a sync Redis client
+import app.services.section_cache as _section_cache_mod  # noqa: E402
+
+_section_cache_mod.get_redis_client = lambda: None  # type: ignore[assignment]
+
+import app.services.count_cache as _count_cache_mod  # noqa: E402
+import app.services.user_profile_cache as _user_profile_cache_mod  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def _clear_section_cache():
+    """Section pools, listing totals and user profiles are cached in-process; start every test empty."""
+    _section_cache_mod.clear_section_cache()
+    _count_cache_mod.clear_count_cache()
+    _user_profile_cache_mod.clear_user_profile_cache()
+
+
+class QueryCounter:
+    """테스트 엔진에서 실행된 SQL 문 (before_cursor_execute)."""
+
+    def __init__(self) -> None:
+        self.statements: list[str] = []
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        self.statements.append(statement)
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+
+@pytest.fixture()
+def count_queries():
+    """`with count_queries() as q:` 블록 안에서 실행된 SQL 문을 q.statements에 모은다."""
+
+    @contextmanager
+    def _count():
+        counter = QueryCounter()
+        event.listen(engine, "before_cursor_execute", counter._record)
+        try:
+            yield counter
+        finally:
+            event.remove(engine, "before_cursor_execute", counter._record)
+
+    return _count
+
 
 @pytest.fixture()
 def client():
@@ -0,0 +1,101 @@
+"""In-memory autocomplete index tests."""
+import time
+from datetime import date
+
+from app.models import Movie, Person, TableVersion
+from app.services import autocomplete as ac
+from tests.conftest import TestingSession
+
+
+def _seed(db):
+    song = Person(id=1, name="송강호")
+    db.add_all([
+        Movie(id=1, title="Parasite", title_ko="기생충", popularity=80.0, weighted_score=8.46,
+              release_date=date(2019, 5, 30), cast_members=[song]),
+        Movie(id=2, title="Harry Potter and the Sorcerer's Stone", title_ko="해리 포터와 마법사의 돌",
+              popularity=90.0, weighted_score=7.9),
+        Movie(id=3, title="The Host", title_ko="괴물", popularity=40.0, cast_members=[song]),
+        Movie(id=4, title="Gisaengchung Fan Cut", title_ko="기생 이야기", popularity=5.0),
+        Person(id=2, name="송강"),
+    ])
+    db.commit()
+
+
+def _index(db):
+    return ac.AutocompleteIndex.load(db)
+
+
+def test_jamo_decomposition():
+    assert ac.to_jamo("과") == "ㄱㅗㅏ"
+    assert ac.to_jamo("닭") == "ㄷㅏㄹㄱ"
+    assert ac.to_chosung("기생충 2") == "ㄱㅅㅊ"
+
+
+def test_prefix_while_typing_hangul(db):
+    _seed(db)
+    index = _index(db)
+
+    # 입력 중 음절("기생ㅊ", "기새")도 접두사로 일치
+    assert [m["id"] for m in index.movies.search("기생ㅊ", 8)] == [1]
+    assert [m["id"] for m in index.movies.search("기새", 8)] == [1, 4]  # 인기도순
+    assert [m["id"] for m in index.movies.search("ㄱㅅㅊ", 8)] == [1]
+
+
+def test_word_prefix_and_infix(db):
+    _seed(db)
+    index = _index(db)
+
+    assert index.movies.search("potter", 8)[0]["id"] == 2  # 단어 시작 일치
+    assert [m["id"] for m in index.movies.search("orcerer", 8)] == [2]  # trigram 중간 일치
+    assert index.movies.search("zzz", 8) == []
+
+    first = index.movies.search("기생충", 1)[0]
+    assert first == {"id": 1, "title": "기생충", "title_en": "Parasite", "year": 2019,
+                     "poster_path": None, "weighted_score": 8.5}
+
+
+def test_endpoint_uses_index(client, db, monkeypatch):
+    _seed(db)
+    monkeypatch.setattr(ac, "_index", _index(db))
+
+    resp = client.get("/api/v1/movies/search/autocomplete", params={"query": "송강"})
+    assert resp.status_code == 200
+    data = resp.json()
+    # 출연작 수 많은 인물 우선
+    assert [p["name"] for p in data["people"]] == ["송강호", "송강"]
+    assert data["movies"] == []
+
+
+def test_index_rebuilt_in_background_after_insert(db, monkeypatch):
+    _seed(db)
+    monkeypatch.setattr(ac, "_index", None)
+    monkeypatch.setattr(ac, "_rebuilder", None)
+    ac.init_autocomplete_index(TestingSession, refresh_interval=0.0)
+    assert ac.get_autocomplete_index().movies.search("설국", 8) == []
+
+    db.add(Movie(id=5, title="Snowpiercer", title_ko="설국열차", popularity=30.0))
+    db.commit()
+    ac.get_autocomplete_index()
+    deadline = time.monotonic() + 5
+    while ac._rebuilder._running and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert [m["id"] for m in ac.get_autocomplete_index().movies.search("설국", 8)] == [5]
+
+
+def test_person_rename_rebuilds_via_table_version(db, monkeypatch):
+    _seed(db)
+    db.add(TableVersion(name="persons", version=0))
+    db.commit()
+    monkeypatch.setattr(ac, "_index", None)
+    monkeypatch.setattr(ac, "_rebuilder", None)
+    ac.init_autocomplete_index(TestingSession, refresh_interval=0.0)
+
+    # transliterate_* 스크립트처럼 인물명만 수정 — movies는 그대로, 트리거가 버전을 올린다
+    db.get(Person, 2).name = "Song Kang"
+    db.get(TableVersion, "persons").version = 1
+    db.commit()
+    ac.get_autocomplete_index()
+    deadline = time.monotonic() + 5
+    while ac._rebuilder._running and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert [p["name"] for p in ac.get_autocomplete_index().search("song", 8)["people"]] == ["Song Kang"]
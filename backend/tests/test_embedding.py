@@ -0,0 +1,110 @@
+"""Query embedding batching and caching tests against the in-process Voyage stub."""
+import asyncio
+
+import httpx
+import numpy as np
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.config import settings
+from app.services import embedding
+from app.services.embedding_batcher import EmbeddingBatcher
+from tests import voyage_stub
+
+_real_get_binary_redis = embedding._get_binary_redis
+
+
+@pytest.fixture()
+async def stub(monkeypatch):
+    client = httpx.AsyncClient(transport=httpx.ASGITransport(app=voyage_stub.app), base_url="http://stub")
+    monkeypatch.setattr(embedding, "get_http_client", lambda: client)
+    monkeypatch.setattr(embedding, "_get_binary_redis", _no_redis)
+    monkeypatch.setattr(embedding, "_batcher", None)
+    monkeypatch.setattr(settings, "VOYAGE_API_KEY", "stub")
+    monkeypatch.setattr(settings, "VOYAGE_API_URL", "http://stub/v1/embeddings")
+    voyage_stub.requests_log.clear()
+    embedding.clear_local_embedding_cache()
+    yield voyage_stub.requests_log
+    embedding.clear_local_embedding_cache()
+    await client.aclose()
+
+
+async def _no_redis():
+    return None
+
+
+async def test_concurrent_queries_share_one_request(stub):
+    queries = ["비 오는 날 영화", "우주 SF", "  비 오는 날 영화 ", "우주 SF", "감동 실화"]
+    results = await asyncio.gather(*(embedding.get_query_embedding(q) for q in queries))
+
+    # 정규화 키가 같은 쿼리는 한 번만 전송
+    assert list(stub) == [["비 오는 날 영화", "우주 SF", "감동 실화"]]
+    assert np.array_equal(results[0], voyage_stub.stub_embedding("비 오는 날 영화"))
+    assert results[0] is results[2]
+    assert np.array_equal(results[4], voyage_stub.stub_embedding("감동 실화"))
+
+
+async def test_full_batch_flushes_immediately(stub, monkeypatch):
+    monkeypatch.setattr(settings, "EMBEDDING_BATCH_MAX_SIZE", 2)
+    monkeypatch.setattr(settings, "EMBEDDING_BATCH_WAIT_MS", 10_000)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(*(embedding.get_query_embedding(q) for q in ["a", "b", "c", "d"])), timeout=5,
+    )
+    assert list(stub) == [["a", "b"], ["c", "d"]]
+    assert all(r is not None for r in results)
+
+
+async def test_batch_failure_returns_none_to_all_waiters():
+    calls = []
+
+    async def failing(texts):
+        calls.append(texts)
+        raise RuntimeError("boom")
+
+    batcher = EmbeddingBatcher(failing, max_wait_ms=1)
+    results = await asyncio.gather(batcher.embed("x"), batcher.embed("x"), batcher.embed("y"))
+    assert results == [None, None, None]
+    assert calls == [["x", "y"]]
+    assert not batcher._inflight
+
+
+async def test_local_cache_serves_repeat_queries(stub):
+    first = await embedding.get_query_embedding("로맨틱 코미디")
+    second = await embedding.get_query_embedding("로맨틱 코미디 ")
+    assert second is first
+    assert not first.flags.writeable
+    assert list(stub) == [["로맨틱 코미디"]]
+
+
+def test_local_cache_byte_budget():
+    cache = embedding._LocalEmbeddingCache(max_bytes=3 * 4096)
+    for key in "abcd":
+        cache.put(key, np.zeros(1024, dtype=np.float32))
+        if key == "b":
+            cache.get("a")  # a를 최근 사용으로
+    assert len(cache) == 3 and cache.nbytes == 3 * 4096
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+
+
+class _FlakyRedis:
+    def __init__(self):
+        self.gets = 0
+
+    async def get(self, key):
+        self.gets += 1
+        raise RedisConnectionError("down")
+
+
+async def test_redis_failure_backs_off_without_ping(stub, monkeypatch):
+    redis = _FlakyRedis()
+    monkeypatch.setattr(embedding, "_get_binary_redis", _real_get_binary_redis)
+    monkeypatch.setattr(embedding, "_redis_binary", redis)
+    monkeypatch.setattr(embedding, "_redis_retry_at", 0.0)
+
+    assert await embedding.get_query_embedding("스릴러") is not None
+    assert redis.gets == 1
+    # 실패 후 클라이언트를 버리고 재시도 간격 동안 연결하지 않는다
+    assert embedding._redis_binary is None
+    assert await embedding._get_binary_redis() is None
@@ -0,0 +1,44 @@
+"""IndexRebuilder staleness tests (movies watermark overlap, table_versions counters)."""
+from datetime import datetime, timedelta
+
+from app.models import Movie, TableVersion
+from app.services.index_rebuilder import WATERMARK_OVERLAP, IndexRebuilder
+
+
+def _rebuilder(tables=()):
+    return IndexRebuilder("test", lambda: None, lambda db: object(), lambda index: None,
+                          refresh_interval=0.0, tables=tables)
+
+
+def test_late_commit_inside_overlap_is_stale(db):
+    now = datetime(2026, 10, 16, 12, 0)
+    db.add(Movie(id=1, title="A", updated_at=now))
+    db.commit()
+    rebuilder = _rebuilder()
+    rebuilder.rebuild(db)
+    assert not rebuilder.is_stale(db)
+
+    # 확인 이후 커밋됐지만 트랜잭션 시작 시각이라 기록된 max보다 이른 행
+    db.add(Movie(id=2, title="B", updated_at=now - WATERMARK_OVERLAP / 2))
+    db.commit()
+    assert rebuilder.is_stale(db)
+    rebuilder.rebuild(db)
+    assert not rebuilder.is_stale(db)
+
+    # 같은 행 수로 겹침 구간 안의 수정 (updated_at이 max보다 이름)
+    db.get(Movie, 1).updated_at = now + timedelta(seconds=1)
+    db.commit()
+    assert rebuilder.is_stale(db)
+
+
+def test_table_version_bump_is_stale(db):
+    db.add_all([Movie(id=1, title="A"), TableVersion(name="persons", version=3)])
+    db.commit()
+    rebuilder = _rebuilder(tables=("persons", "movie_cast"))
+    rebuilder.rebuild(db)
+    assert not rebuilder.is_stale(db)
+
+    # 트리거가 하는 일: persons 문장마다 버전 +1 (movies.updated_at은 그대로)
+    db.get(TableVersion, "persons").version = 4
+    db.commit()
+    assert rebuilder.is_stale(db)
@@ -0,0 +1,109 @@
+"""BM25 lexical index tests."""
+import time
+
+from app.api.v1 import movies
+from app.models import Keyword, Movie
+from app.services import lexical_index as li
+from tests.conftest import TestingSession
+
+
+def _seed(db):
+    heist = Keyword(name="heist")
+    db.add(heist)
+    db.add_all([
+        Movie(id=1, title="Parasite", title_ko="기생충", overview="가난한 가족이 부잣집에 위장 취업한다.",
+              cast_ko="송강호, 이선균", weighted_score=8.5, popularity=80.0),
+        Movie(id=2, title="The Host", title_ko="괴물", overview="한강에 나타난 괴물과 가족의 사투.",
+              cast_ko="송강호, 배두나", weighted_score=7.5, popularity=40.0),
+        Movie(id=3, title="Ocean's Eleven", title_ko="오션스 일레븐", overview="카지노를 터는 범죄 영화.",
+              weighted_score=7.0, popularity=60.0, keywords=[heist]),
+        Movie(id=4, title="Parasite Hunter", overview="A hunter chases parasites.", weighted_score=5.5),
+    ])
+    db.commit()
+
+
+def _index(db):
+    index = li.LexicalIndex()
+    index.load(db)
+    return index
+
+
+def test_exact_title_ranks_first(db):
+    _seed(db)
+    index = _index(db)
+
+    assert [mid for mid, _ in index.search("parasite")][:2] == [1, 4]
+    assert index.search("기생충")[0][0] == 1
+    assert index.search("없는단어") == []
+
+
+def test_fields_and_korean_bigrams(db):
+    _seed(db)
+    index = _index(db)
+
+    assert {mid for mid, _ in index.search("송강호")} == {1, 2}
+    assert index.search("heist")[0][0] == 3
+    assert index.search("오션")[0][0] == 3  # "오션스" bigram 부분 일치
+
+
+def test_reciprocal_rank_fusion():
+    fused = li.reciprocal_rank_fusion([10, 20, 30], [30, 40], k=60)
+    assert max(fused, key=fused.get) == 30
+    assert fused[10] == 1 / 61 and fused[40] == 1 / 62
+
+
+def test_keyword_fallback_uses_index(client, db, monkeypatch):
+    _seed(db)
+    monkeypatch.setattr(li, "_index", _index(db))
+
+    resp = client.get("/api/v1/movies/semantic-search", params={"q": "괴물"})
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["fallback"] is True
+    assert data["results"][0]["id"] == 2
+
+
+def test_hybrid_search_keeps_cosine_scores(client, db, monkeypatch):
+    _seed(db)
+    monkeypatch.setattr(li, "_index", _index(db))
+    monkeypatch.setattr(movies, "is_semantic_search_available", lambda: True)
+
+    async def embed(q):
+        return [0.0]
+
+    monkeypatch.setattr(movies, "get_query_embedding", embed)
+    monkeypatch.setattr(movies, "search_similar", lambda emb, top_k: [(1, 0.62), (3, 0.30)])
+
+    data = client.get("/api/v1/movies/semantic-search", params={"q": "괴물"}).json()
+    results = {r["id"]: r for r in data["results"]}
+    assert [r["id"] for r in data["results"]] == [1, 2, 3]  # RRF 순서 (1, 2 동률은 relevance 순)
+    assert results[1]["semantic_score"] == 0.62 and "분위기 일치" in results[1]["match_reason"]
+    assert results[3]["semantic_score"] == 0.3 and "분위기 일치" not in results[3]["match_reason"]
+    # BM25에만 걸린 영화: 명시적 0.0, 재스케일된 RRF 값이 아님
+    assert results[2]["semantic_score"] == movies.LEXICAL_ONLY_SEMANTIC_SCORE
+    assert results[2]["match_reason"].startswith("키워드 일치")
+
+
+def _wait_rebuild(rebuilder):
+    deadline = time.monotonic() + 5
+    while rebuilder._running and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_index_rebuilt_when_movies_change(db, monkeypatch):
+    _seed(db)
+    monkeypatch.setattr(li, "_index", None)
+    monkeypatch.setattr(li, "_rebuilder", None)
+    first = li.init_lexical_index(TestingSession, refresh_interval=0.0)
+
+    assert li.get_lexical_index() is first  # movies 그대로 — 재빌드 없이 같은 인덱스
+    _wait_rebuild(li._rebuilder)
+    assert li.get_lexical_index() is first
+
+    db.add(Movie(id=5, title="Snowpiercer", title_ko="설국열차", weighted_score=7.0))
+    db.commit()
+    li.get_lexical_index()
+    _wait_rebuild(li._rebuilder)
+    index = li.get_lexical_index()
+    assert index is not first
+    assert index.search("설국열차")[0][0] == 5
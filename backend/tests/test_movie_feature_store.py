@@ -0,0 +1,137 @@
+"""Movie feature store tests.
+
+Loads a handful of movies into SQLite and checks the columnar snapshot,
+candidate selection and watermark-based refresh.
+"""
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from app.api.v1 import recommendation_engine as engine
+from app.models import Genre, Movie
+from app.services import movie_feature_store as fs
+from tests.conftest import TestingSession
+
+
+def _seed(db):
+    drama, action = Genre(id=18, name="드라마"), Genre(id=28, name="액션")
+    db.add_all([drama, action])
+    db.add_all([
+        Movie(id=1, title="A", weighted_score=8.0, popularity=10.0, certification="ALL",
+              mbti_scores={"INTJ": 0.7}, genres=[drama]),
+        Movie(id=2, title="B", weighted_score=7.0, popularity=90.0, certification="18",
+              weather_scores={"rainy": 0.4}, genres=[action, drama]),
+        Movie(id=3, title="C", weighted_score=5.0, popularity=99.0, genres=[action]),
+        Movie(id=4, title="D", weighted_score=9.0, popularity=5.0, genres=[]),
+    ])
+    db.commit()
+
+
+def test_load_builds_columns(db):
+    _seed(db)
+    store = fs.MovieFeatureStore()
+    store.load(db)
+    feats = store.features
+
+    assert store.size == 4
+    assert feats.rows([3, 1, 42]).tolist() == [2, 0, -1]
+    assert feats.score_column("mbti_scores", "INTJ")[0] == np.float32(0.7)
+    assert np.isnan(feats.score_column("mbti_scores", "INTJ")[1])
+    assert feats.genre_mask[1] == feats.genre_bits(["드라마", "액션"])
+    assert store.primary_genre(3) == "액션"
+    assert store.primary_genre(4) is None
+    assert feats.age_rating_mask(["ALL", "12"]).tolist() == [True, False, True, True]
+
+
+def test_hybrid_candidates_use_store(db, monkeypatch):
+    _seed(db)
+    store = fs.MovieFeatureStore()
+    store.load(db)
+    monkeypatch.setattr(fs, "_store", store)
+
+    # weighted_score >= 6, family 등급 외 제외, 제외 목록 제외 → 인기도순
+    refs = engine.get_hybrid_candidates(db, {4}, "family", limit=10)
+    assert [r.id for r in refs] == [1]
+
+    refs = engine.get_hybrid_candidates(db, set(), None, limit=10)
+    assert [r.id for r in refs] == [2, 1, 4]
+
+
+def test_refresh_patches_updated_rows(db):
+    _seed(db)
+    store = fs.MovieFeatureStore()
+    store.load(db)
+
+    movie = db.get(Movie, 3)
+    movie.weighted_score = 6.5
+    movie.updated_at = datetime.utcnow() + timedelta(seconds=5)
+    db.commit()
+
+    assert store.refresh(db) == 1
+    assert store.features.weighted_score[2] == np.float32(6.5)
+    assert store.refresh(db) == 0
+
+    db.add(Movie(id=5, title="E", weighted_score=7.5))
+    db.commit()
+    assert store.refresh(db) == 5
+    assert store.contains(5)
+
+
+def test_refresh_rereads_overlap_for_late_commits(db):
+    _seed(db)
+    store = fs.MovieFeatureStore()
+    store.load(db)
+    watermark = store._watermark
+
+    # 지난 갱신 전에 시작해 이후에 커밋된 트랜잭션 — updated_at이 워터마크보다 작다
+    movie = db.get(Movie, 2)
+    movie.popularity = 1.0
+    movie.updated_at = watermark - timedelta(minutes=1)
+    db.commit()
+
+    assert store.refresh(db) == 1
+    assert store.features.popularity[1] == np.float32(1.0)
+    assert store._watermark == watermark
+
+
+def test_full_reload_runs_in_background(db):
+    _seed(db)
+    store = fs.MovieFeatureStore(refresh_interval=0.0, session_factory=TestingSession)
+    store.load(db)
+
+    db.add(Movie(id=5, title="E", weighted_score=7.5))
+    db.commit()
+    store.refresh_if_stale(db)
+
+    deadline = time.monotonic() + 5
+    while store._reloading and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert store.contains(5)
+    assert store.size == 5
+
+
+def test_movies_by_score_slices_ranked_list(db, monkeypatch):
+    _seed(db)
+    db.add_all([
+        Movie(id=6, title="F", weighted_score=6.5, popularity=50.0, vote_count=80, mbti_scores={"INTJ": 0.5}),
+        Movie(id=7, title="G", weighted_score=6.2, mbti_scores={"INTJ": 0.9}),
+    ])
+    db.commit()
+    store = fs.MovieFeatureStore()
+    store.load(db)
+    monkeypatch.setattr(fs, "_store", store)
+
+    ranked = store.features.ranked_list("mbti_scores", "INTJ")
+    # score DESC, weighted_score DESC
+    assert ranked.ids.tolist() == [7, 1, 6]
+    assert ranked.is_llm.tolist() == [False, False, True]
+
+    movies = engine.get_movies_by_score(db, "mbti_scores", "INTJ", limit=2, pool_size=2, shuffle=False)
+    # LLM 보장 int(2 * 0.3) = 0편 → 점수순 상위 2편
+    assert [m.id for m in movies] == [7, 1]
+
+    movies = engine.get_movies_by_score(db, "mbti_scores", "INTJ", limit=3, pool_size=2, llm_min_ratio=0.5,
+                                        shuffle=False)
+    # LLM 1편(6) 보장 + 나머지 점수순 1편
+    assert [m.id for m in movies] == [7, 6]
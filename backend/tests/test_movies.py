@@ -4,7 +4,14 @@ Note: SQLite in-memory DB has no seed data, so list/search tests
 verify response structure rather than data content.
 PostgreSQL-specific features (pg_trgm, JSONB) are skipped.
 """
+from datetime import date
+
 import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.api.v1 import movies as movies_api
+from app.models import Country, Genre, Movie, similar_movies
+from app.services.score_indexes import index_ddl, score_expr
 
 
 def test_get_movies_returns_200(client):
@@ -30,3 +37,147 @@ def test_get_movie_not_found(client):
 def test_autocomplete(client):
     resp = client.get("/api/v1/movies/search/autocomplete", params={"query": "test"})
     assert resp.status_code == 200
+
+
+def _seed_listing(db):
+    # 인기도 동점(30.0)과 개봉일 NULL을 포함
+    popularity = [50.0, 30.0, 30.0, 5.0, 10.0, 30.0, 1.0]
+    released = [2000, 2001, None, 2003, 2004, 2005, None]
+    db.add_all([
+        Movie(id=i + 1, title=f"M{i + 1}", popularity=p, release_date=date(y, 1, 1) if y else None)
+        for i, (p, y) in enumerate(zip(popularity, released, strict=True))
+    ])
+    db.commit()
+
+
+def _walk(client, **params):
+    ids, cursor, pages = [], None, 0
+    while True:
+        resp = client.get("/api/v1/movies", params={**params, "page_size": 2, **({"cursor": cursor} if cursor else {})})
+        assert resp.status_code == 200
+        data = resp.json()
+        ids += [m["id"] for m in data["items"]]
+        cursor = data["next_cursor"]
+        pages += 1
+        if cursor is None:
+            return ids, pages
+
+
+def test_keyset_pagination_matches_offset(client, db):
+    _seed_listing(db)
+    full = client.get("/api/v1/movies", params={"page_size": 100}).json()
+    # popularity DESC NULLS LAST, id DESC
+    assert [m["id"] for m in full["items"]] == [1, 6, 3, 2, 5, 4, 7]
+    assert full["next_cursor"] is None
+
+    ids, pages = _walk(client)
+    assert ids == [1, 6, 3, 2, 5, 4, 7]
+    assert pages == 4
+
+    ids, _ = _walk(client, sort_by="popularity", sort_order="asc")
+    assert ids == [7, 4, 5, 2, 3, 6, 1]
+    # release_date DESC NULLS LAST — 커서가 NULL 구간을 넘어간다
+    ids, _ = _walk(client, sort_by="release_date")
+    assert ids == [6, 5, 4, 2, 1, 7, 3]
+    ids, _ = _walk(client, sort_by="release_date", sort_order="asc")
+    assert ids == [1, 2, 4, 5, 6, 3, 7]
+
+
+def test_invalid_cursor_rejected(client, db):
+    _seed_listing(db)
+    cursor = client.get("/api/v1/movies", params={"page_size": 2}).json()["next_cursor"]
+    resp = client.get("/api/v1/movies", params={"cursor": cursor, "sort_by": "release_date"})
+    assert resp.status_code == 400
+    assert client.get("/api/v1/movies", params={"cursor": "not-a-cursor"}).status_code == 400
+
+
+def test_total_is_cached_per_filter(client, db):
+    _seed_listing(db)
+    assert client.get("/api/v1/movies").json()["total"] == 7
+
+    db.add(Movie(id=99, title="New", popularity=1.0))
+    db.commit()
+    # 같은 필터 → 캐시된 total, 정렬/페이지가 달라도 같은 키
+    assert client.get("/api/v1/movies", params={"sort_by": "weighted_score", "page": 2}).json()["total"] == 7
+    assert client.get("/api/v1/movies", params={"query": "New"}).json()["total"] == 1
+
+
+def test_mbti_sort_matches_index_expression(client, db):
+    db.add_all([
+        Movie(id=1, title="A", mbti_scores={"INTJ": 0.4}),
+        Movie(id=2, title="B", mbti_scores={"INTJ": 0.9}),
+        Movie(id=3, title="C", mbti_scores={"ENFP": 0.8}),
+        Movie(id=4, title="D", mbti_scores={"INTJ": 0.4}),
+    ])
+    db.commit()
+
+    ids, _ = _walk(client, mbti="INTJ")
+    assert ids == [2, 4, 1, 3]
+
+    # 인덱스 정의와 같은 식 (키 리터럴 인라인)
+    compiled = str(score_expr("mbti_scores", "INTJ").compile(dialect=postgresql.dialect()))
+    assert compiled == "CAST(movies.mbti_scores ->> 'INTJ' AS FLOAT)"
+    assert "((mbti_scores ->> 'INTJ')::float) DESC NULLS LAST" in index_ddl("mbti_scores", "INTJ")
+    with pytest.raises(ValueError):
+        score_expr("mbti_scores", "INTJ'; --")
+
+
+def test_country_filter_uses_join(client, db):
+    korea = Country(name="South Korea", name_ko="대한민국")
+    usa = Country(name="United States of America", name_ko="미국")
+    db.add_all([
+        Movie(id=1, title="A", production_countries_ko="대한민국", countries=[korea]),
+        Movie(id=2, title="B", production_countries_ko="미국, 대한민국", countries=[usa, korea]),
+        Movie(id=3, title="C", production_countries_ko="미국", countries=[usa]),
+        Movie(id=4, title="D", production_countries_ko="프랑스"),
+    ])
+    db.commit()
+
+    def ids(country):
+        resp = client.get("/api/v1/movies", params={"country": country, "sort_by": "release_date"})
+        return sorted(m["id"] for m in resp.json()["items"])
+
+    assert ids("대한민국") == [1, 2]
+    assert ids("United States of America") == [2, 3]
+    # countries에 없는 이름은 텍스트 부분 일치로 폴백
+    assert ids("프랑") == [4]
+
+
+def test_onboarding_pool_cached_and_seeded(client, db, monkeypatch):
+    genres = [Genre(name=f"G{i}") for i in range(3)]
+    db.add_all([
+        Movie(id=i, title=f"M{i}", weighted_score=7.5, vote_count=600, popularity=float(i),
+              release_date=date(2010, 1, 1), poster_path="/p.jpg", genres=[genres[i % 3]])
+        for i in range(1, 31)
+    ] + [Movie(id=99, title="Old", weighted_score=9.0, vote_count=900, release_date=date(1990, 1, 1),
+               poster_path="/p.jpg", genres=[genres[0]])])
+    db.commit()
+
+    loads = []
+    real_load = movies_api._load_onboarding_pool
+    monkeypatch.setattr(movies_api, "_load_onboarding_pool", lambda s: loads.append(1) or real_load(s))
+
+    first = client.get("/api/v1/movies/onboarding", params={"seed": 7}).json()
+    again = client.get("/api/v1/movies/onboarding", params={"seed": 7}).json()
+    other = client.get("/api/v1/movies/onboarding", params={"seed": 8}).json()
+
+    assert loads == [1]  # 풀은 한 번만 빌드
+    assert [m["id"] for m in first] == [m["id"] for m in again]
+    assert [m["id"] for m in first] != [m["id"] for m in other]
+    # 장르당 max(4, 40 // 3 + 1) = 14편 한도 — 장르별 10편이라 모두 선택
+    assert len(first) == 30
+    assert 99 not in {m["id"] for m in first}
+
+
+def test_similar_movies_follow_rank(client, db):
+    db.add_all([Movie(id=i, title=f"M{i}") for i in range(1, 6)])
+    db.commit()
+    db.execute(similar_movies.insert(), [
+        {"movie_id": 1, "similar_movie_id": 5, "score": 0.9, "rank": 1},
+        {"movie_id": 1, "similar_movie_id": 2, "score": 0.7, "rank": 3},
+        {"movie_id": 1, "similar_movie_id": 4, "score": 0.8, "rank": 2},
+    ])
+    db.commit()
+
+    resp = client.get("/api/v1/movies/1/similar", params={"limit": 2})
+    assert [m["id"] for m in resp.json()] == [5, 4]
@@ -0,0 +1,85 @@
+"""Per-endpoint SQL statement budgets (N+1 regression guard).
+
+찜/컬렉션 영화 수와 관계없이 엔드포인트당 SQL 문 수가 일정해야 한다.
+예산은 인증(사용자 조회)을 포함한 요청 전체 기준이다.
+"""
+import pytest
+
+from app.api.v1.recommendation_engine import get_user_preferences
+from app.models import Collection, Genre, Movie, Rating, User
+
+USER = {"email": "budget@example.com", "password": "TestPassword123!", "nickname": "budget"}
+FAVORITES = 40
+
+# (method, path, budget) — {fav}/{other}/{movie}는 시드 후 채운다
+BUDGETS = [
+    ("GET", "/api/v1/collections", 2),
+    ("GET", "/api/v1/collections/{fav}", 4),
+    ("GET", "/api/v1/interactions/favorites?page_size=100", 4),
+    ("GET", "/api/v1/interactions/favorites/genres", 3),
+    ("GET", "/api/v1/recommendations/for-you", 8),
+    ("POST", "/api/v1/interactions/favorite/{movie}", 6),
+    ("POST", "/api/v1/collections/{other}/movies", 6),
+    ("DELETE", "/api/v1/collections/{fav}/movies/1", 5),
+]
+
+
+@pytest.fixture()
+def seeded(client, db):
+    client.post("/api/v1/auth/signup", json=USER)
+    token = client.post(
+        "/api/v1/auth/login", json={"email": USER["email"], "password": USER["password"]},
+    ).json()["access_token"]
+    user = db.query(User).filter(User.email == USER["email"]).one()
+
+    genres = [Genre(id=i, name=f"G{i}") for i in range(1, 5)]
+    movies = [
+        Movie(id=i, title=f"M{i}", weighted_score=7.0, genres=[genres[i % 4], genres[(i + 1) % 4]])
+        for i in range(1, FAVORITES + 2)
+    ]
+    fav = Collection(user_id=user.id, name="찜한 영화", movies=movies[:FAVORITES])
+    other = Collection(user_id=user.id, name="주말", movies=movies[:5])
+    db.add_all([fav, other])
+    db.commit()
+    ids = {"fav": fav.id, "other": other.id, "movie": FAVORITES + 1}
+    return {"Authorization": f"Bearer {token}"}, ids
+
+
+@pytest.mark.parametrize(("method", "path", "budget"), BUDGETS)
+def test_endpoint_statement_budget(client, seeded, count_queries, method, path, budget):
+    headers, ids = seeded
+    url = path.format(**ids)
+    body = {"movie_id": ids["movie"]} if url.endswith("/movies") else None
+
+    with count_queries() as q:
+        resp = client.request(method, url, headers=headers, json=body)
+
+    assert resp.status_code < 300, resp.text
+    assert q.count <= budget, "\n".join(q.statements)
+
+
+def test_collection_responses_are_complete(client, seeded):
+    headers, ids = seeded
+    listing = {c["id"]: c["movie_count"] for c in client.get("/api/v1/collections", headers=headers).json()}
+    assert listing == {ids["fav"]: FAVORITES, ids["other"]: 5}
+
+    detail = client.get(f"/api/v1/collections/{ids['fav']}", headers=headers).json()
+    assert detail["movie_count"] == FAVORITES
+    assert all(len(m["genres"]) == 2 for m in detail["movies"])
+
+    genres = client.get("/api/v1/interactions/favorites/genres", headers=headers).json()
+    assert sum(genres["genres"].values()) == 2 * FAVORITES
+
+
+def test_user_preferences_statement_budget(seeded, db, count_queries):
+    user = db.query(User).filter(User.email == USER["email"]).one()
+    db.add_all([Rating(user_id=user.id, movie_id=i, score=4.5) for i in range(1, 21)])
+    db.commit()
+    db.refresh(user)
+
+    with count_queries() as q:
+        favorited_ids, genre_counts, highly_rated_ids = get_user_preferences(db, user)
+
+    assert q.count <= 4, "\n".join(q.statements)  # 찜 id, 찜 장르, 고평점 id, 고평점 장르
+    assert len(favorited_ids) == FAVORITES and len(highly_rated_ids) == 20
+    assert sum(genre_counts.values()) == 2 * FAVORITES + 2 * 2 * 20
@@ -0,0 +1,76 @@
+"""CF scoring tests with a tiny exported artifact."""
+import json
+
+import numpy as np
+import pytest
+
+from app.api.v1 import recommendation_cf as cf
+from app.models import Movie, Rating, User
+
+
+@pytest.fixture()
+def cf_artifact(tmp_path, monkeypatch):
+    item_ids = np.array([550, 13, 27205], dtype=np.int64)
+    np.save(tmp_path / "item_ids.npy", item_ids)
+    np.save(tmp_path / "item_bias.npy", np.array([0.5, -4.0, 2.0]))
+    np.save(tmp_path / "item_factors.npy", np.ones((3, 4), dtype=np.float32))
+    (tmp_path / "meta.json").write_text(json.dumps({"global_mean": 3.5, "n_factors": 4}))
+
+    monkeypatch.setattr(cf, "CF_DIR", tmp_path)
+    monkeypatch.setattr(cf, "_cf_data", None)
+    yield tmp_path
+    monkeypatch.setattr(cf, "_cf_data", None)
+
+
+def test_predict_cf_scores_batched(cf_artifact):
+    scores = cf.predict_cf_scores(np.array([13, 550, 999999, 27205, -1]))
+
+    assert scores[:2].tolist() == [0.5, 4.0]  # 3.5 - 4.0 → clip 0.5
+    assert np.isnan(scores[2]) and np.isnan(scores[4])
+    assert scores[3] == 5.0  # 3.5 + 2.0 → clip 5.0
+    assert isinstance(cf._cf_data["item_factors"], np.memmap)
+
+
+def test_single_score_matches_batch(cf_artifact):
+    assert cf.predict_cf_score(550) == 4.0
+    assert cf.predict_cf_score(12345) is None
+    assert cf.normalize_cf_score(cf.predict_cf_scores(np.array([550])))[0] == pytest.approx(3.5 / 4.5)
+
+
+def test_fold_in_recovers_user_preference(cf_artifact, monkeypatch):
+    # 2-factor items: user loves factor 0, dislikes factor 1
+    factors = np.array([[1.0, 0.0], [0.0, 1.0], [1.0, 0.1], [0.1, 1.0], [0.9, 0.0], [0.0, 0.9]], dtype=np.float32)
+    np.save(cf_artifact / "item_ids.npy", np.arange(1, 7, dtype=np.int64))
+    np.save(cf_artifact / "item_bias.npy", np.zeros(6))
+    np.save(cf_artifact / "item_factors.npy", factors)
+
+    vector = cf.fold_in_user(np.array([1, 2, 3, 4]), np.array([5.0, 2.0, 4.5, 2.0]))
+    assert vector is not None
+    user_bias, user_factors = vector
+    assert user_factors[0] > user_factors[1]
+
+    monkeypatch.setattr(cf, "get_user_vector", lambda db, user_id: vector)
+    scores = cf.predict_user_cf_scores(None, 1, np.array([5, 6, 99]))
+    assert scores[0] > scores[1]
+    assert np.isnan(scores[2])
+
+
+def test_fold_in_needs_minimum_ratings(cf_artifact):
+    assert cf.fold_in_user(np.array([550, 13]), np.array([4.0, 3.0])) is None
+    # 매핑에 없는 영화는 세지 않는다
+    assert cf.fold_in_user(np.array([550, 13, 1, 2]), np.array([4.0, 3.0, 5.0, 5.0])) is None
+
+
+def test_user_vector_cache_invalidated_on_rating_write(cf_artifact, db, monkeypatch):
+    db.add(User(id=7, email="cf@test.com", password="x", nickname="cf"))
+    db.add_all([Movie(id=mid, title=str(mid)) for mid in (550, 13, 27205)])
+    db.add_all([Rating(user_id=7, movie_id=mid, score=4.0) for mid in (550, 13, 27205)])
+    db.commit()
+    monkeypatch.setattr(cf, "_user_vectors", type(cf._user_vectors)())
+
+    first = cf.get_user_vector(db, 7)
+    assert first is not None
+    assert cf.get_user_vector(db, 7) is first
+
+    cf.invalidate_user_vector(7)
+    assert cf.get_user_vector(db, 7) is not first
@@ -0,0 +1,64 @@
+"""Recommendation engine scoring tests.
+
+Pure-function tests — movies are lightweight stand-ins, no DB access.
+"""
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+
+from app.api.v1 import recommendation_engine as engine
+
+
+def _movie(movie_id, genres, ws=7.0, popularity=50.0, mbti=None, weather=None, emotion=None):
+    return SimpleNamespace(
+        id=movie_id,
+        genres=[SimpleNamespace(name=g) for g in genres],
+        weighted_score=ws,
+        popularity=popularity,
+        mbti_scores=mbti or {},
+        weather_scores=weather or {},
+        emotion_tags=emotion or {},
+        release_date=date(2015, 1, 1),
+    )
+
+
+@pytest.fixture(autouse=True)
+def _no_cf(monkeypatch):
+    monkeypatch.setattr(engine, "is_cf_available", lambda: False)
+
+
+def test_hybrid_scores_match_weighted_formula():
+    movie = _movie(1, ["드라마", "액션"], ws=9.0, popularity=150.0,
+                   mbti={"INTJ": 0.8}, weather={"rainy": 0.6})
+    scored = engine.calculate_hybrid_scores(
+        None, [movie], "INTJ", "rainy", {"드라마": 3, "액션": 2}, set(), {1},
+    )
+
+    # no-mood control weights: mbti 0.35, weather 0.25, personal 0.40
+    expected = 0.35 * 0.8 + 0.25 * 0.6 + 0.40 * (0.6 + 0.4) + 0.05
+    assert scored[0][1] == pytest.approx(min(expected, 1.0))
+    labels = [t.label for t in scored[0][2]]
+    assert labels == ["#INTJ추천", "#비오는날", "#취향저격", "#명작"]
+
+
+def test_hybrid_scores_sorted_and_top_n_limits_tags():
+    movies = [
+        _movie(1, ["코미디"], ws=6.0, mbti={"ENFP": 0.2}),
+        _movie(2, ["코미디"], ws=8.0, mbti={"ENFP": 0.9}),
+        _movie(3, ["스릴러"], ws=7.0, mbti={"ENFP": 0.6}),
+    ]
+    scored = engine.calculate_hybrid_scores(None, movies, "ENFP", None, {}, set(), set())
+    assert [m.id for m, _, _ in scored] == [2, 3, 1]
+
+    top = engine.calculate_hybrid_scores(None, movies, "ENFP", None, {}, set(), set(), top_n=1)
+    assert len(top) == 1
+    assert top[0][0].id == 2
+
+
+def test_mood_score_averages_present_emotions_only():
+    movie = _movie(1, ["드라마"], emotion={"romance": 0.9})
+    scored = engine.calculate_hybrid_scores(
+        None, [movie], None, None, {}, set(), set(), mood="emotional",
+    )
+    assert "#감성적인" in [t.label for t in scored[0][2]]
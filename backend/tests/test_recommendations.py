@@ -3,8 +3,17 @@
 These endpoints query movies from DB. With an empty SQLite DB,
 they should return 200 with empty results.
 """
+import random
+
 import pytest
 
+from app.api.v1 import recommendations
+from app.api.v1.diversity import inject_serendipity
+from app.api.v1.recommendation_engine import get_similar_movie_ids, similar_seed_weights
+from app.config import settings
+from app.models import Genre, Movie, similar_movies
+from app.services.section_cache import clear_section_cache
+
 
 @pytest.mark.skipif(True, reason="Uses JSONB cast — PostgreSQL only")
 def test_get_recommendations_home(client):
@@ -22,3 +31,77 @@ def test_get_popular(client):
 def test_get_top_rated(client):
     resp = client.get("/api/v1/recommendations/top-rated")
     assert resp.status_code == 200
+
+
+def test_korean_pool_reads_is_korean_flag(db):
+    db.add_all([
+        Movie(id=1, title="A", production_countries_ko="대한민국", is_korean=True, popularity=10.0),
+        Movie(id=2, title="B", production_countries_ko="미국", popularity=90.0),
+        Movie(id=3, title="C", production_countries_ko="미국, 대한민국", is_korean=True, popularity=50.0),
+    ])
+    db.commit()
+
+    assert [m.id for m in recommendations._korean_popular_pool(db, None)] == [3, 1]
+
+
+def test_home_output_same_in_parallel_and_sequential(client, db, monkeypatch):
+    drama = Genre(name="Drama", name_ko="드라마")
+    for i in range(1, 200):
+        korean = i % 3 == 0
+        db.add(Movie(
+            id=i, title=f"M{i}", popularity=200.0 - i, vote_count=500, vote_average=7 + i / 1000,
+            weighted_score=7 + i / 1000, is_korean=korean,
+            production_countries_ko="대한민국" if korean else "미국", genres=[drama],
+        ))
+    db.commit()
+
+    def home(parallel):
+        monkeypatch.setattr(settings, "HOME_PARALLEL_SECTIONS", parallel)
+        clear_section_cache()
+        random.seed(7)
+        body = client.get("/api/v1/recommendations").json()
+        return body["featured"], body["rows"]
+
+    sequential = home(False)
+    assert sequential[1] and all(row["movies"] for row in sequential[1])
+    assert home(True) == sequential
+
+
+def test_serendipity_fallback_samples_in_python(db):
+    drama, horror = Genre(name="드라마"), Genre(name="공포")
+    db.add_all([
+        Movie(id=1, title="A", weighted_score=8.0, genres=[drama]),
+        Movie(id=2, title="B", weighted_score=8.0, genres=[horror]),
+        Movie(id=3, title="C", weighted_score=8.0, genres=[horror, drama]),
+        Movie(id=4, title="D", weighted_score=5.0, genres=[horror]),
+    ])
+    db.commit()
+    scored = [(Movie(id=100 + i, title=f"S{i}"), 1.0, []) for i in range(10)]
+
+    def pick(seed):
+        result = inject_serendipity(scored, 10, {"드라마"}, db, serendipity_ratio=0.2, rng=random.Random(seed))
+        return [item[0].id for item in result if item[0].id < 100]
+
+    assert pick(1) == pick(1)
+    assert sorted(pick(1)) == [2, 3]  # 선호 장르 외 장르가 있는 고품질 영화만
+
+
+def test_similar_ids_weighted_union_across_seeds(db):
+    db.add_all([Movie(id=i, title=f"M{i}") for i in range(1, 8)])
+    db.commit()
+    db.execute(similar_movies.insert(), [
+        {"movie_id": 1, "similar_movie_id": 3, "score": 0.9, "rank": 1},
+        {"movie_id": 1, "similar_movie_id": 4, "score": 0.5, "rank": 2},
+        {"movie_id": 1, "similar_movie_id": 7, "score": 0.4, "rank": 3},
+        {"movie_id": 2, "similar_movie_id": 4, "score": 0.8, "rank": 1},
+        {"movie_id": 2, "similar_movie_id": 5, "score": None, "rank": 2},  # 재계산 전 행은 1.0
+    ])
+    db.commit()
+
+    weights = similar_seed_weights({1}, {1, 2})
+    assert weights == pytest.approx({1: 1.7, 2: 0.7})
+    similar = get_similar_movie_ids(db, weights, per_seed=2)
+    # 4: 1.7·0.5 + 0.7·0.8 = 1.41, 3: 1.7·0.9 = 1.53, 5: 0.7, 7은 시드당 Top-2 밖
+    assert list(similar) == [3, 4, 5]
+    assert similar[4] == pytest.approx(1.41)
+    assert list(get_similar_movie_ids(db, {1, 2}, limit=1)) == [4]
@@ -0,0 +1,122 @@
+"""Section pool cache tests (in-process tier; Redis is disabled in tests unless faked)."""
+import threading
+import time
+
+from app.schemas import MovieListItem
+from app.services import section_cache
+
+
+def _item(movie_id):
+    return MovieListItem(
+        id=movie_id, title=f"M{movie_id}", title_ko=None, certification=None, runtime=None,
+        vote_average=7.0, vote_count=100, popularity=1.0, poster_path=None,
+        release_date=None, is_adult=False,
+    )
+
+
+def test_pool_is_cached_per_section_and_age_bucket():
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return [_item(1), _item(2)]
+
+    first = section_cache.get_section_pool("popular", "all", loader)
+    second = section_cache.get_section_pool("popular", "all", loader)
+    assert [m.id for m in first] == [1, 2]
+    assert second is first
+    assert len(calls) == 1
+
+    section_cache.get_section_pool("popular", "family", loader)
+    section_cache.get_section_pool("top_rated", "all", loader)
+    assert len(calls) == 3
+
+
+def test_pool_expires_after_ttl():
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return [_item(len(calls))]
+
+    section_cache.get_section_pool("popular", "all", loader, ttl=0)
+    time.sleep(0.01)
+    pool = section_cache.get_section_pool("popular", "all", loader, ttl=0)
+    assert pool[0].id == 2
+
+
+class _FakeRedis:
+    """get_section_pool이 쓰는 명령만 구현 (PTTL은 저장된 값을 그대로 반환)."""
+
+    def __init__(self):
+        self.data = {}
+        self.pttls = {}
+        self._queued = []
+
+    def setex(self, key, ttl, value):
+        if ttl <= 0:
+            raise ValueError("invalid expire time in 'setex' command")
+        self.data[key] = value
+        self.pttls[key] = ttl * 1000
+
+    def pipeline(self, transaction=True):
+        return self
+
+    def get(self, key):
+        self._queued.append(self.data.get(key))
+
+    def pttl(self, key):
+        self._queued.append(self.pttls.get(key, -2))
+
+    def execute(self):
+        result, self._queued = self._queued, []
+        return result
+
+
+def test_redis_hit_expires_locally_with_remaining_ttl(monkeypatch):
+    fake = _FakeRedis()
+    monkeypatch.setattr(section_cache, "get_redis_client", lambda: fake)
+    section_cache.get_section_pool("popular", "all", lambda: [_item(1)], ttl=60)
+    key = section_cache._redis_key("popular", "all")
+    fake.pttls[key] = 1500  # 다른 워커가 58.5초 전에 채운 항목
+
+    section_cache.clear_section_cache()
+    before = time.monotonic()
+    pool = section_cache.get_section_pool("popular", "all", lambda: [_item(2)], ttl=60)
+    expires_at = section_cache._local[("popular", "all")][0]
+    assert pool[0].id == 1
+    assert before + 1.4 <= expires_at <= time.monotonic() + 1.5
+
+
+def test_zero_ttl_skips_redis_set(monkeypatch):
+    fake = _FakeRedis()
+    monkeypatch.setattr(section_cache, "get_redis_client", lambda: fake)
+    pool = section_cache.get_section_pool("popular", "all", lambda: [_item(1)], ttl=0)
+    assert pool[0].id == 1
+    assert fake.data == {}
+
+
+def test_concurrent_misses_load_once():
+    calls = []
+    release = threading.Event()
+
+    def loader():
+        calls.append(1)
+        release.wait(1.0)
+        return [_item(1)]
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(section_cache.get_section_pool("korean_popular", "teen", loader)))
+        for _ in range(8)
+    ]
+    for t in threads:
+        t.start()
+    time.sleep(0.05)
+    release.set()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1
+    assert len(results) == 8
+    assert all(r is results[0] for r in results)
@@ -0,0 +1,73 @@
+"""Section executor tests (concurrent home section fetch)."""
+import threading
+
+import pytest
+from sqlalchemy import text
+
+from app.config import settings
+from app.core import section_executor
+from app.core.section_executor import run_section_tasks, section_worker_count
+
+
+@pytest.fixture(autouse=True)
+def _fresh_executor():
+    section_executor.close_section_executor()
+    yield
+    section_executor.close_section_executor()
+
+
+def _task(value):
+    def fn(session):
+        session.execute(text("SELECT 1"))
+        return value, session, threading.get_ident()
+    return fn
+
+
+def test_sequential_mode_uses_request_session(db):
+    results = run_section_tasks(db, {"a": _task(1), "b": _task(2)}, parallel=False)
+    assert [v for v, _, _ in results.values()] == [1, 2]
+    assert all(s is db for _, s, _ in results.values())
+
+
+def test_parallel_mode_keeps_task_order_and_isolates_sessions(db):
+    names = ["hybrid", "mbti", "weather", "popular", "korean_popular", "top_rated"]
+    results = run_section_tasks(db, {n: _task(i) for i, n in enumerate(names)}, parallel=True)
+
+    assert list(results) == names
+    assert [v for v, _, _ in results.values()] == list(range(len(names)))
+    # 마지막 태스크는 요청 스레드가 요청 세션으로 실행한다
+    *offloaded, (_, last_session, last_tid) = results.values()
+    assert last_session is db and last_tid == threading.get_ident()
+    sessions = [s for _, s, _ in offloaded]
+    assert len({id(s) for s in sessions}) == len(offloaded)
+    assert all(s is not db and s.get_bind() is db.get_bind() for s in sessions)
+    assert all(tid != threading.get_ident() for _, _, tid in offloaded)
+    assert section_executor._in_flight == 0
+
+
+def test_worker_count_capped_by_db_pool(monkeypatch):
+    monkeypatch.setattr(settings, "HOME_SECTION_WORKERS", 8)
+    monkeypatch.setattr(settings, "DB_POOL_SIZE", 6)
+    assert section_worker_count() == 3
+    monkeypatch.setattr(settings, "DB_POOL_SIZE", 1)
+    assert section_worker_count() == 1
+
+
+def test_overflow_tasks_run_on_request_session(db, monkeypatch):
+    monkeypatch.setattr(settings, "DB_POOL_SIZE", 4)  # 워커 2개
+    names = ["a", "b", "c", "d", "e"]
+    results = run_section_tasks(db, {n: _task(i) for i, n in enumerate(names)}, parallel=True)
+
+    assert [v for v, _, _ in results.values()] == list(range(len(names)))
+    assert [s is db for _, s, _ in results.values()] == [False, False, True, True, True]
+
+
+def test_saturated_executor_falls_back_to_sequential(db):
+    section_executor._get_executor()
+    section_executor._in_flight = section_executor._capacity  # 다른 요청이 워커를 모두 점유
+    try:
+        results = run_section_tasks(db, {"a": _task(1), "b": _task(2)}, parallel=True)
+    finally:
+        section_executor._in_flight = 0
+    assert all(s is db for _, s, _ in results.values())
+    assert all(tid == threading.get_ident() for _, _, tid in results.values())
@@ -0,0 +1,100 @@
+"""Semantic search tests with a small random corpus."""
+import json
+
+import numpy as np
+import pytest
+
+from app.api.v1 import semantic_index
+from app.api.v1 import semantic_search as ss
+
+
+@pytest.fixture()
+def corpus(tmp_path, monkeypatch):
+    rng = np.random.default_rng(0)
+    raw = rng.normal(size=(500, 64)).astype(np.float32)
+    np.save(tmp_path / "movie_embeddings.npy", raw)
+    (tmp_path / "movie_id_index.json").write_text(json.dumps({str(i): 1000 + i for i in range(len(raw))}))
+
+    monkeypatch.setattr(ss, "EMBEDDINGS_DIR", tmp_path)
+    for name in ("_corpus_embeddings", "_corpus_i8", "_corpus_i8_scale", "_index"):
+        monkeypatch.setattr(ss, name, None)
+    monkeypatch.setattr(ss, "_movie_ids", [])
+    return raw
+
+
+def test_float32_fallback(corpus):
+    ss.load_embeddings()
+    assert ss._corpus_i8 is None
+    assert ss._corpus_embeddings.dtype == np.float32
+
+    results = ss.search_similar(corpus[7], top_k=5)
+    assert results[0][0] == 1007
+    assert results[0][1] == pytest.approx(1.0, abs=1e-5)
+
+
+def test_quantized_corpus_is_memory_mapped(corpus):
+    ss.write_quantized_corpus(ss.EMBEDDINGS_DIR / "movie_embeddings.npy", ss.EMBEDDINGS_DIR)
+    ss.load_embeddings()
+    assert isinstance(ss._corpus_embeddings, np.memmap) and ss._corpus_embeddings.dtype == np.float16
+    assert isinstance(ss._corpus_i8, np.memmap)
+
+    normalized = corpus / np.linalg.norm(corpus, axis=1, keepdims=True)
+    query = corpus[42] + 0.5 * corpus[7]
+    truth = np.argsort(normalized @ (query / np.linalg.norm(query)))[::-1][:20] + 1000
+
+    rescored = ss.search_similar(query, top_k=20)
+    assert [mid for mid, _ in rescored[:2]] == truth[:2].tolist()
+    assert len({mid for mid, _ in rescored} & set(truth.tolist())) >= 19
+    assert [s for _, s in rescored] == sorted((s for _, s in rescored), reverse=True)
+
+    approx = ss.search_similar(query, top_k=20, rescore=False)
+    assert len({mid for mid, _ in approx} & set(truth.tolist())) >= 17
+
+
+def test_quantize_corpus_scales():
+    raw = np.array([[3.0, 4.0], [0.0, 0.0]], dtype=np.float32)
+    f16, i8, scale = ss.quantize_corpus(raw)
+    assert f16[0].tolist() == pytest.approx([0.6, 0.8], abs=1e-3)
+    assert i8[0].tolist() == [95, 127]
+    assert (i8[1] == 0).all() and scale[1] == 1.0
+
+
+def test_ivf_index_candidates(corpus):
+    normalized = ss._normalize_rows(corpus)
+    ss.write_quantized_corpus(ss.EMBEDDINGS_DIR / "movie_embeddings.npy", ss.EMBEDDINGS_DIR)
+    assert semantic_index.build_indexes(normalized, ss.EMBEDDINGS_DIR) == [semantic_index.IVF_FILE]
+
+    ss.load_embeddings(index_backend="ivf", nprobe=2)
+    index = ss._index
+    assert isinstance(index, semantic_index.IVFIndex)
+    assert sorted(index.rows.tolist()) == list(range(len(corpus)))
+
+    # 후보는 최소 k × MIN_CANDIDATE_FACTOR행 (리스트 단위로 확장)
+    rows = index.candidates(normalized[3], 10)
+    assert len(rows) >= 10 * semantic_index.MIN_CANDIDATE_FACTOR
+    assert 3 in rows
+    assert ss.search_similar(corpus[3], top_k=10)[0][0] == 1003
+
+    # 모든 리스트를 열면 전체 스캔과 같다
+    index.nprobe = len(index.centroids)
+    assert ss.search_similar(corpus[3], top_k=10) == ss.search_similar(corpus[3], top_k=10, use_index=False)
+
+
+def test_load_index_rejects_mismatch(corpus, tmp_path):
+    semantic_index.build_indexes(ss._normalize_rows(corpus), tmp_path)
+    assert semantic_index.load_index(tmp_path, len(corpus), "ivf") is not None
+    assert semantic_index.load_index(tmp_path, len(corpus) + 1, "ivf") is None
+    assert semantic_index.load_index(tmp_path, len(corpus), "exact") is None
+    assert semantic_index.load_index(tmp_path / "missing", len(corpus), "auto") is None
+
+
+def test_unreadable_faiss_index_falls_back_to_ivf(corpus, tmp_path, monkeypatch):
+    semantic_index.build_indexes(ss._normalize_rows(corpus), tmp_path)
+    (tmp_path / semantic_index.FAISS_FILE).write_bytes(b"corrupt")
+
+    def fail(path, nprobe):
+        raise RuntimeError("Error in faiss::read_index: bad magic")
+
+    monkeypatch.setattr(semantic_index.FaissIndex, "load", fail)
+    assert isinstance(semantic_index.load_index(tmp_path, len(corpus), "auto"), semantic_index.IVFIndex)
+    assert semantic_index.load_index(tmp_path, len(corpus), "faiss") is None
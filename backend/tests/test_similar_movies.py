@@ -0,0 +1,166 @@
+"""Blocked similar-movies engine tests (parity with the per-movie loop)."""
+import importlib.util
+from pathlib import Path
+
+import numpy as np
+from sqlalchemy import select
+
+from app.api.v1.recommendation_engine import get_similar_movie_ids
+from app.models import Movie, similar_movies
+from ml import similar_movies as sm
+from tests.conftest import engine
+
+
+def _inputs(n, seed=0):
+    rng = np.random.default_rng(seed)
+    names = ["드라마", "액션", "코미디", "공포", "SF", "로맨스"]
+    genres = [set(rng.choice(names, size=rng.integers(1, 3), replace=False)) for _ in range(n)]
+    emotion = np.round(rng.random((n, 7)), 1)
+    emotion[::17] = 0.0  # 태그 없는 영화 (영벡터)
+    bits, _ = sm.genre_bitmasks(genres)
+    inputs = sm.SimilarityInputs(
+        np.arange(n) * 7 + 3, emotion, rng.random((n, 16)), bits,
+        rng.uniform(4.0, 9.0, n), (emotion > 0.7).any(axis=1),
+    )
+    return inputs, genres
+
+
+def test_engine_matches_reference_loop():
+    inputs, genres = _inputs(700)
+    targets, idx, score = sm.compute_top_k(inputs, block_size=64, workers=1)
+    actual = sm.to_results(inputs, targets, idx, score)
+    expected = sm.reference_top_k(inputs, genres, range(len(inputs)))
+
+    report = sm.parity(expected, actual)
+    assert report["mismatched"] == 0
+    assert report["max_score_diff"] < 1e-5
+    assert all(mid not in {s for s, _ in nbrs} for mid, nbrs in actual.items())
+
+
+def test_few_candidates_and_subset_targets():
+    inputs, genres = _inputs(40, seed=1)  # 후보 열이 CHUNK보다 적다
+    rows = np.array([5, 0, 33])
+    targets, idx, score = sm.compute_top_k(inputs, rows, k=25, workers=1)
+    actual = sm.to_results(inputs, targets, idx, score)
+    expected = sm.reference_top_k(inputs, genres, rows, k=25)
+
+    assert list(targets) == [5, 0, 33]
+    assert sm.parity(expected, actual)["mismatched"] == 0
+    assert (idx == -1).any()  # 후보가 k보다 적은 행은 -1로 채운다
+
+
+def test_parallel_blocks_match_single_process():
+    inputs, _ = _inputs(300, seed=2)
+    _, idx_single, score_single = sm.compute_top_k(inputs, block_size=32, workers=1)
+    _, idx_pool, score_pool = sm.compute_top_k(inputs, block_size=32, workers=2)
+    assert np.array_equal(idx_single, idx_pool)
+    assert np.array_equal(score_single, score_pool)
+
+
+def test_popcount_fallback_matches_numpy():
+    x = np.array([0, 1, 0b1011, 2**63 + 5], dtype=np.uint64)
+    as_bytes = x.view(np.uint8).reshape(-1, 8)
+    assert list(sm._BYTE_POPCOUNT[as_bytes].sum(axis=1)) == [0, 1, 3, 3]
+    assert list(sm.popcount(x)) == [0, 1, 3, 3]
+
+
+def _stored(inputs):
+    targets, idx, score = sm.compute_top_k(inputs, workers=1)
+    return sm.to_results(inputs, targets, idx, score)
+
+
+def _apply(stored, deletes, upserts):
+    """차분을 (movie_id, similar_id) → (score, rank) 테이블에 적용"""
+    table = {(mid, sid): (score, rank) for mid, nbrs in stored.items() for rank, (sid, score) in enumerate(nbrs, 1)}
+    for key in deletes:
+        del table[key]
+    table.update({(mid, sid): (score, rank) for mid, sid, score, rank in upserts})
+    return table
+
+
+def test_incremental_recompute_matches_full():
+    inputs, _ = _inputs(500, seed=3)
+    stored = _stored(inputs)
+
+    # 태그/평점이 바뀐 영화 몇 편 (품질 필터 통과/탈락 포함)
+    rng = np.random.default_rng(4)
+    changed_rows = rng.choice(len(inputs), size=12, replace=False)
+    emotion, mbti = inputs.emotion.copy(), inputs.mbti.copy()
+    weighted = inputs.weighted_score.copy()
+    emotion[changed_rows] = rng.random((12, 7))
+    mbti[changed_rows] = rng.random((12, 16))
+    weighted[changed_rows[:4]] = [9.5, 3.0, 8.0, 5.0]
+    updated = sm.SimilarityInputs(inputs.ids, emotion, mbti, inputs.genre_bits, weighted, inputs.is_llm)
+    changed_ids = [int(inputs.ids[r]) for r in changed_rows]
+
+    rows = sm.incremental_rows(updated, stored, changed_ids)
+    assert len(rows) < len(updated)
+    targets, idx, score = sm.compute_top_k(updated, rows, workers=1)
+    partial = sm.to_results(updated, targets, idx, score)
+    deletes, upserts = sm.diff_pairs(stored, partial, [int(updated.ids[r]) for r in rows])
+
+    actual = _apply(stored, deletes, upserts)
+    expected = _apply(_stored(updated), [], [])
+    assert actual.keys() == expected.keys()
+    assert all(actual[key][1] == expected[key][1] for key in expected)
+    assert max(abs(actual[key][0] - expected[key][0]) for key in expected) < 1e-6
+
+
+def test_entrant_rows_flags_new_top_k_entries():
+    inputs, _ = _inputs(200, seed=5)
+    neighbors = sm.neighbor_matrix(inputs, _stored(inputs))
+    assert len(sm.entrant_rows(inputs, np.array([], dtype=np.int64), neighbors)) == 0
+
+    # 40번 영화를 21번의 복제본으로 바꾸면 21번의 Top-K 1위로 들어간다
+    emotion, mbti, bits = inputs.emotion.copy(), inputs.mbti.copy(), inputs.genre_bits.copy()
+    emotion[40], mbti[40], bits[40] = emotion[21], mbti[21], bits[21]
+    weighted = inputs.weighted_score.copy()
+    weighted[40] = 9.0
+    updated = sm.SimilarityInputs(inputs.ids, emotion, mbti, bits, weighted, inputs.is_llm)
+
+    flagged = sm.entrant_rows(updated, np.array([40]), neighbors)
+    assert 21 in flagged and 40 not in flagged
+    targets, idx, _ = sm.compute_top_k(updated, flagged, workers=1)
+    assert all(40 in row for row in idx)  # 표시된 행은 실제로 40번이 Top-K에 든다
+
+
+def test_diff_pairs_upserts_changed_score_and_rank():
+    stored = {1: [(2, 0.9), (3, 0.8)], 4: [(5, 0.7)], 7: [(8, None)]}
+    results = {1: [(3, 0.95), (6, 0.5)], 7: [(8, 0.6)]}
+    deletes, upserts = sm.diff_pairs(stored, results, [1, 4, 7])
+    assert deletes == [(1, 2), (4, 5)]
+    assert upserts == [(1, 3, 0.95, 1), (1, 6, 0.5, 2), (7, 8, 0.6, 1)]  # 점수 없던 행도 채운다
+    assert sm.diff_pairs(results, results, [1, 7]) == ([], [])
+
+
+def _load_script(name):
+    path = Path(__file__).resolve().parent.parent / "scripts" / f"{name}.py"
+    spec = importlib.util.spec_from_file_location(f"scripts_{name}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_ranked_csv_neighbors_keeps_csv_order():
+    pairs, skipped = sm.ranked_csv_neighbors(1, " 30, 2.0,, x, 1, 99, 30, 4", {1, 2, 4, 30})
+    assert pairs == [(30, 1), (2, 2), (4, 3)]
+    assert skipped == 3  # 자기 자신, 데이터셋 밖, 중복
+    assert sm.ranked_csv_neighbors(1, None, {2}) == ([], 0)
+    assert sm.ranked_csv_neighbors(1, [30, 1, 4], {1, 4, 30}) == ([(30, 1), (4, 2)], 1)  # 파싱된 리스트
+
+
+def test_import_relationships_writes_rank(db):
+    db.add_all([Movie(id=i, title=f"M{i}") for i in (1, 2, 3, 4)])
+    db.commit()
+    rows = [{"id": "1", "similar_movie_ids": "4, 2, 3"}, {"id": "2", "similar_movie_ids": "1"}]
+
+    script = _load_script("import_relationships")
+    with engine.connect() as conn:
+        assert script.insert_similar_movies(conn, rows, {1, 2, 3, 4}) == (4, 0)
+
+    stored = db.execute(
+        select(similar_movies.c.movie_id, similar_movies.c.similar_movie_id, similar_movies.c.rank)
+        .order_by(similar_movies.c.movie_id, similar_movies.c.rank)
+    ).all()
+    assert [tuple(r) for r in stored] == [(1, 4, 1), (1, 2, 2), (1, 3, 3), (2, 1, 1)]
+    assert set(get_similar_movie_ids(db, {1}, per_seed=2)) == {4, 2}  # rank <= per_seed
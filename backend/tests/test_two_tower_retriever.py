@@ -0,0 +1,119 @@
+"""Two-Tower retriever tests (user-vector cache, batch retrieval, filtered search).
+
+The user tower and FAISS index are replaced by small NumPy stand-ins,
+so these run without torch/faiss installed.
+"""
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from app.services import two_tower_retriever as tt
+
+GENRE_TO_IDX = {g: i for i, g in enumerate(["SF", "드라마", "액션"])}
+MBTI_TO_IDX = {"INTJ": 0, "ENFP": 1}
+
+
+class _FlatIndex:
+    def __init__(self, items):
+        self.items = items
+        self.ntotal = len(items)
+        self.calls = 0
+
+    def search(self, queries, k):
+        self.calls += 1
+        scores = queries @ self.items.T
+        order = np.argsort(-scores, axis=1)[:, :k]
+        return np.take_along_axis(scores, order, axis=1), order
+
+
+def _retriever(cache_size=16):
+    r = object.__new__(tt.TwoTowerRetriever)
+    r._GENRE_TO_IDX = GENRE_TO_IDX
+    r._MBTI_TO_IDX = MBTI_TO_IDX
+    r.cache_size = cache_size
+    r._user_cache = OrderedDict()
+    r._cache_lock = threading.Lock()
+    r.forward_batches = []
+
+    def forward(mbti_idx, genre_mat):
+        r.forward_batches.append(len(mbti_idx))
+        vecs = np.zeros((len(mbti_idx), tt.USER_EMBED_DIM), dtype=np.float32)
+        vecs[:, 0] = mbti_idx
+        vecs[:, 1:4] = genre_mat
+        return vecs
+
+    r._forward = forward
+    items = np.zeros((4, tt.USER_EMBED_DIM), dtype=np.float32)
+    items[0, 1] = items[1, 2] = items[2, 3] = items[3, 0] = 1.0
+    r.index = _FlatIndex(items)
+    r.movie_id_map = [100, 200, 300, 400]
+    r._position_of = {m: i for i, m in enumerate(r.movie_id_map)}
+    r._cert_masks = {}
+    r._faiss = None
+    return r
+
+
+def test_retrieve_batch_single_forward_and_search():
+    r = _retriever()
+    results = r.retrieve_batch(
+        [("INTJ", ["SF"]), ("ENFP", ["액션"]), ("INTJ", ["SF"])],
+        top_k=2,
+        exclude_ids=[set(), {400}, set()],
+    )
+
+    assert r.forward_batches == [2]  # 중복 키는 한 번만 계산
+    assert r.index.calls == 2  # 제외 집합별 1회
+    assert results[0][0][0] == 100
+    assert results[1][0][0] == 300 and 400 not in [m for m, _ in results[1]]
+    assert results[2] == results[0]
+
+
+def test_user_vector_cache_hits_and_lru_eviction():
+    r = _retriever(cache_size=2)
+    r.retrieve("INTJ", ["SF", "드라마"], top_k=1)
+    r.retrieve("INTJ", ["드라마", "SF"], top_k=1)  # 같은 비트마스크
+    assert r.forward_batches == [1]
+
+    r.retrieve("ENFP", [], top_k=1)
+    r.retrieve("INTJ", ["액션"], top_k=1)  # 가장 오래된 키 축출
+    assert len(r._user_cache) == 2
+    r.retrieve("INTJ", ["SF", "드라마"], top_k=1)
+    assert r.forward_batches == [1, 1, 1, 1]
+
+
+def test_long_exclusion_list_still_fills_top_k():
+    r = _retriever()
+    # 가장 가까운 3편을 제외해도 나머지 1편이 반환되어야 함
+    results = r.retrieve("INTJ", ["SF", "드라마", "액션"], top_k=1, exclude_ids={100, 200, 300})
+    assert [m for m, _ in results] == [400]
+
+
+def test_age_rating_pushdown_uses_feature_store(monkeypatch):
+    class _Feats:
+        def rows(self, ids):
+            return np.arange(len(ids))
+
+        def age_rating_mask(self, allowed):
+            return np.array([False, True, True, False])  # 100, 400은 등급 제외
+
+    class _Store:
+        features = _Feats()
+
+    monkeypatch.setattr(tt, "get_feature_store", lambda: _Store())
+    r = _retriever()
+    results = r.retrieve("INTJ", ["SF", "드라마", "액션"], top_k=4, allowed_certifications=["ALL"])
+    assert sorted(m for m, _ in results) == [200, 300]
+
+    # 등급 + 제외 동시 적용
+    results = r.retrieve("INTJ", ["SF"], top_k=4, exclude_ids={200}, allowed_certifications=["ALL"])
+    assert [m for m, _ in results] == [300]
+
+
+def test_age_rating_without_feature_store_returns_nothing(monkeypatch):
+    monkeypatch.setattr(tt, "get_feature_store", lambda: None)
+    r = _retriever()
+    assert r.retrieve("INTJ", ["SF"], top_k=4, allowed_certifications=["ALL"]) == []
+    assert r.forward_batches == []
+    # 등급 제한이 없으면 store 없이도 검색
+    assert len(r.retrieve("INTJ", ["SF"], top_k=4)) == 4
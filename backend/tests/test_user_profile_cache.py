@@ -0,0 +1,91 @@
+"""User profile cache tests (in-process tier, versioned Redis tier, write-path invalidation)."""
+from app.api.v1.recommendation_engine import load_user_profile
+from app.models import Movie, User
+from app.services import section_cache
+from app.services import user_profile_cache as upc
+
+USER = {"email": "profile@example.com", "password": "TestPassword123!", "nickname": "profile"}
+
+
+def _profile(n):
+    return upc.UserProfile({n}, {"드라마": n}, set(), {n + 100: 0.5})
+
+
+class _FakeRedis:
+    """get_user_profile/invalidate_user_profile가 쓰는 명령만 구현한 dict 기반 Redis."""
+
+    def __init__(self):
+        self.data = {}
+
+    def mget(self, *keys):
+        return [self.data.get(k) for k in keys]
+
+    def setex(self, key, ttl, value):
+        self.data[key] = value
+
+    def incr(self, key):
+        self.data[key] = str(int(self.data.get(key, 0)) + 1)
+
+    def expire(self, key, ttl):
+        pass
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+    def pipeline(self):
+        return self
+
+    def execute(self):
+        pass
+
+
+def test_profile_cached_until_invalidated():
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return _profile(len(calls))
+
+    first = upc.get_user_profile(1, loader)
+    assert upc.get_user_profile(1, loader) is first
+    assert upc.get_user_profile(2, loader).favorited_ids == {2}
+
+    upc.invalidate_user_profile(1)
+    assert upc.get_user_profile(1, loader).favorited_ids == {3}
+    assert len(calls) == 3
+
+
+def test_redis_version_invalidates_other_workers(monkeypatch):
+    fake = _FakeRedis()
+    monkeypatch.setattr(section_cache, "get_redis_client", lambda: fake)
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return _profile(len(calls))
+
+    upc.get_user_profile(7, loader)
+    upc.clear_user_profile_cache()  # 다른 워커: 로컬은 비어 있고 Redis에서 복원
+    restored = upc.get_user_profile(7, loader)
+    assert len(calls) == 1
+    assert restored.similar_ids == {101: 0.5}
+
+    fake.incr(upc._version_key(7))  # 다른 워커가 무효화 — 이 워커의 로컬 항목은 버전이 달라 버린다
+    assert upc.get_user_profile(7, loader).favorited_ids == {2}
+    assert len(calls) == 2
+
+
+def test_favorite_toggle_invalidates_profile(client, db):
+    client.post("/api/v1/auth/signup", json=USER)
+    token = client.post(
+        "/api/v1/auth/login", json={"email": USER["email"], "password": USER["password"]},
+    ).json()["access_token"]
+    db.add(Movie(id=10, title="M10"))
+    db.commit()
+    user_id = db.query(User.id).filter(User.email == USER["email"]).scalar()
+
+    assert load_user_profile(db, user_id).favorited_ids == set()
+    resp = client.post("/api/v1/interactions/favorite/10", headers={"Authorization": f"Bearer {token}"})
+    assert resp.json()["is_favorited"] is True
+    db.expire_all()
+    assert load_user_profile(db, user_id).favorited_ids == {10}
@@ -0,0 +1,40 @@
+"""NumPy user tower parity against the torch UserTower."""
+import numpy as np
+import pytest
+
+from ml.user_tower_np import NumpyUserTower, export_user_tower_npz
+
+torch = pytest.importorskip("torch")
+
+
+def test_numpy_user_tower_matches_torch(tmp_path):
+    from ml.two_tower import TwoTowerModel
+
+    torch.manual_seed(0)
+    model = TwoTowerModel()
+    model.eval()
+    # LayerNorm 기본값(1, 0)이 아닌 가중치로 검증
+    with torch.no_grad():
+        model.user_tower.ln1.weight.uniform_(0.5, 1.5)
+        model.user_tower.ln1.bias.uniform_(-0.1, 0.1)
+
+    path = tmp_path / "user_tower.npz"
+    export_user_tower_npz(model.state_dict(), path)
+    tower = NumpyUserTower.load(path)
+
+    rng = np.random.default_rng(0)
+    mbti_idx = rng.integers(0, 16, size=64)
+    genre_vec = (rng.random((64, 19)) < 0.3).astype(np.float32)
+    history = rng.standard_normal((64, 128)).astype(np.float32)
+
+    with torch.no_grad():
+        expected = model.user_tower(
+            torch.from_numpy(mbti_idx), torch.from_numpy(genre_vec), torch.from_numpy(history),
+        ).numpy()
+    np.testing.assert_allclose(tower(mbti_idx, genre_vec, history), expected, atol=1e-5)
+
+    with torch.no_grad():
+        expected = model.user_tower(
+            torch.from_numpy(mbti_idx), torch.from_numpy(genre_vec), torch.zeros(64, 128),
+        ).numpy()
+    np.testing.assert_allclose(tower(mbti_idx, genre_vec), expected, atol=1e-5)
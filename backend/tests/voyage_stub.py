@@ -0,0 +1,53 @@
+"""
+Local stub of the Voyage AI embeddings endpoint.
+
+API 키/네트워크 없이 시맨틱 검색 경로를 돌려보기 위한 스텁 서버.
+텍스트 해시를 시드로 한 결정적 단위 벡터를 반환하고, 최근 요청의 input 목록을 기록한다.
+
+실행 (backend/에서):
+  uvicorn tests.voyage_stub:app --port 8100
+  VOYAGE_API_URL=http://localhost:8100/v1/embeddings VOYAGE_API_KEY=stub uvicorn app.main:app
+
+테스트에서는 httpx.ASGITransport(app=app)로 프로세스 내에서 호출한다.
+"""
+import hashlib
+from collections import deque
+
+import numpy as np
+from fastapi import FastAPI
+from pydantic import BaseModel
+
+EMBEDDING_DIM = 1024
+REQUEST_LOG_SIZE = 256
+
+app = FastAPI(title="Voyage AI stub")
+
+# 최근 요청별 input 목록 (테스트 검증용, 장시간 벤치마크에서도 최근 REQUEST_LOG_SIZE건만 유지)
+requests_log: deque[list[str]] = deque(maxlen=REQUEST_LOG_SIZE)
+
+
+class EmbeddingRequest(BaseModel):
+    input: list[str]
+    model: str = "voyage-multilingual-2"
+    input_type: str | None = None
+
+
+def stub_embedding(text: str, dim: int = EMBEDDING_DIM) -> np.ndarray:
+    """텍스트 → 결정적 L2 정규화 float32 벡터."""
+    seed = int.from_bytes(hashlib.sha256(text.encode()).digest()[:8], "little")
+    vec = np.random.default_rng(seed).standard_normal(dim).astype(np.float32)
+    return vec / np.linalg.norm(vec)
+
+
+@app.post("/v1/embeddings")
+async def embeddings(body: EmbeddingRequest) -> dict:
+    requests_log.append(list(body.input))
+    return {
+        "object": "list",
+        "data": [
+            {"object": "embedding", "index": i, "embedding": stub_embedding(text).tolist()}
+            for i, text in enumerate(body.input)
+        ],
+        "model": body.model,
+        "usage": {"total_tokens": sum(len(text) for text in body.input)},
+    }
@@ -45,6 +45,7 @@ function MoviesPageContent() {
   // Infinite scroll mode
   const [useInfiniteMode, setUseInfiniteMode] = useState(false);
   const [infinitePage, setInfinitePage] = useState(1);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
 
   const hasMore = useInfiniteMode
     ? infinitePage < totalPages
@@ -98,6 +99,7 @@ function MoviesPageContent() {
         });
         setMovies(data.items);
         setTotalPages(data.total_pages);
+        setNextCursor(data.next_cursor);
 
         if (data.items.length === 0 && query) {
           const popular = await getPopularMovies(12);
@@ -163,15 +165,17 @@ function MoviesPageContent() {
         page: nextPage,
         page_size: 24,
         sort_by: sortBy,
+        cursor: nextCursor || undefined,
       });
       setMovies((prev) => [...prev, ...data.items]);
       setInfinitePage(nextPage);
+      setNextCursor(data.next_cursor);
     } catch (error) {
       console.error("Failed to load more movies:", error);
     } finally {
       setLoadingMore(false);
     }
-  }, [infinitePage, totalPages, loadingMore, query, selectedGenre, selectedAgeRating, sortBy, selectedCountry, selectedKeyword, selectedMbti, selectedWeather]);
+  }, [infinitePage, totalPages, nextCursor, loadingMore, query, selectedGenre, selectedAgeRating, sortBy, selectedCountry, selectedKeyword, selectedMbti, selectedWeather]);
 
   const { loadMoreRef } = useInfiniteScroll({
     onLoadMore: loadMore,
@@ -156,6 +156,7 @@ export async function getMovies(params?: {
   page?: number;
   page_size?: number;
   sort_by?: string;
+  cursor?: string;
 }) {
   const searchParams = new URLSearchParams();
   if (params?.query) searchParams.set("query", params.query);
@@ -168,9 +169,10 @@ export async function getMovies(params?: {
   if (params?.page) searchParams.set("page", params.page.toString());
   if (params?.page_size) searchParams.set("page_size", params.page_size.toString());
   if (params?.sort_by) searchParams.set("sort_by", params.sort_by);
+  if (params?.cursor) searchParams.set("cursor", params.cursor);
 
   const query = searchParams.toString();
-  return fetchAPI<{ items: Movie[]; total: number; page: number; total_pages: number }>(
+  return fetchAPI<{ items: Movie[]; total: number; page: number; total_pages: number; next_cursor: string | null }>(
     `/movies${query ? `?${query}` : ""}`
   );
 }
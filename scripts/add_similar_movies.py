@@ -16,6 +16,7 @@ from sqlalchemy.dialects.postgresql import insert as pg_insert
 from app.database import SessionLocal
 from app.models import Movie
 from app.models.movie import similar_movies
+from ml.similar_movies import ranked_csv_neighbors
 
 
 def parse_list_string(value):
@@ -56,17 +57,18 @@ def add_similar_movies(csv_path: str):
         batch = []
 
         for movie_id, similar_ids in similar_movie_data:
-            for similar_id in similar_ids:
-                if similar_id in movie_ids:
-                    batch.append({'movie_id': movie_id, 'similar_movie_id': similar_id})
-                    similar_count += 1
-
-                    if len(batch) >= batch_size:
-                        stmt = pg_insert(similar_movies).values(batch).on_conflict_do_nothing()
-                        session.execute(stmt)
-                        session.commit()
-                        batch = []
-                        print(f"Processed {similar_count} relationships...")
+            # rank = CSV 목록 순서 (score는 NULL — compute_similar_movies.py가 덮어쓴다)
+            pairs, _ = ranked_csv_neighbors(movie_id, similar_ids, movie_ids)
+            for similar_id, rank in pairs:
+                batch.append({'movie_id': movie_id, 'similar_movie_id': similar_id, 'rank': rank})
+                similar_count += 1
+
+                if len(batch) >= batch_size:
+                    stmt = pg_insert(similar_movies).values(batch).on_conflict_do_nothing()
+                    session.execute(stmt)
+                    session.commit()
+                    batch = []
+                    print(f"Processed {similar_count} relationships...")
 
         # Insert remaining batch
         if batch:
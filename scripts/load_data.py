@@ -18,6 +18,7 @@ from sqlalchemy import text
 from app.database import engine, SessionLocal, Base
 from app.models import Movie, Genre, Person, Keyword, Country, GENRE_MAPPING
 from app.models.movie import movie_genres, movie_cast, movie_keywords, movie_countries, similar_movies
+from ml.similar_movies import ranked_csv_neighbors
 
 
 def parse_list_string(value):
@@ -218,14 +219,16 @@ def load_data(csv_path: str):
         from sqlalchemy.dialects.postgresql import insert as pg_insert
 
         for movie_id, similar_ids in similar_movie_data:
-            for similar_id in similar_ids:
-                if similar_id in movie_ids:
-                    stmt = pg_insert(similar_movies).values(
-                        movie_id=movie_id,
-                        similar_movie_id=similar_id
-                    ).on_conflict_do_nothing()
-                    session.execute(stmt)
-                    similar_count += 1
+            # rank = CSV 목록 순서 (score는 NULL — compute_similar_movies.py가 덮어쓴다)
+            pairs, _ = ranked_csv_neighbors(movie_id, similar_ids, movie_ids)
+            for similar_id, rank in pairs:
+                stmt = pg_insert(similar_movies).values(
+                    movie_id=movie_id,
+                    similar_movie_id=similar_id,
+                    rank=rank
+                ).on_conflict_do_nothing()
+                session.execute(stmt)
+                similar_count += 1
 
         session.commit()
         print(f"Added {similar_count} similar movie relationships")